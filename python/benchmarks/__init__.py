@@ -0,0 +1,17 @@
+"""Performance benchmarks of the SDK against a local stand-in for the Scorable API.
+
+The fake API (:mod:`benchmarks.server`) is generated from ``openapi.yaml`` and
+runs offline, with configurable latency and error injection. The suite
+(:mod:`benchmarks.suite`) measures synchronous and asynchronous evaluator
+throughput, pagination, bulk dataset ingest, uploads and import time, and
+writes JSON results that can be compared between releases::
+
+  python -m benchmarks run --output baseline.json
+  python -m benchmarks run --output results.json
+  python -m benchmarks compare baseline.json results.json
+
+The stress harness (:mod:`benchmarks.stress`) measures goodput, retries and
+latency under a fault profile injected on the client side::
+
+  python -m benchmarks stress --profile storm --attempts 5
+"""
@@ -0,0 +1,117 @@
+"""Command line of the benchmark suite.
+
+  python -m benchmarks run --output results.json [--quick] [--latency lognormal:0.02,0.5] [--error-rate 0.01]
+  python -m benchmarks compare baseline.json results.json [--tolerance 0.1]
+  python -m benchmarks stress [--profile flaky|storm|slow|profile.json] [--attempts 3] [--async]
+
+``compare`` exits with status 1 if a scenario got worse by more than the tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from .server import FakeServerConfig, Latency
+from .stress import PROFILES, StressConfig, load_profile, run_stress
+from .suite import SCENARIOS, Result, SuiteConfig, compare, run_suite
+
+
+def _run(args: argparse.Namespace) -> int:
+    server = FakeServerConfig(latency=args.latency, error_rate=args.error_rate, seed=args.seed)
+    sizes = {name: getattr(args, name) for name in ("requests", "concurrency") if getattr(args, name) is not None}
+    if args.quick:
+        config = SuiteConfig.quick(server=server, in_process=args.in_process, **sizes)
+    else:
+        config = SuiteConfig(server=server, in_process=args.in_process, **sizes)
+
+    def report(name: str, result: Result) -> None:
+        print(f"{name:28} {result.value:12.2f} {result.unit}", file=sys.stderr)
+
+    results = run_suite(config, args.scenario or None, progress=report)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    changes = compare(baseline, current, args.tolerance)
+    for change in changes:
+        flag = "REGRESSION" if change["regression"] else ""
+        print(
+            f"{change['scenario']:28} {change['baseline']:12.2f} -> {change['current']:12.2f} {change['unit']:8}"
+            f" {change['ratio'] - 1:+7.1%} {flag}"
+        )
+    return 1 if any(change["regression"] for change in changes) else 0
+
+
+def _stress(args: argparse.Namespace) -> int:
+    options = {name: getattr(args, name) for name in ("requests", "concurrency") if getattr(args, name) is not None}
+    config = StressConfig(
+        profile=load_profile(args.profile),
+        attempts=args.attempts,
+        backoff=args.backoff,
+        run_async=args.run_async,
+        in_process=args.in_process,
+        **options,
+    )
+    text = json.dumps(run_stress(config), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks of the Scorable SDK")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmarks against a fake API")
+    run.add_argument("--output", "-o", help="file to write the JSON results to; stdout by default")
+    run.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="scenario to run; repeatable")
+    run.add_argument("--quick", action="store_true", help="small sizes, for smoke runs")
+    run.add_argument("--requests", type=int, help="evaluator executions per throughput scenario")
+    run.add_argument("--concurrency", type=int, help="concurrent calls")
+    run.add_argument("--latency", type=Latency.parse, default=Latency(), help="server latency, e.g. uniform:0.01,0.05")
+    run.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests failing with 5xx")
+    run.add_argument("--seed", type=int, help="seed of the latency and error draws")
+    run.add_argument("--in-process", action="store_true", help="serve the fake API from a thread of this process")
+    run.set_defaults(handler=_run)
+
+    diff = commands.add_parser("compare", help="compare two result files")
+    diff.add_argument("baseline")
+    diff.add_argument("current")
+    diff.add_argument("--tolerance", type=float, default=0.1, help="relative change tolerated; 0.1 by default")
+    diff.set_defaults(handler=_compare)
+
+    stress = commands.add_parser("stress", help="measure throughput and retries under injected faults")
+    stress.add_argument("--output", "-o", help="file to write the JSON report to; stdout by default")
+    stress.add_argument(
+        "--profile", default="flaky", help=f"fault profile: one of {', '.join(PROFILES)}, or a JSON file"
+    )
+    stress.add_argument("--requests", type=int, help="evaluator executions")
+    stress.add_argument("--concurrency", type=int, help="concurrent calls")
+    stress.add_argument("--attempts", type=int, default=3, help="requests sent at most per call")
+    stress.add_argument("--backoff", type=float, default=0.1, help="longest wait before the first retry")
+    stress.add_argument("--async", dest="run_async", action="store_true", help="make the calls with evaluators.arun")
+    stress.add_argument("--in-process", action="store_true", help="serve the fake API from a thread of this process")
+    stress.set_defaults(handler=_stress)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+"""A stand-in for the Scorable API, served from its OpenAPI spec.
+
+Every operation of ``openapi.yaml`` gets a route whose response is synthesized
+from the schema of its success response, so the SDK exercises its real
+serialization, transport and deserialization code without a network or mocks.
+List endpoints page through ``collection_size`` items with cursors, bulk
+endpoints answer with one item per item sent, and ``POST /v1/files/`` returns a
+new file ID per upload.
+
+Latency is drawn from a configurable distribution, globally or per operation,
+and a fraction of requests can be answered with injected errors::
+
+  config = FakeServerConfig(latency=Latency.parse("lognormal:0.05,0.5"), error_rate=0.01)
+  with run_in_thread(config) as url:
+      client = Scorable(api_key="fake", base_url=url)
+
+``GET /_fake/stats`` returns the number of calls per operation and of injected
+errors, also when the server runs in another process (:func:`run_in_process`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import random
+import threading
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+from aiohttp import web
+
+from scorable.faults import Latency
+
+SPEC_PATH = Path(__file__).resolve().parent.parent / "openapi.yaml"
+
+_STRING_FORMATS = {
+    "uuid": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+    "date-time": "2025-01-01T00:00:00Z",
+    "date": "2025-01-01",
+    "uri": "https://example.com/",
+    "email": "user@example.com",
+}
+
+
+@dataclass
+class FakeServerConfig:
+    """Behaviour of the fake server.
+
+    Args:
+      latency: Delay of every response.
+      operation_latency: Delays of specific operations, by operation id.
+      error_rate: Fraction of requests answered with an injected error.
+      operation_error_rate: Error rates of specific operations, by operation id.
+      error_statuses: Statuses of injected errors, chosen at random; 429 responses carry a ``Retry-After``.
+      collection_size: Number of items every list endpoint pages through.
+      max_page_size: Largest page returned, whatever ``page_size`` asks for.
+      overrides: Fields replaced in the synthesized responses of an operation, by operation id.
+      seed: Seed of the latency and error draws.
+    """
+
+    latency: Latency = field(default_factory=Latency)
+    operation_latency: Dict[str, Latency] = field(default_factory=dict)
+    error_rate: float = 0.0
+    operation_error_rate: Dict[str, float] = field(default_factory=dict)
+    error_statuses: Tuple[int, ...] = (500, 502, 503)
+    collection_size: int = 1000
+    max_page_size: int = 100
+    overrides: Dict[str, Dict[str, Any]] = field(
+        default_factory=lambda: {"judges_batch_executions_retrieve": {"status": "completed"}}
+    )
+    seed: Optional[int] = None
+
+
+class _Schemas:
+    # Synthesizes payloads that satisfy the response schemas of the spec.
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.components = spec.get("components", {}).get("schemas", {})
+
+    def resolve(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        while "$ref" in schema:
+            schema = self.components[schema["$ref"].rsplit("/", 1)[-1]]
+        if "allOf" in schema:
+            merged: Dict[str, Any] = {k: v for k, v in schema.items() if k != "allOf"}
+            for part in schema["allOf"]:
+                part = self.resolve(part)
+                merged.setdefault("properties", {}).update(part.get("properties", {}))
+                merged.update({k: v for k, v in part.items() if k != "properties"})
+            return merged
+        return schema
+
+    def example(self, schema: Dict[str, Any], depth: int = 0) -> Any:
+        schema = self.resolve(schema)
+        if "example" in schema:
+            return schema["example"]
+        for key in ("oneOf", "anyOf"):
+            if key in schema:
+                return self.example(schema[key][0], depth)
+        if "enum" in schema:
+            return next((value for value in schema["enum"] if value is not None), None)
+        kind = schema.get("type", "object" if "properties" in schema else None)
+        if kind == "object":
+            if depth > 6:
+                return {}
+            return {
+                name: self.example(prop, depth + 1)
+                for name, prop in schema.get("properties", {}).items()
+                if not prop.get("writeOnly")
+            }
+        if kind == "array":
+            return [] if depth > 6 else [self.example(schema.get("items", {}), depth + 1)]
+        return _scalar(kind, schema)
+
+
+def _scalar(kind: Optional[str], schema: Dict[str, Any]) -> Any:
+    if kind == "string":
+        value = _STRING_FORMATS.get(schema.get("format", ""), "string")
+        return value.ljust(schema.get("minLength", 0), "x")[: schema.get("maxLength")]
+    if kind == "integer":
+        return int(schema.get("minimum", 0))
+    if kind == "number":
+        return float(schema.get("minimum", 0.5))
+    if kind == "boolean":
+        return False
+    return None
+
+
+@dataclass
+class _Operation:
+    operation_id: str
+    status: int
+    body: Optional[bytes] = None
+    #: For list endpoints: one item of a page.
+    page_item: Optional[bytes] = None
+    #: For bulk endpoints: one item per item of the request.
+    echo_item: Optional[bytes] = None
+    upload: bool = False
+
+
+def _operations(spec: Dict[str, Any], config: FakeServerConfig) -> List[Tuple[str, str, _Operation]]:
+    schemas = _Schemas(spec)
+    operations = []
+    for path, methods in spec["paths"].items():
+        for method, op in methods.items():
+            if method == "parameters":
+                continue
+            operation_id = op["operationId"]
+            status = min(int(code) for code in op["responses"] if code.startswith("2"))
+            operation = _Operation(operation_id, status, upload=operation_id == "files_create")
+            content = op["responses"][str(status)].get("content", {}).get("application/json")
+            if content is not None:
+                schema = schemas.resolve(content["schema"])
+                properties = schema.get("properties", {})
+                if "results" in properties and "next" in properties:
+                    operation.page_item = json.dumps(schemas.example(properties["results"]["items"])).encode()
+                elif schema.get("type") == "array" and "requestBody" in op:
+                    operation.echo_item = json.dumps(schemas.example(schema["items"])).encode()
+                else:
+                    payload = schemas.example(schema)
+                    if isinstance(payload, dict):
+                        payload.update(config.overrides.get(operation_id, {}))
+                    operation.body = json.dumps(payload).encode()
+            operations.append((method.upper(), path, operation))
+    # Static path segments must win over parameters, e.g. /v1/judges/generate/ over /v1/judges/{id}/.
+    operations.sort(key=lambda entry: tuple(segment.startswith("{") for segment in entry[1].split("/")))
+    return operations
+
+
+class FakeScorableServer:
+    """The aiohttp application of the fake API.
+
+    Args:
+      config: Latency, errors and collection sizes.
+      spec_path: OpenAPI spec to serve; the SDK's own by default.
+    """
+
+    def __init__(self, config: Optional[FakeServerConfig] = None, spec_path: Path = SPEC_PATH):
+        self.config = config or FakeServerConfig()
+        with open(spec_path) as f:
+            spec = yaml.safe_load(f)
+        self.calls: Counter = Counter()
+        self.errors: Counter = Counter()
+        self._rng = random.Random(self.config.seed)  # noqa: S311
+        self.app = web.Application(client_max_size=64 * 1024 * 1024)
+        self.app.router.add_get("/_fake/stats", self._stats)
+        for method, path, operation in _operations(spec, self.config):
+            self.app.router.add_route(method, path, self._handler(operation))
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response({"calls": dict(self.calls), "errors": dict(self.errors)})
+
+    def _handler(self, operation: _Operation) -> Any:
+        config = self.config
+        latency = config.operation_latency.get(operation.operation_id, config.latency)
+        error_rate = config.operation_error_rate.get(operation.operation_id, config.error_rate)
+
+        async def handle(request: web.Request) -> web.StreamResponse:
+            self.calls[operation.operation_id] += 1
+            body = await request.read()
+            delay = latency.sample(self._rng)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if error_rate and self._rng.random() < error_rate:
+                self.errors[operation.operation_id] += 1
+                status = self._rng.choice(config.error_statuses)
+                headers = {"Retry-After": "0"} if status == 429 else None
+                return web.json_response({"detail": "Injected error"}, status=status, headers=headers)
+            if operation.upload:
+                return web.json_response({"id": str(uuid.uuid4())}, status=operation.status)
+            if operation.page_item is not None:
+                return _page(request, operation.page_item, config)
+            if operation.echo_item is not None:
+                count = len(json.loads(body)) if body else 0
+                return _json(b"[" + b",".join([operation.echo_item] * count) + b"]", operation.status)
+            if operation.body is None:
+                return web.Response(status=operation.status)
+            return _json(operation.body, operation.status)
+
+        return handle
+
+
+def _json(body: bytes, status: int) -> web.Response:
+    return web.Response(body=body, status=status, content_type="application/json")
+
+
+def _page(request: web.Request, item: bytes, config: FakeServerConfig) -> web.Response:
+    start = int(request.query.get("cursor") or 0)
+    size = min(int(request.query.get("page_size") or config.max_page_size), config.max_page_size)
+    stop = min(start + size, config.collection_size)
+    next_cursor = json.dumps(str(stop) if stop < config.collection_size else None).encode()
+    previous = json.dumps(str(max(start - size, 0)) if start else None).encode()
+    results = b",".join([item] * max(stop - start, 0))
+    return _json(b'{"next":' + next_cursor + b',"previous":' + previous + b',"results":[' + results + b"]}", 200)
+
+
+async def _start(server: FakeScorableServer, port: int = 0) -> Tuple[web.AppRunner, str]:
+    runner = web.AppRunner(server.app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", port)
+    await site.start()
+    sockets = site._server.sockets  # type: ignore[union-attr]
+    return runner, f"http://127.0.0.1:{sockets[0].getsockname()[1]}"
+
+
+@contextmanager
+def run_in_thread(config: Optional[FakeServerConfig] = None) -> Iterator[str]:
+    """Serve the fake API on an event loop in a background thread and yield its URL."""
+    server = FakeScorableServer(config)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="fake-scorable-api", daemon=True)
+    thread.start()
+    runner, url = asyncio.run_coroutine_threadsafe(_start(server), loop).result()
+    try:
+        yield url
+    finally:
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def _serve(config: FakeServerConfig, ready: Any, port: int = 0) -> None:
+    async def main() -> None:
+        runner, url = await _start(FakeScorableServer(config), port)
+        ready.put(url)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+
+@contextmanager
+def run_in_process(config: Optional[FakeServerConfig] = None) -> Iterator[str]:
+    """Serve the fake API from a separate process, so it does not compete with the client for the GIL."""
+    context = multiprocessing.get_context("spawn")
+    ready = context.Queue()
+    process = context.Process(target=_serve, args=(config or FakeServerConfig(), ready), daemon=True)
+    process.start()
+    try:
+        yield ready.get(timeout=60)
+    finally:
+        process.terminate()
+        process.join()
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve a fake Scorable API generated from openapi.yaml")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=Latency.parse, default=Latency(), help="e.g. lognormal:0.05,0.5")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--collection-size", type=int, default=1000)
+    args = parser.parse_args()
+    config = FakeServerConfig(latency=args.latency, error_rate=args.error_rate, collection_size=args.collection_size)
+    web.run_app(FakeScorableServer(config).app, host="127.0.0.1", port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Throughput of the SDK under injected faults.
+
+Evaluator executions run against the fake API through a
+:class:`~scorable.faults.FaultInjector`, behind a
+:class:`~scorable.transport.Retry`, so that retry budgets and concurrency
+limits can be sized against 429 storms, resets and slow responses::
+
+  python -m benchmarks stress --profile storm --attempts 5 --concurrency 64
+
+The report gives the rate of successful calls, the failures by exception type,
+latency percentiles, the retries made and the faults injected.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List
+
+from scorable import Scorable
+from scorable.faults import FaultInjector
+from scorable.transport import Retry
+
+from .server import FakeServerConfig, run_in_process, run_in_thread
+from .suite import _ID, _latencies
+
+#: Profiles selectable by name from the command line.
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "flaky": {
+        "latency": "lognormal:0.02,0.5",
+        "error_rate": 0.05,
+        "statuses": [500, 502, 503],
+        "drop_rate": 0.01,
+        "reset_rate": 0.01,
+    },
+    "storm": {
+        "latency": "uniform:0.005,0.02",
+        "storms": [{"every": 2.0, "duration": 0.5, "status": 429, "retry_after": 0.25}],
+    },
+    "slow": {"latency": "exponential:0.05", "body_rate": 20_000, "truncate_rate": 0.01},
+}
+
+
+@dataclass
+class StressConfig:
+    """A stress run.
+
+    Args:
+      requests: Evaluator executions.
+      concurrency: Concurrent calls (threads, or tasks with ``run_async``).
+      profile: Declarative fault profile, see :meth:`~scorable.faults.FaultProfile.from_dict`.
+      attempts: Requests sent at most per call, by the retry wrapper.
+      backoff: Longest wait before the first retry, in seconds.
+      run_async: Make the calls with ``evaluators.arun`` instead of ``evaluators.run``.
+      in_process: Serve the fake API from a thread of this process instead of a separate process.
+    """
+
+    requests: int = 1000
+    concurrency: int = 32
+    profile: Dict[str, Any] = field(default_factory=lambda: dict(PROFILES["flaky"]))
+    attempts: int = 3
+    backoff: float = 0.1
+    run_async: bool = False
+    in_process: bool = False
+
+
+class _Outcomes:
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.failures: Counter[str] = Counter()
+
+    def record(self, start: float, error: BaseException | None) -> None:
+        if error is None:
+            self.latencies.append(time.perf_counter() - start)
+        else:
+            self.failures[type(error).__name__] += 1
+
+
+def _run_sync(client: Scorable, config: StressConfig, outcomes: _Outcomes) -> None:
+    def call(_: int) -> None:
+        start = time.perf_counter()
+        try:
+            client.evaluators.run(_ID, response="The response to score", request="The question")
+        except Exception as e:
+            outcomes.record(start, e)
+        else:
+            outcomes.record(start, None)
+
+    with ThreadPoolExecutor(config.concurrency) as pool:
+        list(pool.map(call, range(config.requests)))
+
+
+async def _run_async(client: Scorable, config: StressConfig, outcomes: _Outcomes) -> None:
+    semaphore = asyncio.Semaphore(config.concurrency)
+
+    async def call() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await client.evaluators.arun(_ID, response="The response to score", request="The question")
+            except Exception as e:
+                outcomes.record(start, e)
+            else:
+                outcomes.record(start, None)
+
+    await asyncio.gather(*(call() for _ in range(config.requests)))
+
+
+def run_stress(config: StressConfig) -> Dict[str, Any]:
+    """Run the calls of ``config`` against a fresh fake API and return the JSON-serializable report."""
+    injector = FaultInjector(config.profile)
+    retry = Retry(attempts=config.attempts, backoff=config.backoff)
+    outcomes = _Outcomes()
+    serve = run_in_thread if config.in_process else run_in_process
+    with serve(FakeServerConfig()) as url:
+        client = Scorable(
+            api_key="fake", base_url=url, run_async=config.run_async, transport_wrappers=[retry, injector]
+        )
+        start = time.perf_counter()
+        if config.run_async:
+            asyncio.run(_run_async(client, config, outcomes))
+        else:
+            _run_sync(client, config, outcomes)
+        elapsed = time.perf_counter() - start
+        client.close()
+    succeeded = len(outcomes.latencies)
+    return {
+        "config": asdict(config),
+        "seconds": elapsed,
+        "succeeded": succeeded,
+        "failed": dict(outcomes.failures),
+        "success_rate": succeeded / config.requests if config.requests else 1.0,
+        "goodput": succeeded / elapsed,
+        "latency": _latencies(outcomes.latencies),
+        "retries": retry.retries,
+        "retries_exhausted": retry.exhausted,
+        "injected": dict(injector.injected),
+    }
+
+
+def load_profile(name_or_path: str) -> Dict[str, Any]:
+    """A profile of :data:`PROFILES`, or read from a JSON file."""
+    if name_or_path in PROFILES:
+        return dict(PROFILES[name_or_path])
+    with open(name_or_path) as f:
+        return json.load(f)
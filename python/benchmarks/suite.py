@@ -0,0 +1,334 @@
+"""Benchmark scenarios of the SDK against the fake API.
+
+Each scenario returns a :class:`Result` with one headline value (a throughput,
+or the import time) that :func:`compare` checks between two runs, plus details
+such as latency percentiles and error counts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from scorable import Scorable
+from scorable.__about__ import __version__
+
+from .server import FakeServerConfig, run_in_process, run_in_thread
+
+#: Any ID is accepted by the fake API.
+_ID = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+_INGEST_CHUNK = 1000
+_RESULTS_SCHEMA = 1
+
+
+@dataclass
+class SuiteConfig:
+    """Sizes of the benchmark scenarios.
+
+    Args:
+      requests: Evaluator executions per throughput scenario.
+      concurrency: Concurrent calls (threads or tasks) of the throughput, ingest and upload scenarios.
+      collection_size: Items paged through by the pagination scenarios.
+      ingest_items: Dataset items created by the ingest scenarios.
+      uploads: Files uploaded by the upload scenarios.
+      upload_size: Size of each uploaded file in bytes.
+      import_runs: Fresh interpreters timed by the import scenario.
+      server: Behaviour of the fake API.
+      in_process: Serve the fake API from a thread of the benchmark process instead of a separate process.
+    """
+
+    requests: int = 2000
+    concurrency: int = 32
+    collection_size: int = 10_000
+    ingest_items: int = 10_000
+    uploads: int = 200
+    upload_size: int = 256 * 1024
+    import_runs: int = 5
+    server: FakeServerConfig = field(default_factory=FakeServerConfig)
+    in_process: bool = False
+
+    @classmethod
+    def quick(cls, **kwargs: Any) -> SuiteConfig:
+        """A configuration that finishes in seconds, for smoke runs."""
+        sizes = {"requests": 200, "concurrency": 8, "collection_size": 1000, "ingest_items": 1000, "uploads": 20}
+        return cls(**{**sizes, "upload_size": 64 * 1024, "import_runs": 2, **kwargs})
+
+
+@dataclass
+class Result:
+    #: Headline value of the scenario, e.g. calls per second.
+    value: float
+    unit: str
+    higher_is_better: bool = True
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+def _latencies(samples: List[float]) -> Dict[str, float]:
+    if len(samples) < 2:
+        return {}
+    quantiles = statistics.quantiles(samples, n=100)
+    return {
+        "mean": statistics.fmean(samples),
+        "p50": quantiles[49],
+        "p95": quantiles[94],
+        "p99": quantiles[98],
+    }
+
+
+def _throughput(count: int, elapsed: float, unit: str, latencies: List[float], errors: int) -> Result:
+    details = {"count": count, "seconds": elapsed, "errors": errors, "latency": _latencies(latencies)}
+    return Result(count / elapsed, unit, details=details)
+
+
+def _run_sync(url: str, config: SuiteConfig, **client_args: Any) -> Result:
+    client = Scorable(api_key="fake", base_url=url, **client_args)
+    latencies: List[float] = []
+    errors = 0
+
+    def call(_: int) -> None:
+        nonlocal errors
+        start = time.perf_counter()
+        try:
+            client.evaluators.run(_ID, response="The response to score", request="The question")
+        except Exception:
+            errors += 1
+            return
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(config.concurrency) as pool:
+        list(pool.map(call, range(config.requests)))
+    elapsed = time.perf_counter() - start
+    client.close()
+    return _throughput(config.requests, elapsed, "calls/s", latencies, errors)
+
+
+def run_sync(url: str, config: SuiteConfig) -> Result:
+    """``evaluators.run`` from a thread pool."""
+    return _run_sync(url, config)
+
+
+def run_sync_background_loop(url: str, config: SuiteConfig) -> Result:
+    """``evaluators.run`` from a thread pool, on the shared background loop."""
+    return _run_sync(url, config, background_loop=True)
+
+
+async def _gather(count: int, concurrency: int, call: Callable[[int], Awaitable[Any]]) -> tuple:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def timed(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await call(index)
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(timed(index) for index in range(count)))
+    return latencies, errors
+
+
+def run_async(url: str, config: SuiteConfig) -> Result:
+    """Concurrent ``evaluators.arun`` calls."""
+
+    async def main() -> tuple:
+        client = Scorable(api_key="fake", base_url=url, run_async=True)
+        return await _gather(
+            config.requests,
+            config.concurrency,
+            lambda _: client.evaluators.arun(_ID, response="The response to score", request="The question"),
+        )
+
+    start = time.perf_counter()
+    latencies, errors = asyncio.run(main())
+    return _throughput(config.requests, time.perf_counter() - start, "calls/s", latencies, errors)
+
+
+def paginate_sync(url: str, config: SuiteConfig) -> Result:
+    """Iterating ``datasets.list_items`` over every page."""
+    client = Scorable(api_key="fake", base_url=url)
+    start = time.perf_counter()
+    count = sum(1 for _ in client.datasets.list_items(_ID, limit=config.collection_size))
+    return _throughput(count, time.perf_counter() - start, "items/s", [], 0)
+
+
+def paginate_async(url: str, config: SuiteConfig) -> Result:
+    """Iterating ``datasets.alist_items`` over every page."""
+
+    async def main() -> int:
+        client = Scorable(api_key="fake", base_url=url, run_async=True)
+        return len([item async for item in client.datasets.alist_items(_ID, limit=config.collection_size)])
+
+    start = time.perf_counter()
+    count = asyncio.run(main())
+    return _throughput(count, time.perf_counter() - start, "items/s", [], 0)
+
+
+def _ingest_chunks(config: SuiteConfig) -> List[List[Dict[str, Any]]]:
+    items = [
+        {"request": f"question {i}", "response": f"answer {i}", "expected_output": "expected"}
+        for i in range(config.ingest_items)
+    ]
+    return [items[i : i + _INGEST_CHUNK] for i in range(0, len(items), _INGEST_CHUNK)]
+
+
+def ingest_sync(url: str, config: SuiteConfig) -> Result:
+    """Bulk ``datasets.add_items`` of 1000-item chunks from a thread pool."""
+    client = Scorable(api_key="fake", base_url=url)
+    chunks = _ingest_chunks(config)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(config.concurrency) as pool:
+        created = sum(len(items) for items in pool.map(lambda chunk: client.datasets.add_items(_ID, chunk), chunks))
+    return _throughput(created, time.perf_counter() - start, "items/s", [], 0)
+
+
+def ingest_async(url: str, config: SuiteConfig) -> Result:
+    """Concurrent bulk ``datasets.aadd_items`` of 1000-item chunks."""
+    chunks = _ingest_chunks(config)
+
+    async def main() -> tuple:
+        client = Scorable(api_key="fake", base_url=url, run_async=True)
+        return await _gather(len(chunks), config.concurrency, lambda i: client.datasets.aadd_items(_ID, chunks[i]))
+
+    start = time.perf_counter()
+    latencies, errors = asyncio.run(main())
+    return _throughput(config.ingest_items, time.perf_counter() - start, "items/s", latencies, errors)
+
+
+def _upload_files(config: SuiteConfig) -> List[tuple]:
+    content = b"%PDF-1.4\n" + bytes(config.upload_size - 9)
+    return [(f"document-{i}.pdf", content) for i in range(config.uploads)]
+
+
+def _upload_result(outcomes: List[Any], elapsed: float, config: SuiteConfig) -> Result:
+    errors = sum(isinstance(outcome, BaseException) for outcome in outcomes)
+    megabytes = config.uploads * config.upload_size / 1e6
+    details = {
+        "count": config.uploads,
+        "seconds": elapsed,
+        "errors": errors,
+        "files_per_second": config.uploads / elapsed,
+    }
+    return Result(megabytes / elapsed, "MB/s", details=details)
+
+
+def upload_sync(url: str, config: SuiteConfig) -> Result:
+    """``files.upload_many`` of distinct in-memory PDFs."""
+    client = Scorable(api_key="fake", base_url=url)
+    files = _upload_files(config)
+    start = time.perf_counter()
+    outcomes = client.files.upload_many(files, concurrency=config.concurrency)
+    return _upload_result(outcomes, time.perf_counter() - start, config)
+
+
+def upload_async(url: str, config: SuiteConfig) -> Result:
+    """``files.aupload_many`` of distinct in-memory PDFs."""
+    files = _upload_files(config)
+
+    async def main() -> List[Any]:
+        client = Scorable(api_key="fake", base_url=url, run_async=True)
+        return await client.files.aupload_many(files, concurrency=config.concurrency)
+
+    start = time.perf_counter()
+    outcomes = asyncio.run(main())
+    return _upload_result(outcomes, time.perf_counter() - start, config)
+
+
+def import_time(url: str, config: SuiteConfig) -> Result:
+    """Wall time of ``import scorable`` in a fresh interpreter; the median of several runs."""
+    code = "import time; start = time.perf_counter(); import scorable; print(time.perf_counter() - start)"
+    runs = [
+        float(subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True).stdout)
+        for _ in range(config.import_runs)
+    ]
+    return Result(statistics.median(runs), "s", higher_is_better=False, details={"runs": runs, "min": min(runs)})
+
+
+SCENARIOS: Dict[str, Callable[[str, SuiteConfig], Result]] = {
+    "run_sync": run_sync,
+    "run_sync_background_loop": run_sync_background_loop,
+    "run_async": run_async,
+    "paginate_sync": paginate_sync,
+    "paginate_async": paginate_async,
+    "ingest_sync": ingest_sync,
+    "ingest_async": ingest_async,
+    "upload_sync": upload_sync,
+    "upload_async": upload_async,
+    "import_time": import_time,
+}
+
+
+def run_suite(
+    config: Optional[SuiteConfig] = None,
+    scenarios: Optional[List[str]] = None,
+    progress: Optional[Callable[[str, Result], None]] = None,
+) -> Dict[str, Any]:
+    """Run scenarios (all by default) against a fresh fake API and return the JSON-serializable results."""
+    config = config or SuiteConfig()
+    server_config = replace(config.server, collection_size=config.collection_size)
+    serve = run_in_thread if config.in_process else run_in_process
+    results: Dict[str, Any] = {}
+    started = datetime.now(timezone.utc)
+    with serve(server_config) as url:
+        for name in scenarios or list(SCENARIOS):
+            result = SCENARIOS[name](url, config)
+            results[name] = asdict(result)
+            if progress is not None:
+                progress(name, result)
+    return {
+        "schema": _RESULTS_SCHEMA,
+        "scorable_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "started_at": started.isoformat(),
+        "config": _config_json(config),
+        "results": results,
+    }
+
+
+def _config_json(config: SuiteConfig) -> Dict[str, Any]:
+    data = asdict(config)
+    server = config.server
+    data["server"].update(
+        latency=str(server.latency),
+        operation_latency={operation: str(latency) for operation, latency in server.operation_latency.items()},
+    )
+    return data
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.1) -> List[Dict[str, Any]]:
+    """Changes of the scenarios present in both runs.
+
+    ``regression`` marks a change for the worse by more than ``tolerance``, a fraction of the baseline value.
+    """
+    changes = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None or not before["value"]:
+            continue
+        ratio = result["value"] / before["value"]
+        worse = ratio < 1 - tolerance if result["higher_is_better"] else ratio > 1 + tolerance
+        changes.append(
+            {
+                "scenario": name,
+                "unit": result["unit"],
+                "baseline": before["value"],
+                "current": result["value"],
+                "ratio": ratio,
+                "regression": worse,
+            }
+        )
+    return changes
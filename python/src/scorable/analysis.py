@@ -0,0 +1,510 @@
+"""Agreement between an evaluator and human annotations, computed locally with NumPy.
+
+Install NumPy (``pip install scorable[analysis]``), load the items of a
+calibration run into contiguous arrays once, and compute agreement metrics with
+bootstrap confidence intervals on the whole run or any slice of it, without
+starting a new run on the server::
+
+  from scorable.analysis import CalibrationArrays, agreement
+
+  arrays = CalibrationArrays.from_items(client.calibration_runs.list_items(run_id, limit=10**6))
+  print(agreement(arrays).mae)
+  by_tag = arrays.group_by([tags[item] for item in arrays.dataset_items])
+  reports = {tag: agreement(group) for tag, group in by_tag.items()}
+
+Every metric is vectorized, bootstrap resamples included: resamples are drawn
+and scored as 2-D index arrays in chunks of bounded size, never item by item.
+Kappa and the confusion matrix apply to categorical score configs, whose
+categories are passed explicitly.
+
+:func:`threshold_curve` sweeps every distinct evaluator score as a pass
+threshold at once, from one sort and cumulative sums, and
+:func:`recommend_thresholds` picks a threshold per score config by F1, error
+cost or Youden's J::
+
+  curve = threshold_curve(arrays.evaluator_scores, arrays.human_values >= 0.5)
+  print(curve.roc_auc(), curve.best("cost", false_negative_cost=5))
+"""
+
+from __future__ import annotations
+
+import array
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - exercised without the optional dependency
+    raise ImportError("scorable.analysis requires NumPy: pip install scorable[analysis]") from e
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from .generated.openapi_client.models.calibration_run_item import CalibrationRunItem
+
+#: Largest number of index entries drawn at once when bootstrapping (resamples times items).
+_BOOTSTRAP_CHUNK = 1 << 22
+
+
+class _Builder:
+    # Accumulates items column by column in growable buffers, without keeping the models.
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.dataset_items: List[Optional[str]] = []
+        self.scores = array.array("d")
+        self.human = array.array("d")
+        self.disagreements = array.array("d")
+        self.completed = array.array("b")
+
+    def add(self, item: CalibrationRunItem) -> None:
+        nan = float("nan")
+        self.ids.append(item.id)
+        self.dataset_items.append(item.dataset_item)
+        self.scores.append(nan if item.evaluator_score is None else item.evaluator_score)
+        self.human.append(nan if item.human_value is None else item.human_value)
+        self.disagreements.append(nan if item.disagreement is None else item.disagreement)
+        self.completed.append(item.status == "completed")
+
+    def build(self) -> CalibrationArrays:
+        return CalibrationArrays(
+            ids=np.array(self.ids, dtype=object),
+            dataset_items=np.array(self.dataset_items, dtype=object),
+            evaluator_scores=np.frombuffer(self.scores, dtype=np.float64),
+            human_values=np.frombuffer(self.human, dtype=np.float64),
+            disagreements=np.frombuffer(self.disagreements, dtype=np.float64),
+            completed=np.frombuffer(self.completed, dtype=np.int8).astype(bool),
+        )
+
+
+@dataclass(frozen=True)
+class CalibrationArrays:
+    """The items of a calibration run as columns, one array per field; missing values are NaN.
+
+    Index it with a slice, an index array or a boolean mask to get the matching subset.
+    """
+
+    ids: NDArray[Any]
+    dataset_items: NDArray[Any]
+    evaluator_scores: NDArray[np.float64]
+    human_values: NDArray[np.float64]
+    disagreements: NDArray[np.float64]
+    #: Whether the evaluator ran successfully on the item.
+    completed: NDArray[np.bool_]
+
+    @classmethod
+    def from_items(cls, items: Iterable[CalibrationRunItem]) -> CalibrationArrays:
+        """Load items, e.g. from ``calibration_runs.list_items(run_id, limit=...)``, as they are fetched."""
+        builder = _Builder()
+        for item in items:
+            builder.add(item)
+        return builder.build()
+
+    @classmethod
+    async def afrom_items(cls, items: AsyncIterable[CalibrationRunItem]) -> CalibrationArrays:
+        """Load items, e.g. from ``calibration_runs.alist_items(run_id, limit=...)``, as they are fetched."""
+        builder = _Builder()
+        async for item in items:
+            builder.add(item)
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, selection: Any) -> CalibrationArrays:
+        return CalibrationArrays(
+            ids=self.ids[selection],
+            dataset_items=self.dataset_items[selection],
+            evaluator_scores=self.evaluator_scores[selection],
+            human_values=self.human_values[selection],
+            disagreements=self.disagreements[selection],
+            completed=self.completed[selection],
+        )
+
+    @property
+    def scored(self) -> NDArray[np.bool_]:
+        """Mask of the items with both an evaluator score and a human value."""
+        return self.completed & ~np.isnan(self.evaluator_scores) & ~np.isnan(self.human_values)
+
+    def group_by(self, labels: Sequence[Any]) -> Dict[Any, CalibrationArrays]:
+        """Split the items by a label per item, e.g. a tag of their dataset item."""
+        keys = np.asarray(labels)
+        if len(keys) != len(self):
+            raise ValueError(f"Expected {len(self)} labels, got {len(keys)}")
+        unique, inverse = np.unique(keys, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(unique) + 1))
+        return {
+            key.item(): self[order[start:stop]] for key, start, stop in zip(unique, bounds, bounds[1:], strict=False)
+        }
+
+
+# Metrics of paired samples along the last axis, so that a 2-D stack of resamples is scored at once.
+
+
+def pearson(x: NDArray[np.float64], y: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Pearson correlation of ``x`` and ``y`` along the last axis; NaN where either is constant."""
+    dx = x - x.mean(axis=-1, keepdims=True)
+    dy = y - y.mean(axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (dx * dy).sum(axis=-1) / np.sqrt((dx * dx).sum(axis=-1) * (dy * dy).sum(axis=-1))
+
+
+def rank(x: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Ranks (from 1) along the last axis, ties getting the average of their ranks."""
+    x = np.atleast_2d(x)
+    n = x.shape[-1]
+    order = np.argsort(x, axis=-1, kind="stable")
+    ordered = np.take_along_axis(x, order, axis=-1)
+    positions = np.broadcast_to(np.arange(n), x.shape)
+    starts = np.ones(x.shape, dtype=bool)
+    starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    ends = np.ones(x.shape, dtype=bool)
+    ends[:, :-1] = starts[:, 1:]
+    # First and last position of the run of ties each position belongs to.
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=-1)
+    last = np.minimum.accumulate(np.where(ends, positions, n)[:, ::-1], axis=-1)[:, ::-1]
+    ranks = np.empty(x.shape)
+    np.put_along_axis(ranks, order, (first + last) / 2 + 1, axis=-1)
+    return ranks
+
+
+def spearman(x: NDArray[np.float64], y: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Spearman rank correlation of ``x`` and ``y`` along the last axis."""
+    result = pearson(rank(x), rank(y))
+    return result if np.ndim(x) > 1 else result[0]
+
+
+def mae(x: NDArray[np.float64], y: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Mean absolute error between ``x`` and ``y`` along the last axis."""
+    return np.abs(x - y).mean(axis=-1)
+
+
+def confusion_matrix(x: NDArray[np.float64], y: NDArray[np.float64], categories: Sequence[float]) -> NDArray[np.int64]:
+    """Counts of (``x`` category, ``y`` category) pairs along the last axis.
+
+    Values are assigned to the nearest category. The matrix is ``K x K`` for 1-D inputs and
+    ``R x K x K`` for ``R`` stacked samples.
+    """
+    centers = np.asarray(categories, dtype=np.float64)
+    k = len(centers)
+    a, b = _nearest(np.atleast_2d(x), centers), _nearest(np.atleast_2d(y), centers)
+    rows = np.arange(a.shape[0])[:, None] * k * k
+    counts = np.bincount((rows + a * k + b).ravel(), minlength=a.shape[0] * k * k)
+    matrix = counts.reshape(a.shape[0], k, k)
+    return matrix if np.ndim(x) > 1 else matrix[0]
+
+
+def kappa(
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    categories: Sequence[float],
+    weights: Optional[Literal["linear", "quadratic"]] = None,
+) -> NDArray[np.float64]:
+    """Cohen's kappa of ``x`` and ``y`` along the last axis, weighted by category distance if ``weights`` is set."""
+    k = len(categories)
+    observed = confusion_matrix(np.atleast_2d(x), np.atleast_2d(y), categories).astype(np.float64)
+    total = observed.sum(axis=(-2, -1), keepdims=True)
+    expected = observed.sum(axis=-1, keepdims=True) * observed.sum(axis=-2, keepdims=True) / total
+    distance = np.abs(np.subtract.outer(np.arange(k), np.arange(k))) / max(k - 1, 1)
+    if weights is None:
+        cost = (distance > 0).astype(np.float64)
+    elif weights == "linear":
+        cost = distance
+    elif weights == "quadratic":
+        cost = distance**2
+    else:
+        raise ValueError(f"Unknown kappa weights {weights!r}; choose from None, 'linear' and 'quadratic'")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = 1 - (cost * observed).sum(axis=(-2, -1)) / (cost * expected).sum(axis=(-2, -1))
+    return result if np.ndim(x) > 1 else result[0]
+
+
+def _nearest(values: NDArray[np.float64], centers: NDArray[np.float64]) -> NDArray[np.int64]:
+    order = np.argsort(centers)
+    ordered = centers[order]
+    midpoints = (ordered[1:] + ordered[:-1]) / 2
+    return order[np.searchsorted(midpoints, values)]
+
+
+@dataclass(frozen=True)
+class Estimate:
+    """A metric and its bootstrap confidence interval."""
+
+    value: float
+    low: float
+    high: float
+
+
+def bootstrap(
+    metric: Callable[[NDArray[np.float64], NDArray[np.float64]], NDArray[np.float64]],
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    *,
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    seed: Optional[int] = None,
+) -> Estimate:
+    """A metric of paired samples with its percentile bootstrap confidence interval.
+
+    ``metric`` must accept 2-D stacks of resamples, as the metrics of this module do.
+    """
+    n = len(x)
+    if n == 0:
+        return Estimate(float("nan"), float("nan"), float("nan"))
+    value = float(metric(x[None, :], y[None, :])[0])
+    if n < 2 or n_resamples < 1:
+        return Estimate(value, float("nan"), float("nan"))
+    rng = np.random.default_rng(seed)
+    per_chunk = max(1, _BOOTSTRAP_CHUNK // n)
+    scores = []
+    for start in range(0, n_resamples, per_chunk):
+        indices = rng.integers(0, n, size=(min(per_chunk, n_resamples - start), n))
+        scores.append(metric(x[indices], y[indices]))
+    alpha = (1 - confidence) / 2
+    low, high = np.nanquantile(np.concatenate(scores), [alpha, 1 - alpha])
+    return Estimate(value, float(low), float(high))
+
+
+@dataclass(frozen=True)
+class AgreementReport:
+    """Agreement of evaluator scores with human values, over the items scored by both."""
+
+    n: int
+    pearson: Estimate
+    spearman: Estimate
+    mae: Estimate
+    #: Categories of a categorical score config, when given.
+    categories: Optional[Sequence[float]] = None
+    kappa: Optional[Estimate] = None
+    weighted_kappa: Optional[Estimate] = None
+    #: Counts of (evaluator category, human category) pairs.
+    confusion: Optional[NDArray[np.int64]] = field(default=None, compare=False)
+
+
+def agreement(
+    arrays: CalibrationArrays,
+    *,
+    categories: Optional[Sequence[float]] = None,
+    weights: Literal["linear", "quadratic"] = "quadratic",
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    seed: Optional[int] = None,
+) -> AgreementReport:
+    """
+    Compute the agreement metrics of calibration items, with bootstrap confidence intervals.
+
+    Args:
+      arrays: Items to analyse; those without an evaluator score or a human value are left out.
+      categories: Values of a categorical score config; enables kappa and the confusion matrix.
+      weights: Weighting of ``weighted_kappa`` by the distance between categories.
+      n_resamples: Bootstrap resamples; 0 to skip the confidence intervals.
+      confidence: Coverage of the confidence intervals.
+      seed: Seed of the resampling, for reproducible intervals.
+    """
+    scored = arrays.scored
+    x, y = arrays.evaluator_scores[scored], arrays.human_values[scored]
+    options: Dict[str, Any] = {"n_resamples": n_resamples, "confidence": confidence, "seed": seed}
+    report = AgreementReport(
+        n=len(x),
+        pearson=bootstrap(pearson, x, y, **options),
+        spearman=bootstrap(spearman, x, y, **options),
+        mae=bootstrap(mae, x, y, **options),
+    )
+    if categories is None:
+        return report
+    return AgreementReport(
+        n=report.n,
+        pearson=report.pearson,
+        spearman=report.spearman,
+        mae=report.mae,
+        categories=tuple(categories),
+        kappa=bootstrap(lambda a, b: kappa(a, b, categories), x, y, **options),
+        weighted_kappa=bootstrap(lambda a, b: kappa(a, b, categories, weights), x, y, **options),
+        confusion=confusion_matrix(x, y, categories),
+    )
+
+
+@dataclass(frozen=True)
+class Threshold:
+    """The confusion counts and metrics of passing the scores at or above ``threshold``."""
+
+    threshold: float
+    true_positives: int
+    false_positives: int
+    false_negatives: int
+    true_negatives: int
+    precision: float
+    recall: float
+    f1: float
+    false_positive_rate: float
+    cost: float
+
+
+@dataclass(frozen=True)
+class ThresholdCurve:
+    """Confusion counts for every candidate threshold, from the highest score down.
+
+    Scores at or above a threshold pass. The first threshold is ``inf``, where nothing passes.
+    """
+
+    thresholds: NDArray[np.float64]
+    true_positives: NDArray[np.int64]
+    false_positives: NDArray[np.int64]
+    positives: int
+    negatives: int
+
+    @property
+    def false_negatives(self) -> NDArray[np.int64]:
+        return self.positives - self.true_positives
+
+    @property
+    def true_negatives(self) -> NDArray[np.int64]:
+        return self.negatives - self.false_positives
+
+    @property
+    def precision(self) -> NDArray[np.float64]:
+        """Precision, 1 where nothing passes."""
+        predicted = self.true_positives + self.false_positives
+        return np.divide(self.true_positives, predicted, out=np.ones(len(self.thresholds)), where=predicted > 0)
+
+    @property
+    def recall(self) -> NDArray[np.float64]:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.true_positives / self.positives
+
+    @property
+    def f1(self) -> NDArray[np.float64]:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return 2 * self.true_positives / (self.true_positives + self.positives + self.false_positives)
+
+    @property
+    def false_positive_rate(self) -> NDArray[np.float64]:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.false_positives / self.negatives
+
+    def cost(self, false_positive_cost: float = 1.0, false_negative_cost: float = 1.0) -> NDArray[np.float64]:
+        """Total cost of the errors at every threshold."""
+        return false_positive_cost * self.false_positives + false_negative_cost * self.false_negatives
+
+    def roc_auc(self) -> float:
+        """Area under the ROC curve."""
+        fpr, tpr = self.false_positive_rate, self.recall
+        return float((np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2).sum())
+
+    def at(self, index: int, false_positive_cost: float = 1.0, false_negative_cost: float = 1.0) -> Threshold:
+        """The threshold at ``index`` of the curve."""
+        return Threshold(
+            threshold=float(self.thresholds[index]),
+            true_positives=int(self.true_positives[index]),
+            false_positives=int(self.false_positives[index]),
+            false_negatives=int(self.false_negatives[index]),
+            true_negatives=int(self.true_negatives[index]),
+            precision=float(self.precision[index]),
+            recall=float(self.recall[index]),
+            f1=float(self.f1[index]),
+            false_positive_rate=float(self.false_positive_rate[index]),
+            cost=float(self.cost(false_positive_cost, false_negative_cost)[index]),
+        )
+
+    def best(
+        self,
+        objective: Literal["f1", "cost", "youden"] = "f1",
+        *,
+        false_positive_cost: float = 1.0,
+        false_negative_cost: float = 1.0,
+        min_precision: float = 0.0,
+    ) -> Threshold:
+        """
+        The threshold optimizing ``objective``, the highest one on ties.
+
+        Args:
+          objective: Maximize F1, minimize the cost of errors, or maximize Youden's J (recall minus false
+            positive rate).
+          false_positive_cost: Cost of passing a negative, for the ``cost`` objective.
+          false_negative_cost: Cost of failing a positive, for the ``cost`` objective.
+          min_precision: Only consider the thresholds reaching this precision.
+        """
+        if objective == "f1":
+            score = self.f1
+        elif objective == "cost":
+            score = -self.cost(false_positive_cost, false_negative_cost)
+        elif objective == "youden":
+            score = self.recall - self.false_positive_rate
+        else:
+            raise ValueError(f"Unknown objective {objective!r}; choose from 'f1', 'cost' and 'youden'")
+        score = np.where(self.precision >= min_precision, np.nan_to_num(score, nan=-np.inf), -np.inf)
+        return self.at(int(np.argmax(score)), false_positive_cost, false_negative_cost)
+
+
+def threshold_curve(scores: Any, labels: Any) -> ThresholdCurve:
+    """
+    Sweep every distinct score as a pass threshold, in O(n log n).
+
+    Args:
+      scores: Evaluator scores.
+      labels: Whether a human judged each item a pass, e.g. ``human_values >= 0.5`` of calibration
+        items or the categories of annotations.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    labels = np.asarray(labels, dtype=bool)
+    if scores.shape != labels.shape or scores.ndim != 1:
+        raise ValueError(f"Expected scores and labels of the same length, got shapes {scores.shape} and {labels.shape}")
+    order = np.argsort(-scores, kind="stable")
+    ordered = scores[order]
+    true_positives = np.cumsum(labels[order])
+    false_positives = np.arange(1, len(scores) + 1) - true_positives
+    # The counts at each threshold are those after its last occurrence.
+    last = np.append(ordered[1:] != ordered[:-1], True) if len(scores) else np.zeros(0, dtype=bool)
+    return ThresholdCurve(
+        thresholds=np.append(np.inf, ordered[last]),
+        true_positives=np.append(0, true_positives[last]),
+        false_positives=np.append(0, false_positives[last]),
+        positives=int(labels.sum()),
+        negatives=int(len(labels) - labels.sum()),
+    )
+
+
+def recommend_thresholds(
+    runs: Mapping[str, CalibrationArrays],
+    *,
+    passing: float = 0.5,
+    objective: Literal["f1", "cost", "youden"] = "f1",
+    false_positive_cost: float = 1.0,
+    false_negative_cost: float = 1.0,
+    min_precision: float = 0.0,
+) -> Dict[str, Threshold]:
+    """
+    Recommend a pass threshold per score config from the items of its calibration runs.
+
+    Args:
+      runs: Calibration items by score config, e.g. keyed by ``CalibrationRun.score_config``.
+      passing: Human values at or above which an item is a pass.
+      objective: See :meth:`ThresholdCurve.best`.
+      false_positive_cost: See :meth:`ThresholdCurve.best`.
+      false_negative_cost: See :meth:`ThresholdCurve.best`.
+      min_precision: See :meth:`ThresholdCurve.best`.
+    """
+    recommended = {}
+    for score_config, arrays in runs.items():
+        scored = arrays[arrays.scored]
+        curve = threshold_curve(scored.evaluator_scores, scored.human_values >= passing)
+        recommended[score_config] = curve.best(
+            objective,
+            false_positive_cost=false_positive_cost,
+            false_negative_cost=false_negative_cost,
+            min_precision=min_precision,
+        )
+    return recommended
@@ -2,28 +2,24 @@ from __future__ import annotations
 
 from contextlib import AbstractAsyncContextManager
 from functools import partial
-from typing import AsyncIterator, Iterator, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Optional
 
 from pydantic import StrictStr
 
-from .generated.openapi_aclient import ApiClient as AApiClient
-from .generated.openapi_aclient.api.annotations_api import AnnotationsApi as AAnnotationsApi
-from .generated.openapi_aclient.models.annotation import Annotation as AAnnotation
-from .generated.openapi_aclient.models.annotation_request import AnnotationRequest as AAnnotationRequest
-from .generated.openapi_aclient.models.annotation_status_enum import AnnotationStatusEnum as AAnnotationStatusEnum
-from .generated.openapi_aclient.models.paginated_annotation_list import (
-    PaginatedAnnotationList as APaginatedAnnotationList,
-)
-from .generated.openapi_aclient.models.patched_annotation_request import (
-    PatchedAnnotationRequest as APatchedAnnotationRequest,
-)
 from .generated.openapi_client import ApiClient
 from .generated.openapi_client.api.annotations_api import AnnotationsApi
 from .generated.openapi_client.models.annotation import Annotation
 from .generated.openapi_client.models.annotation_request import AnnotationRequest
 from .generated.openapi_client.models.annotation_status_enum import AnnotationStatusEnum
+from .generated.openapi_client.models.paginated_annotation_list import PaginatedAnnotationList
 from .generated.openapi_client.models.patched_annotation_request import PatchedAnnotationRequest
-from .utils import ClientContextCallable, iterate_cursor_list, with_async_client, with_sync_client
+from .utils import ClientContextCallable, LazyImport, iterate_cursor_list, with_async_client, with_sync_client
+
+if TYPE_CHECKING:
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.annotations_api import AnnotationsApi as AAnnotationsApi
+else:
+    AAnnotationsApi = LazyImport("scorable.generated.openapi_aclient.api.annotations_api", "AnnotationsApi")
 
 
 def _one_target(dataset_item_id: Optional[str], execution_log_id: Optional[str]) -> None:
@@ -100,18 +96,18 @@ class Annotations:
         score_config_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AAnnotation:
+    ) -> Annotation:
         """Asynchronously create an annotation."""
 
         _one_target(dataset_item_id, execution_log_id)
-        request = AAnnotationRequest(
+        request = AnnotationRequest(
             dataset_item=dataset_item_id,
             execution_log=execution_log_id,
             score_config=score_config_id,
             value=value,
             category=category,
             rationale=rationale,
-            status=AAnnotationStatusEnum(status),
+            status=AnnotationStatusEnum(status),
         )
         api_instance = AAnnotationsApi(_client)
         return await api_instance.annotations_create(annotation_request=request, _request_timeout=_request_timeout)
@@ -126,7 +122,7 @@ class Annotations:
     @with_async_client
     async def aget(
         self, annotation_id: str, *, _request_timeout: Optional[int] = None, _client: AApiClient
-    ) -> AAnnotation:
+    ) -> Annotation:
         """Asynchronously get an annotation by ID."""
 
         api_instance = AAnnotationsApi(_client)
@@ -177,7 +173,7 @@ class Annotations:
         dataset_item: Optional[str] = None,
         execution_log: Optional[str] = None,
         limit: int = 100,
-    ) -> AsyncIterator[AAnnotation]:
+    ) -> AsyncIterator[Annotation]:
         """Asynchronously iterate through annotations."""
 
         context = self.client_context()
@@ -194,7 +190,7 @@ class Annotations:
             )
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedAnnotationList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedAnnotationList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
                 used_results = result.results[:limit]
@@ -240,14 +236,14 @@ class Annotations:
         status: Optional[str] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AAnnotation:
+    ) -> Annotation:
         """Asynchronously update an annotation."""
 
-        request = APatchedAnnotationRequest(
+        request = PatchedAnnotationRequest(
             value=value,
             category=category,
             rationale=rationale,
-            status=AAnnotationStatusEnum(status) if status is not None else None,
+            status=AnnotationStatusEnum(status) if status is not None else None,
         )
         api_instance = AAnnotationsApi(_client)
         return await api_instance.annotations_partial_update(
@@ -0,0 +1,257 @@
+"""Run the asynchronous transport on a background event loop for synchronous callers.
+
+With ``Scorable(background_loop=True)`` the synchronous methods do not open a
+urllib3 pool per call; each request is submitted as a coroutine to a single
+event loop running in a daemon thread, and the calling thread blocks on the
+resulting future. All threads then share one aiohttp connection pool, and
+``Scorable.submit`` can schedule many asynchronous calls from synchronous code
+without a thread per call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import os
+import threading
+import weakref
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import TYPE_CHECKING, Any, Awaitable, Coroutine, Mapping, NamedTuple, Optional, TypeVar
+
+from .__about__ import __version__
+
+if TYPE_CHECKING:
+    from .generated import openapi_aclient, openapi_client
+
+T = TypeVar("T")
+
+
+class BackgroundLoop:
+    """An asyncio event loop running forever in a daemon thread."""
+
+    def __init__(self, name: str = "scorable-background-loop") -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def in_loop_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Schedule a coroutine on the loop and return a future for its result."""
+        if self._loop.is_closed():
+            coro.close()
+            raise RuntimeError("The background loop is closed")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop and block until it finishes."""
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("Blocking on the background loop from its own thread would deadlock")
+        return self.submit(coro).result()
+
+    def close(self, cleanup: Optional[Awaitable[Any]] = None) -> None:
+        """Optionally await ``cleanup`` on the loop, then stop it and join the thread."""
+        if self._loop.is_closed():
+            return
+        if cleanup is not None:
+
+            async def _cleanup() -> None:
+                await cleanup
+
+            self.run(_cleanup())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class _BufferedResponse(NamedTuple):
+    # The attributes the synchronous RESTResponse reads from a urllib3 response.
+    status: int
+    reason: Optional[str]
+    data: bytes
+    headers: Mapping[str, str]
+
+
+def _aiohttp_timeout(timeout: Any) -> Any:
+    import aiohttp
+
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return aiohttp.ClientTimeout(connect=connect, sock_read=read)
+    return timeout
+
+
+class LoopRESTClient:
+    """Synchronous stand-in for ``openapi_client.rest.RESTClientObject``.
+
+    Requests are executed by the asynchronous REST client on the background loop;
+    the body is read there and handed back as a synchronous ``RESTResponse``.
+    """
+
+    def __init__(self, loop: BackgroundLoop, rest_client: Any) -> None:
+        self._loop = loop
+        self._rest_client = rest_client
+
+    async def _request(self, context: contextvars.Context, *args: Any, **kwargs: Any) -> _BufferedResponse:
+        # Run in the caller's context, so that context variables (e.g. the timing of the
+        # request by scorable.instrumentation) carry over to the loop thread.
+        for var, value in context.items():
+            var.set(value)
+        response = await self._rest_client.request(*args, **kwargs)
+        data = await response.read()
+        return _BufferedResponse(response.status, response.reason, data, response.getheaders())
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        body: Any = None,
+        post_params: Any = None,
+        _request_timeout: Any = None,
+    ) -> Any:
+        from .generated.openapi_client import rest
+
+        buffered = self._loop.run(
+            self._request(
+                contextvars.copy_context(),
+                method,
+                url,
+                headers=headers,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_aiohttp_timeout(_request_timeout),
+            )
+        )
+        return rest.RESTResponse(buffered)
+
+
+class _SharedClientContext(AbstractContextManager, AbstractAsyncContextManager):
+    # Usable both with ``with`` (synchronous methods) and ``async with`` (asynchronous
+    # methods awaited on the background loop); neither closes the shared clients.
+
+    def __init__(self, transport: BackgroundTransport) -> None:
+        self._transport = transport
+
+    def __enter__(self) -> openapi_client.ApiClient:
+        return self._transport.sync_client()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    async def __aenter__(self) -> openapi_aclient.ApiClient:
+        return self._transport.async_client()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class BackgroundTransport:
+    """One asynchronous API client on a background loop, shared by all calls of a ``Scorable``."""
+
+    def __init__(self, configure: Any, instrument: Optional[Any] = None) -> None:
+        # ``configure(config_cls)`` returns a configuration for the given generated client;
+        # ``instrument(api_client)`` installs request hooks on a new one.
+        self._configure = configure
+        self._instrument = instrument
+        self._lock = threading.Lock()
+        self._loop: Optional[BackgroundLoop] = None
+        self._async_client: Optional[openapi_aclient.ApiClient] = None
+        self._sync_client: Optional[openapi_client.ApiClient] = None
+        _transports.add(self)
+
+    def _after_fork(self) -> None:
+        # The loop thread did not survive the fork and the pooled sockets belong to the
+        # parent. Keep the inherited objects referenced so that they are never closed or
+        # garbage collected here, and let the next call build a fresh loop and pool.
+        _abandoned.append((self._loop, self._async_client, self._sync_client))
+        self._lock = threading.Lock()
+        self._loop = None
+        self._async_client = None
+        self._sync_client = None
+
+    @property
+    def loop(self) -> BackgroundLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = BackgroundLoop()
+            return self._loop
+
+    def async_client(self) -> openapi_aclient.ApiClient:
+        # The aiohttp session must be created, and used, on the loop it belongs to.
+        if self._loop is None or not self._loop.in_loop_thread():
+            raise RuntimeError(
+                "Asynchronous methods of a background loop client must be scheduled with Scorable.submit()"
+            )
+        if self._async_client is None:
+            from .generated import openapi_aclient
+            from .generated.openapi_aclient.configuration import Configuration
+
+            client = openapi_aclient.ApiClient(self._configure(Configuration))
+            client.user_agent = f"rs-python-sdk/{__version__}"
+            if self._instrument is not None:
+                self._instrument(client)
+            self._async_client = client
+        return self._async_client
+
+    def sync_client(self) -> openapi_client.ApiClient:
+        with self._lock:
+            if self._sync_client is not None:
+                return self._sync_client
+        loop = self.loop
+
+        async def _rest_client() -> Any:
+            return self.async_client().rest_client
+
+        rest_client = loop.run(_rest_client())
+
+        from .generated import openapi_client
+        from .generated.openapi_client.configuration import Configuration
+
+        client = openapi_client.ApiClient(self._configure(Configuration))
+        client.user_agent = f"rs-python-sdk/{__version__}"
+        client.rest_client = LoopRESTClient(loop, rest_client)  # type: ignore[assignment]
+        if self._instrument is not None:
+            self._instrument(client)
+        with self._lock:
+            if self._sync_client is None:
+                self._sync_client = client
+            return self._sync_client
+
+    def client_context(self) -> _SharedClientContext:
+        return _SharedClientContext(self)
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        return self.loop.submit(coro)
+
+    def close(self) -> None:
+        with self._lock:
+            loop, self._loop = self._loop, None
+            async_client, self._async_client = self._async_client, None
+            self._sync_client = None
+        if loop is not None:
+            loop.close(async_client.close() if async_client is not None else None)
+
+
+_transports: weakref.WeakSet[BackgroundTransport] = weakref.WeakSet()
+_abandoned: list = []
+
+
+def _reset_after_fork() -> None:
+    for transport in list(_transports):
+        transport._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
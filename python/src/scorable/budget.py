@@ -0,0 +1,277 @@
+"""Run evaluators within a latency budget.
+
+A :class:`BudgetScheduler` launches a set of evaluators concurrently and
+returns whatever finished by the deadline; stragglers are cancelled and
+reported with the default score of their evaluator. Before launching, it looks
+up the latency of each evaluator in :class:`LatencyProfiles` and runs the first
+variant expected to fit in the budget, e.g. ``Faithfulness_Swift`` when
+``Faithfulness`` usually takes too long, or skips the evaluator if none fits::
+
+  scheduler = client.evaluators.budget_scheduler()
+  outcome = scheduler.run(
+      [Budgeted("Faithfulness", variants=["Faithfulness_Swift"], default=1.0), "Toxicity"],
+      budget=0.3,
+      request=question,
+      response=answer,
+  )
+  print(outcome.scores, outcome.timed_out)
+
+Profiles learn from every call the scheduler makes, and can be seeded from the
+``evaluator_latencies`` of execution logs with :meth:`LatencyProfiles.learn_from_log`.
+The synchronous :meth:`BudgetScheduler.run` cannot interrupt a request in
+flight; it stops waiting for it at the deadline, and the request is bounded by
+a request timeout of the budget rounded up to whole seconds. Each run has threads
+of its own, so that stragglers of earlier runs never delay it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+if TYPE_CHECKING:
+    from .generated.openapi_client.models.evaluator_execution_result import EvaluatorExecutionResult
+    from .generated.openapi_client.models.execution_log_details import ExecutionLogDetails
+    from .skills import Evaluators
+
+#: The evaluator or variant to launch, and the seconds it may take.
+_Plan = Tuple[str, float]
+
+
+class LatencyProfiles:
+    """Recent latencies of evaluators, by evaluator ID.
+
+    Evaluators may be given by ID or preset name (e.g. ``"Faithfulness_Swift"``), which stands for
+    the ID of the preset.
+
+    Args:
+      window: Latencies kept per evaluator.
+      quantile: Quantile of the kept latencies that an evaluator is expected to finish within.
+    """
+
+    def __init__(self, window: int = 200, quantile: float = 0.9):
+        if window < 1 or not 0 < quantile <= 1:
+            raise ValueError("window must be positive and quantile within (0, 1]")
+        self.window = window
+        self.quantile = quantile
+        self._latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.window))
+        self._lock = threading.Lock()
+
+    def record(self, evaluator: str, seconds: float) -> None:
+        from .skills import _evaluator_id
+
+        with self._lock:
+            self._latencies[_evaluator_id(evaluator)].append(seconds)
+
+    def learn_from_log(self, log: ExecutionLogDetails, ids: Optional[Mapping[str, str]] = None) -> None:
+        """Record the ``evaluator_latencies`` (in seconds) of an execution log, e.g. a judge execution.
+
+        Args:
+          log: The execution log.
+          ids: Evaluator IDs by evaluator name. Logs name their evaluators, so the latencies of
+            evaluators that are neither in ``ids`` nor presets are kept under their name.
+        """
+        for latency in log.evaluator_latencies or ():
+            if latency.evaluator_name is not None and latency.duration is not None:
+                name = latency.evaluator_name
+                self.record(name if ids is None else ids.get(name, name), latency.duration)
+
+    def estimate(self, evaluator: str) -> Optional[float]:
+        """The expected latency of an evaluator, or None if it has not been observed."""
+        from .skills import _evaluator_id
+
+        with self._lock:
+            latencies = sorted(self._latencies.get(_evaluator_id(evaluator), ()))
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, math.ceil(self.quantile * len(latencies)) - 1)]
+
+
+@dataclass(frozen=True)
+class Budgeted:
+    """An evaluator to schedule, with its fallbacks.
+
+    Args:
+      evaluator: Evaluator ID or preset name, which also names the evaluator in the outcome.
+      variants: Faster evaluators to run instead, in order of preference, when this one is not
+        expected to fit in the budget.
+      default: Score reported when no variant finishes in time.
+      timeout: Seconds the evaluator may take at most, if less than the budget.
+    """
+
+    evaluator: str
+    variants: Sequence[str] = ()
+    default: Optional[float] = None
+    timeout: Optional[float] = None
+
+
+@dataclass
+class BudgetOutcome:
+    """What a budgeted run returned, by the name of each scheduled evaluator."""
+
+    #: Results that finished in time.
+    results: Dict[str, EvaluatorExecutionResult] = field(default_factory=dict)
+    #: The scores of the results, or the default scores of the other evaluators.
+    scores: Dict[str, Optional[float]] = field(default_factory=dict)
+    #: The evaluator or variant launched for each scheduled evaluator.
+    launched: Dict[str, str] = field(default_factory=dict)
+    #: Evaluators cancelled at their deadline.
+    timed_out: List[str] = field(default_factory=list)
+    #: Evaluators not launched because no variant was expected to fit in the budget.
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, BaseException] = field(default_factory=dict)
+    #: Seconds from launch until the outcome was returned.
+    elapsed: float = 0.0
+
+
+class BudgetScheduler:
+    """Launch evaluators concurrently and keep the results that arrive within a budget.
+
+    Create it with :meth:`scorable.skills.Evaluators.budget_scheduler`.
+
+    Args:
+      evaluators: The evaluators API that runs the evaluators.
+      profiles: Latency profiles that decide which variants to launch, updated with every call.
+    """
+
+    def __init__(self, evaluators: Evaluators, profiles: Optional[LatencyProfiles] = None):
+        self._evaluators = evaluators
+        self.profiles = LatencyProfiles() if profiles is None else profiles
+
+    def _plan(self, specs: Sequence[Union[str, Budgeted]], budget: float, outcome: BudgetOutcome) -> Dict[str, _Plan]:
+        planned: Dict[str, _Plan] = {}
+        for spec in specs:
+            spec = Budgeted(spec) if isinstance(spec, str) else spec
+            if spec.evaluator in planned or spec.evaluator in outcome.skipped:
+                raise ValueError(f"{spec.evaluator} is scheduled more than once")
+            limit = budget if spec.timeout is None else min(budget, spec.timeout)
+            for candidate in (spec.evaluator, *spec.variants):
+                expected = self.profiles.estimate(candidate)
+                if expected is None or expected < limit:
+                    outcome.launched[spec.evaluator] = candidate
+                    planned[spec.evaluator] = (candidate, limit)
+                    break
+            else:
+                outcome.skipped.append(spec.evaluator)
+            outcome.scores[spec.evaluator] = spec.default
+        return planned
+
+    def _call(self, candidate: str, limit: float, arguments: Dict[str, Any]) -> EvaluatorExecutionResult:
+        from .skills import _evaluator_id
+
+        start = time.perf_counter()
+        try:
+            return self._evaluators.run(_evaluator_id(candidate), _request_timeout=math.ceil(limit), **arguments)
+        finally:
+            self.profiles.record(candidate, time.perf_counter() - start)
+
+    async def _acall(self, candidate: str, limit: float, arguments: Dict[str, Any]) -> EvaluatorExecutionResult:
+        from .skills import _evaluator_id
+
+        start = time.perf_counter()
+        at_least = 0.0
+        try:
+            return await self._evaluators.arun(_evaluator_id(candidate), _request_timeout=math.ceil(limit), **arguments)
+        except asyncio.CancelledError:
+            # Cancelled at its deadline: the profile learns that the variant did not fit.
+            at_least = limit
+            raise
+        finally:
+            self.profiles.record(candidate, max(at_least, time.perf_counter() - start))
+
+    def _settle(self, outcome: BudgetOutcome, name: str, done: Union[Future, asyncio.Future]) -> None:
+        error = done.exception()
+        if error is not None:
+            outcome.failed[name] = error
+        else:
+            outcome.results[name] = done.result()
+            outcome.scores[name] = outcome.results[name].score
+
+    def run(self, evaluators: Sequence[Union[str, Budgeted]], budget: float, **arguments: Any) -> BudgetOutcome:
+        """
+        Run evaluators on an input, returning what finished within ``budget`` seconds.
+
+        Args:
+          evaluators: Evaluator IDs or preset names, or :class:`Budgeted` evaluators with variants and
+            defaults.
+          budget: Seconds from now until the deadline.
+          arguments: Keyword arguments of :meth:`scorable.skills.Evaluators.run`.
+        """
+        started = time.perf_counter()
+        outcome = BudgetOutcome()
+        planned = self._plan(evaluators, budget, outcome)
+        if not planned:
+            return outcome
+        # A thread per evaluator, not shared with other runs: stragglers keep theirs until their
+        # request times out, and are left behind when the run returns.
+        pool = ThreadPoolExecutor(len(planned), thread_name_prefix="scorable-budget")
+        try:
+            futures: Dict[Future, str] = {
+                pool.submit(self._call, candidate, limit, arguments): name
+                for name, (candidate, limit) in planned.items()
+            }
+            pending = set(futures)
+            while pending:
+                remaining = min(started + planned[futures[f]][1] for f in pending) - time.perf_counter()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._settle(outcome, futures[future], future)
+                self._expire(pending, futures, planned, started, outcome)
+            self._expire(pending, futures, planned, started, outcome, everything=True)
+        finally:
+            pool.shutdown(wait=False)
+        outcome.elapsed = time.perf_counter() - started
+        return outcome
+
+    def _expire(
+        self,
+        pending: Set[Any],
+        futures: Dict[Any, str],
+        planned: Dict[str, _Plan],
+        started: float,
+        outcome: BudgetOutcome,
+        *,
+        everything: bool = False,
+    ) -> None:
+        # Cancels the evaluators past their deadline (all of them at the end of the budget).
+        now = time.perf_counter()
+        for future in [f for f in pending if everything or started + planned[futures[f]][1] <= now]:
+            pending.discard(future)
+            future.cancel()
+            outcome.timed_out.append(futures[future])
+
+    async def arun(self, evaluators: Sequence[Union[str, Budgeted]], budget: float, **arguments: Any) -> BudgetOutcome:
+        """
+        Asynchronously run evaluators on an input, returning what finished within ``budget`` seconds.
+
+        Stragglers are cancelled. See :meth:`run` for the parameters.
+        """
+        started = time.perf_counter()
+        outcome = BudgetOutcome()
+        planned = self._plan(evaluators, budget, outcome)
+        tasks: Dict[asyncio.Task, str] = {
+            asyncio.ensure_future(self._acall(candidate, limit, arguments)): name
+            for name, (candidate, limit) in planned.items()
+        }
+        pending = set(tasks)
+        while pending:
+            remaining = min(started + planned[tasks[t]][1] for t in pending) - time.perf_counter()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                self._settle(outcome, tasks[task], task)
+            self._expire(pending, tasks, planned, started, outcome)
+        self._expire(pending, tasks, planned, started, outcome, everything=True)
+        # Let the cancellations land, so that the stragglers are recorded in the profiles.
+        await asyncio.gather(*(task for task in tasks if not task.done()), return_exceptions=True)
+        outcome.elapsed = time.perf_counter() - started
+        return outcome
@@ -1,38 +1,57 @@
 from __future__ import annotations
 
 from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
 from functools import partial
-from typing import AsyncIterator, Iterator, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Iterator, List, Optional
 
 from pydantic import StrictStr
 
-from .generated.openapi_aclient import ApiClient as AApiClient
-from .generated.openapi_aclient.api.calibration_runs_api import CalibrationRunsApi as ACalibrationRunsApi
-from .generated.openapi_aclient.models.calibration_run import CalibrationRun as ACalibrationRun
-from .generated.openapi_aclient.models.calibration_run_create_request import (
-    CalibrationRunCreateRequest as ACalibrationRunCreateRequest,
-)
-from .generated.openapi_aclient.models.calibration_run_item import CalibrationRunItem as ACalibrationRunItem
-from .generated.openapi_aclient.models.calibration_run_source_request import (
-    CalibrationRunSourceRequest as ACalibrationRunSourceRequest,
-)
-from .generated.openapi_aclient.models.calibration_source_type_enum import (
-    CalibrationSourceTypeEnum as ACalibrationSourceTypeEnum,
-)
-from .generated.openapi_aclient.models.paginated_calibration_run_item_list import (
-    PaginatedCalibrationRunItemList as APaginatedCalibrationRunItemList,
-)
-from .generated.openapi_aclient.models.paginated_calibration_run_list import (
-    PaginatedCalibrationRunList as APaginatedCalibrationRunList,
-)
-from .generated.openapi_client import ApiClient
-from .generated.openapi_client.api.calibration_runs_api import CalibrationRunsApi
-from .generated.openapi_client.models.calibration_run import CalibrationRun
-from .generated.openapi_client.models.calibration_run_create_request import CalibrationRunCreateRequest
-from .generated.openapi_client.models.calibration_run_item import CalibrationRunItem
-from .generated.openapi_client.models.calibration_run_source_request import CalibrationRunSourceRequest
-from .generated.openapi_client.models.calibration_source_type_enum import CalibrationSourceTypeEnum
-from .utils import ClientContextCallable, iterate_cursor_list, with_async_client, with_sync_client
+from .polling import apoll_until_done, poll_until_done
+from .utils import ClientContextCallable, LazyImport, iterate_cursor_list, with_async_client, with_sync_client
+
+if TYPE_CHECKING:
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.calibration_runs_api import CalibrationRunsApi as ACalibrationRunsApi
+    from .generated.openapi_client import ApiClient
+    from .generated.openapi_client.api.calibration_runs_api import CalibrationRunsApi
+    from .generated.openapi_client.models.calibration_run import CalibrationRun
+    from .generated.openapi_client.models.calibration_run_create_request import CalibrationRunCreateRequest
+    from .generated.openapi_client.models.calibration_run_item import CalibrationRunItem
+    from .generated.openapi_client.models.calibration_run_source_request import CalibrationRunSourceRequest
+    from .generated.openapi_client.models.calibration_source_type_enum import CalibrationSourceTypeEnum
+    from .generated.openapi_client.models.paginated_calibration_run_item_list import PaginatedCalibrationRunItemList
+    from .generated.openapi_client.models.paginated_calibration_run_list import PaginatedCalibrationRunList
+else:
+    ACalibrationRunsApi = LazyImport(
+        "scorable.generated.openapi_aclient.api.calibration_runs_api", "CalibrationRunsApi"
+    )
+    CalibrationRunsApi = LazyImport("scorable.generated.openapi_client.api.calibration_runs_api", "CalibrationRunsApi")
+    CalibrationRunCreateRequest = LazyImport(
+        "scorable.generated.openapi_client.models.calibration_run_create_request", "CalibrationRunCreateRequest"
+    )
+    CalibrationRunSourceRequest = LazyImport(
+        "scorable.generated.openapi_client.models.calibration_run_source_request", "CalibrationRunSourceRequest"
+    )
+    CalibrationSourceTypeEnum = LazyImport(
+        "scorable.generated.openapi_client.models.calibration_source_type_enum", "CalibrationSourceTypeEnum"
+    )
+
+#: Page size used to fetch all the items of a finished run.
+_ITEMS_PAGE_SIZE = 100
+
+
+@dataclass
+class FinishedCalibrationRun:
+    """A calibration run that completed or failed, as yielded by :meth:`CalibrationRuns.wait_runs`."""
+
+    run: CalibrationRun
+    #: Per-example results of a completed run, when requested with ``with_items``.
+    items: Optional[List[CalibrationRunItem]] = None
+
+
+def _finished(run: CalibrationRun) -> bool:
+    return run.status in ("completed", "failed")
 
 
 class CalibrationRuns:
@@ -40,8 +59,8 @@ class CalibrationRuns:
 
     A calibration run measures the agreement between an evaluator and the human annotations on a
     dataset, producing per-example results and aggregate metrics. Runs execute asynchronously: a
-    freshly created run has ``status="pending"``; poll :meth:`get` until it is ``completed`` or
-    ``failed`` to read its ``metrics``.
+    freshly created run has ``status="pending"``; :meth:`wait_runs` waits for any number of runs to
+    be ``completed`` or ``failed`` to read their ``metrics``.
 
     Note:
 
@@ -93,14 +112,14 @@ class CalibrationRuns:
         evaluator_version_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> ACalibrationRun:
+    ) -> CalibrationRun:
         """Asynchronously start a calibration run."""
 
-        request = ACalibrationRunCreateRequest(
+        request = CalibrationRunCreateRequest(
             evaluator_external_id=evaluator_id,
             evaluator_version_id=evaluator_version_id,
             score_config_id=score_config_id,
-            source=ACalibrationRunSourceRequest(type=ACalibrationSourceTypeEnum("dataset"), dataset_id=dataset_id),
+            source=CalibrationRunSourceRequest(type=CalibrationSourceTypeEnum("dataset"), dataset_id=dataset_id),
         )
         api_instance = ACalibrationRunsApi(_client)
         return await api_instance.calibration_runs_create(
@@ -115,9 +134,7 @@ class CalibrationRuns:
         return api_instance.calibration_runs_retrieve(id=run_id, _request_timeout=_request_timeout)
 
     @with_async_client
-    async def aget(
-        self, run_id: str, *, _request_timeout: Optional[int] = None, _client: AApiClient
-    ) -> ACalibrationRun:
+    async def aget(self, run_id: str, *, _request_timeout: Optional[int] = None, _client: AApiClient) -> CalibrationRun:
         """Asynchronously get a calibration run by ID."""
 
         api_instance = ACalibrationRunsApi(_client)
@@ -143,7 +160,7 @@ class CalibrationRuns:
             partial(api_instance.calibration_runs_list, evaluator_external_id=evaluator_id), limit=limit
         )
 
-    async def alist(self, *, evaluator_id: Optional[str] = None, limit: int = 100) -> AsyncIterator[ACalibrationRun]:
+    async def alist(self, *, evaluator_id: Optional[str] = None, limit: int = 100) -> AsyncIterator[CalibrationRun]:
         """Asynchronously iterate through calibration runs."""
 
         context = self.client_context()
@@ -153,7 +170,7 @@ class CalibrationRuns:
             partial_list = partial(api_instance.calibration_runs_list, evaluator_external_id=evaluator_id)
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedCalibrationRunList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedCalibrationRunList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
                 used_results = result.results[:limit]
@@ -170,7 +187,7 @@ class CalibrationRuns:
         api_instance = CalibrationRunsApi(_client)
         yield from iterate_cursor_list(partial(api_instance.calibration_runs_items_list, id=run_id), limit=limit)
 
-    async def alist_items(self, run_id: str, *, limit: int = 100) -> AsyncIterator[ACalibrationRunItem]:
+    async def alist_items(self, run_id: str, *, limit: int = 100) -> AsyncIterator[CalibrationRunItem]:
         """Asynchronously iterate through the per-example results of a calibration run."""
 
         context = self.client_context()
@@ -180,7 +197,7 @@ class CalibrationRuns:
             partial_list = partial(api_instance.calibration_runs_items_list, id=run_id)
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedCalibrationRunItemList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedCalibrationRunItemList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
                 used_results = result.results[:limit]
@@ -189,3 +206,97 @@ class CalibrationRuns:
                     yield used_result
                 if not (cursor := result.next):
                     return
+
+    @with_sync_client
+    def wait_runs(
+        self,
+        run_ids: Iterable[str],
+        *,
+        timeout: Optional[float] = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        with_items: bool = False,
+        _request_timeout: Optional[int] = None,
+        _client: ApiClient,
+    ) -> Iterator[FinishedCalibrationRun]:
+        """Wait for calibration runs to finish, yielding each as soon as it has completed or failed.
+
+        All runs are polled from one schedule: each run is polled again after a delay that doubles
+        from ``poll_interval`` up to ``max_poll_interval``, with jitter.
+
+        Args:
+          run_ids: IDs of the runs to wait for.
+          timeout: Seconds to wait at most; ``TimeoutError`` is raised for the runs still pending then.
+          poll_interval: Shortest delay between polls of a run, in seconds.
+          max_poll_interval: Longest delay between polls of a run, in seconds.
+          with_items: Fetch the per-example results of each completed run before yielding it.
+          _request_timeout: Optional timeout for each request
+        """
+
+        api_instance = CalibrationRunsApi(_client)
+        fetch = partial(api_instance.calibration_runs_retrieve, _request_timeout=_request_timeout)
+        for run in poll_until_done(
+            run_ids,
+            lambda run_id: fetch(id=run_id),
+            _finished,
+            min_interval=poll_interval,
+            max_interval=max_poll_interval,
+            timeout=timeout,
+        ):
+            items = None
+            if with_items and run.status == "completed":
+                items = list(_all_items(api_instance, run.id, _request_timeout))
+            yield FinishedCalibrationRun(run, items)
+
+    async def await_runs(
+        self,
+        run_ids: Iterable[str],
+        *,
+        timeout: Optional[float] = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        with_items: bool = False,
+        _request_timeout: Optional[int] = None,
+    ) -> AsyncIterator[FinishedCalibrationRun]:
+        """Asynchronously wait for calibration runs to finish, yielding each as soon as it has completed or failed."""
+
+        context = self.client_context()
+        assert isinstance(context, AbstractAsyncContextManager), "This method is not available in synchronous mode"
+        async with context as client:
+            api_instance = ACalibrationRunsApi(client)
+            fetch = partial(api_instance.calibration_runs_retrieve, _request_timeout=_request_timeout)
+            async for run in apoll_until_done(
+                run_ids,
+                lambda run_id: fetch(id=run_id),
+                _finished,
+                min_interval=poll_interval,
+                max_interval=max_poll_interval,
+                timeout=timeout,
+            ):
+                items = None
+                if with_items and run.status == "completed":
+                    items = [item async for item in _aall_items(api_instance, run.id, _request_timeout)]
+                yield FinishedCalibrationRun(run, items)
+
+
+def _all_items(api_instance: Any, run_id: str, timeout: Optional[int]) -> Iterator[CalibrationRunItem]:
+    cursor: Optional[StrictStr] = None
+    while True:
+        page: PaginatedCalibrationRunItemList = api_instance.calibration_runs_items_list(
+            id=run_id, page_size=_ITEMS_PAGE_SIZE, cursor=cursor, _request_timeout=timeout
+        )
+        yield from page.results
+        if not page.results or not (cursor := page.next):
+            return
+
+
+async def _aall_items(api_instance: Any, run_id: str, timeout: Optional[int]) -> AsyncIterator[CalibrationRunItem]:
+    cursor: Optional[StrictStr] = None
+    while True:
+        page: PaginatedCalibrationRunItemList = await api_instance.calibration_runs_items_list(
+            id=run_id, page_size=_ITEMS_PAGE_SIZE, cursor=cursor, _request_timeout=timeout
+        )
+        for item in page.results:
+            yield item
+        if not page.results or not (cursor := page.next):
+            return
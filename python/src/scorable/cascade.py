@@ -0,0 +1,192 @@
+"""Escalate from a fast evaluator to a thorough one only when it is unsure.
+
+A :class:`Cascade` runs its first evaluator, e.g. ``Faithfulness_Swift``, and
+escalates to the next one, e.g. ``Faithfulness``, only when the result falls in
+the uncertain :class:`Band` of that stage: a score between ``low`` and ``high``,
+or a confidence under ``min_confidence``. Most inputs are then answered at the
+cost and latency of the fast evaluator::
+
+  cascade = client.evaluators.cascade("Faithfulness_Swift", "Faithfulness", bands=[Band(0.3, 0.7)])
+  result = cascade.run(request=question, response=answer, contexts=contexts)
+  print(result.score, result.escalated, cascade.report.escalation_rate)
+
+The :class:`CascadeReport` estimates the latency and cost saved from what the
+last stage took on the inputs that did reach it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    from .generated.openapi_client.models.evaluator_execution_result import EvaluatorExecutionResult
+    from .skills import Evaluators
+
+
+@dataclass(frozen=True)
+class Band:
+    """Results of a stage that are escalated to the next one.
+
+    Args:
+      low: Lowest uncertain score.
+      high: Highest uncertain score.
+      min_confidence: Escalate results with a lower confidence, or none.
+    """
+
+    low: float = 0.3
+    high: float = 0.7
+    min_confidence: Optional[float] = None
+
+    def uncertain(self, result: EvaluatorExecutionResult) -> bool:
+        if result.score is None or self.low <= result.score <= self.high:
+            return True
+        if self.min_confidence is None:
+            return False
+        return result.confidence is None or result.confidence < self.min_confidence
+
+
+@dataclass
+class CascadeResult:
+    """The result of the stage that answered, and the results of the stages before it."""
+
+    result: EvaluatorExecutionResult
+    #: Index of the stage that answered.
+    stage: int
+    evaluator_id: str
+    results: List[Union[EvaluatorExecutionResult, BaseException]]
+    #: Seconds spent in all stages.
+    latency: float
+
+    @property
+    def score(self) -> Optional[float]:
+        return self.result.score
+
+    @property
+    def escalated(self) -> bool:
+        return self.stage > 0
+
+
+@dataclass
+class CascadeReport:
+    """Escalations of a cascade, and what answering early saved.
+
+    The savings are estimates: inputs answered early are assumed to have taken as long and cost as much
+    in the last stage as the inputs that reached it did on average, and every stage they went through
+    counts against the saving.
+    """
+
+    runs: int = 0
+    #: Inputs that reached each stage.
+    reached: List[int] = field(default_factory=list)
+    #: Inputs escalated because the stage failed.
+    errors: int = 0
+    #: Seconds and cost of the calls to each stage.
+    latency: List[float] = field(default_factory=list)
+    cost: List[float] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def escalation_rate(self) -> float:
+        """Fraction of the inputs answered by a later stage than the first."""
+        return self.reached[1] / self.runs if self.runs and len(self.reached) > 1 else 0.0
+
+    @property
+    def latency_saved(self) -> float:
+        """Seconds saved against running only the last stage on every input."""
+        return self._saved(self.latency)
+
+    @property
+    def cost_saved(self) -> float:
+        """Cost saved against running only the last stage on every input."""
+        return self._saved(self.cost)
+
+    def _saved(self, spent: List[float]) -> float:
+        if not self.runs or self.reached[-1] == 0:
+            return 0.0
+        return self.runs * spent[-1] / self.reached[-1] - sum(spent)
+
+    def _record(self, stage: int, latency: float, cost: Optional[float]) -> None:
+        with self._lock:
+            self.reached[stage] += 1
+            self.latency[stage] += latency
+            self.cost[stage] += cost or 0.0
+            self.runs += stage == 0
+
+
+class Cascade:
+    """Run evaluators in turn until one gives a result outside the uncertain band of its stage.
+
+    Create it with :meth:`scorable.skills.Evaluators.cascade`.
+    """
+
+    def __init__(self, evaluators: Evaluators, stages: Sequence[str], bands: Sequence[Band]):
+        from .skills import _evaluator_id
+
+        if len(stages) < 2:
+            raise ValueError("A cascade needs at least two evaluators")
+        if len(bands) != len(stages) - 1:
+            raise ValueError(f"Expected a band for each of the {len(stages) - 1} stages before the last one")
+        self._evaluators = evaluators
+        self.stages = [_evaluator_id(stage) for stage in stages]
+        self.bands = list(bands)
+        self.report = CascadeReport(reached=[0] * len(stages), latency=[0.0] * len(stages), cost=[0.0] * len(stages))
+
+    def _escalate(self, stage: int, outcome: Union[EvaluatorExecutionResult, BaseException]) -> bool:
+        if stage == len(self.stages) - 1:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return False
+        if isinstance(outcome, BaseException):
+            with self.report._lock:
+                self.report.errors += 1
+            return True
+        return self.bands[stage].uncertain(outcome)
+
+    def _result(self, outcomes: List[Union[EvaluatorExecutionResult, BaseException]], start: float) -> CascadeResult:
+        result = outcomes[-1]
+        assert not isinstance(result, BaseException)
+        stage = len(outcomes) - 1
+        return CascadeResult(result, stage, self.stages[stage], outcomes, time.perf_counter() - start)
+
+    def run(self, **arguments: Any) -> CascadeResult:
+        """Evaluate an input, with the keyword arguments of :meth:`scorable.skills.Evaluators.run`.
+
+        A failure of a stage escalates to the next one; a failure of the last stage is raised.
+        """
+        start = time.perf_counter()
+        outcomes: List[Union[EvaluatorExecutionResult, BaseException]] = []
+        for stage, evaluator_id in enumerate(self.stages):
+            called = time.perf_counter()
+            outcome: Union[EvaluatorExecutionResult, BaseException]
+            try:
+                outcome = self._evaluators.run(evaluator_id, **arguments)
+            except Exception as e:
+                outcome = e
+            self.report._record(stage, time.perf_counter() - called, getattr(outcome, "cost", None))
+            outcomes.append(outcome)
+            if not self._escalate(stage, outcome):
+                break
+        return self._result(outcomes, start)
+
+    async def arun(self, **arguments: Any) -> CascadeResult:
+        """Asynchronously evaluate an input, with the keyword arguments of :meth:`scorable.skills.Evaluators.arun`.
+
+        A failure of a stage escalates to the next one; a failure of the last stage is raised.
+        """
+        start = time.perf_counter()
+        outcomes: List[Union[EvaluatorExecutionResult, BaseException]] = []
+        for stage, evaluator_id in enumerate(self.stages):
+            called = time.perf_counter()
+            outcome: Union[EvaluatorExecutionResult, BaseException]
+            try:
+                outcome = await self._evaluators.arun(evaluator_id, **arguments)
+            except Exception as e:
+                outcome = e
+            self.report._record(stage, time.perf_counter() - called, getattr(outcome, "cost", None))
+            outcomes.append(outcome)
+            if not self._escalate(stage, outcome):
+                break
+        return self._result(outcomes, start)
@@ -0,0 +1,244 @@
+"""Record API interactions to a cassette file and replay them offline.
+
+A :class:`Cassette` is a transport wrapper that stores the response to every
+request under a hash of the request, and answers later runs from the file
+without touching the network::
+
+  with Cassette("tests/cassettes/regression.json.gz") as cassette:
+      client = Scorable(transport_wrappers=[cassette])
+      results = client.evaluators.run_many(evaluator_id, inputs)
+
+The first run records real responses (the file does not exist yet) and writes
+the cassette when the ``with`` block exits; later runs replay it, and with
+``strict=True`` fail on any request that was not recorded, so a CI run can
+neither reach the API nor drift from the recording. Repeated identical
+requests, such as polls of a batch execution, replay their recorded responses
+in order.
+
+Uploads made with the synchronous ``files.upload()``, which does not use the
+generated client, are not recorded.
+"""
+
+from __future__ import annotations
+
+import base64
+import functools
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import IO, Any, Awaitable, Callable, Dict, List, Literal, Optional, Sequence
+from urllib.parse import parse_qsl, urlsplit
+
+from .transport import Headers, Request, Response, TransportWrapper
+
+_VERSION = 1
+_MATCH_ON = ("method", "host", "path", "query", "body")
+
+
+def _strip(value: Any, ignore: frozenset) -> Any:
+    if isinstance(value, dict):
+        return {key: _strip(item, ignore) for key, item in value.items() if key not in ignore}
+    if isinstance(value, (list, tuple)):
+        return [_strip(item, ignore) for item in value]
+    return value
+
+
+def _content(content: Any) -> Any:
+    # File contents are matched by their digest when they are in memory, by their size otherwise.
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(content).hexdigest()
+    size = getattr(content, "size", None)
+    return {"size": size} if isinstance(size, int) else None
+
+
+def _body(request: Request, ignore: frozenset) -> Any:
+    if request.post_params:
+        return [
+            [name, {"filename": value[0], "content": _content(value[1]), "content_type": value[2]}]
+            if isinstance(value, tuple) and len(value) == 3
+            else [name, value]
+            for name, value in request.post_params
+        ]
+    body = request.body
+    if isinstance(body, (bytes, bytearray, str)):
+        try:
+            body = json.loads(body)
+        except ValueError:
+            return _content(body.encode() if isinstance(body, str) else body)
+    return _strip(body, ignore)
+
+
+class Cassette(TransportWrapper):
+    """Records responses to a file and replays them.
+
+    Args:
+      path: Cassette file; compressed with gzip if its name ends with ``.gz``.
+      mode: ``record`` sends every request and records it, replacing the content of the
+        cassette; ``replay`` answers requests from the cassette; ``auto`` replays if the
+        file exists and records otherwise.
+      strict: When replaying, raise ``LookupError`` for a request that was not recorded.
+        Otherwise such a request is sent, and recorded as well.
+      match_on: Parts of a request that identify it: any of ``method``, ``host``, ``path``,
+        ``query`` and ``body``. The host is left out by default, so a cassette recorded
+        against one deployment replays against any other.
+      ignore: Names of fields left out of the match, in JSON bodies at any depth and in
+        query strings, e.g. ``("tags", "user_id")``.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        *,
+        mode: Literal["auto", "record", "replay"] = "auto",
+        strict: bool = True,
+        match_on: Sequence[str] = ("method", "path", "query", "body"),
+        ignore: Sequence[str] = (),
+    ):
+        unknown = set(match_on) - set(_MATCH_ON)
+        if unknown:
+            raise ValueError(f"Cannot match on {sorted(unknown)}; choose from {_MATCH_ON}")
+        if mode not in ("auto", "record", "replay"):
+            raise ValueError(f"Unknown cassette mode {mode!r}")
+        self.path = os.fspath(os.path.expanduser(path))
+        self.strict = strict
+        self.match_on = tuple(match_on)
+        self.ignore = frozenset(ignore)
+        self.recording = mode == "record" or (mode == "auto" and not os.path.exists(self.path))
+        #: Requests answered from the cassette, and requests sent to the API.
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._interactions: Dict[str, Dict[str, Any]] = {}
+        self._responses: Dict[str, List[Response]] = {}
+        self._played: Dict[str, int] = {}
+        self._dirty = False
+        if not self.recording:
+            self._load()
+
+    def __reduce__(self) -> Any:
+        # Worker processes replay the same file; recordings are kept by the process that made them.
+        if self.recording or self._dirty:
+            raise TypeError("A cassette that is recording cannot be pickled")
+        replay = functools.partial(
+            Cassette, self.path, mode="replay", strict=self.strict, match_on=self.match_on, ignore=tuple(self.ignore)
+        )
+        return (replay, ())
+
+    def __enter__(self) -> Cassette:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.save()
+
+    def _open(self, path: str, mode: str) -> IO[Any]:
+        if self.path.endswith(".gz"):
+            return gzip.open(path, mode)  # type: ignore[return-value]
+        return open(path, mode)
+
+    def _load(self) -> None:
+        with self._open(self.path, "rt") as f:
+            data = json.load(f)
+        if data.get("version") != _VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')!r} in {self.path}")
+        for interaction in data["interactions"]:
+            key = interaction["key"]
+            self._interactions[key] = interaction["request"]
+            self._responses[key] = [_decode(response) for response in interaction["responses"]]
+
+    def save(self) -> None:
+        """Write the cassette, if anything was recorded. Called when the ``with`` block exits."""
+        with self._lock:
+            if not self._dirty:
+                return
+            interactions = [
+                {
+                    "key": key,
+                    "request": request,
+                    "responses": [_encode(response) for response in self._responses[key]],
+                }
+                for key, request in self._interactions.items()
+            ]
+            self._dirty = False
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".cassette-")
+        os.close(descriptor)
+        try:
+            with self._open(temporary, "wt") as f:
+                json.dump({"version": _VERSION, "interactions": interactions}, f, indent=1)
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def match(self, request: Request) -> Dict[str, Any]:
+        """The parts of a request that identify it in the cassette."""
+        url = urlsplit(request.url)
+        parts = {
+            "method": request.method.upper(),
+            "host": url.netloc,
+            "path": url.path,
+            "query": sorted((name, value) for name, value in parse_qsl(url.query) if name not in self.ignore),
+            "body": _body(request, self.ignore) if "body" in self.match_on else None,
+        }
+        return {part: parts[part] for part in self.match_on}
+
+    def _key(self, request: Request) -> tuple:
+        parts = self.match(request)
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest(), parts
+
+    def _replay(self, key: str, request: Request) -> Optional[Response]:
+        with self._lock:
+            responses = self._responses.get(key) if not self.recording else None
+            if responses:
+                # Repeated requests replay their responses in order, then the last one again.
+                played = self._played.get(key, 0)
+                self._played[key] = played + 1
+                self.hits += 1
+                return responses[min(played, len(responses) - 1)]
+            self.misses += 1
+        if self.strict and not self.recording:
+            raise LookupError(f"No recorded response for {request.method} {request.url} in cassette {self.path}")
+        return None
+
+    def _record(self, key: str, parts: Dict[str, Any], response: Response) -> Response:
+        recorded = Response(response.status, response.reason, response.data, Headers(response.headers))
+        with self._lock:
+            self._interactions.setdefault(key, parts)
+            self._responses.setdefault(key, []).append(recorded)
+            self._dirty = True
+        return response
+
+    def handle(self, request: Request, send: Callable[[Request], Response]) -> Response:
+        key, parts = self._key(request)
+        response = self._replay(key, request)
+        if response is None:
+            response = self._record(key, parts, send(request))
+        return response
+
+    async def ahandle(self, request: Request, send: Callable[[Request], Awaitable[Response]]) -> Response:
+        key, parts = self._key(request)
+        response = self._replay(key, request)
+        if response is None:
+            response = self._record(key, parts, await send(request))
+        return response
+
+
+def _encode(response: Response) -> Dict[str, Any]:
+    encoded: Dict[str, Any] = {"status": response.status, "reason": response.reason, "headers": dict(response.headers)}
+    try:
+        encoded["body"] = response.data.decode()
+    except UnicodeDecodeError:
+        encoded["body_base64"] = base64.b64encode(response.data).decode()
+    return encoded
+
+
+def _decode(encoded: Dict[str, Any]) -> Response:
+    if "body_base64" in encoded:
+        data = base64.b64decode(encoded["body_base64"])
+    else:
+        data = encoded["body"].encode()
+    return Response(encoded["status"], encoded["reason"], data, Headers(encoded["headers"]))
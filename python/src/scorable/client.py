@@ -1,39 +1,55 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import os
 import re
+import sys
 import textwrap
-from contextlib import asynccontextmanager, contextmanager
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, contextmanager
 from functools import cached_property
 from typing import (
     TYPE_CHECKING,
+    Any,
     AsyncContextManager,
     AsyncGenerator,
+    Awaitable,
     Callable,
     ContextManager,
     Generator,
+    MutableMapping,
     Optional,
+    Sequence,
     Type,
+    TypeVar,
     Union,
 )
 
 from .__about__ import __version__
-from .generated import openapi_aclient, openapi_client
-from .generated.openapi_aclient.configuration import Configuration as _AConfiguration
-from .generated.openapi_client.configuration import Configuration as _Configuration
 
 if TYPE_CHECKING:
     from .annotations import Annotations
+    from .background import BackgroundTransport
     from .calibration_runs import CalibrationRuns
+    from .compare import Comparison, ComparisonSource, EvaluatorSpec, Outcome
     from .datasets import DataSets
     from .execution_logs import ExecutionLogs
     from .files import Files
+    from .generated import openapi_aclient, openapi_client
+    from .generated.openapi_aclient.configuration import Configuration as _AConfiguration
+    from .generated.openapi_client.configuration import Configuration as _Configuration
+    from .instrumentation import Instrumentation, RequestHook
+    from .jobs import Jobs
     from .judges import Judges
     from .models import Models
     from .objectives import Objectives
     from .projects import Projects
     from .score_configs import ScoreConfigs
     from .skills import Evaluators
+    from .transport import TransportWrapper
+    from .upload_cache import UploadCache
+
+T = TypeVar("T")
 
 
 def _get_api_key(*, dot_env: str = ".env") -> str:
@@ -54,6 +70,15 @@ def _get_api_key(*, dot_env: str = ".env") -> str:
     )
 
 
+def _is_async_api_client(api_client: object) -> bool:
+    # Avoid importing the async client (and aiohttp) just to rule it out.
+    if "scorable.generated.openapi_aclient.api_client" not in sys.modules:
+        return False
+    from .generated import openapi_aclient
+
+    return isinstance(api_client, openapi_aclient.ApiClient)
+
+
 class Beta:
     """Beta API features namespace"""
 
@@ -83,9 +108,24 @@ class Scorable:
     2. environment variable `SCORABLE_API_KEY`, or
     3. .env file containing `SCORABLE_API_KEY=`
 
+    A client can be pickled, e.g. to pass it to a process pool: only its configuration is transferred and the
+    connections are re-created on first use. Pooled connections are likewise dropped in a child process after
+    ``os.fork()``.
+
     Args:
         api_key: Scorable API Key (if not provided from environment)
         run_async: Whether to run the API client asynchronously
+        background_loop: Run requests of the synchronous client on a shared background event loop. Synchronous
+            methods then share one connection pool across threads, and asynchronous methods can be scheduled from
+            synchronous code with :meth:`submit`. Cannot be combined with ``run_async``.
+        upload_cache: An :class:`scorable.upload_cache.UploadCache`, or the path of its database, used by
+            :attr:`files` to avoid uploading the same content twice.
+        request_hooks: Callables that receive a :class:`scorable.instrumentation.RequestTiming` with the
+            timing breakdown of every API call. More can be added with ``client.instrumentation.add_hook()``.
+        metrics: Record request counts, latencies, retries and bytes of every API call in
+            :data:`scorable.metrics.REGISTRY`, alongside the metrics the SDK always records there.
+        transport_wrappers: :class:`scorable.transport.TransportWrapper` instances that every HTTP request
+            passes through, outermost first, e.g. a :class:`scorable.cassette.Cassette`.
     """
 
     def __init__(
@@ -93,10 +133,18 @@ class Scorable:
         api_key: Optional[str] = None,
         *,
         run_async: bool = False,
+        background_loop: bool = False,
+        upload_cache: Union[UploadCache, str, os.PathLike, None] = None,
+        request_hooks: Sequence[RequestHook] = (),
+        metrics: bool = False,
+        transport_wrappers: Sequence[TransportWrapper] = (),
         _api_client: Union[Optional[openapi_aclient.ApiClient], Optional[openapi_client.ApiClient]] = None,
         base_url: Optional[str] = None,
     ):
+        if run_async and background_loop:
+            raise ValueError("background_loop cannot be combined with run_async")
         self.run_async = run_async
+        self.background_loop = background_loop
         if api_key is None:
             api_key = _get_api_key()
         if base_url is None:
@@ -104,6 +152,186 @@ class Scorable:
         self.base_url = base_url
         self.api_key = api_key
         self._api_client_arg = _api_client
+        if isinstance(upload_cache, (str, os.PathLike)):
+            from .upload_cache import UploadCache
+
+            upload_cache = UploadCache(upload_cache)
+        self.upload_cache = upload_cache
+        from .instrumentation import Instrumentation
+
+        self.instrumentation: Instrumentation = Instrumentation(request_hooks)
+        self.metrics = metrics
+        self._metrics_hook: Optional[RequestHook] = None
+        if metrics:
+            from .metrics import MetricsHook
+
+            self._metrics_hook = MetricsHook()
+            self.instrumentation.add_hook(self._metrics_hook)
+        self.transport_wrappers = list(transport_wrappers)
+        self._background: Optional[BackgroundTransport] = None
+        if background_loop:
+            from .background import BackgroundTransport
+
+            self._background = BackgroundTransport(self._configuration, self._install)
+
+    def __getstate__(self) -> dict:
+        # Only the configuration is pickled; the transport and sub-API objects are rebuilt
+        # lazily in the process that unpickles the client.
+        if self._api_client_arg is not None:
+            raise TypeError("A Scorable client created with an explicit _api_client cannot be pickled")
+        return {
+            "api_key": self.api_key,
+            "base_url": self.base_url,
+            "run_async": self.run_async,
+            "background_loop": self.background_loop,
+            "upload_cache": self.upload_cache,
+            "request_hooks": [hook for hook in self.instrumentation.hooks if hook is not self._metrics_hook],
+            "metrics": self.metrics,
+            "transport_wrappers": self.transport_wrappers,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)  # type: ignore[misc]
+
+    def submit(self, fn: Callable[..., Awaitable[T]], /, *args: Any, **kwargs: Any) -> concurrent.futures.Future[T]:
+        """Schedule an asynchronous SDK method on the background loop.
+
+        Available with ``background_loop=True``. Returns immediately with a future for the result, so many
+        calls can be in flight from synchronous code at once::
+
+            futures = [client.submit(client.evaluators.arun, evaluator_id, response=r) for r in responses]
+            results = [f.result() for f in futures]
+        """
+        if self._background is None:
+            raise ValueError("submit() requires Scorable(background_loop=True)")
+        coro = fn(*args, **kwargs)
+        if not asyncio.iscoroutine(coro):
+            raise TypeError(f"{fn!r} did not return a coroutine; pass the asynchronous (a-prefixed) method")
+        return self._background.submit(coro)
+
+    def close(self) -> None:
+        """Close the background loop and its connection pool, if one was started."""
+        if self._background is not None:
+            self._background.close()
+
+    def compare(
+        self,
+        evaluators: Sequence[EvaluatorSpec],
+        source: ComparisonSource,
+        *,
+        concurrency: int = 16,
+        dedup_window: Optional[int] = None,
+        cache: Optional[MutableMapping[str, Outcome]] = None,
+        n_resamples: int = 2000,
+        confidence: float = 0.95,
+        seed: Optional[int] = None,
+        _request_timeout: Optional[int] = None,
+    ) -> Comparison:
+        """
+        Run evaluator variants on the same inputs and compare their scores, latencies and costs.
+
+        All variants run concurrently on every input, through one connection pool shared by all
+        requests; see :mod:`scorable.compare`. Requires NumPy (``pip install scorable[analysis]``).
+
+        Args:
+          evaluators: Evaluator IDs or preset names (e.g. ``"Faithfulness_Swift"``), or
+            ``(evaluator, version ID)`` pairs to compare versions from ``evaluators.versions.list``.
+          source: A dataset ID, a :mod:`scorable.sources` source, or keyword arguments of
+            ``evaluators.run`` for each input.
+          concurrency: Maximum number of concurrent executions, across all variants.
+          dedup_window: Number of distinct inputs remembered for deduplication, by default
+            :data:`scorable.dedup.DEFAULT_WINDOW`.
+          cache: Mapping in which the outcomes of ``(variant, input)`` pairs are kept and looked up,
+            e.g. to reuse across comparisons.
+          n_resamples: Resamples of the bootstrap intervals and permutation tests.
+          confidence: Coverage of the bootstrap intervals.
+          seed: Seed of the resampling, for reproducible tests.
+          _request_timeout: Optional timeout for each request.
+        """
+        from .compare import acompare
+
+        coro = acompare(
+            self,
+            evaluators,
+            source,
+            concurrency=concurrency,
+            dedup_window=dedup_window,
+            cache=cache,
+            n_resamples=n_resamples,
+            confidence=confidence,
+            seed=seed,
+            _request_timeout=_request_timeout,
+        )
+        if self._background is not None:
+            return self._background.submit(coro).result()
+        if isinstance(self.get_client_context(), AbstractAsyncContextManager):
+            coro.close()
+            raise AssertionError("This method is not available in asynchronous mode")
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        coro.close()
+        raise RuntimeError(
+            "compare() cannot run inside an event loop; use acompare() or Scorable(background_loop=True)"
+        )
+
+    async def acompare(
+        self,
+        evaluators: Sequence[EvaluatorSpec],
+        source: ComparisonSource,
+        *,
+        concurrency: int = 16,
+        dedup_window: Optional[int] = None,
+        cache: Optional[MutableMapping[str, Outcome]] = None,
+        n_resamples: int = 2000,
+        confidence: float = 0.95,
+        seed: Optional[int] = None,
+        _request_timeout: Optional[int] = None,
+    ) -> Comparison:
+        """
+        Asynchronously run evaluator variants on the same inputs and compare their scores, latencies and costs.
+
+        See :meth:`compare` for the parameters.
+        """
+        from .compare import acompare
+
+        return await acompare(
+            self,
+            evaluators,
+            source,
+            concurrency=concurrency,
+            dedup_window=dedup_window,
+            cache=cache,
+            n_resamples=n_resamples,
+            confidence=confidence,
+            seed=seed,
+            _request_timeout=_request_timeout,
+        )
+
+    @asynccontextmanager
+    async def _pooled_async_client(self) -> AsyncGenerator[Scorable, None]:
+        # An asynchronous client that reuses one connection pool for all its calls, for
+        # bulk helpers that make many requests regardless of the mode of this client.
+        from .generated import openapi_aclient
+        from .generated.openapi_aclient.configuration import Configuration as _AConfiguration
+
+        async with openapi_aclient.ApiClient(self._configuration(_AConfiguration)) as api_client:
+            api_client.user_agent = f"rs-python-sdk/{__version__}"
+            self._install(api_client)
+            yield Scorable(self.api_key, base_url=self.base_url, run_async=True, _api_client=api_client)
+
+    def _install(self, api_client: Any) -> None:
+        # Request hooks and transport wrappers of this client, on a new generated API client.
+        from .transport import install
+
+        self.instrumentation.install(api_client)
+        install(api_client, self.transport_wrappers)
+
+    def _configuration(self, config_cls: Type[Any]) -> Any:
+        config = config_cls(host=self.base_url)
+        config.api_key["publicApiKey"] = f"Api-Key {self.api_key}"
+        return config
 
     @cached_property
     def get_client_context(
@@ -112,8 +340,11 @@ class Scorable:
         Callable[[], AsyncContextManager[openapi_aclient.ApiClient]],
         Callable[[], ContextManager[openapi_client.ApiClient]],
     ]:
+        # The generated clients are imported here rather than at module level so that
+        # only the transport actually in use (and aiohttp only for the async one) is loaded.
         if self._api_client_arg is not None:
-            if isinstance(self._api_client_arg, openapi_aclient.ApiClient):
+            if _is_async_api_client(self._api_client_arg):
+                from .generated import openapi_aclient
 
                 @asynccontextmanager
                 async def async_client_context() -> AsyncGenerator[openapi_aclient.ApiClient, None]:
@@ -122,6 +353,7 @@ class Scorable:
 
                 return async_client_context
             else:
+                from .generated import openapi_client
 
                 @contextmanager
                 def sync_client_context() -> Generator[openapi_client.ApiClient, None, None]:
@@ -130,8 +362,18 @@ class Scorable:
 
                 return sync_client_context
 
+        if self._background is not None:
+            return self._background.client_context
+
         if self.run_async:
+            from .generated import openapi_aclient
+            from .generated.openapi_aclient.configuration import Configuration as _AConfiguration
+
             return self._configure_client_context(openapi_aclient.ApiClient, _AConfiguration)
+
+        from .generated import openapi_client
+        from .generated.openapi_client.configuration import Configuration as _Configuration
+
         return self._configure_client_context(openapi_client.ApiClient, _Configuration)
 
     def _configure_client_context(
@@ -142,24 +384,31 @@ class Scorable:
         Callable[[], ContextManager[openapi_client.ApiClient]],
         Callable[[], AsyncContextManager[openapi_aclient.ApiClient]],
     ]:
-        config = config_cls(host=self.base_url)
-        config.api_key["publicApiKey"] = f"Api-Key {self.api_key}"
+        config = self._configuration(config_cls)
 
-        if issubclass(client_cls, openapi_aclient.ApiClient):
+        if self.run_async:
+            from .generated import openapi_aclient
+
+            assert issubclass(client_cls, openapi_aclient.ApiClient)
 
             @asynccontextmanager
             async def async_client_context() -> AsyncGenerator[openapi_aclient.ApiClient, None]:
                 async with client_cls(config) as client:
                     client.user_agent = f"rs-python-sdk/{__version__}"
+                    self._install(client)
                     yield client
 
             return async_client_context
         else:
+            from .generated import openapi_client
+
+            assert issubclass(client_cls, openapi_client.ApiClient)
 
             @contextmanager
             def sync_client_context() -> Generator[openapi_client.ApiClient, None, None]:
                 with client_cls(config) as client:
                     client.user_agent = f"rs-python-sdk/{__version__}"
+                    self._install(client)
                     yield client
 
             return sync_client_context
@@ -176,7 +425,7 @@ class Scorable:
         """Get Files API"""
         from .files import Files
 
-        return Files(self.get_client_context, self.base_url, self.api_key)
+        return Files(self.get_client_context, self.base_url, self.api_key, self.upload_cache, self._install)
 
     @cached_property
     def evaluators(self) -> Evaluators:
@@ -241,6 +490,13 @@ class Scorable:
 
         return ScoreConfigs(self.get_client_context)
 
+    @cached_property
+    def jobs(self) -> Jobs:
+        """Get Jobs API"""
+        from .jobs import Jobs
+
+        return Jobs(self)
+
     @cached_property
     def beta(self) -> Beta:
         """Get Beta API features"""
@@ -0,0 +1,291 @@
+"""Side-by-side comparison of evaluator variants on the same inputs.
+
+:meth:`scorable.client.Scorable.compare` runs every variant (evaluators, or
+versions of one evaluator) on every input of a source, with all requests sharing
+one connection pool and one concurrency limit. It returns the paired scores,
+latencies and costs as NumPy arrays, and paired tests of every two variants::
+
+  comparison = client.compare(evaluators=["Faithfulness", "Faithfulness_Swift"], source=dataset_id)
+  for test in comparison.tests:
+      print(test.a, test.b, test.mean_difference, test.p_value)
+
+Identical inputs are run once per variant, and the scores of ``(variant, input)``
+pairs can be kept in a ``cache`` mapping, e.g. a dict or a :mod:`shelve`, so
+that comparing a new variant against known ones only runs the new one.
+Requires NumPy (``pip install scorable[analysis]``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import math
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .analysis import _BOOTSTRAP_CHUNK, Estimate, bootstrap, np, pearson, rank, spearman
+from .dedup import DEFAULT_WINDOW, Deduplicator, DedupReport, TaskWindow, input_key
+from .metrics import CACHE_LOOKUPS, queued
+from .sources import DatasetSource, JsonlSource, SourceItem
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from .client import Scorable
+
+#: An evaluator ID or preset name (e.g. ``"Faithfulness"``), or an ``(evaluator, version ID)`` pair.
+EvaluatorSpec = Union[str, Tuple[str, Optional[str]]]
+#: A dataset ID, a source of :mod:`scorable.sources`, or keyword arguments of ``evaluators.run`` per input.
+ComparisonSource = Union[str, JsonlSource, DatasetSource, Iterable[Dict[str, Any]]]
+#: Score, latency in seconds and cost of one evaluation.
+Outcome = Tuple[Optional[float], float, Optional[float]]
+
+
+@dataclass(frozen=True)
+class Variant:
+    evaluator_id: str
+    version_id: Optional[str]
+    #: How the variant was specified, with ``@version`` appended for versions.
+    name: str
+
+    @classmethod
+    def parse(cls, spec: EvaluatorSpec) -> Variant:
+        from .skills import _evaluator_id
+
+        evaluator, version_id = spec if isinstance(spec, tuple) else (spec, None)
+        name = evaluator if version_id is None else f"{evaluator}@{version_id}"
+        return cls(_evaluator_id(evaluator), version_id, name)
+
+    def cache_key(self, arguments: Dict[str, Any]) -> str:
+        return f"{self.evaluator_id}:{self.version_id or ''}:{input_key(arguments)}"
+
+
+@dataclass(frozen=True)
+class PairedTest:
+    """Paired comparison of the scores of variants ``a`` and ``b`` on the inputs both scored."""
+
+    a: str
+    b: str
+    n: int
+    #: Mean of ``a - b``, with its bootstrap confidence interval.
+    mean_difference: Estimate
+    #: Two-sided p-value of the mean difference, by a sign-flip permutation test.
+    p_value: float
+    #: Two-sided p-value of the Wilcoxon signed-rank test (normal approximation, zero differences dropped).
+    wilcoxon_p_value: float
+    pearson: float
+    spearman: float
+    #: Inputs where ``a`` scored higher, lower, and the same as ``b``.
+    wins: int
+    losses: int
+    ties: int
+
+
+@dataclass
+class Comparison:
+    """Scores, latencies and costs of every variant on every input, in source order.
+
+    Each column is an array aligned with :attr:`keys`; a failed evaluation has NaN score, latency and
+    cost and its error message in :attr:`errors`.
+    """
+
+    keys: List[str]
+    variants: List[str]
+    scores: Dict[str, NDArray[np.float64]]
+    latencies: Dict[str, NDArray[np.float64]]
+    costs: Dict[str, NDArray[np.float64]]
+    errors: Dict[str, List[Optional[str]]]
+    #: Deduplication of the inputs, per variant.
+    reports: Dict[str, DedupReport]
+    #: Evaluations served from the cache.
+    cached: int = 0
+    #: Paired tests of every two variants, in the order of :attr:`variants`.
+    tests: List[PairedTest] = field(default_factory=list)
+
+    def paired_test(
+        self, a: str, b: str, *, n_resamples: int = 2000, confidence: float = 0.95, seed: Optional[int] = None
+    ) -> PairedTest:
+        """Compare the scores of variants ``a`` and ``b``."""
+        x, y = self.scores[a], self.scores[b]
+        both = ~np.isnan(x) & ~np.isnan(y)
+        x, y = x[both], y[both]
+        differences = x - y
+        return PairedTest(
+            a=a,
+            b=b,
+            n=len(x),
+            mean_difference=bootstrap(
+                _mean_difference, x, y, n_resamples=n_resamples, confidence=confidence, seed=seed
+            ),
+            p_value=_sign_flip_p_value(differences, n_resamples, seed),
+            wilcoxon_p_value=_wilcoxon_p_value(differences),
+            pearson=float(pearson(x, y)) if len(x) > 1 else math.nan,
+            spearman=float(spearman(x, y)) if len(x) > 1 else math.nan,
+            wins=int((differences > 0).sum()),
+            losses=int((differences < 0).sum()),
+            ties=int((differences == 0).sum()),
+        )
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per variant: mean score, median and 95th percentile latency, total cost and error count."""
+        return {
+            variant: {
+                "mean_score": _nan_stat(np.nanmean, self.scores[variant]),
+                "latency_p50": _nan_stat(np.nanmedian, self.latencies[variant]),
+                "latency_p95": _nan_stat(lambda a: np.nanquantile(a, 0.95), self.latencies[variant]),
+                "cost": float(np.nansum(self.costs[variant])),
+                "errors": float(sum(error is not None for error in self.errors[variant])),
+            }
+            for variant in self.variants
+        }
+
+
+def _nan_stat(stat: Any, values: NDArray[np.float64]) -> float:
+    return float(stat(values)) if (~np.isnan(values)).any() else math.nan
+
+
+def _mean_difference(x: NDArray[np.float64], y: NDArray[np.float64]) -> NDArray[np.float64]:
+    return (x - y).mean(axis=-1)
+
+
+def _sign_flip_p_value(differences: NDArray[np.float64], n_resamples: int, seed: Optional[int]) -> float:
+    n = len(differences)
+    if n == 0:
+        return math.nan
+    observed = abs(differences.mean())
+    rng = np.random.default_rng(seed)
+    per_chunk = max(1, _BOOTSTRAP_CHUNK // n)
+    extreme = 0
+    for start in range(0, n_resamples, per_chunk):
+        signs = rng.choice(np.array([-1.0, 1.0]), size=(min(per_chunk, n_resamples - start), n))
+        # The tolerance keeps permutations equal to the observed mean, up to rounding, as extreme.
+        extreme += int((np.abs((signs * differences).mean(axis=-1)) >= observed - 1e-12).sum())
+    return (extreme + 1) / (n_resamples + 1)
+
+
+def _wilcoxon_p_value(differences: NDArray[np.float64]) -> float:
+    nonzero = differences[differences != 0]
+    n = len(nonzero)
+    if n == 0:
+        return 1.0
+    ranks = rank(np.abs(nonzero))[0]
+    positive = ranks[nonzero > 0].sum()
+    _, ties = np.unique(np.abs(nonzero), return_counts=True)
+    variance = n * (n + 1) * (2 * n + 1) / 24 - (ties**3 - ties).sum() / 48
+    if variance <= 0:
+        return 1.0
+    z = (positive - n * (n + 1) / 4) / math.sqrt(variance)
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+async def _aread(client: Scorable, source: ComparisonSource) -> AsyncIterator[SourceItem]:
+    if isinstance(source, str):
+        source = DatasetSource(source)
+    if isinstance(source, (JsonlSource, DatasetSource)):
+        async for item in source.aread(client):
+            yield item
+        return
+    for position, arguments in enumerate(source):
+        yield str(position), arguments
+
+
+async def acompare(
+    client: Scorable,
+    evaluators: Sequence[EvaluatorSpec],
+    source: ComparisonSource,
+    *,
+    concurrency: int = 16,
+    dedup_window: Optional[int] = None,
+    cache: Optional[MutableMapping[str, Outcome]] = None,
+    n_resamples: int = 2000,
+    confidence: float = 0.95,
+    seed: Optional[int] = None,
+    _request_timeout: Optional[int] = None,
+) -> Comparison:
+    """The implementation of :meth:`scorable.client.Scorable.acompare`."""
+    variants = [Variant.parse(spec) for spec in evaluators]
+    names = [variant.name for variant in variants]
+    if len(variants) < 2:
+        raise ValueError("At least two evaluators are required for a comparison")
+    if len(set(names)) != len(names):
+        raise ValueError(f"Evaluators are compared more than once: {names}")
+    if cache is None:
+        cache = {}
+    tasks: TaskWindow[Outcome] = TaskWindow(concurrency)
+    cached = 0
+
+    async with client._pooled_async_client() as aclient:
+
+        async def evaluate(variant: Variant, arguments: Dict[str, Any]) -> Outcome:
+            nonlocal cached
+            key = variant.cache_key(arguments)
+            if key in cache:
+                CACHE_LOOKUPS.inc("compare", "hit")
+                cached += 1
+                return cache[key]
+            CACHE_LOOKUPS.inc("compare", "miss")
+            start = time.perf_counter()
+            result = await aclient.evaluators.arun(
+                variant.evaluator_id,
+                evaluator_version_id=variant.version_id,
+                _request_timeout=_request_timeout,
+                **arguments,
+            )
+            outcome = (result.score, time.perf_counter() - start, result.cost)
+            cache[key] = outcome
+            return outcome
+
+        def start(variant: Variant, arguments: Dict[str, Any]) -> asyncio.Future[Outcome]:
+            return queued(tasks.start(evaluate(variant, arguments)), "compare")
+
+        window = DEFAULT_WINDOW if dedup_window is None else dedup_window
+        dedups = {variant: Deduplicator[asyncio.Future[Outcome]](window) for variant in variants}
+        keys: List[str] = []
+        # Input by input, so that the variants of an input run side by side; the source is read as
+        # earlier evaluations finish, with at most ``concurrency`` of them in flight.
+        async for key, arguments in _aread(aclient, source):
+            keys.append(key)
+            for variant in variants:
+                await tasks.reserve()
+                tasks.collect(dedups[variant].submit(arguments, partial(start, variant, arguments)))
+        outcomes = await tasks.drain()
+
+    comparison = _collect(keys, variants, outcomes)
+    comparison.reports = {variant.name: dedups[variant].report for variant in variants}
+    comparison.cached = cached
+    comparison.tests = [
+        comparison.paired_test(a, b, n_resamples=n_resamples, confidence=confidence, seed=seed)
+        for a, b in itertools.combinations(names, 2)
+    ]
+    return comparison
+
+
+def _collect(keys: List[str], variants: List[Variant], outcomes: List[Union[Outcome, BaseException]]) -> Comparison:
+    comparison = Comparison(keys, [variant.name for variant in variants], {}, {}, {}, {}, {})
+    for index, variant in enumerate(variants):
+        column = outcomes[index :: len(variants)]
+        nan = math.nan
+        rows = [(nan, nan, nan) if isinstance(outcome, BaseException) else outcome for outcome in column]
+        values = np.array([[nan if value is None else value for value in row] for row in rows], dtype=np.float64)
+        values = values.reshape(len(keys), 3)
+        comparison.scores[variant.name] = values[:, 0].copy()
+        comparison.latencies[variant.name] = values[:, 1].copy()
+        comparison.costs[variant.name] = values[:, 2].copy()
+        comparison.errors[variant.name] = [
+            f"{type(outcome).__name__}: {outcome}" if isinstance(outcome, BaseException) else None for outcome in column
+        ]
+    return comparison
@@ -1,37 +1,41 @@
+from __future__ import annotations
+
 from contextlib import AbstractAsyncContextManager
 from functools import partial
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
-import aiohttp
 import requests
 from pydantic import StrictStr
 
 from scorable.generated.openapi_client.api_client import ApiClient
 
-from .generated.openapi_aclient import ApiClient as AApiClient
-from .generated.openapi_aclient.api.datasets_api import DatasetsApi as ADatasetsApi
-from .generated.openapi_aclient.models.data_set_create import DataSetCreate as ADataSetCreate
-from .generated.openapi_aclient.models.data_set_list import DataSetList as ADataSetList
-from .generated.openapi_aclient.models.dataset_item import DatasetItem as ADatasetItem
-from .generated.openapi_aclient.models.dataset_item_request import DatasetItemRequest as ADatasetItemRequest
-from .generated.openapi_aclient.models.paginated_data_set_list_list import (
-    PaginatedDataSetListList as APaginatedDataSetListList,
-)
-from .generated.openapi_aclient.models.paginated_dataset_item_list import (
-    PaginatedDatasetItemList as APaginatedDatasetItemList,
-)
-from .generated.openapi_aclient.models.patched_dataset_item_request import (
-    PatchedDatasetItemRequest as APatchedDatasetItemRequest,
-)
-from .generated.openapi_client.api.datasets_api import DatasetsApi as DatasetsApi
-from .generated.openapi_client.models.data_set_create import DataSetCreate
-from .generated.openapi_client.models.data_set_list import DataSetList
-from .generated.openapi_client.models.dataset_item import DatasetItem
-from .generated.openapi_client.models.dataset_item_request import DatasetItemRequest
-from .generated.openapi_client.models.patched_dataset_item_request import PatchedDatasetItemRequest
-from .utils import ClientContextCallable, iterate_cursor_list, with_async_client, with_sync_client
+from .utils import ClientContextCallable, LazyImport, iterate_cursor_list, with_async_client, with_sync_client
+
+if TYPE_CHECKING:
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.datasets_api import DatasetsApi as ADatasetsApi
+    from .generated.openapi_client.api.datasets_api import DatasetsApi as DatasetsApi
+    from .generated.openapi_client.models.data_set_create import DataSetCreate
+    from .generated.openapi_client.models.data_set_list import DataSetList
+    from .generated.openapi_client.models.dataset_item import DatasetItem
+    from .generated.openapi_client.models.dataset_item_request import DatasetItemRequest
+    from .generated.openapi_client.models.paginated_data_set_list_list import PaginatedDataSetListList
+    from .generated.openapi_client.models.paginated_dataset_item_list import PaginatedDatasetItemList
+    from .generated.openapi_client.models.patched_dataset_item_request import PatchedDatasetItemRequest
+else:
+    ADatasetsApi = LazyImport("scorable.generated.openapi_aclient.api.datasets_api", "DatasetsApi")
+    DatasetsApi = LazyImport("scorable.generated.openapi_client.api.datasets_api", "DatasetsApi")
+    DataSetCreate = LazyImport("scorable.generated.openapi_client.models.data_set_create", "DataSetCreate")
+    DatasetItemRequest = LazyImport(
+        "scorable.generated.openapi_client.models.dataset_item_request", "DatasetItemRequest"
+    )
+    PatchedDatasetItemRequest = LazyImport(
+        "scorable.generated.openapi_client.models.patched_dataset_item_request", "PatchedDatasetItemRequest"
+    )
 
 MAX_BULK_ITEMS = 5000
+#: Items requested per page when iterating through the items of a dataset.
+ITEMS_PAGE_SIZE = 100
 
 
 class DataSets:
@@ -97,12 +101,13 @@ class DataSets:
         type: str = "reference",
         project_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
-    ) -> Optional[ADataSetCreate]:
+    ) -> Optional[DataSetCreate]:
         """
         Asynchronously create a dataset object with the given parameters to the registry.
         If the dataset has a path, it will be uploaded to the registry.
 
         """
+        import aiohttp
 
         payload = aiohttp.FormData()
         payload.add_field("name", name)
@@ -127,7 +132,7 @@ class DataSets:
                         raise Exception(
                             f"create failed with status code {response.status} and message\n{response.text}"
                         )
-                    return ADataSetCreate.from_dict(await response.json())
+                    return DataSetCreate.from_dict(await response.json())
         finally:
             if file and not file.closed:
                 file.close()
@@ -154,7 +159,7 @@ class DataSets:
         *,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> ADataSetList:
+    ) -> DataSetList:
         """
         Asynchronously get a dataset object from the registry.
         """
@@ -199,7 +204,7 @@ class DataSets:
         limit: int = 100,
         project_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
-    ) -> AsyncIterator[ADataSetList]:
+    ) -> AsyncIterator[DataSetList]:
         """
         Asynchronously iterate through the datasets.
 
@@ -221,7 +226,7 @@ class DataSets:
             )
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedDataSetListList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedDataSetListList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
 
@@ -309,10 +314,10 @@ class DataSets:
         change_note: str = "",
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> ADatasetItem:
+    ) -> DatasetItem:
         """Asynchronously add a single item to a dataset."""
 
-        item_request = ADatasetItemRequest(
+        item_request = DatasetItemRequest(
             response=response,
             request=request,
             expected_output=expected_output,
@@ -353,12 +358,12 @@ class DataSets:
         *,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> List[ADatasetItem]:
+    ) -> List[DatasetItem]:
         """Asynchronously bulk add items to a dataset (at most 5000 per call)."""
 
         if len(items) > MAX_BULK_ITEMS:
             raise ValueError(f"at most {MAX_BULK_ITEMS} items per bulk request")
-        item_requests = [ADatasetItemRequest.model_validate(item) for item in items]
+        item_requests = [DatasetItemRequest.model_validate(item) for item in items]
         api_instance = ADatasetsApi(_client)
         return await api_instance.datasets_items_bulk_create(
             dataset_id=dataset_id, dataset_item_request=item_requests, _request_timeout=_request_timeout
@@ -393,7 +398,7 @@ class DataSets:
         *,
         include_archived: bool = False,
         limit: int = 100,
-    ) -> AsyncIterator[ADatasetItem]:
+    ) -> AsyncIterator[DatasetItem]:
         """Asynchronously iterate through the items of a dataset."""
 
         context = self.client_context()
@@ -405,7 +410,9 @@ class DataSets:
             )
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedDatasetItemList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedDatasetItemList = await partial_list(
+                    page_size=min(limit, ITEMS_PAGE_SIZE), cursor=cursor
+                )
                 if not result.results:
                     return
                 used_results = result.results[:limit]
@@ -415,6 +422,23 @@ class DataSets:
                 if not (cursor := result.next):
                     return
 
+    async def _aitem_pages(
+        self, dataset_id: str, *, include_archived: bool = False, cursor: Optional[str] = None
+    ) -> AsyncIterator[Tuple[Optional[str], PaginatedDatasetItemList]]:
+        # Pages of items from ``cursor`` on, each with the cursor it was read from, for readers
+        # that remember where a position is and resume from there.
+        context = self.client_context()
+        assert isinstance(context, AbstractAsyncContextManager), "This method is not available in synchronous mode"
+        async with context as client:
+            api_instance = ADatasetsApi(client)
+            while True:
+                page: PaginatedDatasetItemList = await api_instance.datasets_items_list(
+                    dataset_id=dataset_id, is_archived=include_archived, page_size=ITEMS_PAGE_SIZE, cursor=cursor
+                )
+                yield cursor, page
+                if not page.results or not (cursor := page.next):
+                    return
+
     @with_sync_client
     def get_item(
         self, dataset_id: str, item_id: str, *, _request_timeout: Optional[int] = None, _client: ApiClient
@@ -429,7 +453,7 @@ class DataSets:
     @with_async_client
     async def aget_item(
         self, dataset_id: str, item_id: str, *, _request_timeout: Optional[int] = None, _client: AApiClient
-    ) -> ADatasetItem:
+    ) -> DatasetItem:
         """Asynchronously get a single dataset item."""
 
         api_instance = ADatasetsApi(_client)
@@ -487,10 +511,10 @@ class DataSets:
         change_note: Optional[str] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> ADatasetItem:
+    ) -> DatasetItem:
         """Asynchronously edit a dataset item."""
 
-        item_request = APatchedDatasetItemRequest(
+        item_request = PatchedDatasetItemRequest(
             response=response,
             request=request,
             expected_output=expected_output,
@@ -0,0 +1,213 @@
+"""In-batch deduplication of evaluation inputs.
+
+Batch entry points (:meth:`scorable.skills.Evaluators.run_many`,
+:meth:`scorable.judges.Judges.run_batch`) hash the canonical form of every
+input, send each distinct input once and hand its result to every position
+that had the same input. They start their requests through a :class:`TaskWindow`
+or, with threads, a :class:`ThreadWindow`, so that only a bounded number of them
+is in flight, and read from the input stream, however long the stream is.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Awaitable, Callable, Generic, List, Mapping, Set, TypeVar, Union
+
+from pydantic import BaseModel
+
+from .metrics import CACHE_LOOKUPS
+
+T = TypeVar("T")
+
+DEFAULT_WINDOW = 10_000
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", exclude_none=True)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_jsonable)
+
+
+def input_key(arguments: Mapping[str, Any]) -> str:
+    """SHA-256 of the canonical JSON form of an input's arguments.
+
+    Keys are sorted and arguments that are None are left out, so inputs that only differ
+    in the order or presence of unset arguments hash the same. The JSON is hashed as it
+    is encoded, without building the whole string.
+    """
+    digest = hashlib.sha256()
+    for chunk in _ENCODER.iterencode({name: value for name, value in arguments.items() if value is not None}):
+        digest.update(chunk.encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class DedupReport:
+    """How many inputs a batch had, and how many of them were sent."""
+
+    total: int = 0
+    unique: int = 0
+
+    @property
+    def duplicates(self) -> int:
+        return self.total - self.unique
+
+    @property
+    def ratio(self) -> float:
+        """Fraction of inputs that were served from an identical earlier input."""
+        return self.duplicates / self.total if self.total else 0.0
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """Results of a batch, one per input in input order, with its deduplication report.
+
+    A failed input has the exception in place of its result.
+    """
+
+    results: List[Union[T, BaseException]] = field(default_factory=list)
+    report: DedupReport = field(default_factory=DedupReport)
+
+
+class Deduplicator(Generic[T]):
+    """Remembers what was started for the most recent ``window`` distinct inputs.
+
+    Only the keys and handles (futures, batch positions) of the window are kept, so
+    memory stays bounded for arbitrarily long input streams; an input whose twin has
+    left the window is simply sent again.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        if window < 1:
+            raise ValueError("window must be positive")
+        self.window = window
+        self.report = DedupReport()
+        self._seen: OrderedDict[str, T] = OrderedDict()
+
+    def submit(self, arguments: Mapping[str, Any], start: Callable[[], T]) -> T:
+        """Return the handle of an identical input in the window, or ``start()`` a new one."""
+        key = input_key(arguments)
+        self.report.total += 1
+        if key in self._seen:
+            CACHE_LOOKUPS.inc("dedup", "hit")
+            self._seen.move_to_end(key)
+            return self._seen[key]
+        CACHE_LOOKUPS.inc("dedup", "miss")
+        self.report.unique += 1
+        handle = self._seen[key] = start()
+        if len(self._seen) > self.window:
+            self._seen.popitem(last=False)
+        return handle
+
+
+class TaskWindow(Generic[T]):
+    """Runs at most ``size`` tasks at a time, and collects their outcomes in submission order.
+
+    A single producer calls :meth:`reserve` before each submission, which waits for a free slot,
+    then :meth:`collect` with the future of the submission: a task started with :meth:`start`
+    takes the slot until it is done, while a future shared with an earlier submission (e.g. by a
+    :class:`Deduplicator`) gives it back. Outcomes are results, or exceptions in place of them.
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("size must be positive")
+        self.outcomes: List[Union[T, BaseException, None]] = []
+        self._slots = asyncio.Semaphore(size)
+        self._reserved = False
+        self._pending: Set[asyncio.Future[T]] = set()
+
+    async def reserve(self) -> None:
+        await self._slots.acquire()
+        self._reserved = True
+
+    def start(self, coro: Awaitable[T]) -> asyncio.Future[T]:
+        """Start a task in the reserved slot."""
+        self._reserved = False
+        task = asyncio.ensure_future(coro)
+        task.add_done_callback(lambda _: self._slots.release())
+        return task
+
+    def collect(self, future: asyncio.Future[T]) -> None:
+        if self._reserved:
+            self._reserved = False
+            self._slots.release()
+        self.outcomes.append(None)
+        future.add_done_callback(partial(self._store, len(self.outcomes) - 1))
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    def _store(self, position: int, future: asyncio.Future[T]) -> None:
+        if future.cancelled():
+            self.outcomes[position] = asyncio.CancelledError()
+        else:
+            self.outcomes[position] = future.exception() or future.result()
+
+    async def drain(self) -> List[Union[T, BaseException]]:
+        """Wait for the collected futures, and return their outcomes."""
+        if self._pending:
+            await asyncio.wait(set(self._pending))
+        return self.outcomes  # type: ignore[return-value]
+
+
+class ThreadWindow(Generic[T]):
+    """Runs at most ``size`` calls at a time on a thread pool, like :class:`TaskWindow` does with tasks.
+
+    Args:
+      pool: The executor that runs the calls.
+      size: Calls running or waiting in the pool at most.
+    """
+
+    def __init__(self, pool: concurrent.futures.Executor, size: int):
+        if size < 1:
+            raise ValueError("size must be positive")
+        self.outcomes: List[Union[T, BaseException, None]] = []
+        self._pool = pool
+        self._slots = threading.Semaphore(size)
+        self._reserved = False
+        # Outcomes not stored yet: futures are done before their callbacks have run.
+        self._unsettled = 0
+        self._settled = threading.Condition()
+
+    def reserve(self) -> None:
+        self._slots.acquire()
+        self._reserved = True
+
+    def start(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> concurrent.futures.Future[T]:
+        """Submit a call in the reserved slot."""
+        self._reserved = False
+        future = self._pool.submit(fn, *args, **kwargs)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def collect(self, future: concurrent.futures.Future[T]) -> None:
+        if self._reserved:
+            self._reserved = False
+            self._slots.release()
+        with self._settled:
+            self.outcomes.append(None)
+            self._unsettled += 1
+        future.add_done_callback(partial(self._store, len(self.outcomes) - 1))
+
+    def _store(self, position: int, future: concurrent.futures.Future[T]) -> None:
+        outcome = concurrent.futures.CancelledError() if future.cancelled() else future.exception() or future.result()
+        with self._settled:
+            self.outcomes[position] = outcome
+            self._unsettled -= 1
+            self._settled.notify_all()
+
+    def drain(self) -> List[Union[T, BaseException]]:
+        """Wait for the collected futures, and return their outcomes."""
+        with self._settled:
+            self._settled.wait_for(lambda: not self._unsettled)
+        return self.outcomes  # type: ignore[return-value]
@@ -0,0 +1,196 @@
+"""Wrappers of single evaluators, as returned by :class:`scorable.skills.Evaluators`.
+
+They subclass the generated evaluator model, so this module is imported on first use
+rather than with :mod:`scorable.skills`.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
+
+from .generated.openapi_client import ApiClient
+from .generated.openapi_client.api.evaluators_api import EvaluatorsApi
+from .generated.openapi_client.models.evaluator import Evaluator as OpenApiEvaluator
+from .generated.openapi_client.models.evaluator_execution_request import EvaluatorExecutionRequest
+from .generated.openapi_client.models.evaluator_execution_result import EvaluatorExecutionResult
+from .generated.openapi_client.models.message_turn_request import MessageTurnRequest
+from .utils import ClientContextCallable, LazyImport, with_async_client, with_sync_client
+
+if TYPE_CHECKING:
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.evaluators_api import EvaluatorsApi as AEvaluatorsApi
+else:
+    AEvaluatorsApi = LazyImport("scorable.generated.openapi_aclient.api.evaluators_api", "EvaluatorsApi")
+
+
+class Evaluator(OpenApiEvaluator):
+    """
+    Wrapper for a single Evaluator.
+
+    For available attributes, please check the (automatically
+    generated) superclass documentation.
+    """
+
+    client_context: ClientContextCallable
+
+    @classmethod
+    def _wrap(cls, apiobj: OpenApiEvaluator, client_context: ClientContextCallable) -> "Evaluator":  # noqa: E501
+        obj = cast(Evaluator, apiobj)
+        obj.__class__ = cls
+        obj.client_context = client_context
+        return obj
+
+    @with_sync_client
+    def run(
+        self,
+        response: Optional[str] = None,
+        request: Optional[str] = None,
+        turns: Optional[List[MessageTurnRequest]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        contexts: Optional[List[str]] = None,
+        expected_output: Optional[str] = None,
+        variables: Optional[dict[str, str]] = None,
+        tags: Optional[List[str]] = None,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        file_ids: Optional[List[uuid.UUID]] = None,
+        project_id: Optional[str] = None,
+        *,
+        _client: ApiClient,
+        _request_timeout: Optional[int] = None,
+    ) -> EvaluatorExecutionResult:
+        """
+        Run the evaluator.
+
+        Args:
+          response: LLM output.
+          request: The prompt sent to the LLM.
+          turns: Optional multi-turn conversation as a list of turns.
+          tools: Optional OpenAI-style tool catalog available to the agent during the conversation.
+          contexts: Optional documents passed to RAG evaluators
+          expected_output: Optional expected output for the evaluator.
+          variables: Optional additional variable mappings for the evaluator. For example, if the evaluator
+            predicate is "evaluate the output based on {subject}: {output}", then variables={"subject": "clarity"}.
+          tags: Optional tags to add to the evaluator execution
+          user_id: Optional user identifier for tracking purposes.
+          session_id: Optional session identifier for tracking purposes.
+          system_prompt: Optional system prompt that was used for the LLM call.
+          file_ids: Optional list of file UUIDs (from Files.upload). PDFs are extracted to text
+            context; images are passed directly to the model.
+          project_id: Optional project to attribute the execution log to.
+        """
+
+        if not response and not request and not turns:
+            raise ValueError("Either response, request, or turns must be provided")
+
+        api_instance = EvaluatorsApi(_client)
+
+        evaluator_execution_request = EvaluatorExecutionRequest(
+            evaluator_version_id=self.version_id,
+            request=request,
+            response=response,
+            turns=turns,
+            tools=tools,
+            contexts=contexts,
+            expected_output=expected_output,
+            variables=variables,
+            tags=tags,
+            user_id=user_id,
+            session_id=session_id,
+            system_prompt=system_prompt,
+            file_ids=[str(f) for f in file_ids] if file_ids else None,
+            project_id=project_id,
+        )
+        return api_instance.evaluators_execute_create(
+            id=self.id,
+            evaluator_execution_request=evaluator_execution_request,
+            _request_timeout=_request_timeout,
+        )
+
+
+class AEvaluator(OpenApiEvaluator):
+    """
+    Wrapper for a single Evaluator.
+
+    For available attributes, please check the (automatically
+    generated) superclass documentation.
+    """
+
+    client_context: ClientContextCallable
+
+    @classmethod
+    async def _awrap(cls, apiobj: OpenApiEvaluator, client_context: ClientContextCallable) -> "AEvaluator":  # noqa: E501
+        obj = cast(AEvaluator, apiobj)
+        obj.__class__ = cls
+        obj.client_context = client_context
+        return obj
+
+    @with_async_client
+    async def arun(
+        self,
+        response: Optional[str] = None,
+        request: Optional[str] = None,
+        turns: Optional[List[MessageTurnRequest]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        contexts: Optional[List[str]] = None,
+        expected_output: Optional[str] = None,
+        variables: Optional[dict[str, str]] = None,
+        tags: Optional[List[str]] = None,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        file_ids: Optional[List[uuid.UUID]] = None,
+        project_id: Optional[str] = None,
+        *,
+        _client: AApiClient,
+        _request_timeout: Optional[int] = None,
+    ) -> EvaluatorExecutionResult:
+        """
+        Asynchronously run the evaluator.
+
+        Args:
+          response: LLM output.
+          request: The prompt sent to the LLM.
+          turns: Optional multi-turn conversation as a list of turns.
+          tools: Optional OpenAI-style tool catalog available to the agent during the conversation.
+          contexts: Optional documents passed to RAG evaluators
+          expected_output: Optional expected output for the evaluator.
+          variables: Optional additional variable mappings for the evaluator. For example, if the evaluator
+            predicate is "evaluate the output based on {subject}: {output}", then variables={"subject": "clarity"}.
+          tags: Optional tags to add to the evaluator execution
+          user_id: Optional user identifier for tracking purposes.
+          session_id: Optional session identifier for tracking purposes.
+          system_prompt: Optional system prompt that was used for the LLM call.
+          file_ids: Optional list of file UUIDs (from Files.upload). PDFs are extracted to text
+            context; images are passed directly to the model.
+          project_id: Optional project to attribute the execution log to.
+        """
+
+        if not response and not request and not turns:
+            raise ValueError("Either response, request, or turns must be provided")
+
+        api_instance = AEvaluatorsApi(_client)
+
+        evaluator_execution_request = EvaluatorExecutionRequest(
+            evaluator_version_id=self.version_id,
+            request=request,
+            response=response,
+            turns=turns,
+            tools=tools,
+            contexts=contexts,
+            expected_output=expected_output,
+            variables=variables,
+            tags=tags,
+            user_id=user_id,
+            session_id=session_id,
+            system_prompt=system_prompt,
+            file_ids=[str(f) for f in file_ids] if file_ids else None,
+            project_id=project_id,
+        )
+        return await api_instance.evaluators_execute_create(
+            id=self.id,
+            evaluator_execution_request=evaluator_execution_request,
+            _request_timeout=_request_timeout,
+        )
@@ -0,0 +1,315 @@
+"""Fault injection for load and resilience testing.
+
+A :class:`FaultInjector` is a transport wrapper that delays, fails, drops or
+truncates requests as a declarative profile describes, before they reach the
+API or a fake of it::
+
+  injector = FaultInjector({
+      "latency": "lognormal:0.05,0.5",
+      "endpoints": {
+          "POST /v1/evaluators/execute/*": {"error_rate": 0.05, "statuses": [429], "retry_after": 1},
+          "GET /v1/datasets/*": {"body_rate": 100000, "truncate_rate": 0.01},
+      },
+      "storms": [{"every": 30, "duration": 5, "status": 429}],
+  })
+  client = Scorable(transport_wrappers=[Retry(attempts=5), injector])
+
+Wrappers listed before the injector, such as :class:`~scorable.transport.Retry`,
+see the injected faults; the retries of the generated clients themselves
+(``Configuration.retries``) sit below it and do not. ``injector.injected``
+counts the faults injected, by kind.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import errno
+import fnmatch
+import http
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Awaitable, Callable, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from .transport import Headers, Request, Response, TransportWrapper
+
+
+@dataclass(frozen=True)
+class Latency:
+    """A distribution of delays, in seconds.
+
+    Kinds and their parameters: ``constant`` (delay), ``uniform`` (low, high),
+    ``exponential`` (mean) and ``lognormal`` (median, sigma).
+    """
+
+    kind: str = "constant"
+    params: Tuple[float, ...] = (0.0,)
+
+    @classmethod
+    def parse(cls, spec: str) -> Latency:
+        """Parse ``kind:param,...``, e.g. ``uniform:0.01,0.05``; a bare number is a constant delay."""
+        kind, _, params = spec.partition(":") if ":" in spec else ("constant", "", spec)
+        latency = cls(kind, tuple(float(p) for p in params.split(",")))
+        latency.sample(random.Random())  # noqa: S311 - validates the parameters
+        return latency
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "constant":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        if self.kind == "exponential":
+            return rng.expovariate(1 / self.params[0]) if self.params[0] else 0.0
+        if self.kind == "lognormal":
+            median, sigma = self.params
+            return rng.lognormvariate(math.log(median), sigma)
+        raise ValueError(f"Unknown latency distribution {self.kind!r}")
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{','.join(map(str, self.params))}"
+
+
+@dataclass(frozen=True)
+class Faults:
+    """Faults injected into the requests of an endpoint.
+
+    Args:
+      latency: Delay added before the request is sent.
+      error_rate: Fraction of requests answered with an error status, without being sent.
+      statuses: Statuses of those errors, chosen at random.
+      retry_after: ``Retry-After`` of injected errors, in seconds.
+      drop_rate: Fraction of requests failing with a connection reset before being sent.
+      reset_rate: Fraction of requests sent, whose connection is then reset instead of
+        returning the response; the API did execute them.
+      truncate_rate: Fraction of responses cut to half of their body.
+      body_rate: Bytes per second at which response bodies are received; unlimited if None.
+    """
+
+    latency: Latency = field(default_factory=Latency)
+    error_rate: float = 0.0
+    statuses: Tuple[int, ...] = (503,)
+    retry_after: Optional[float] = None
+    drop_rate: float = 0.0
+    reset_rate: float = 0.0
+    truncate_rate: float = 0.0
+    body_rate: Optional[float] = None
+
+    def update(self, options: Mapping[str, Any]) -> Faults:
+        """These faults with the fields of a profile entry replaced."""
+        names = {f.name for f in fields(self)}
+        unknown = set(options) - names
+        if unknown:
+            raise ValueError(f"Unknown fault options {sorted(unknown)}; choose from {sorted(names)}")
+        values = dict(options)
+        if isinstance(values.get("latency"), (str, int, float)):
+            values["latency"] = Latency.parse(str(values["latency"]))
+        if "statuses" in values:
+            values["statuses"] = tuple(values["statuses"])
+        return replace(self, **values)
+
+
+@dataclass(frozen=True)
+class Storm:
+    """A recurring window during which every matching request is rejected.
+
+    Args:
+      every: Period of the storms, in seconds from the creation of the injector.
+      duration: Length of each storm, at the start of the period.
+      status: Status of the rejected requests.
+      retry_after: ``Retry-After`` of the rejections, in seconds.
+      endpoint: Endpoint pattern of the requests rejected; all by default.
+    """
+
+    every: float
+    duration: float
+    status: int = 429
+    retry_after: Optional[float] = None
+    endpoint: str = "*"
+
+    def active(self, elapsed: float) -> bool:
+        return elapsed % self.every < self.duration
+
+
+def _matches(pattern: str, method: str, path: str) -> bool:
+    # "POST /v1/evaluators/*" matches a method and a path glob; a pattern without a method matches any.
+    verb, _, glob = pattern.partition(" ")
+    if not glob:
+        verb, glob = "*", pattern
+    return fnmatch.fnmatchcase(method, verb.upper()) and fnmatch.fnmatchcase(path, glob)
+
+
+@dataclass
+class FaultProfile:
+    """What to inject, for all requests and per endpoint.
+
+    Endpoints are patterns of a method and a path glob, e.g. ``POST /v1/evaluators/execute/*``,
+    or a path glob alone. The first endpoint matching a request applies; the options it sets
+    replace those of ``default``.
+    """
+
+    default: Faults = field(default_factory=Faults)
+    endpoints: List[Tuple[str, Faults]] = field(default_factory=list)
+    storms: List[Storm] = field(default_factory=list)
+    #: Seed of the random draws, for reproducible runs.
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> FaultProfile:
+        """Build a profile from its declarative form, e.g. loaded from JSON or YAML.
+
+        Top-level :class:`Faults` options are the defaults; ``endpoints`` maps patterns to
+        the options they replace, ``storms`` lists :class:`Storm` options, ``seed`` seeds the draws.
+        """
+        options = dict(data)
+        endpoints = options.pop("endpoints", {})
+        storms = options.pop("storms", [])
+        seed = options.pop("seed", None)
+        default = Faults().update(options)
+        return cls(
+            default=default,
+            endpoints=[(pattern, default.update(faults)) for pattern, faults in endpoints.items()],
+            storms=[Storm(**storm) for storm in storms],
+            seed=seed,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> FaultProfile:
+        """Read a profile from a JSON file."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def faults_for(self, method: str, path: str) -> Faults:
+        for pattern, faults in self.endpoints:
+            if _matches(pattern, method, path):
+                return faults
+        return self.default
+
+
+@dataclass
+class _Plan:
+    faults: Faults
+    delay: float
+    #: "storm", "error" or "drop", decided before sending; None to send the request.
+    fault: Optional[str] = None
+    status: int = 0
+    retry_after: Optional[float] = None
+    reset: bool = False
+    truncate: bool = False
+
+
+class FaultInjector(TransportWrapper):
+    """Injects the faults of a profile into the requests of the clients it wraps.
+
+    Args:
+      profile: A :class:`FaultProfile`, or its declarative form (see :meth:`FaultProfile.from_dict`).
+    """
+
+    def __init__(self, profile: Union[FaultProfile, Mapping[str, Any]]):
+        self.profile = profile if isinstance(profile, FaultProfile) else FaultProfile.from_dict(profile)
+        #: Faults injected, by kind: ``latency``, ``storm``, ``error``, ``drop``, ``reset``,
+        #: ``truncate`` and ``slow_body``.
+        self.injected: Counter[str] = Counter()
+        self._rng = random.Random(self.profile.seed)  # noqa: S311
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    def __reduce__(self) -> Any:
+        return (FaultInjector, (self.profile,))
+
+    def _plan(self, request: Request) -> _Plan:
+        method = request.method.upper()
+        path = urlsplit(request.url).path
+        faults = self.profile.faults_for(method, path)
+        elapsed = time.monotonic() - self._started
+        with self._lock:
+            plan = _Plan(faults, faults.latency.sample(self._rng))
+            storm = next(
+                (s for s in self.profile.storms if s.active(elapsed) and _matches(s.endpoint, method, path)), None
+            )
+            draw = self._rng.random()
+            if storm is not None:
+                plan.fault, plan.status, plan.retry_after = "storm", storm.status, storm.retry_after
+            elif draw < faults.drop_rate:
+                plan.fault = "drop"
+            elif draw < faults.drop_rate + faults.error_rate:
+                plan.fault, plan.status = "error", self._rng.choice(faults.statuses)
+                plan.retry_after = faults.retry_after
+            else:
+                plan.reset = self._rng.random() < faults.reset_rate
+                plan.truncate = self._rng.random() < faults.truncate_rate
+            if plan.delay > 0:
+                self.injected["latency"] += 1
+            if plan.fault:
+                self.injected[plan.fault] += 1
+        return plan
+
+    def _count(self, kind: str) -> None:
+        with self._lock:
+            self.injected[kind] += 1
+
+    def _error(self, plan: _Plan) -> Response:
+        headers = Headers({"Content-Type": "application/json"})
+        if plan.retry_after is not None:
+            headers["retry-after"] = f"{plan.retry_after:g}"
+        reason = http.HTTPStatus(plan.status).phrase
+        return Response(plan.status, reason, json.dumps({"detail": f"Injected {reason}"}).encode(), headers)
+
+    def _received(self, plan: _Plan, response: Response) -> Tuple[Response, float]:
+        # The response as the client gets it, and how long reading its body is delayed.
+        if plan.truncate:
+            self._count("truncate")
+            response = replace(response, data=response.data[: len(response.data) // 2])
+        if plan.faults.body_rate is None:
+            return response, 0.0
+        self._count("slow_body")
+        return response, len(response.data) / plan.faults.body_rate
+
+    def handle(self, request: Request, send: Callable[[Request], Response]) -> Response:
+        plan = self._plan(request)
+        time.sleep(plan.delay)
+        if plan.fault == "drop":
+            raise _sync_reset()
+        if plan.fault:
+            return self._error(plan)
+        response = send(request)
+        if plan.reset:
+            self._count("reset")
+            raise _sync_reset()
+        response, delay = self._received(plan, response)
+        time.sleep(delay)
+        return response
+
+    async def ahandle(self, request: Request, send: Callable[[Request], Awaitable[Response]]) -> Response:
+        plan = self._plan(request)
+        await asyncio.sleep(plan.delay)
+        if plan.fault == "drop":
+            raise _async_reset()
+        if plan.fault:
+            return self._error(plan)
+        response = await send(request)
+        if plan.reset:
+            self._count("reset")
+            raise _async_reset()
+        response, delay = self._received(plan, response)
+        await asyncio.sleep(delay)
+        return response
+
+
+# The errors urllib3 and aiohttp raise when the server resets a connection.
+
+
+def _sync_reset() -> Exception:
+    from urllib3.exceptions import ProtocolError
+
+    return ProtocolError("Connection aborted.", ConnectionResetError(errno.ECONNRESET, "Connection reset by peer"))
+
+
+def _async_reset() -> Exception:
+    import aiohttp
+
+    return aiohttp.ClientOSError(errno.ECONNRESET, "Connection reset by peer")
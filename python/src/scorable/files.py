@@ -1,24 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import mimetypes
+import threading
 import uuid
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from pathlib import Path
-from typing import IO, Optional, Union
+from typing import IO, TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-import aiohttp
 import requests
 
+from .__about__ import __version__
+from .metrics import CACHE_LOOKUPS
 from .utils import ClientContextCallable
 
+if TYPE_CHECKING:
+    from .generated import openapi_aclient
+    from .generated.openapi_client.models.file_upload_response import FileUploadResponse
+    from .upload_cache import UploadCache
+    from .upload_stream import ProgressCallback, UploadSource
+
 
 class Files:
     """
     Files API — upload documents and images for use in evaluator execution.
 
-    Access via ``client.files``.
+    Access via ``client.files``. With an :class:`scorable.upload_cache.UploadCache`, content that
+    was uploaded before is not sent again; its cached file ID is returned instead.
     """
 
-    def __init__(self, client_context: ClientContextCallable, base_url: str, api_key: str):
+    def __init__(
+        self,
+        client_context: ClientContextCallable,
+        base_url: str,
+        api_key: str,
+        cache: Optional[UploadCache] = None,
+        install: Optional[Callable[[Any], None]] = None,
+    ):
         self.client_context = client_context
         self.base_url = base_url
         self.api_key = api_key
+        self.cache = cache
+        # Installs the request hooks and transport wrappers of the client on temporary API clients.
+        self._install = install
+        # Uploads in flight by content digest, shared by the event loops of every thread.
+        self._inflight: Dict[str, concurrent.futures.Future[uuid.UUID]] = {}
+        self._inflight_lock = threading.Lock()
 
     def upload(
         self,
@@ -39,6 +68,25 @@ class Files:
             UUID of the uploaded file. Pass this to the ``file_ids`` parameter
             of :meth:`Evaluator.run`.
         """
+        if self.cache is None:
+            return self._post(file, filename, _request_timeout=_request_timeout)
+        from .upload_cache import content_digest
+
+        digest = content_digest(file)
+        file_id = self.cache.get(digest)
+        CACHE_LOOKUPS.inc("upload", "miss" if file_id is None else "hit")
+        if file_id is None:
+            file_id = self._post(file, filename, _request_timeout=_request_timeout)
+            self.cache.put(digest, file_id)
+        return file_id
+
+    def _post(
+        self,
+        file: Union[str, IO[bytes]],
+        filename: Optional[str],
+        *,
+        _request_timeout: Optional[int],
+    ) -> uuid.UUID:
         _file = None
         try:
             _filename: str
@@ -66,37 +114,186 @@ class Files:
 
     async def aupload(
         self,
-        file: Union[str, IO[bytes]],
+        file: UploadSource,
         filename: Optional[str] = None,
         *,
+        progress: Optional[ProgressCallback] = None,
         _request_timeout: Optional[int] = None,
     ) -> uuid.UUID:
-        """Asynchronously upload a file and return its ID."""
-        _file = None
+        """Asynchronously upload a file and return its ID.
+
+        Besides paths and file objects, ``file`` may be the content itself (bytes or a memoryview)
+        or an asynchronous iterator of byte chunks. Files are streamed rather than read into memory,
+        and concurrent uploads of the same content share a single request.
+        """
+        async with self._async_client() as api_client:
+            return await self._aupload(api_client, file, filename, progress, _request_timeout)
+
+    def upload_many(
+        self,
+        files: Sequence[Union[UploadSource, Tuple[str, UploadSource]]],
+        *,
+        concurrency: int = 8,
+        progress: Optional[Callable[[int, int, Optional[int]], None]] = None,
+        _request_timeout: Optional[int] = None,
+    ) -> List[Union[uuid.UUID, BaseException]]:
+        """
+        Upload many files concurrently over one connection pool.
+
+        Args:
+            files: Paths, file objects, bytes-like content or asynchronous byte iterators, each
+                optionally paired with its file name as a ``(filename, file)`` tuple.
+            concurrency: Maximum number of uploads in flight.
+            progress: Called with the position of a file in ``files``, the bytes of it sent so far
+                and its size (None for iterators) as the upload progresses.
+
+        Returns:
+            The file IDs in the order of ``files``. A failed upload has the exception in place of its ID.
+        """
+        from .background import BackgroundTransport
+
+        transport = getattr(self.client_context, "__self__", None)
+        coro = self.aupload_many(files, concurrency=concurrency, progress=progress, _request_timeout=_request_timeout)
+        if isinstance(transport, BackgroundTransport):
+            return transport.submit(coro).result()
+        if isinstance(self.client_context(), AbstractAsyncContextManager):
+            coro.close()
+            raise AssertionError("This method is not available in asynchronous mode")
+        return asyncio.run(coro)
+
+    async def aupload_many(
+        self,
+        files: Sequence[Union[UploadSource, Tuple[str, UploadSource]]],
+        *,
+        concurrency: int = 8,
+        progress: Optional[Callable[[int, int, Optional[int]], None]] = None,
+        _request_timeout: Optional[int] = None,
+    ) -> List[Union[uuid.UUID, BaseException]]:
+        """
+        Asynchronously upload many files concurrently over one connection pool.
+
+        Args:
+            files: Paths, file objects, bytes-like content or asynchronous byte iterators, each
+                optionally paired with its file name as a ``(filename, file)`` tuple.
+            concurrency: Maximum number of uploads in flight.
+            progress: Called with the position of a file in ``files``, the bytes of it sent so far
+                and its size (None for iterators) as the upload progresses.
+
+        Returns:
+            The file IDs in the order of ``files``. A failed upload has the exception in place of its ID.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with self._async_client() as api_client:
+
+            async def upload(index: int, item: Union[UploadSource, Tuple[str, UploadSource]]) -> uuid.UUID:
+                filename, file = item if isinstance(item, tuple) else (None, item)
+                report = None if progress is None else functools.partial(progress, index)
+                async with semaphore:
+                    return await self._aupload(api_client, file, filename, report, _request_timeout)
+
+            return await asyncio.gather(
+                *(upload(index, item) for index, item in enumerate(files)), return_exceptions=True
+            )
+
+    @asynccontextmanager
+    async def _async_client(self) -> AsyncIterator[openapi_aclient.ApiClient]:
+        # The client of an asynchronous or background-loop context, whose connection pool is
+        # reused; a synchronous client gets a temporary asynchronous one.
+        context = self.client_context()
+        if isinstance(context, AbstractAsyncContextManager):
+            async with context as api_client:
+                yield api_client
+            return
+        from .generated import openapi_aclient
+        from .generated.openapi_aclient.configuration import Configuration
+
+        config = Configuration(host=self.base_url)
+        config.api_key["publicApiKey"] = f"Api-Key {self.api_key}"
+        async with openapi_aclient.ApiClient(config) as api_client:
+            api_client.user_agent = f"rs-python-sdk/{__version__}"
+            if self._install is not None:
+                self._install(api_client)
+            yield api_client
+
+    async def _aupload(
+        self,
+        api_client: openapi_aclient.ApiClient,
+        file: UploadSource,
+        filename: Optional[str],
+        progress: Optional[ProgressCallback],
+        _request_timeout: Optional[int],
+        digest: Optional[str] = None,
+    ) -> uuid.UUID:
+        # Uploads with a known ``digest`` (or any with a cache) share the request of a concurrent
+        # upload of the same content.
+        from .upload_stream import source_filename
+
+        filename = source_filename(file, filename)
+        if digest is None:
+            if self.cache is None or hasattr(file, "__aiter__"):
+                return await self._apost(api_client, file, filename, progress, _request_timeout)
+            from .upload_cache import content_digest
+
+            # hashlib releases the GIL, so large files are hashed without blocking the loop.
+            digest = await asyncio.to_thread(content_digest, file)
+        with self._inflight_lock:
+            pending = self._inflight.get(digest)
+            if pending is None:
+                owned = self._inflight[digest] = concurrent.futures.Future()
+        if pending is not None:
+            CACHE_LOOKUPS.inc("upload", "hit")
+            return await asyncio.shield(asyncio.wrap_future(pending))
         try:
-            form = aiohttp.FormData()
-            _filename: str
-            if isinstance(file, str):
-                _file = open(file, "rb")
-                _filename = filename or Path(file).name
-                form.add_field("file", _file, filename=_filename)
-            else:
-                raw_name = getattr(file, "name", None)
-                _filename = filename or Path(str(raw_name or "upload")).name
-                form.add_field("file", file, filename=_filename)
-
-            timeout = aiohttp.ClientTimeout(total=120 if _request_timeout is None else _request_timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    f"{self.base_url}/v1/files/",
-                    headers={"Authorization": f"Api-Key {self.api_key}"},
-                    data=form,
-                ) as resp:
-                    if not resp.ok:
-                        text = await resp.text()
-                        raise Exception(f"File upload failed with status {resp.status}: {text}")
-                    data = await resp.json()
-                    return uuid.UUID(data["id"])
+            file_id = None
+            if self.cache is not None:
+                # The cache may wait for a lock on its database, which must not block the loop.
+                file_id = await asyncio.to_thread(self.cache.get, digest)
+                CACHE_LOOKUPS.inc("upload", "miss" if file_id is None else "hit")
+            if file_id is None:
+                file_id = await self._apost(api_client, file, filename, progress, _request_timeout)
+                if self.cache is not None:
+                    await asyncio.to_thread(self.cache.put, digest, file_id)
+            owned.set_result(file_id)
+            return file_id
+        except asyncio.CancelledError:
+            owned.cancel()
+            raise
+        except BaseException as e:
+            owned.set_exception(e)
+            raise
         finally:
-            if _file and not _file.closed:
-                _file.close()
+            with self._inflight_lock:
+                del self._inflight[digest]
+
+    async def _apost(
+        self,
+        api_client: openapi_aclient.ApiClient,
+        file: UploadSource,
+        filename: str,
+        progress: Optional[ProgressCallback],
+        _request_timeout: Optional[int],
+    ) -> uuid.UUID:
+        from .upload_stream import upload_body
+
+        method, url, headers, body, _ = api_client.param_serialize(
+            method="POST",
+            resource_path="/v1/files/",
+            header_params={"Accept": "application/json", "Content-Type": "multipart/form-data"},
+            auth_settings=["publicApiKey"],
+        )
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        with upload_body(file, filename, content_type, progress) as value:
+            response = await api_client.call_api(
+                method,
+                url,
+                headers,
+                body,
+                [("file", (filename, value, content_type))],
+                _request_timeout=120 if _request_timeout is None else _request_timeout,
+            )
+            await response.read()
+        uploaded: FileUploadResponse = api_client.response_deserialize(
+            response, {"200": "FileUploadResponse", "201": "FileUploadResponse"}
+        ).data  # type: ignore[assignment]
+        return uuid.UUID(uploaded.id)
@@ -19,11 +19,11 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.annotation import Annotation
-from scorable.generated.openapi_aclient.models.annotation_request import AnnotationRequest
-from scorable.generated.openapi_aclient.models.paginated_annotation_list import PaginatedAnnotationList
-from scorable.generated.openapi_aclient.models.patched_annotation_request import PatchedAnnotationRequest
 from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.annotation import Annotation
+from scorable.generated.openapi_client.models.annotation_request import AnnotationRequest
+from scorable.generated.openapi_client.models.paginated_annotation_list import PaginatedAnnotationList
+from scorable.generated.openapi_client.models.patched_annotation_request import PatchedAnnotationRequest
 
 
 class AnnotationsApi:
@@ -19,13 +19,13 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.calibration_run import CalibrationRun
-from scorable.generated.openapi_aclient.models.calibration_run_create_request import CalibrationRunCreateRequest
-from scorable.generated.openapi_aclient.models.paginated_calibration_run_item_list import (
+from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.calibration_run import CalibrationRun
+from scorable.generated.openapi_client.models.calibration_run_create_request import CalibrationRunCreateRequest
+from scorable.generated.openapi_client.models.paginated_calibration_run_item_list import (
     PaginatedCalibrationRunItemList,
 )
-from scorable.generated.openapi_aclient.models.paginated_calibration_run_list import PaginatedCalibrationRunList
-from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.paginated_calibration_run_list import PaginatedCalibrationRunList
 
 
 class CalibrationRunsApi:
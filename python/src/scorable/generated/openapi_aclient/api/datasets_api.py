@@ -19,15 +19,15 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.data_set_create import DataSetCreate
-from scorable.generated.openapi_aclient.models.data_set_create_request import DataSetCreateRequest
-from scorable.generated.openapi_aclient.models.data_set_list import DataSetList
-from scorable.generated.openapi_aclient.models.dataset_item import DatasetItem
-from scorable.generated.openapi_aclient.models.dataset_item_request import DatasetItemRequest
-from scorable.generated.openapi_aclient.models.paginated_data_set_list_list import PaginatedDataSetListList
-from scorable.generated.openapi_aclient.models.paginated_dataset_item_list import PaginatedDatasetItemList
-from scorable.generated.openapi_aclient.models.patched_dataset_item_request import PatchedDatasetItemRequest
 from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.data_set_create import DataSetCreate
+from scorable.generated.openapi_client.models.data_set_create_request import DataSetCreateRequest
+from scorable.generated.openapi_client.models.data_set_list import DataSetList
+from scorable.generated.openapi_client.models.dataset_item import DatasetItem
+from scorable.generated.openapi_client.models.dataset_item_request import DatasetItemRequest
+from scorable.generated.openapi_client.models.paginated_data_set_list_list import PaginatedDataSetListList
+from scorable.generated.openapi_client.models.paginated_dataset_item_list import PaginatedDatasetItemList
+from scorable.generated.openapi_client.models.patched_dataset_item_request import PatchedDatasetItemRequest
 
 
 class DatasetsApi:
@@ -19,8 +19,8 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.file_upload_response import FileUploadResponse
 from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.file_upload_response import FileUploadResponse
 
 
 class FilesApi:
@@ -20,29 +20,29 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.duplicate_judge_request_request import DuplicateJudgeRequestRequest
-from scorable.generated.openapi_aclient.models.judge import Judge
-from scorable.generated.openapi_aclient.models.judge_batch_execution_detail import JudgeBatchExecutionDetail
-from scorable.generated.openapi_aclient.models.judge_batch_execution_request import JudgeBatchExecutionRequest
-from scorable.generated.openapi_aclient.models.judge_batch_execution_response import JudgeBatchExecutionResponse
-from scorable.generated.openapi_aclient.models.judge_claim_request_request import JudgeClaimRequestRequest
-from scorable.generated.openapi_aclient.models.judge_execution_request import JudgeExecutionRequest
-from scorable.generated.openapi_aclient.models.judge_execution_response import JudgeExecutionResponse
-from scorable.generated.openapi_aclient.models.judge_generator_request import JudgeGeneratorRequest
-from scorable.generated.openapi_aclient.models.judge_generator_response import JudgeGeneratorResponse
-from scorable.generated.openapi_aclient.models.judge_invite_request import JudgeInviteRequest
-from scorable.generated.openapi_aclient.models.judge_rectifier_request_request import JudgeRectifierRequestRequest
-from scorable.generated.openapi_aclient.models.judge_rectifier_response import JudgeRectifierResponse
-from scorable.generated.openapi_aclient.models.judge_request import JudgeRequest
-from scorable.generated.openapi_aclient.models.judges_synthetic_data_retrieve200_response import (
+from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.duplicate_judge_request_request import DuplicateJudgeRequestRequest
+from scorable.generated.openapi_client.models.judge import Judge
+from scorable.generated.openapi_client.models.judge_batch_execution_detail import JudgeBatchExecutionDetail
+from scorable.generated.openapi_client.models.judge_batch_execution_request import JudgeBatchExecutionRequest
+from scorable.generated.openapi_client.models.judge_batch_execution_response import JudgeBatchExecutionResponse
+from scorable.generated.openapi_client.models.judge_claim_request_request import JudgeClaimRequestRequest
+from scorable.generated.openapi_client.models.judge_execution_request import JudgeExecutionRequest
+from scorable.generated.openapi_client.models.judge_execution_response import JudgeExecutionResponse
+from scorable.generated.openapi_client.models.judge_generator_request import JudgeGeneratorRequest
+from scorable.generated.openapi_client.models.judge_generator_response import JudgeGeneratorResponse
+from scorable.generated.openapi_client.models.judge_invite_request import JudgeInviteRequest
+from scorable.generated.openapi_client.models.judge_rectifier_request_request import JudgeRectifierRequestRequest
+from scorable.generated.openapi_client.models.judge_rectifier_response import JudgeRectifierResponse
+from scorable.generated.openapi_client.models.judge_request import JudgeRequest
+from scorable.generated.openapi_client.models.judges_synthetic_data_retrieve200_response import (
     JudgesSyntheticDataRetrieve200Response,
 )
-from scorable.generated.openapi_aclient.models.paginated_judge_batch_execution_list_item_list import (
+from scorable.generated.openapi_client.models.paginated_judge_batch_execution_list_item_list import (
     PaginatedJudgeBatchExecutionListItemList,
 )
-from scorable.generated.openapi_aclient.models.paginated_judge_list_list import PaginatedJudgeListList
-from scorable.generated.openapi_aclient.models.patched_judge_request import PatchedJudgeRequest
-from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.paginated_judge_list_list import PaginatedJudgeListList
+from scorable.generated.openapi_client.models.patched_judge_request import PatchedJudgeRequest
 
 
 class JudgesApi:
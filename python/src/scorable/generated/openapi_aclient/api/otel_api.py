@@ -19,15 +19,15 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.otel_trace import OtelTrace
-from scorable.generated.openapi_aclient.models.otel_trace_evaluation_filter_input_request import (
+from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.otel_trace import OtelTrace
+from scorable.generated.openapi_client.models.otel_trace_evaluation_filter_input_request import (
     OtelTraceEvaluationFilterInputRequest,
 )
-from scorable.generated.openapi_aclient.models.otel_trace_evaluation_filter_output import (
+from scorable.generated.openapi_client.models.otel_trace_evaluation_filter_output import (
     OtelTraceEvaluationFilterOutput,
 )
-from scorable.generated.openapi_aclient.models.paginated_otel_trace_record_list import PaginatedOtelTraceRecordList
-from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.paginated_otel_trace_record_list import PaginatedOtelTraceRecordList
 
 
 class OtelApi:
@@ -19,11 +19,11 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.paginated_project_list import PaginatedProjectList
-from scorable.generated.openapi_aclient.models.patched_project_request import PatchedProjectRequest
-from scorable.generated.openapi_aclient.models.project import Project
-from scorable.generated.openapi_aclient.models.project_request import ProjectRequest
 from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.paginated_project_list import PaginatedProjectList
+from scorable.generated.openapi_client.models.patched_project_request import PatchedProjectRequest
+from scorable.generated.openapi_client.models.project import Project
+from scorable.generated.openapi_client.models.project_request import ProjectRequest
 
 
 class ProjectsApi:
@@ -19,11 +19,11 @@ from typing_extensions import Annotated
 
 from scorable.generated.openapi_aclient.api_client import ApiClient, RequestSerialized
 from scorable.generated.openapi_aclient.api_response import ApiResponse
-from scorable.generated.openapi_aclient.models.paginated_score_config_list import PaginatedScoreConfigList
-from scorable.generated.openapi_aclient.models.patched_score_config_request import PatchedScoreConfigRequest
-from scorable.generated.openapi_aclient.models.score_config import ScoreConfig
-from scorable.generated.openapi_aclient.models.score_config_request import ScoreConfigRequest
 from scorable.generated.openapi_aclient.rest import RESTResponseType
+from scorable.generated.openapi_client.models.paginated_score_config_list import PaginatedScoreConfigList
+from scorable.generated.openapi_client.models.patched_score_config_request import PatchedScoreConfigRequest
+from scorable.generated.openapi_client.models.score_config import ScoreConfig
+from scorable.generated.openapi_client.models.score_config_request import ScoreConfigRequest
 
 
 class ScoreConfigsApi:
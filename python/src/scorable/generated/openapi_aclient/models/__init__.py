@@ -12,165 +12,18 @@ Generated by OpenAPI Generator (https://openapi-generator.tech)
 Do not edit the class manually.
 """  # noqa: E501
 
-# import models into model package
-from scorable.generated.openapi_aclient.models.annotation import Annotation
-from scorable.generated.openapi_aclient.models.annotation_request import AnnotationRequest
-from scorable.generated.openapi_aclient.models.annotation_status_enum import AnnotationStatusEnum
-from scorable.generated.openapi_aclient.models.batch_execution_status import BatchExecutionStatus
-from scorable.generated.openapi_aclient.models.batch_set_tags_model_request import BatchSetTagsModelRequest
-from scorable.generated.openapi_aclient.models.calibration_run import CalibrationRun
-from scorable.generated.openapi_aclient.models.calibration_run_create_request import CalibrationRunCreateRequest
-from scorable.generated.openapi_aclient.models.calibration_run_item import CalibrationRunItem
-from scorable.generated.openapi_aclient.models.calibration_run_source_request import CalibrationRunSourceRequest
-from scorable.generated.openapi_aclient.models.calibration_run_status_enum import CalibrationRunStatusEnum
-from scorable.generated.openapi_aclient.models.calibration_source_type_enum import CalibrationSourceTypeEnum
-from scorable.generated.openapi_aclient.models.data_set_create import DataSetCreate
-from scorable.generated.openapi_aclient.models.data_set_create_request import DataSetCreateRequest
-from scorable.generated.openapi_aclient.models.data_set_list import DataSetList
-from scorable.generated.openapi_aclient.models.data_set_type import DataSetType
-from scorable.generated.openapi_aclient.models.dataset_item import DatasetItem
-from scorable.generated.openapi_aclient.models.dataset_item_request import DatasetItemRequest
-from scorable.generated.openapi_aclient.models.dataset_range_request import DatasetRangeRequest
-from scorable.generated.openapi_aclient.models.duplicate_judge_request_request import DuplicateJudgeRequestRequest
-from scorable.generated.openapi_aclient.models.duplicate_request import DuplicateRequest
-from scorable.generated.openapi_aclient.models.evaluator import Evaluator
-from scorable.generated.openapi_aclient.models.evaluator_behavior_enum import EvaluatorBehaviorEnum
-from scorable.generated.openapi_aclient.models.evaluator_calibration_output import EvaluatorCalibrationOutput
-from scorable.generated.openapi_aclient.models.evaluator_calibration_result import EvaluatorCalibrationResult
-from scorable.generated.openapi_aclient.models.evaluator_demonstrations import EvaluatorDemonstrations
-from scorable.generated.openapi_aclient.models.evaluator_demonstrations_request import EvaluatorDemonstrationsRequest
-from scorable.generated.openapi_aclient.models.evaluator_execution_request import EvaluatorExecutionRequest
-from scorable.generated.openapi_aclient.models.evaluator_execution_result import EvaluatorExecutionResult
-from scorable.generated.openapi_aclient.models.evaluator_import_yaml_request_request import (
-    EvaluatorImportYamlRequestRequest,
-)
-from scorable.generated.openapi_aclient.models.evaluator_inputs_value import EvaluatorInputsValue
-from scorable.generated.openapi_aclient.models.evaluator_inputs_value_items import EvaluatorInputsValueItems
-from scorable.generated.openapi_aclient.models.evaluator_list_output import EvaluatorListOutput
-from scorable.generated.openapi_aclient.models.evaluator_reference import EvaluatorReference
-from scorable.generated.openapi_aclient.models.evaluator_reference_request import EvaluatorReferenceRequest
-from scorable.generated.openapi_aclient.models.evaluator_request import EvaluatorRequest
-from scorable.generated.openapi_aclient.models.evaluator_result import EvaluatorResult
-from scorable.generated.openapi_aclient.models.execution_log_details import ExecutionLogDetails
-from scorable.generated.openapi_aclient.models.execution_log_details_evaluation_context import (
-    ExecutionLogDetailsEvaluationContext,
-)
-from scorable.generated.openapi_aclient.models.execution_log_details_evaluator_latencies_inner import (
-    ExecutionLogDetailsEvaluatorLatenciesInner,
-)
-from scorable.generated.openapi_aclient.models.execution_log_list import ExecutionLogList
-from scorable.generated.openapi_aclient.models.execution_log_list_evaluation_context import (
-    ExecutionLogListEvaluationContext,
-)
-from scorable.generated.openapi_aclient.models.experiment_status_enum import ExperimentStatusEnum
-from scorable.generated.openapi_aclient.models.file_upload_response import FileUploadResponse
-from scorable.generated.openapi_aclient.models.generation_model_params_request import GenerationModelParamsRequest
-from scorable.generated.openapi_aclient.models.id import ID
-from scorable.generated.openapi_aclient.models.input_variable import InputVariable
-from scorable.generated.openapi_aclient.models.input_variable_request import InputVariableRequest
-from scorable.generated.openapi_aclient.models.judge import Judge
-from scorable.generated.openapi_aclient.models.judge_batch_execution_detail import JudgeBatchExecutionDetail
-from scorable.generated.openapi_aclient.models.judge_batch_execution_input_request import (
-    JudgeBatchExecutionInputRequest,
-)
-from scorable.generated.openapi_aclient.models.judge_batch_execution_item import JudgeBatchExecutionItem
-from scorable.generated.openapi_aclient.models.judge_batch_execution_item_input import JudgeBatchExecutionItemInput
-from scorable.generated.openapi_aclient.models.judge_batch_execution_item_status_enum import (
-    JudgeBatchExecutionItemStatusEnum,
-)
-from scorable.generated.openapi_aclient.models.judge_batch_execution_list_item import JudgeBatchExecutionListItem
-from scorable.generated.openapi_aclient.models.judge_batch_execution_request import JudgeBatchExecutionRequest
-from scorable.generated.openapi_aclient.models.judge_batch_execution_response import JudgeBatchExecutionResponse
-from scorable.generated.openapi_aclient.models.judge_claim_request_request import JudgeClaimRequestRequest
-from scorable.generated.openapi_aclient.models.judge_execution_request import JudgeExecutionRequest
-from scorable.generated.openapi_aclient.models.judge_execution_response import JudgeExecutionResponse
-from scorable.generated.openapi_aclient.models.judge_files_inner import JudgeFilesInner
-from scorable.generated.openapi_aclient.models.judge_generator_request import JudgeGeneratorRequest
-from scorable.generated.openapi_aclient.models.judge_generator_response import JudgeGeneratorResponse
-from scorable.generated.openapi_aclient.models.judge_invite_request import JudgeInviteRequest
-from scorable.generated.openapi_aclient.models.judge_list import JudgeList
-from scorable.generated.openapi_aclient.models.judge_rectifier_request_request import JudgeRectifierRequestRequest
-from scorable.generated.openapi_aclient.models.judge_rectifier_response import JudgeRectifierResponse
-from scorable.generated.openapi_aclient.models.judge_request import JudgeRequest
-from scorable.generated.openapi_aclient.models.judges_synthetic_data_retrieve200_response import (
-    JudgesSyntheticDataRetrieve200Response,
-)
-from scorable.generated.openapi_aclient.models.judges_synthetic_data_retrieve200_response_samples_inner import (
-    JudgesSyntheticDataRetrieve200ResponseSamplesInner,
-)
-from scorable.generated.openapi_aclient.models.message_log_turn import MessageLogTurn
-from scorable.generated.openapi_aclient.models.message_turn_request import MessageTurnRequest
-from scorable.generated.openapi_aclient.models.model import Model
-from scorable.generated.openapi_aclient.models.model_list import ModelList
-from scorable.generated.openapi_aclient.models.model_list_visibility_enum import ModelListVisibilityEnum
-from scorable.generated.openapi_aclient.models.model_request import ModelRequest
-from scorable.generated.openapi_aclient.models.model_test_request_request import ModelTestRequestRequest
-from scorable.generated.openapi_aclient.models.model_test_response import ModelTestResponse
-from scorable.generated.openapi_aclient.models.nested_evaluator import NestedEvaluator
-from scorable.generated.openapi_aclient.models.nested_evaluator_objective import NestedEvaluatorObjective
-from scorable.generated.openapi_aclient.models.nested_evaluator_request import NestedEvaluatorRequest
-from scorable.generated.openapi_aclient.models.nested_judge import NestedJudge
-from scorable.generated.openapi_aclient.models.nested_objective_list import NestedObjectiveList
-from scorable.generated.openapi_aclient.models.nested_user_details import NestedUserDetails
-from scorable.generated.openapi_aclient.models.nested_user_details_request import NestedUserDetailsRequest
-from scorable.generated.openapi_aclient.models.null_enum import NullEnum
-from scorable.generated.openapi_aclient.models.objective import Objective
-from scorable.generated.openapi_aclient.models.objective_list import ObjectiveList
-from scorable.generated.openapi_aclient.models.objective_request import ObjectiveRequest
-from scorable.generated.openapi_aclient.models.otel_trace import OtelTrace
-from scorable.generated.openapi_aclient.models.otel_trace_evaluation_filter_input_request import (
-    OtelTraceEvaluationFilterInputRequest,
-)
-from scorable.generated.openapi_aclient.models.otel_trace_evaluation_filter_output import (
-    OtelTraceEvaluationFilterOutput,
-)
-from scorable.generated.openapi_aclient.models.otel_trace_record import OtelTraceRecord
-from scorable.generated.openapi_aclient.models.paginated_annotation_list import PaginatedAnnotationList
-from scorable.generated.openapi_aclient.models.paginated_calibration_run_item_list import (
-    PaginatedCalibrationRunItemList,
-)
-from scorable.generated.openapi_aclient.models.paginated_calibration_run_list import PaginatedCalibrationRunList
-from scorable.generated.openapi_aclient.models.paginated_data_set_list_list import PaginatedDataSetListList
-from scorable.generated.openapi_aclient.models.paginated_dataset_item_list import PaginatedDatasetItemList
-from scorable.generated.openapi_aclient.models.paginated_evaluator_list import PaginatedEvaluatorList
-from scorable.generated.openapi_aclient.models.paginated_evaluator_list_output_list import (
-    PaginatedEvaluatorListOutputList,
-)
-from scorable.generated.openapi_aclient.models.paginated_execution_log_list_list import PaginatedExecutionLogListList
-from scorable.generated.openapi_aclient.models.paginated_judge_batch_execution_list_item_list import (
-    PaginatedJudgeBatchExecutionListItemList,
-)
-from scorable.generated.openapi_aclient.models.paginated_judge_list_list import PaginatedJudgeListList
-from scorable.generated.openapi_aclient.models.paginated_model_list_list import PaginatedModelListList
-from scorable.generated.openapi_aclient.models.paginated_objective_list import PaginatedObjectiveList
-from scorable.generated.openapi_aclient.models.paginated_objective_list_list import PaginatedObjectiveListList
-from scorable.generated.openapi_aclient.models.paginated_otel_trace_record_list import PaginatedOtelTraceRecordList
-from scorable.generated.openapi_aclient.models.paginated_project_list import PaginatedProjectList
-from scorable.generated.openapi_aclient.models.paginated_score_config_list import PaginatedScoreConfigList
-from scorable.generated.openapi_aclient.models.patched_annotation_request import PatchedAnnotationRequest
-from scorable.generated.openapi_aclient.models.patched_dataset_item_request import PatchedDatasetItemRequest
-from scorable.generated.openapi_aclient.models.patched_evaluator_request import PatchedEvaluatorRequest
-from scorable.generated.openapi_aclient.models.patched_judge_request import PatchedJudgeRequest
-from scorable.generated.openapi_aclient.models.patched_model_request import PatchedModelRequest
-from scorable.generated.openapi_aclient.models.patched_objective_request import PatchedObjectiveRequest
-from scorable.generated.openapi_aclient.models.patched_project_request import PatchedProjectRequest
-from scorable.generated.openapi_aclient.models.patched_score_config_request import PatchedScoreConfigRequest
-from scorable.generated.openapi_aclient.models.project import Project
-from scorable.generated.openapi_aclient.models.project_request import ProjectRequest
-from scorable.generated.openapi_aclient.models.provider import Provider
-from scorable.generated.openapi_aclient.models.reasoning_effort_enum import ReasoningEffortEnum
-from scorable.generated.openapi_aclient.models.reference_variable_request import ReferenceVariableRequest
-from scorable.generated.openapi_aclient.models.role_enum import RoleEnum
-from scorable.generated.openapi_aclient.models.score_config import ScoreConfig
-from scorable.generated.openapi_aclient.models.score_config_request import ScoreConfigRequest
-from scorable.generated.openapi_aclient.models.score_config_type_enum import ScoreConfigTypeEnum
-from scorable.generated.openapi_aclient.models.skill_execution_validator_result import SkillExecutionValidatorResult
-from scorable.generated.openapi_aclient.models.skill_test_data_request import SkillTestDataRequest
-from scorable.generated.openapi_aclient.models.skill_test_data_request_dataset_range import (
-    SkillTestDataRequestDatasetRange,
-)
-from scorable.generated.openapi_aclient.models.skill_test_input_behavior_enum import SkillTestInputBehaviorEnum
-from scorable.generated.openapi_aclient.models.skill_test_input_request import SkillTestInputRequest
-from scorable.generated.openapi_aclient.models.status_enum import StatusEnum
-from scorable.generated.openapi_aclient.models.validation_result_status import ValidationResultStatus
-from scorable.generated.openapi_aclient.models.visibility_enum import VisibilityEnum
+# This file is rewritten by tools/share_generated_models.py (make fix-openapi-client).
+# The async client shares its models with the synchronous one; this module only
+# keeps ``scorable.generated.openapi_aclient.models.<Model>`` lookups working.
+
+from scorable.generated.openapi_client import models as _models
+
+__all__ = _models.__all__
+
+
+def __getattr__(name: str):
+    return getattr(_models, name)
+
+
+def __dir__():
+    return dir(_models)
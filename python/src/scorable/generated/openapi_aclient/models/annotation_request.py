@@ -1,128 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set, Union
-
-from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, StrictStr
-from typing_extensions import Annotated, Self
-
-from scorable.generated.openapi_aclient.models.annotation_status_enum import AnnotationStatusEnum
-
-
-class AnnotationRequest(BaseModel):
-    """
-    AnnotationRequest
-    """  # noqa: E501
-
-    dataset_item: Optional[StrictStr] = None
-    execution_log: Optional[StrictStr] = None
-    score_config: Optional[StrictStr] = None
-    value: Optional[Union[StrictFloat, StrictInt]] = None
-    category: Optional[Annotated[str, Field(strict=True, max_length=255)]] = None
-    rationale: Optional[StrictStr] = None
-    status: Optional[AnnotationStatusEnum] = None
-    __properties: ClassVar[List[str]] = [
-        "dataset_item",
-        "execution_log",
-        "score_config",
-        "value",
-        "category",
-        "rationale",
-        "status",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of AnnotationRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # set to None if dataset_item (nullable) is None
-        # and model_fields_set contains the field
-        if self.dataset_item is None and "dataset_item" in self.model_fields_set:
-            _dict["dataset_item"] = None
-
-        # set to None if execution_log (nullable) is None
-        # and model_fields_set contains the field
-        if self.execution_log is None and "execution_log" in self.model_fields_set:
-            _dict["execution_log"] = None
-
-        # set to None if value (nullable) is None
-        # and model_fields_set contains the field
-        if self.value is None and "value" in self.model_fields_set:
-            _dict["value"] = None
-
-        # set to None if category (nullable) is None
-        # and model_fields_set contains the field
-        if self.category is None and "category" in self.model_fields_set:
-            _dict["category"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of AnnotationRequest from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "dataset_item": obj.get("dataset_item"),
-                "execution_log": obj.get("execution_log"),
-                "score_config": obj.get("score_config"),
-                "value": obj.get("value"),
-                "category": obj.get("category"),
-                "rationale": obj.get("rationale"),
-                "status": obj.get("status"),
-            }
-        )
-        return _obj
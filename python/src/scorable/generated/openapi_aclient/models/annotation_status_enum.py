@@ -1,36 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-from enum import Enum
-
-from typing_extensions import Self
-
-
-class AnnotationStatusEnum(str, Enum):
-    """
-    * `draft` - draft * `published` - published
-    """
-
-    """
-    allowed enum values
-    """
-    DRAFT = "draft"
-    PUBLISHED = "published"
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Self:
-        """Create an instance of AnnotationStatusEnum from a JSON string"""
-        return cls(json.loads(json_str))
@@ -1,172 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from datetime import datetime
-from typing import Any, ClassVar, Dict, List, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr
-from typing_extensions import Self
-
-from scorable.generated.openapi_aclient.models.calibration_run_status_enum import CalibrationRunStatusEnum
-from scorable.generated.openapi_aclient.models.calibration_source_type_enum import CalibrationSourceTypeEnum
-
-
-class CalibrationRun(BaseModel):
-    """
-    CalibrationRun
-    """  # noqa: E501
-
-    id: StrictStr
-    evaluator_external_id: StrictStr
-    evaluator_version_id: StrictStr
-    score_config: Optional[StrictStr]
-    source_type: CalibrationSourceTypeEnum
-    dataset: Optional[StrictStr]
-    status: CalibrationRunStatusEnum
-    metrics: Optional[Any]
-    n_examples: StrictInt
-    n_skipped: StrictInt
-    error: StrictStr
-    created_at: Optional[datetime]
-    __properties: ClassVar[List[str]] = [
-        "id",
-        "evaluator_external_id",
-        "evaluator_version_id",
-        "score_config",
-        "source_type",
-        "dataset",
-        "status",
-        "metrics",
-        "n_examples",
-        "n_skipped",
-        "error",
-        "created_at",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of CalibrationRun from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        """
-        excluded_fields: Set[str] = set(
-            [
-                "id",
-                "evaluator_external_id",
-                "evaluator_version_id",
-                "score_config",
-                "source_type",
-                "dataset",
-                "status",
-                "metrics",
-                "n_examples",
-                "n_skipped",
-                "error",
-                "created_at",
-            ]
-        )
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # set to None if score_config (nullable) is None
-        # and model_fields_set contains the field
-        if self.score_config is None and "score_config" in self.model_fields_set:
-            _dict["score_config"] = None
-
-        # set to None if dataset (nullable) is None
-        # and model_fields_set contains the field
-        if self.dataset is None and "dataset" in self.model_fields_set:
-            _dict["dataset"] = None
-
-        # set to None if metrics (nullable) is None
-        # and model_fields_set contains the field
-        if self.metrics is None and "metrics" in self.model_fields_set:
-            _dict["metrics"] = None
-
-        # set to None if created_at (nullable) is None
-        # and model_fields_set contains the field
-        if self.created_at is None and "created_at" in self.model_fields_set:
-            _dict["created_at"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of CalibrationRun from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "id": obj.get("id"),
-                "evaluator_external_id": obj.get("evaluator_external_id"),
-                "evaluator_version_id": obj.get("evaluator_version_id"),
-                "score_config": obj.get("score_config"),
-                "source_type": obj.get("source_type"),
-                "dataset": obj.get("dataset"),
-                "status": obj.get("status"),
-                "metrics": obj.get("metrics"),
-                "n_examples": obj.get("n_examples"),
-                "n_skipped": obj.get("n_skipped"),
-                "error": obj.get("error"),
-                "created_at": obj.get("created_at"),
-            }
-        )
-        return _obj
@@ -1,186 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from datetime import datetime
-from typing import Any, ClassVar, Dict, List, Optional, Set, Union
-
-from pydantic import BaseModel, ConfigDict, StrictFloat, StrictInt, StrictStr
-from typing_extensions import Self
-
-from scorable.generated.openapi_aclient.models.experiment_status_enum import ExperimentStatusEnum
-
-
-class CalibrationRunItem(BaseModel):
-    """
-    CalibrationRunItem
-    """  # noqa: E501
-
-    id: StrictStr
-    annotation: Optional[StrictStr]
-    dataset_item: Optional[StrictStr]
-    execution_log: Optional[StrictStr]
-    evaluator_score: Optional[Union[StrictFloat, StrictInt]]
-    human_value: Optional[Union[StrictFloat, StrictInt]]
-    disagreement: Optional[Union[StrictFloat, StrictInt]]
-    status: ExperimentStatusEnum
-    justification: StrictStr
-    request: StrictStr
-    response: StrictStr
-    created_at: Optional[datetime]
-    __properties: ClassVar[List[str]] = [
-        "id",
-        "annotation",
-        "dataset_item",
-        "execution_log",
-        "evaluator_score",
-        "human_value",
-        "disagreement",
-        "status",
-        "justification",
-        "request",
-        "response",
-        "created_at",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of CalibrationRunItem from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        """
-        excluded_fields: Set[str] = set(
-            [
-                "id",
-                "annotation",
-                "dataset_item",
-                "execution_log",
-                "evaluator_score",
-                "human_value",
-                "disagreement",
-                "status",
-                "justification",
-                "request",
-                "response",
-                "created_at",
-            ]
-        )
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # set to None if annotation (nullable) is None
-        # and model_fields_set contains the field
-        if self.annotation is None and "annotation" in self.model_fields_set:
-            _dict["annotation"] = None
-
-        # set to None if dataset_item (nullable) is None
-        # and model_fields_set contains the field
-        if self.dataset_item is None and "dataset_item" in self.model_fields_set:
-            _dict["dataset_item"] = None
-
-        # set to None if execution_log (nullable) is None
-        # and model_fields_set contains the field
-        if self.execution_log is None and "execution_log" in self.model_fields_set:
-            _dict["execution_log"] = None
-
-        # set to None if evaluator_score (nullable) is None
-        # and model_fields_set contains the field
-        if self.evaluator_score is None and "evaluator_score" in self.model_fields_set:
-            _dict["evaluator_score"] = None
-
-        # set to None if human_value (nullable) is None
-        # and model_fields_set contains the field
-        if self.human_value is None and "human_value" in self.model_fields_set:
-            _dict["human_value"] = None
-
-        # set to None if disagreement (nullable) is None
-        # and model_fields_set contains the field
-        if self.disagreement is None and "disagreement" in self.model_fields_set:
-            _dict["disagreement"] = None
-
-        # set to None if created_at (nullable) is None
-        # and model_fields_set contains the field
-        if self.created_at is None and "created_at" in self.model_fields_set:
-            _dict["created_at"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of CalibrationRunItem from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "id": obj.get("id"),
-                "annotation": obj.get("annotation"),
-                "dataset_item": obj.get("dataset_item"),
-                "execution_log": obj.get("execution_log"),
-                "evaluator_score": obj.get("evaluator_score"),
-                "human_value": obj.get("human_value"),
-                "disagreement": obj.get("disagreement"),
-                "status": obj.get("status"),
-                "justification": obj.get("justification"),
-                "request": obj.get("request"),
-                "response": obj.get("response"),
-                "created_at": obj.get("created_at"),
-            }
-        )
-        return _obj
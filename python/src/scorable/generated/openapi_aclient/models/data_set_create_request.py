@@ -1,115 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set, Union
-
-from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictBytes, StrictStr
-from typing_extensions import Annotated, Self
-
-from scorable.generated.openapi_aclient.models.data_set_type import DataSetType
-
-
-class DataSetCreateRequest(BaseModel):
-    """
-    DataSetCreateRequest
-    """  # noqa: E501
-
-    name: Optional[Annotated[str, Field(min_length=1, strict=True)]] = None
-    file: Optional[Union[StrictBytes, StrictStr]] = None
-    draft_id: Optional[StrictStr] = None
-    type: Optional[DataSetType] = None
-    url: Optional[Annotated[str, Field(min_length=1, strict=True)]] = None
-    tags: Optional[List[StrictStr]] = None
-    has_header: Optional[StrictBool] = False
-    project_id: Optional[StrictStr] = Field(
-        default=None,
-        description="Project to associate this dataset with. Defaults to the organization's default project.",
-    )
-    __properties: ClassVar[List[str]] = ["name", "file", "draft_id", "type", "url", "tags", "has_header", "project_id"]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of DataSetCreateRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # set to None if name (nullable) is None
-        # and model_fields_set contains the field
-        if self.name is None and "name" in self.model_fields_set:
-            _dict["name"] = None
-
-        # set to None if project_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.project_id is None and "project_id" in self.model_fields_set:
-            _dict["project_id"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of DataSetCreateRequest from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "name": obj.get("name"),
-                "file": obj.get("file"),
-                "draft_id": obj.get("draft_id"),
-                "type": obj.get("type"),
-                "url": obj.get("url"),
-                "tags": obj.get("tags"),
-                "has_header": obj.get("has_header") if obj.get("has_header") is not None else False,
-                "project_id": obj.get("project_id"),
-            }
-        )
-        return _obj
@@ -1,176 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from datetime import datetime
-from typing import Any, ClassVar, Dict, List, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, StrictBool, StrictStr
-from typing_extensions import Self
-
-from scorable.generated.openapi_aclient.models.annotation import Annotation
-
-
-class DatasetItem(BaseModel):
-    """
-    DatasetItem
-    """  # noqa: E501
-
-    id: StrictStr
-    external_id: StrictStr
-    version_id: StrictStr
-    is_latest_version: StrictBool
-    response: StrictStr
-    request: Optional[StrictStr] = None
-    expected_output: Optional[StrictStr] = None
-    contexts: Optional[Any] = None
-    variables: Optional[Any] = None
-    metadata: Optional[Any] = None
-    change_note: Optional[StrictStr] = None
-    is_archived: StrictBool
-    annotations: List[Annotation]
-    created_at: Optional[datetime]
-    __properties: ClassVar[List[str]] = [
-        "id",
-        "external_id",
-        "version_id",
-        "is_latest_version",
-        "response",
-        "request",
-        "expected_output",
-        "contexts",
-        "variables",
-        "metadata",
-        "change_note",
-        "is_archived",
-        "annotations",
-        "created_at",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of DatasetItem from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        """
-        excluded_fields: Set[str] = set(
-            [
-                "id",
-                "external_id",
-                "version_id",
-                "is_latest_version",
-                "is_archived",
-                "annotations",
-                "created_at",
-            ]
-        )
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # override the default output from pydantic by calling `to_dict()` of each item in annotations (list)
-        _items = []
-        if self.annotations:
-            for _item in self.annotations:
-                if _item:
-                    _items.append(_item.to_dict())
-            _dict["annotations"] = _items
-        # set to None if contexts (nullable) is None
-        # and model_fields_set contains the field
-        if self.contexts is None and "contexts" in self.model_fields_set:
-            _dict["contexts"] = None
-
-        # set to None if variables (nullable) is None
-        # and model_fields_set contains the field
-        if self.variables is None and "variables" in self.model_fields_set:
-            _dict["variables"] = None
-
-        # set to None if metadata (nullable) is None
-        # and model_fields_set contains the field
-        if self.metadata is None and "metadata" in self.model_fields_set:
-            _dict["metadata"] = None
-
-        # set to None if created_at (nullable) is None
-        # and model_fields_set contains the field
-        if self.created_at is None and "created_at" in self.model_fields_set:
-            _dict["created_at"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of DatasetItem from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "id": obj.get("id"),
-                "external_id": obj.get("external_id"),
-                "version_id": obj.get("version_id"),
-                "is_latest_version": obj.get("is_latest_version") if obj.get("is_latest_version") is not None else True,
-                "response": obj.get("response"),
-                "request": obj.get("request"),
-                "expected_output": obj.get("expected_output"),
-                "contexts": obj.get("contexts"),
-                "variables": obj.get("variables"),
-                "metadata": obj.get("metadata"),
-                "change_note": obj.get("change_note"),
-                "is_archived": obj.get("is_archived"),
-                "annotations": [Annotation.from_dict(_item) for _item in obj["annotations"]]
-                if obj.get("annotations") is not None
-                else None,
-                "created_at": obj.get("created_at"),
-            }
-        )
-        return _obj
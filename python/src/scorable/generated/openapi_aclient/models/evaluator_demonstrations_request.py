@@ -1,107 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set, Union
-
-from pydantic import BaseModel, ConfigDict, Field, StrictStr
-from typing_extensions import Annotated, Self
-
-
-class EvaluatorDemonstrationsRequest(BaseModel):
-    """
-    EvaluatorDemonstrationsRequest
-    """  # noqa: E501
-
-    request: Optional[StrictStr] = None
-    response: Optional[StrictStr] = None
-    score: Union[Annotated[float, Field(le=1, strict=True, ge=0)], Annotated[int, Field(le=1, strict=True, ge=0)]]
-    justification: Optional[StrictStr] = None
-    __properties: ClassVar[List[str]] = ["request", "response", "score", "justification"]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of EvaluatorDemonstrationsRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # set to None if request (nullable) is None
-        # and model_fields_set contains the field
-        if self.request is None and "request" in self.model_fields_set:
-            _dict["request"] = None
-
-        # set to None if response (nullable) is None
-        # and model_fields_set contains the field
-        if self.response is None and "response" in self.model_fields_set:
-            _dict["response"] = None
-
-        # set to None if justification (nullable) is None
-        # and model_fields_set contains the field
-        if self.justification is None and "justification" in self.model_fields_set:
-            _dict["justification"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of EvaluatorDemonstrationsRequest from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "request": obj.get("request"),
-                "response": obj.get("response"),
-                "score": obj.get("score"),
-                "justification": obj.get("justification"),
-            }
-        )
-        return _obj
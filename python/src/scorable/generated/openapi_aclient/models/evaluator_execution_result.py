@@ -1,128 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set, Union
-
-from pydantic import BaseModel, ConfigDict, StrictFloat, StrictInt, StrictStr
-from typing_extensions import Self
-
-
-class EvaluatorExecutionResult(BaseModel):
-    """
-    EvaluatorExecutionResult
-    """  # noqa: E501
-
-    evaluator_name: Optional[StrictStr]
-    score: Optional[Union[StrictFloat, StrictInt]]
-    cost: Optional[Union[StrictFloat, StrictInt]]
-    execution_log_id: StrictStr
-    justification: Optional[StrictStr]
-    confidence: Optional[Union[StrictFloat, StrictInt]]
-    __properties: ClassVar[List[str]] = [
-        "evaluator_name",
-        "score",
-        "cost",
-        "execution_log_id",
-        "justification",
-        "confidence",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of EvaluatorExecutionResult from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # set to None if evaluator_name (nullable) is None
-        # and model_fields_set contains the field
-        if self.evaluator_name is None and "evaluator_name" in self.model_fields_set:
-            _dict["evaluator_name"] = None
-
-        # set to None if score (nullable) is None
-        # and model_fields_set contains the field
-        if self.score is None and "score" in self.model_fields_set:
-            _dict["score"] = None
-
-        # set to None if cost (nullable) is None
-        # and model_fields_set contains the field
-        if self.cost is None and "cost" in self.model_fields_set:
-            _dict["cost"] = None
-
-        # set to None if justification (nullable) is None
-        # and model_fields_set contains the field
-        if self.justification is None and "justification" in self.model_fields_set:
-            _dict["justification"] = None
-
-        # set to None if confidence (nullable) is None
-        # and model_fields_set contains the field
-        if self.confidence is None and "confidence" in self.model_fields_set:
-            _dict["confidence"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of EvaluatorExecutionResult from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "evaluator_name": obj.get("evaluator_name"),
-                "score": obj.get("score"),
-                "cost": obj.get("cost"),
-                "execution_log_id": obj.get("execution_log_id"),
-                "justification": obj.get("justification"),
-                "confidence": obj.get("confidence"),
-            }
-        )
-        return _obj
@@ -1,182 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
-from typing_extensions import Annotated, Self
-
-from scorable.generated.openapi_aclient.models.evaluator_behavior_enum import EvaluatorBehaviorEnum
-from scorable.generated.openapi_aclient.models.evaluator_demonstrations_request import EvaluatorDemonstrationsRequest
-from scorable.generated.openapi_aclient.models.input_variable_request import InputVariableRequest
-
-
-class EvaluatorRequest(BaseModel):
-    """
-    EvaluatorRequest
-    """  # noqa: E501
-
-    change_note: Optional[StrictStr] = None
-    demonstration_dataset_id: Optional[StrictStr] = Field(
-        default=None, description="Dataset whose annotations for this evaluator are used as few-shot demonstrations."
-    )
-    evaluator_demonstrations: Optional[List[EvaluatorDemonstrationsRequest]] = None
-    input_variables: Optional[List[InputVariableRequest]] = None
-    models: Optional[List[Annotated[str, Field(min_length=1, strict=True)]]] = Field(
-        default=None,
-        description="Primary model (index 0) and an optional list of fallback models to use if the primary model is not available. If not provided, a default model will be used.",
-    )
-    name: Annotated[str, Field(min_length=2, strict=True, max_length=1000)]
-    objective_id: StrictStr
-    objective_version_id: Optional[StrictStr] = Field(
-        default=None,
-        description="Optionally pin the Skill to a specific version of an Objective. If not provided, the latest version of the objective will be used and followed.",
-    )
-    overwrite: Optional[StrictBool] = Field(
-        default=False, description="Overwrite existing skill with the same name. Only for POST requests."
-    )
-    project_id: Optional[StrictStr] = Field(
-        default=None, description="Project to assign this evaluator to. Defaults to org default project."
-    )
-    scoring_criteria: Annotated[str, Field(min_length=1, strict=True, max_length=500000)]
-    behavior: Optional[EvaluatorBehaviorEnum] = None
-    __properties: ClassVar[List[str]] = [
-        "change_note",
-        "demonstration_dataset_id",
-        "evaluator_demonstrations",
-        "input_variables",
-        "models",
-        "name",
-        "objective_id",
-        "objective_version_id",
-        "overwrite",
-        "project_id",
-        "scoring_criteria",
-        "behavior",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of EvaluatorRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # override the default output from pydantic by calling `to_dict()` of each item in evaluator_demonstrations (list)
-        _items = []
-        if self.evaluator_demonstrations:
-            for _item in self.evaluator_demonstrations:
-                if _item:
-                    _items.append(_item.to_dict())
-            _dict["evaluator_demonstrations"] = _items
-        # override the default output from pydantic by calling `to_dict()` of each item in input_variables (list)
-        _items = []
-        if self.input_variables:
-            for _item in self.input_variables:
-                if _item:
-                    _items.append(_item.to_dict())
-            _dict["input_variables"] = _items
-        # set to None if change_note (nullable) is None
-        # and model_fields_set contains the field
-        if self.change_note is None and "change_note" in self.model_fields_set:
-            _dict["change_note"] = None
-
-        # set to None if demonstration_dataset_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.demonstration_dataset_id is None and "demonstration_dataset_id" in self.model_fields_set:
-            _dict["demonstration_dataset_id"] = None
-
-        # set to None if evaluator_demonstrations (nullable) is None
-        # and model_fields_set contains the field
-        if self.evaluator_demonstrations is None and "evaluator_demonstrations" in self.model_fields_set:
-            _dict["evaluator_demonstrations"] = None
-
-        # set to None if objective_version_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.objective_version_id is None and "objective_version_id" in self.model_fields_set:
-            _dict["objective_version_id"] = None
-
-        # set to None if project_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.project_id is None and "project_id" in self.model_fields_set:
-            _dict["project_id"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of EvaluatorRequest from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "change_note": obj.get("change_note"),
-                "demonstration_dataset_id": obj.get("demonstration_dataset_id"),
-                "evaluator_demonstrations": [
-                    EvaluatorDemonstrationsRequest.from_dict(_item) for _item in obj["evaluator_demonstrations"]
-                ]
-                if obj.get("evaluator_demonstrations") is not None
-                else None,
-                "input_variables": [InputVariableRequest.from_dict(_item) for _item in obj["input_variables"]]
-                if obj.get("input_variables") is not None
-                else None,
-                "models": obj.get("models"),
-                "name": obj.get("name"),
-                "objective_id": obj.get("objective_id"),
-                "objective_version_id": obj.get("objective_version_id"),
-                "overwrite": obj.get("overwrite") if obj.get("overwrite") is not None else False,
-                "project_id": obj.get("project_id"),
-                "scoring_criteria": obj.get("scoring_criteria"),
-                "behavior": obj.get("behavior"),
-            }
-        )
-        return _obj
@@ -1,126 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, StrictStr
-from typing_extensions import Self
-
-
-class JudgeGeneratorResponse(BaseModel):
-    """
-    JudgeGeneratorResponse
-    """  # noqa: E501
-
-    judge_id: StrictStr
-    judge_version_id: StrictStr
-    error_code: Optional[StrictStr] = None
-    claim_token: Optional[StrictStr] = None
-    missing_context_from_system_goal: Optional[List[Dict[str, StrictStr]]] = None
-    stages: Optional[List[StrictStr]] = None
-    __properties: ClassVar[List[str]] = [
-        "judge_id",
-        "judge_version_id",
-        "error_code",
-        "claim_token",
-        "missing_context_from_system_goal",
-        "stages",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of JudgeGeneratorResponse from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # set to None if error_code (nullable) is None
-        # and model_fields_set contains the field
-        if self.error_code is None and "error_code" in self.model_fields_set:
-            _dict["error_code"] = None
-
-        # set to None if claim_token (nullable) is None
-        # and model_fields_set contains the field
-        if self.claim_token is None and "claim_token" in self.model_fields_set:
-            _dict["claim_token"] = None
-
-        # set to None if missing_context_from_system_goal (nullable) is None
-        # and model_fields_set contains the field
-        if (
-            self.missing_context_from_system_goal is None
-            and "missing_context_from_system_goal" in self.model_fields_set
-        ):
-            _dict["missing_context_from_system_goal"] = None
-
-        # set to None if stages (nullable) is None
-        # and model_fields_set contains the field
-        if self.stages is None and "stages" in self.model_fields_set:
-            _dict["stages"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of JudgeGeneratorResponse from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "judge_id": obj.get("judge_id"),
-                "judge_version_id": obj.get("judge_version_id"),
-                "error_code": obj.get("error_code"),
-                "claim_token": obj.get("claim_token"),
-                "missing_context_from_system_goal": obj.get("missing_context_from_system_goal"),
-                "stages": obj.get("stages"),
-            }
-        )
-        return _obj
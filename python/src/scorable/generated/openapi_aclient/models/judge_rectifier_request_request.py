@@ -1,214 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set, Union
-
-from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictFloat, StrictInt, StrictStr
-from typing_extensions import Annotated, Self
-
-from scorable.generated.openapi_aclient.models.message_turn_request import MessageTurnRequest
-
-
-class JudgeRectifierRequestRequest(BaseModel):
-    """
-    JudgeRectifierRequestRequest
-    """  # noqa: E501
-
-    turns: Optional[List[MessageTurnRequest]] = None
-    tools: Optional[List[Dict[str, Any]]] = Field(
-        default=None, description="OpenAI-style tool catalog available to the agent during the conversation."
-    )
-    request: Optional[StrictStr] = None
-    response: Optional[StrictStr] = None
-    contexts: Optional[List[Annotated[str, Field(min_length=1, strict=True)]]] = None
-    expected_output: Optional[Annotated[str, Field(strict=True, max_length=3500000)]] = None
-    tags: Optional[List[Annotated[str, Field(min_length=1, strict=True, max_length=1000)]]] = None
-    user_id: Optional[Annotated[str, Field(strict=True, max_length=255)]] = None
-    session_id: Optional[Annotated[str, Field(strict=True, max_length=255)]] = None
-    system_prompt: Optional[Annotated[str, Field(strict=True, max_length=3500000)]] = None
-    file_ids: Optional[List[StrictStr]] = Field(
-        default=None,
-        description="File IDs (from POST /v1/files/). Note, not all models support uploaded files as context.",
-    )
-    project_id: Optional[StrictStr] = Field(
-        default=None,
-        description="Project to assign the execution log to. Defaults to the resource's project or org default.",
-    )
-    judge_version_id: Optional[StrictStr] = None
-    max_iterations: Optional[StrictInt] = Field(default=3, description="Maximum number of improvement attempts")
-    patience: Optional[StrictInt] = Field(
-        default=1, description="Number of tries without improvement before early stopping"
-    )
-    min_improvement: Optional[Union[StrictFloat, StrictInt]] = Field(
-        default=0.05, description="Minimum score improvement required to accept a change"
-    )
-    threshold: Optional[Union[StrictFloat, StrictInt]] = Field(default=0.8, description="Target score to achieve")
-    stream: Optional[StrictBool] = Field(
-        default=False, description="Enable streaming of intermediate and final results"
-    )
-    __properties: ClassVar[List[str]] = [
-        "turns",
-        "tools",
-        "request",
-        "response",
-        "contexts",
-        "expected_output",
-        "tags",
-        "user_id",
-        "session_id",
-        "system_prompt",
-        "file_ids",
-        "project_id",
-        "judge_version_id",
-        "max_iterations",
-        "patience",
-        "min_improvement",
-        "threshold",
-        "stream",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of JudgeRectifierRequestRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # override the default output from pydantic by calling `to_dict()` of each item in turns (list)
-        _items = []
-        if self.turns:
-            for _item in self.turns:
-                if _item:
-                    _items.append(_item.to_dict())
-            _dict["turns"] = _items
-        # set to None if turns (nullable) is None
-        # and model_fields_set contains the field
-        if self.turns is None and "turns" in self.model_fields_set:
-            _dict["turns"] = None
-
-        # set to None if tools (nullable) is None
-        # and model_fields_set contains the field
-        if self.tools is None and "tools" in self.model_fields_set:
-            _dict["tools"] = None
-
-        # set to None if request (nullable) is None
-        # and model_fields_set contains the field
-        if self.request is None and "request" in self.model_fields_set:
-            _dict["request"] = None
-
-        # set to None if response (nullable) is None
-        # and model_fields_set contains the field
-        if self.response is None and "response" in self.model_fields_set:
-            _dict["response"] = None
-
-        # set to None if expected_output (nullable) is None
-        # and model_fields_set contains the field
-        if self.expected_output is None and "expected_output" in self.model_fields_set:
-            _dict["expected_output"] = None
-
-        # set to None if user_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.user_id is None and "user_id" in self.model_fields_set:
-            _dict["user_id"] = None
-
-        # set to None if session_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.session_id is None and "session_id" in self.model_fields_set:
-            _dict["session_id"] = None
-
-        # set to None if system_prompt (nullable) is None
-        # and model_fields_set contains the field
-        if self.system_prompt is None and "system_prompt" in self.model_fields_set:
-            _dict["system_prompt"] = None
-
-        # set to None if project_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.project_id is None and "project_id" in self.model_fields_set:
-            _dict["project_id"] = None
-
-        # set to None if judge_version_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.judge_version_id is None and "judge_version_id" in self.model_fields_set:
-            _dict["judge_version_id"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of JudgeRectifierRequestRequest from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "turns": [MessageTurnRequest.from_dict(_item) for _item in obj["turns"]]
-                if obj.get("turns") is not None
-                else None,
-                "tools": obj.get("tools"),
-                "request": obj.get("request"),
-                "response": obj.get("response"),
-                "contexts": obj.get("contexts"),
-                "expected_output": obj.get("expected_output"),
-                "tags": obj.get("tags"),
-                "user_id": obj.get("user_id"),
-                "session_id": obj.get("session_id"),
-                "system_prompt": obj.get("system_prompt"),
-                "file_ids": obj.get("file_ids"),
-                "project_id": obj.get("project_id"),
-                "judge_version_id": obj.get("judge_version_id"),
-                "max_iterations": obj.get("max_iterations") if obj.get("max_iterations") is not None else 3,
-                "patience": obj.get("patience") if obj.get("patience") is not None else 1,
-                "min_improvement": obj.get("min_improvement") if obj.get("min_improvement") is not None else 0.05,
-                "threshold": obj.get("threshold") if obj.get("threshold") is not None else 0.8,
-                "stream": obj.get("stream") if obj.get("stream") is not None else False,
-            }
-        )
-        return _obj
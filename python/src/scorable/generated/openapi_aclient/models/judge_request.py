@@ -1,135 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, Field, StrictStr
-from typing_extensions import Annotated, Self
-
-from scorable.generated.openapi_aclient.models.evaluator_reference_request import EvaluatorReferenceRequest
-from scorable.generated.openapi_aclient.models.visibility_enum import VisibilityEnum
-
-
-class JudgeRequest(BaseModel):
-    """
-    JudgeRequest
-    """  # noqa: E501
-
-    evaluator_references: Optional[List[EvaluatorReferenceRequest]] = None
-    file_id: Optional[StrictStr] = Field(
-        default=None,
-        description="ID of the JudgeFile to attach to this judge. Only one file per judge is supported. Set to null to remove the file.",
-    )
-    intent: Annotated[str, Field(min_length=1, strict=True)] = Field(description="Intent for the judge")
-    name: Annotated[str, Field(min_length=3, strict=True, max_length=512)]
-    project_id: Optional[StrictStr] = Field(
-        default=None, description="Project to assign this judge to. Defaults to org default project."
-    )
-    stage: Optional[Annotated[str, Field(strict=True, max_length=255)]] = None
-    visibility: Optional[VisibilityEnum] = None
-    __properties: ClassVar[List[str]] = [
-        "evaluator_references",
-        "file_id",
-        "intent",
-        "name",
-        "project_id",
-        "stage",
-        "visibility",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of JudgeRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # override the default output from pydantic by calling `to_dict()` of each item in evaluator_references (list)
-        _items = []
-        if self.evaluator_references:
-            for _item in self.evaluator_references:
-                if _item:
-                    _items.append(_item.to_dict())
-            _dict["evaluator_references"] = _items
-        # set to None if file_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.file_id is None and "file_id" in self.model_fields_set:
-            _dict["file_id"] = None
-
-        # set to None if project_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.project_id is None and "project_id" in self.model_fields_set:
-            _dict["project_id"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of JudgeRequest from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "evaluator_references": [
-                    EvaluatorReferenceRequest.from_dict(_item) for _item in obj["evaluator_references"]
-                ]
-                if obj.get("evaluator_references") is not None
-                else None,
-                "file_id": obj.get("file_id"),
-                "intent": obj.get("intent"),
-                "name": obj.get("name"),
-                "project_id": obj.get("project_id"),
-                "stage": obj.get("stage"),
-                "visibility": obj.get("visibility"),
-            }
-        )
-        return _obj
@@ -1,126 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set, Union
-
-from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
-from typing_extensions import Annotated, Self
-
-
-class OtelTraceEvaluationFilterInputRequest(BaseModel):
-    """
-    OtelTraceEvaluationFilterInputRequest
-    """  # noqa: E501
-
-    name: Annotated[str, Field(strict=True, max_length=255)]
-    evaluator_id: Optional[StrictStr] = None
-    judge_id: Optional[StrictStr] = None
-    filter_criteria: Optional[Dict[str, Any]] = None
-    sampling_rate: Optional[
-        Union[Annotated[float, Field(le=1, strict=True, ge=0)], Annotated[int, Field(le=1, strict=True, ge=0)]]
-    ] = 1.0
-    delay_seconds: Optional[Annotated[int, Field(strict=True, ge=0)]] = 20
-    applies_to_new_only: Optional[StrictBool] = True
-    is_active: Optional[StrictBool] = True
-    extractor_rules: Optional[List[Dict[str, Any]]] = None
-    __properties: ClassVar[List[str]] = [
-        "name",
-        "evaluator_id",
-        "judge_id",
-        "filter_criteria",
-        "sampling_rate",
-        "delay_seconds",
-        "applies_to_new_only",
-        "is_active",
-        "extractor_rules",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of OtelTraceEvaluationFilterInputRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # set to None if evaluator_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.evaluator_id is None and "evaluator_id" in self.model_fields_set:
-            _dict["evaluator_id"] = None
-
-        # set to None if judge_id (nullable) is None
-        # and model_fields_set contains the field
-        if self.judge_id is None and "judge_id" in self.model_fields_set:
-            _dict["judge_id"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of OtelTraceEvaluationFilterInputRequest from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "name": obj.get("name"),
-                "evaluator_id": obj.get("evaluator_id"),
-                "judge_id": obj.get("judge_id"),
-                "filter_criteria": obj.get("filter_criteria"),
-                "sampling_rate": obj.get("sampling_rate") if obj.get("sampling_rate") is not None else 1.0,
-                "delay_seconds": obj.get("delay_seconds") if obj.get("delay_seconds") is not None else 20,
-                "applies_to_new_only": obj.get("applies_to_new_only")
-                if obj.get("applies_to_new_only") is not None
-                else True,
-                "is_active": obj.get("is_active") if obj.get("is_active") is not None else True,
-                "extractor_rules": obj.get("extractor_rules"),
-            }
-        )
-        return _obj
@@ -1,111 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from datetime import datetime
-from typing import Any, ClassVar, Dict, List, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, Field, StrictStr
-from typing_extensions import Annotated, Self
-
-
-class OtelTraceRecord(BaseModel):
-    """
-    OtelTraceRecord
-    """  # noqa: E501
-
-    trace_id: Annotated[str, Field(strict=True, max_length=32)] = Field(description="OTEL trace ID")
-    root_span_name: Optional[Annotated[str, Field(strict=True, max_length=255)]] = Field(
-        default=None, description="Name of root span"
-    )
-    first_span_at: datetime = Field(description="Timestamp of first span received")
-    last_span_at: datetime = Field(description="Timestamp of last span received")
-    span_count: Optional[Annotated[int, Field(le=2147483647, strict=True, ge=-2147483648)]] = Field(
-        default=None, description="Total number of spans in trace"
-    )
-    input_preview: Optional[StrictStr] = None
-    output_preview: Optional[StrictStr] = None
-    __properties: ClassVar[List[str]] = [
-        "trace_id",
-        "root_span_name",
-        "first_span_at",
-        "last_span_at",
-        "span_count",
-        "input_preview",
-        "output_preview",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of OtelTraceRecord from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of OtelTraceRecord from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "trace_id": obj.get("trace_id"),
-                "root_span_name": obj.get("root_span_name"),
-                "first_span_at": obj.get("first_span_at"),
-                "last_span_at": obj.get("last_span_at"),
-                "span_count": obj.get("span_count"),
-                "input_preview": obj.get("input_preview"),
-                "output_preview": obj.get("output_preview"),
-            }
-        )
-        return _obj
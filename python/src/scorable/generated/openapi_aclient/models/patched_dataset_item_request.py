@@ -1,121 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from typing import Any, ClassVar, Dict, List, Optional, Set
-
-from pydantic import BaseModel, ConfigDict, Field, StrictStr
-from typing_extensions import Annotated, Self
-
-
-class PatchedDatasetItemRequest(BaseModel):
-    """
-    PatchedDatasetItemRequest
-    """  # noqa: E501
-
-    response: Optional[Annotated[str, Field(min_length=1, strict=True)]] = None
-    request: Optional[StrictStr] = None
-    expected_output: Optional[StrictStr] = None
-    contexts: Optional[Any] = None
-    variables: Optional[Any] = None
-    metadata: Optional[Any] = None
-    change_note: Optional[StrictStr] = None
-    __properties: ClassVar[List[str]] = [
-        "response",
-        "request",
-        "expected_output",
-        "contexts",
-        "variables",
-        "metadata",
-        "change_note",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of PatchedDatasetItemRequest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        """
-        excluded_fields: Set[str] = set([])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # set to None if contexts (nullable) is None
-        # and model_fields_set contains the field
-        if self.contexts is None and "contexts" in self.model_fields_set:
-            _dict["contexts"] = None
-
-        # set to None if variables (nullable) is None
-        # and model_fields_set contains the field
-        if self.variables is None and "variables" in self.model_fields_set:
-            _dict["variables"] = None
-
-        # set to None if metadata (nullable) is None
-        # and model_fields_set contains the field
-        if self.metadata is None and "metadata" in self.model_fields_set:
-            _dict["metadata"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of PatchedDatasetItemRequest from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "response": obj.get("response"),
-                "request": obj.get("request"),
-                "expected_output": obj.get("expected_output"),
-                "contexts": obj.get("contexts"),
-                "variables": obj.get("variables"),
-                "metadata": obj.get("metadata"),
-                "change_note": obj.get("change_note"),
-            }
-        )
-        return _obj
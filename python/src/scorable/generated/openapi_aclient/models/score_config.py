@@ -1,141 +0,0 @@
-# coding: utf-8
-
-"""
-Scorable API
-
-Scorable JSON API provides a way to access Scorable using provisioned API token
-
-The version of the OpenAPI document: 1.0.0 (latest)
-Generated by OpenAPI Generator (https://openapi-generator.tech)
-
-Do not edit the class manually.
-"""  # noqa: E501
-
-from __future__ import annotations
-
-import json
-import pprint
-import re  # noqa: F401
-from datetime import datetime
-from typing import Any, ClassVar, Dict, List, Optional, Set, Union
-
-from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictFloat, StrictInt, StrictStr
-from typing_extensions import Annotated, Self
-
-from scorable.generated.openapi_aclient.models.score_config_type_enum import ScoreConfigTypeEnum
-
-
-class ScoreConfig(BaseModel):
-    """
-    ScoreConfig
-    """  # noqa: E501
-
-    id: StrictStr
-    name: Annotated[str, Field(strict=True, max_length=255)]
-    type: Optional[ScoreConfigTypeEnum] = None
-    categories: Optional[Any] = None
-    min_value: Optional[Union[StrictFloat, StrictInt]] = None
-    max_value: Optional[Union[StrictFloat, StrictInt]] = None
-    is_default: StrictBool
-    created_at: Optional[datetime]
-    __properties: ClassVar[List[str]] = [
-        "id",
-        "name",
-        "type",
-        "categories",
-        "min_value",
-        "max_value",
-        "is_default",
-        "created_at",
-    ]
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        validate_assignment=True,
-        protected_namespaces=(),
-    )
-
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
-
-    def to_json(self) -> str:
-        """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
-
-    @classmethod
-    def from_json(cls, json_str: str) -> Optional[Self]:
-        """Create an instance of ScoreConfig from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the dictionary representation of the model using alias.
-
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        * OpenAPI `readOnly` fields are excluded.
-        """
-        excluded_fields: Set[str] = set(
-            [
-                "id",
-                "is_default",
-                "created_at",
-            ]
-        )
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # set to None if categories (nullable) is None
-        # and model_fields_set contains the field
-        if self.categories is None and "categories" in self.model_fields_set:
-            _dict["categories"] = None
-
-        # set to None if min_value (nullable) is None
-        # and model_fields_set contains the field
-        if self.min_value is None and "min_value" in self.model_fields_set:
-            _dict["min_value"] = None
-
-        # set to None if max_value (nullable) is None
-        # and model_fields_set contains the field
-        if self.max_value is None and "max_value" in self.model_fields_set:
-            _dict["max_value"] = None
-
-        # set to None if created_at (nullable) is None
-        # and model_fields_set contains the field
-        if self.created_at is None and "created_at" in self.model_fields_set:
-            _dict["created_at"] = None
-
-        return _dict
-
-    @classmethod
-    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
-        """Create an instance of ScoreConfig from a dict"""
-        if obj is None:
-            return None
-
-        if not isinstance(obj, dict):
-            return cls.model_validate(obj)
-
-        _obj = cls.model_validate(
-            {
-                "id": obj.get("id"),
-                "name": obj.get("name"),
-                "type": obj.get("type"),
-                "categories": obj.get("categories"),
-                "min_value": obj.get("min_value"),
-                "max_value": obj.get("max_value"),
-                "is_default": obj.get("is_default"),
-                "created_at": obj.get("created_at"),
-            }
-        )
-        return _obj
@@ -1 +1,42 @@
-from .api_client import ApiClient
+# coding: utf-8
+
+# flake8: noqa
+"""
+Scorable API
+
+Scorable JSON API provides a way to access Scorable using provisioned API token
+
+The version of the OpenAPI document: 1.0.0 (latest)
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+# This file is rewritten by tools/lazy_generated_init.py (make fix-openapi-client)
+# so that models are imported on first access instead of all at once.
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scorable.generated.openapi_client.api_client import ApiClient
+
+_LAZY = {
+    "ApiClient": ".api_client",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
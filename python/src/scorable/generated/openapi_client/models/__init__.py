@@ -12,159 +12,323 @@ Generated by OpenAPI Generator (https://openapi-generator.tech)
 Do not edit the class manually.
 """  # noqa: E501
 
-# import models into model package
-from scorable.generated.openapi_client.models.annotation import Annotation
-from scorable.generated.openapi_client.models.annotation_request import AnnotationRequest
-from scorable.generated.openapi_client.models.annotation_status_enum import AnnotationStatusEnum
-from scorable.generated.openapi_client.models.batch_execution_status import BatchExecutionStatus
-from scorable.generated.openapi_client.models.batch_set_tags_model_request import BatchSetTagsModelRequest
-from scorable.generated.openapi_client.models.calibration_run import CalibrationRun
-from scorable.generated.openapi_client.models.calibration_run_create_request import CalibrationRunCreateRequest
-from scorable.generated.openapi_client.models.calibration_run_item import CalibrationRunItem
-from scorable.generated.openapi_client.models.calibration_run_source_request import CalibrationRunSourceRequest
-from scorable.generated.openapi_client.models.calibration_run_status_enum import CalibrationRunStatusEnum
-from scorable.generated.openapi_client.models.calibration_source_type_enum import CalibrationSourceTypeEnum
-from scorable.generated.openapi_client.models.data_set_create import DataSetCreate
-from scorable.generated.openapi_client.models.data_set_create_request import DataSetCreateRequest
-from scorable.generated.openapi_client.models.data_set_list import DataSetList
-from scorable.generated.openapi_client.models.data_set_type import DataSetType
-from scorable.generated.openapi_client.models.dataset_item import DatasetItem
-from scorable.generated.openapi_client.models.dataset_item_request import DatasetItemRequest
-from scorable.generated.openapi_client.models.dataset_range_request import DatasetRangeRequest
-from scorable.generated.openapi_client.models.duplicate_judge_request_request import DuplicateJudgeRequestRequest
-from scorable.generated.openapi_client.models.duplicate_request import DuplicateRequest
-from scorable.generated.openapi_client.models.evaluator import Evaluator
-from scorable.generated.openapi_client.models.evaluator_behavior_enum import EvaluatorBehaviorEnum
-from scorable.generated.openapi_client.models.evaluator_calibration_output import EvaluatorCalibrationOutput
-from scorable.generated.openapi_client.models.evaluator_calibration_result import EvaluatorCalibrationResult
-from scorable.generated.openapi_client.models.evaluator_demonstrations import EvaluatorDemonstrations
-from scorable.generated.openapi_client.models.evaluator_demonstrations_request import EvaluatorDemonstrationsRequest
-from scorable.generated.openapi_client.models.evaluator_execution_request import EvaluatorExecutionRequest
-from scorable.generated.openapi_client.models.evaluator_execution_result import EvaluatorExecutionResult
-from scorable.generated.openapi_client.models.evaluator_import_yaml_request_request import (
-    EvaluatorImportYamlRequestRequest,
-)
-from scorable.generated.openapi_client.models.evaluator_inputs_value import EvaluatorInputsValue
-from scorable.generated.openapi_client.models.evaluator_inputs_value_items import EvaluatorInputsValueItems
-from scorable.generated.openapi_client.models.evaluator_list_output import EvaluatorListOutput
-from scorable.generated.openapi_client.models.evaluator_reference import EvaluatorReference
-from scorable.generated.openapi_client.models.evaluator_reference_request import EvaluatorReferenceRequest
-from scorable.generated.openapi_client.models.evaluator_request import EvaluatorRequest
-from scorable.generated.openapi_client.models.evaluator_result import EvaluatorResult
-from scorable.generated.openapi_client.models.execution_log_details import ExecutionLogDetails
-from scorable.generated.openapi_client.models.execution_log_details_evaluation_context import (
-    ExecutionLogDetailsEvaluationContext,
-)
-from scorable.generated.openapi_client.models.execution_log_details_evaluator_latencies_inner import (
-    ExecutionLogDetailsEvaluatorLatenciesInner,
-)
-from scorable.generated.openapi_client.models.execution_log_list import ExecutionLogList
-from scorable.generated.openapi_client.models.execution_log_list_evaluation_context import (
-    ExecutionLogListEvaluationContext,
-)
-from scorable.generated.openapi_client.models.experiment_status_enum import ExperimentStatusEnum
-from scorable.generated.openapi_client.models.file_upload_response import FileUploadResponse
-from scorable.generated.openapi_client.models.generation_model_params_request import GenerationModelParamsRequest
-from scorable.generated.openapi_client.models.id import ID
-from scorable.generated.openapi_client.models.input_variable import InputVariable
-from scorable.generated.openapi_client.models.input_variable_request import InputVariableRequest
-from scorable.generated.openapi_client.models.judge import Judge
-from scorable.generated.openapi_client.models.judge_batch_execution_detail import JudgeBatchExecutionDetail
-from scorable.generated.openapi_client.models.judge_batch_execution_input_request import JudgeBatchExecutionInputRequest
-from scorable.generated.openapi_client.models.judge_batch_execution_item import JudgeBatchExecutionItem
-from scorable.generated.openapi_client.models.judge_batch_execution_item_input import JudgeBatchExecutionItemInput
-from scorable.generated.openapi_client.models.judge_batch_execution_item_status_enum import (
-    JudgeBatchExecutionItemStatusEnum,
-)
-from scorable.generated.openapi_client.models.judge_batch_execution_list_item import JudgeBatchExecutionListItem
-from scorable.generated.openapi_client.models.judge_batch_execution_request import JudgeBatchExecutionRequest
-from scorable.generated.openapi_client.models.judge_batch_execution_response import JudgeBatchExecutionResponse
-from scorable.generated.openapi_client.models.judge_claim_request_request import JudgeClaimRequestRequest
-from scorable.generated.openapi_client.models.judge_execution_request import JudgeExecutionRequest
-from scorable.generated.openapi_client.models.judge_execution_response import JudgeExecutionResponse
-from scorable.generated.openapi_client.models.judge_files_inner import JudgeFilesInner
-from scorable.generated.openapi_client.models.judge_generator_request import JudgeGeneratorRequest
-from scorable.generated.openapi_client.models.judge_generator_response import JudgeGeneratorResponse
-from scorable.generated.openapi_client.models.judge_invite_request import JudgeInviteRequest
-from scorable.generated.openapi_client.models.judge_list import JudgeList
-from scorable.generated.openapi_client.models.judge_rectifier_request_request import JudgeRectifierRequestRequest
-from scorable.generated.openapi_client.models.judge_rectifier_response import JudgeRectifierResponse
-from scorable.generated.openapi_client.models.judge_request import JudgeRequest
-from scorable.generated.openapi_client.models.judges_synthetic_data_retrieve200_response import (
-    JudgesSyntheticDataRetrieve200Response,
-)
-from scorable.generated.openapi_client.models.judges_synthetic_data_retrieve200_response_samples_inner import (
-    JudgesSyntheticDataRetrieve200ResponseSamplesInner,
-)
-from scorable.generated.openapi_client.models.message_log_turn import MessageLogTurn
-from scorable.generated.openapi_client.models.message_turn_request import MessageTurnRequest
-from scorable.generated.openapi_client.models.model import Model
-from scorable.generated.openapi_client.models.model_list import ModelList
-from scorable.generated.openapi_client.models.model_list_visibility_enum import ModelListVisibilityEnum
-from scorable.generated.openapi_client.models.model_request import ModelRequest
-from scorable.generated.openapi_client.models.model_test_request_request import ModelTestRequestRequest
-from scorable.generated.openapi_client.models.model_test_response import ModelTestResponse
-from scorable.generated.openapi_client.models.nested_evaluator import NestedEvaluator
-from scorable.generated.openapi_client.models.nested_evaluator_objective import NestedEvaluatorObjective
-from scorable.generated.openapi_client.models.nested_evaluator_request import NestedEvaluatorRequest
-from scorable.generated.openapi_client.models.nested_judge import NestedJudge
-from scorable.generated.openapi_client.models.nested_objective_list import NestedObjectiveList
-from scorable.generated.openapi_client.models.nested_user_details import NestedUserDetails
-from scorable.generated.openapi_client.models.nested_user_details_request import NestedUserDetailsRequest
-from scorable.generated.openapi_client.models.null_enum import NullEnum
-from scorable.generated.openapi_client.models.objective import Objective
-from scorable.generated.openapi_client.models.objective_list import ObjectiveList
-from scorable.generated.openapi_client.models.objective_request import ObjectiveRequest
-from scorable.generated.openapi_client.models.otel_trace import OtelTrace
-from scorable.generated.openapi_client.models.otel_trace_evaluation_filter_input_request import (
-    OtelTraceEvaluationFilterInputRequest,
-)
-from scorable.generated.openapi_client.models.otel_trace_evaluation_filter_output import OtelTraceEvaluationFilterOutput
-from scorable.generated.openapi_client.models.otel_trace_record import OtelTraceRecord
-from scorable.generated.openapi_client.models.paginated_annotation_list import PaginatedAnnotationList
-from scorable.generated.openapi_client.models.paginated_calibration_run_item_list import PaginatedCalibrationRunItemList
-from scorable.generated.openapi_client.models.paginated_calibration_run_list import PaginatedCalibrationRunList
-from scorable.generated.openapi_client.models.paginated_data_set_list_list import PaginatedDataSetListList
-from scorable.generated.openapi_client.models.paginated_dataset_item_list import PaginatedDatasetItemList
-from scorable.generated.openapi_client.models.paginated_evaluator_list import PaginatedEvaluatorList
-from scorable.generated.openapi_client.models.paginated_evaluator_list_output_list import (
-    PaginatedEvaluatorListOutputList,
-)
-from scorable.generated.openapi_client.models.paginated_execution_log_list_list import PaginatedExecutionLogListList
-from scorable.generated.openapi_client.models.paginated_judge_batch_execution_list_item_list import (
-    PaginatedJudgeBatchExecutionListItemList,
-)
-from scorable.generated.openapi_client.models.paginated_judge_list_list import PaginatedJudgeListList
-from scorable.generated.openapi_client.models.paginated_model_list_list import PaginatedModelListList
-from scorable.generated.openapi_client.models.paginated_objective_list import PaginatedObjectiveList
-from scorable.generated.openapi_client.models.paginated_objective_list_list import PaginatedObjectiveListList
-from scorable.generated.openapi_client.models.paginated_otel_trace_record_list import PaginatedOtelTraceRecordList
-from scorable.generated.openapi_client.models.paginated_project_list import PaginatedProjectList
-from scorable.generated.openapi_client.models.paginated_score_config_list import PaginatedScoreConfigList
-from scorable.generated.openapi_client.models.patched_annotation_request import PatchedAnnotationRequest
-from scorable.generated.openapi_client.models.patched_dataset_item_request import PatchedDatasetItemRequest
-from scorable.generated.openapi_client.models.patched_evaluator_request import PatchedEvaluatorRequest
-from scorable.generated.openapi_client.models.patched_judge_request import PatchedJudgeRequest
-from scorable.generated.openapi_client.models.patched_model_request import PatchedModelRequest
-from scorable.generated.openapi_client.models.patched_objective_request import PatchedObjectiveRequest
-from scorable.generated.openapi_client.models.patched_project_request import PatchedProjectRequest
-from scorable.generated.openapi_client.models.patched_score_config_request import PatchedScoreConfigRequest
-from scorable.generated.openapi_client.models.project import Project
-from scorable.generated.openapi_client.models.project_request import ProjectRequest
-from scorable.generated.openapi_client.models.provider import Provider
-from scorable.generated.openapi_client.models.reasoning_effort_enum import ReasoningEffortEnum
-from scorable.generated.openapi_client.models.reference_variable_request import ReferenceVariableRequest
-from scorable.generated.openapi_client.models.role_enum import RoleEnum
-from scorable.generated.openapi_client.models.score_config import ScoreConfig
-from scorable.generated.openapi_client.models.score_config_request import ScoreConfigRequest
-from scorable.generated.openapi_client.models.score_config_type_enum import ScoreConfigTypeEnum
-from scorable.generated.openapi_client.models.skill_execution_validator_result import SkillExecutionValidatorResult
-from scorable.generated.openapi_client.models.skill_test_data_request import SkillTestDataRequest
-from scorable.generated.openapi_client.models.skill_test_data_request_dataset_range import (
-    SkillTestDataRequestDatasetRange,
-)
-from scorable.generated.openapi_client.models.skill_test_input_behavior_enum import SkillTestInputBehaviorEnum
-from scorable.generated.openapi_client.models.skill_test_input_request import SkillTestInputRequest
-from scorable.generated.openapi_client.models.status_enum import StatusEnum
-from scorable.generated.openapi_client.models.validation_result_status import ValidationResultStatus
-from scorable.generated.openapi_client.models.visibility_enum import VisibilityEnum
+# This file is rewritten by tools/lazy_generated_init.py (make fix-openapi-client)
+# so that models are imported on first access instead of all at once.
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scorable.generated.openapi_client.models.annotation import Annotation
+    from scorable.generated.openapi_client.models.annotation_request import AnnotationRequest
+    from scorable.generated.openapi_client.models.annotation_status_enum import AnnotationStatusEnum
+    from scorable.generated.openapi_client.models.batch_execution_status import BatchExecutionStatus
+    from scorable.generated.openapi_client.models.batch_set_tags_model_request import BatchSetTagsModelRequest
+    from scorable.generated.openapi_client.models.calibration_run import CalibrationRun
+    from scorable.generated.openapi_client.models.calibration_run_create_request import CalibrationRunCreateRequest
+    from scorable.generated.openapi_client.models.calibration_run_item import CalibrationRunItem
+    from scorable.generated.openapi_client.models.calibration_run_source_request import CalibrationRunSourceRequest
+    from scorable.generated.openapi_client.models.calibration_run_status_enum import CalibrationRunStatusEnum
+    from scorable.generated.openapi_client.models.calibration_source_type_enum import CalibrationSourceTypeEnum
+    from scorable.generated.openapi_client.models.data_set_create import DataSetCreate
+    from scorable.generated.openapi_client.models.data_set_create_request import DataSetCreateRequest
+    from scorable.generated.openapi_client.models.data_set_list import DataSetList
+    from scorable.generated.openapi_client.models.data_set_type import DataSetType
+    from scorable.generated.openapi_client.models.dataset_item import DatasetItem
+    from scorable.generated.openapi_client.models.dataset_item_request import DatasetItemRequest
+    from scorable.generated.openapi_client.models.dataset_range_request import DatasetRangeRequest
+    from scorable.generated.openapi_client.models.duplicate_judge_request_request import DuplicateJudgeRequestRequest
+    from scorable.generated.openapi_client.models.duplicate_request import DuplicateRequest
+    from scorable.generated.openapi_client.models.evaluator import Evaluator
+    from scorable.generated.openapi_client.models.evaluator_behavior_enum import EvaluatorBehaviorEnum
+    from scorable.generated.openapi_client.models.evaluator_calibration_output import EvaluatorCalibrationOutput
+    from scorable.generated.openapi_client.models.evaluator_calibration_result import EvaluatorCalibrationResult
+    from scorable.generated.openapi_client.models.evaluator_demonstrations import EvaluatorDemonstrations
+    from scorable.generated.openapi_client.models.evaluator_demonstrations_request import EvaluatorDemonstrationsRequest
+    from scorable.generated.openapi_client.models.evaluator_execution_request import EvaluatorExecutionRequest
+    from scorable.generated.openapi_client.models.evaluator_execution_result import EvaluatorExecutionResult
+    from scorable.generated.openapi_client.models.evaluator_import_yaml_request_request import (
+        EvaluatorImportYamlRequestRequest,
+    )
+    from scorable.generated.openapi_client.models.evaluator_inputs_value import EvaluatorInputsValue
+    from scorable.generated.openapi_client.models.evaluator_inputs_value_items import EvaluatorInputsValueItems
+    from scorable.generated.openapi_client.models.evaluator_list_output import EvaluatorListOutput
+    from scorable.generated.openapi_client.models.evaluator_reference import EvaluatorReference
+    from scorable.generated.openapi_client.models.evaluator_reference_request import EvaluatorReferenceRequest
+    from scorable.generated.openapi_client.models.evaluator_request import EvaluatorRequest
+    from scorable.generated.openapi_client.models.evaluator_result import EvaluatorResult
+    from scorable.generated.openapi_client.models.execution_log_details import ExecutionLogDetails
+    from scorable.generated.openapi_client.models.execution_log_details_evaluation_context import (
+        ExecutionLogDetailsEvaluationContext,
+    )
+    from scorable.generated.openapi_client.models.execution_log_details_evaluator_latencies_inner import (
+        ExecutionLogDetailsEvaluatorLatenciesInner,
+    )
+    from scorable.generated.openapi_client.models.execution_log_list import ExecutionLogList
+    from scorable.generated.openapi_client.models.execution_log_list_evaluation_context import (
+        ExecutionLogListEvaluationContext,
+    )
+    from scorable.generated.openapi_client.models.experiment_status_enum import ExperimentStatusEnum
+    from scorable.generated.openapi_client.models.file_upload_response import FileUploadResponse
+    from scorable.generated.openapi_client.models.generation_model_params_request import GenerationModelParamsRequest
+    from scorable.generated.openapi_client.models.id import ID
+    from scorable.generated.openapi_client.models.input_variable import InputVariable
+    from scorable.generated.openapi_client.models.input_variable_request import InputVariableRequest
+    from scorable.generated.openapi_client.models.judge import Judge
+    from scorable.generated.openapi_client.models.judge_batch_execution_detail import JudgeBatchExecutionDetail
+    from scorable.generated.openapi_client.models.judge_batch_execution_input_request import (
+        JudgeBatchExecutionInputRequest,
+    )
+    from scorable.generated.openapi_client.models.judge_batch_execution_item import JudgeBatchExecutionItem
+    from scorable.generated.openapi_client.models.judge_batch_execution_item_input import JudgeBatchExecutionItemInput
+    from scorable.generated.openapi_client.models.judge_batch_execution_item_status_enum import (
+        JudgeBatchExecutionItemStatusEnum,
+    )
+    from scorable.generated.openapi_client.models.judge_batch_execution_list_item import JudgeBatchExecutionListItem
+    from scorable.generated.openapi_client.models.judge_batch_execution_request import JudgeBatchExecutionRequest
+    from scorable.generated.openapi_client.models.judge_batch_execution_response import JudgeBatchExecutionResponse
+    from scorable.generated.openapi_client.models.judge_claim_request_request import JudgeClaimRequestRequest
+    from scorable.generated.openapi_client.models.judge_execution_request import JudgeExecutionRequest
+    from scorable.generated.openapi_client.models.judge_execution_response import JudgeExecutionResponse
+    from scorable.generated.openapi_client.models.judge_files_inner import JudgeFilesInner
+    from scorable.generated.openapi_client.models.judge_generator_request import JudgeGeneratorRequest
+    from scorable.generated.openapi_client.models.judge_generator_response import JudgeGeneratorResponse
+    from scorable.generated.openapi_client.models.judge_invite_request import JudgeInviteRequest
+    from scorable.generated.openapi_client.models.judge_list import JudgeList
+    from scorable.generated.openapi_client.models.judge_rectifier_request_request import JudgeRectifierRequestRequest
+    from scorable.generated.openapi_client.models.judge_rectifier_response import JudgeRectifierResponse
+    from scorable.generated.openapi_client.models.judge_request import JudgeRequest
+    from scorable.generated.openapi_client.models.judges_synthetic_data_retrieve200_response import (
+        JudgesSyntheticDataRetrieve200Response,
+    )
+    from scorable.generated.openapi_client.models.judges_synthetic_data_retrieve200_response_samples_inner import (
+        JudgesSyntheticDataRetrieve200ResponseSamplesInner,
+    )
+    from scorable.generated.openapi_client.models.message_log_turn import MessageLogTurn
+    from scorable.generated.openapi_client.models.message_turn_request import MessageTurnRequest
+    from scorable.generated.openapi_client.models.model import Model
+    from scorable.generated.openapi_client.models.model_list import ModelList
+    from scorable.generated.openapi_client.models.model_list_visibility_enum import ModelListVisibilityEnum
+    from scorable.generated.openapi_client.models.model_request import ModelRequest
+    from scorable.generated.openapi_client.models.model_test_request_request import ModelTestRequestRequest
+    from scorable.generated.openapi_client.models.model_test_response import ModelTestResponse
+    from scorable.generated.openapi_client.models.nested_evaluator import NestedEvaluator
+    from scorable.generated.openapi_client.models.nested_evaluator_objective import NestedEvaluatorObjective
+    from scorable.generated.openapi_client.models.nested_evaluator_request import NestedEvaluatorRequest
+    from scorable.generated.openapi_client.models.nested_judge import NestedJudge
+    from scorable.generated.openapi_client.models.nested_objective_list import NestedObjectiveList
+    from scorable.generated.openapi_client.models.nested_user_details import NestedUserDetails
+    from scorable.generated.openapi_client.models.nested_user_details_request import NestedUserDetailsRequest
+    from scorable.generated.openapi_client.models.null_enum import NullEnum
+    from scorable.generated.openapi_client.models.objective import Objective
+    from scorable.generated.openapi_client.models.objective_list import ObjectiveList
+    from scorable.generated.openapi_client.models.objective_request import ObjectiveRequest
+    from scorable.generated.openapi_client.models.otel_trace import OtelTrace
+    from scorable.generated.openapi_client.models.otel_trace_evaluation_filter_input_request import (
+        OtelTraceEvaluationFilterInputRequest,
+    )
+    from scorable.generated.openapi_client.models.otel_trace_evaluation_filter_output import (
+        OtelTraceEvaluationFilterOutput,
+    )
+    from scorable.generated.openapi_client.models.otel_trace_record import OtelTraceRecord
+    from scorable.generated.openapi_client.models.paginated_annotation_list import PaginatedAnnotationList
+    from scorable.generated.openapi_client.models.paginated_calibration_run_item_list import (
+        PaginatedCalibrationRunItemList,
+    )
+    from scorable.generated.openapi_client.models.paginated_calibration_run_list import PaginatedCalibrationRunList
+    from scorable.generated.openapi_client.models.paginated_data_set_list_list import PaginatedDataSetListList
+    from scorable.generated.openapi_client.models.paginated_dataset_item_list import PaginatedDatasetItemList
+    from scorable.generated.openapi_client.models.paginated_evaluator_list import PaginatedEvaluatorList
+    from scorable.generated.openapi_client.models.paginated_evaluator_list_output_list import (
+        PaginatedEvaluatorListOutputList,
+    )
+    from scorable.generated.openapi_client.models.paginated_execution_log_list_list import PaginatedExecutionLogListList
+    from scorable.generated.openapi_client.models.paginated_judge_batch_execution_list_item_list import (
+        PaginatedJudgeBatchExecutionListItemList,
+    )
+    from scorable.generated.openapi_client.models.paginated_judge_list_list import PaginatedJudgeListList
+    from scorable.generated.openapi_client.models.paginated_model_list_list import PaginatedModelListList
+    from scorable.generated.openapi_client.models.paginated_objective_list import PaginatedObjectiveList
+    from scorable.generated.openapi_client.models.paginated_objective_list_list import PaginatedObjectiveListList
+    from scorable.generated.openapi_client.models.paginated_otel_trace_record_list import PaginatedOtelTraceRecordList
+    from scorable.generated.openapi_client.models.paginated_project_list import PaginatedProjectList
+    from scorable.generated.openapi_client.models.paginated_score_config_list import PaginatedScoreConfigList
+    from scorable.generated.openapi_client.models.patched_annotation_request import PatchedAnnotationRequest
+    from scorable.generated.openapi_client.models.patched_dataset_item_request import PatchedDatasetItemRequest
+    from scorable.generated.openapi_client.models.patched_evaluator_request import PatchedEvaluatorRequest
+    from scorable.generated.openapi_client.models.patched_judge_request import PatchedJudgeRequest
+    from scorable.generated.openapi_client.models.patched_model_request import PatchedModelRequest
+    from scorable.generated.openapi_client.models.patched_objective_request import PatchedObjectiveRequest
+    from scorable.generated.openapi_client.models.patched_project_request import PatchedProjectRequest
+    from scorable.generated.openapi_client.models.patched_score_config_request import PatchedScoreConfigRequest
+    from scorable.generated.openapi_client.models.project import Project
+    from scorable.generated.openapi_client.models.project_request import ProjectRequest
+    from scorable.generated.openapi_client.models.provider import Provider
+    from scorable.generated.openapi_client.models.reasoning_effort_enum import ReasoningEffortEnum
+    from scorable.generated.openapi_client.models.reference_variable_request import ReferenceVariableRequest
+    from scorable.generated.openapi_client.models.role_enum import RoleEnum
+    from scorable.generated.openapi_client.models.score_config import ScoreConfig
+    from scorable.generated.openapi_client.models.score_config_request import ScoreConfigRequest
+    from scorable.generated.openapi_client.models.score_config_type_enum import ScoreConfigTypeEnum
+    from scorable.generated.openapi_client.models.skill_execution_validator_result import SkillExecutionValidatorResult
+    from scorable.generated.openapi_client.models.skill_test_data_request import SkillTestDataRequest
+    from scorable.generated.openapi_client.models.skill_test_data_request_dataset_range import (
+        SkillTestDataRequestDatasetRange,
+    )
+    from scorable.generated.openapi_client.models.skill_test_input_behavior_enum import SkillTestInputBehaviorEnum
+    from scorable.generated.openapi_client.models.skill_test_input_request import SkillTestInputRequest
+    from scorable.generated.openapi_client.models.status_enum import StatusEnum
+    from scorable.generated.openapi_client.models.validation_result_status import ValidationResultStatus
+    from scorable.generated.openapi_client.models.visibility_enum import VisibilityEnum
+
+_LAZY = {
+    "Annotation": ".annotation",
+    "AnnotationRequest": ".annotation_request",
+    "AnnotationStatusEnum": ".annotation_status_enum",
+    "BatchExecutionStatus": ".batch_execution_status",
+    "BatchSetTagsModelRequest": ".batch_set_tags_model_request",
+    "CalibrationRun": ".calibration_run",
+    "CalibrationRunCreateRequest": ".calibration_run_create_request",
+    "CalibrationRunItem": ".calibration_run_item",
+    "CalibrationRunSourceRequest": ".calibration_run_source_request",
+    "CalibrationRunStatusEnum": ".calibration_run_status_enum",
+    "CalibrationSourceTypeEnum": ".calibration_source_type_enum",
+    "DataSetCreate": ".data_set_create",
+    "DataSetCreateRequest": ".data_set_create_request",
+    "DataSetList": ".data_set_list",
+    "DataSetType": ".data_set_type",
+    "DatasetItem": ".dataset_item",
+    "DatasetItemRequest": ".dataset_item_request",
+    "DatasetRangeRequest": ".dataset_range_request",
+    "DuplicateJudgeRequestRequest": ".duplicate_judge_request_request",
+    "DuplicateRequest": ".duplicate_request",
+    "Evaluator": ".evaluator",
+    "EvaluatorBehaviorEnum": ".evaluator_behavior_enum",
+    "EvaluatorCalibrationOutput": ".evaluator_calibration_output",
+    "EvaluatorCalibrationResult": ".evaluator_calibration_result",
+    "EvaluatorDemonstrations": ".evaluator_demonstrations",
+    "EvaluatorDemonstrationsRequest": ".evaluator_demonstrations_request",
+    "EvaluatorExecutionRequest": ".evaluator_execution_request",
+    "EvaluatorExecutionResult": ".evaluator_execution_result",
+    "EvaluatorImportYamlRequestRequest": ".evaluator_import_yaml_request_request",
+    "EvaluatorInputsValue": ".evaluator_inputs_value",
+    "EvaluatorInputsValueItems": ".evaluator_inputs_value_items",
+    "EvaluatorListOutput": ".evaluator_list_output",
+    "EvaluatorReference": ".evaluator_reference",
+    "EvaluatorReferenceRequest": ".evaluator_reference_request",
+    "EvaluatorRequest": ".evaluator_request",
+    "EvaluatorResult": ".evaluator_result",
+    "ExecutionLogDetails": ".execution_log_details",
+    "ExecutionLogDetailsEvaluationContext": ".execution_log_details_evaluation_context",
+    "ExecutionLogDetailsEvaluatorLatenciesInner": ".execution_log_details_evaluator_latencies_inner",
+    "ExecutionLogList": ".execution_log_list",
+    "ExecutionLogListEvaluationContext": ".execution_log_list_evaluation_context",
+    "ExperimentStatusEnum": ".experiment_status_enum",
+    "FileUploadResponse": ".file_upload_response",
+    "GenerationModelParamsRequest": ".generation_model_params_request",
+    "ID": ".id",
+    "InputVariable": ".input_variable",
+    "InputVariableRequest": ".input_variable_request",
+    "Judge": ".judge",
+    "JudgeBatchExecutionDetail": ".judge_batch_execution_detail",
+    "JudgeBatchExecutionInputRequest": ".judge_batch_execution_input_request",
+    "JudgeBatchExecutionItem": ".judge_batch_execution_item",
+    "JudgeBatchExecutionItemInput": ".judge_batch_execution_item_input",
+    "JudgeBatchExecutionItemStatusEnum": ".judge_batch_execution_item_status_enum",
+    "JudgeBatchExecutionListItem": ".judge_batch_execution_list_item",
+    "JudgeBatchExecutionRequest": ".judge_batch_execution_request",
+    "JudgeBatchExecutionResponse": ".judge_batch_execution_response",
+    "JudgeClaimRequestRequest": ".judge_claim_request_request",
+    "JudgeExecutionRequest": ".judge_execution_request",
+    "JudgeExecutionResponse": ".judge_execution_response",
+    "JudgeFilesInner": ".judge_files_inner",
+    "JudgeGeneratorRequest": ".judge_generator_request",
+    "JudgeGeneratorResponse": ".judge_generator_response",
+    "JudgeInviteRequest": ".judge_invite_request",
+    "JudgeList": ".judge_list",
+    "JudgeRectifierRequestRequest": ".judge_rectifier_request_request",
+    "JudgeRectifierResponse": ".judge_rectifier_response",
+    "JudgeRequest": ".judge_request",
+    "JudgesSyntheticDataRetrieve200Response": ".judges_synthetic_data_retrieve200_response",
+    "JudgesSyntheticDataRetrieve200ResponseSamplesInner": ".judges_synthetic_data_retrieve200_response_samples_inner",
+    "MessageLogTurn": ".message_log_turn",
+    "MessageTurnRequest": ".message_turn_request",
+    "Model": ".model",
+    "ModelList": ".model_list",
+    "ModelListVisibilityEnum": ".model_list_visibility_enum",
+    "ModelRequest": ".model_request",
+    "ModelTestRequestRequest": ".model_test_request_request",
+    "ModelTestResponse": ".model_test_response",
+    "NestedEvaluator": ".nested_evaluator",
+    "NestedEvaluatorObjective": ".nested_evaluator_objective",
+    "NestedEvaluatorRequest": ".nested_evaluator_request",
+    "NestedJudge": ".nested_judge",
+    "NestedObjectiveList": ".nested_objective_list",
+    "NestedUserDetails": ".nested_user_details",
+    "NestedUserDetailsRequest": ".nested_user_details_request",
+    "NullEnum": ".null_enum",
+    "Objective": ".objective",
+    "ObjectiveList": ".objective_list",
+    "ObjectiveRequest": ".objective_request",
+    "OtelTrace": ".otel_trace",
+    "OtelTraceEvaluationFilterInputRequest": ".otel_trace_evaluation_filter_input_request",
+    "OtelTraceEvaluationFilterOutput": ".otel_trace_evaluation_filter_output",
+    "OtelTraceRecord": ".otel_trace_record",
+    "PaginatedAnnotationList": ".paginated_annotation_list",
+    "PaginatedCalibrationRunItemList": ".paginated_calibration_run_item_list",
+    "PaginatedCalibrationRunList": ".paginated_calibration_run_list",
+    "PaginatedDataSetListList": ".paginated_data_set_list_list",
+    "PaginatedDatasetItemList": ".paginated_dataset_item_list",
+    "PaginatedEvaluatorList": ".paginated_evaluator_list",
+    "PaginatedEvaluatorListOutputList": ".paginated_evaluator_list_output_list",
+    "PaginatedExecutionLogListList": ".paginated_execution_log_list_list",
+    "PaginatedJudgeBatchExecutionListItemList": ".paginated_judge_batch_execution_list_item_list",
+    "PaginatedJudgeListList": ".paginated_judge_list_list",
+    "PaginatedModelListList": ".paginated_model_list_list",
+    "PaginatedObjectiveList": ".paginated_objective_list",
+    "PaginatedObjectiveListList": ".paginated_objective_list_list",
+    "PaginatedOtelTraceRecordList": ".paginated_otel_trace_record_list",
+    "PaginatedProjectList": ".paginated_project_list",
+    "PaginatedScoreConfigList": ".paginated_score_config_list",
+    "PatchedAnnotationRequest": ".patched_annotation_request",
+    "PatchedDatasetItemRequest": ".patched_dataset_item_request",
+    "PatchedEvaluatorRequest": ".patched_evaluator_request",
+    "PatchedJudgeRequest": ".patched_judge_request",
+    "PatchedModelRequest": ".patched_model_request",
+    "PatchedObjectiveRequest": ".patched_objective_request",
+    "PatchedProjectRequest": ".patched_project_request",
+    "PatchedScoreConfigRequest": ".patched_score_config_request",
+    "Project": ".project",
+    "ProjectRequest": ".project_request",
+    "Provider": ".provider",
+    "ReasoningEffortEnum": ".reasoning_effort_enum",
+    "ReferenceVariableRequest": ".reference_variable_request",
+    "RoleEnum": ".role_enum",
+    "ScoreConfig": ".score_config",
+    "ScoreConfigRequest": ".score_config_request",
+    "ScoreConfigTypeEnum": ".score_config_type_enum",
+    "SkillExecutionValidatorResult": ".skill_execution_validator_result",
+    "SkillTestDataRequest": ".skill_test_data_request",
+    "SkillTestDataRequestDatasetRange": ".skill_test_data_request_dataset_range",
+    "SkillTestInputBehaviorEnum": ".skill_test_input_behavior_enum",
+    "SkillTestInputRequest": ".skill_test_input_request",
+    "StatusEnum": ".status_enum",
+    "ValidationResultStatus": ".validation_result_status",
+    "VisibilityEnum": ".visibility_enum",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,324 @@
+"""Per-request timing breakdown of API calls.
+
+Request hooks receive a :class:`RequestTiming` for every API call a client
+makes, tagged with the operation id of the OpenAPI spec (for example
+``evaluators_execute_create``)::
+
+  timings = []
+  client = Scorable(request_hooks=[timings.append])
+
+Phases are measured where each transport exposes them: aiohttp trace signals
+for the asynchronous (and background-loop) transport, instrumented urllib3
+connection pools for the synchronous one. A client without hooks installs
+nothing, so requests pay no overhead.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import sys
+import time
+import warnings
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+RequestHook = Callable[["RequestTiming"], None]
+
+
+@dataclass
+class RequestTiming:
+    """Where the time of one API call went.
+
+    Durations are in seconds and None for phases that did not happen (a reused connection
+    is not connected again) or that the transport does not report: aiohttp connects and
+    completes the TLS handshake in one step, so ``tls`` is only measured by the synchronous
+    transport, which in turn resolves host names as part of ``connect``.
+    """
+
+    #: Operation id of the call in the OpenAPI spec, None for requests made outside the generated API.
+    operation_id: Optional[str]
+    method: str
+    #: Path template of the endpoint, e.g. ``/v1/evaluators/execute/{id}/``.
+    resource_path: str
+    url: str = ""
+    status: Optional[int] = None
+    error: Optional[BaseException] = None
+    #: Building the request: parameter and body serialization.
+    serialize: Optional[float] = None
+    #: Waiting for a free connection in the pool.
+    queue: Optional[float] = None
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    tls: Optional[float] = None
+    #: From sending the request (including any connecting) to receiving the response headers.
+    ttfb: Optional[float] = None
+    #: Reading the response body.
+    body: Optional[float] = None
+    #: Decoding the response into models.
+    deserialize: Optional[float] = None
+    total: Optional[float] = None
+    #: Requests sent for the call; more than one when the transport retried it.
+    attempts: int = 0
+    request_bytes: Optional[int] = None
+    response_bytes: Optional[int] = None
+    #: Storage for hooks that keep per-call state between ``start`` and the end of the call.
+    context: Dict[Any, Any] = field(default_factory=dict, repr=False)
+    started: float = field(default_factory=time.perf_counter, repr=False)
+    headers_received: Optional[float] = field(default=None, repr=False)
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+
+_current: contextvars.ContextVar[Optional[RequestTiming]] = contextvars.ContextVar("scorable_request", default=None)
+
+
+def _add(field: str, amount: float) -> None:
+    timing = _current.get()
+    if timing is not None:
+        setattr(timing, field, (getattr(timing, field) or 0) + amount)
+
+
+class Instrumentation:
+    """The request hooks of a client, and their installation on its API clients.
+
+    Hooks run on the thread (or task) that made the call, after the response is decoded or
+    the call failed. A hook with a ``start(timing, headers)`` method is also called before the
+    request is sent, with the request headers, to which it may add (e.g. trace context). An
+    exception raised by a hook is turned into a warning.
+
+    Args:
+      hooks: Callables receiving the :class:`RequestTiming` of each call.
+    """
+
+    def __init__(self, hooks: Iterable[RequestHook] = ()):
+        self.hooks: List[RequestHook] = list(hooks)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.hooks)
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """Add a hook. Pooled transports (``background_loop``) only pick it up if no request was made yet."""
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        self.hooks.remove(hook)
+
+    def _start(self, timing: RequestTiming, headers: Dict[str, Any]) -> None:
+        for hook in self.hooks:
+            start = getattr(hook, "start", None)
+            if start is not None:
+                try:
+                    start(timing, headers)
+                except Exception as e:
+                    warnings.warn(f"Request hook {hook!r} failed: {e!r}", RuntimeWarning, stacklevel=2)
+
+    def _emit(self, timing: RequestTiming) -> None:
+        _current.set(None)
+        for hook in self.hooks:
+            try:
+                hook(timing)
+            except Exception as e:
+                warnings.warn(f"Request hook {hook!r} failed: {e!r}", RuntimeWarning, stacklevel=2)
+
+    def install(self, api_client: Any) -> None:
+        """Time the calls of a generated ``ApiClient``; does nothing without hooks."""
+        if not self.hooks or getattr(api_client, "_scorable_instrumented", False):
+            return
+        api_client._scorable_instrumented = True
+        _install_transport(api_client.rest_client)
+        api_client.param_serialize = _timed_param_serialize(api_client.param_serialize, self._start)
+        api_client.call_api = _timed_call_api(api_client.call_api, self._emit)
+        api_client.response_deserialize = _timed_response_deserialize(api_client.response_deserialize, self._emit)
+
+
+def _timed_param_serialize(
+    param_serialize: Callable[..., Any], start: Callable[[RequestTiming, Dict[str, Any]], None]
+) -> Callable[..., Any]:
+    @functools.wraps(param_serialize)
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        # Generated operations build their request in ``_<operation id>_serialize``.
+        caller = sys._getframe(1).f_code.co_name
+        operation_id = caller[1 : -len("_serialize")] if caller.endswith("_serialize") else None
+        timing = RequestTiming(operation_id, kwargs.get("method", ""), kwargs.get("resource_path", ""))
+        serialized = param_serialize(*args, **kwargs)
+        timing.url = serialized[1]
+        timing.serialize = time.perf_counter() - timing.started
+        _current.set(timing)
+        start(timing, serialized[2])
+        return serialized
+
+    return timed
+
+
+def _sent(timing: RequestTiming, start: float, response: Any) -> None:
+    timing.headers_received = time.perf_counter()
+    timing.ttfb = timing.headers_received - start
+    timing.status = response.status
+
+
+def _failed(timing: RequestTiming, error: BaseException, emit: RequestHook) -> None:
+    timing.error = error
+    timing.total = time.perf_counter() - timing.started
+    emit(timing)
+
+
+def _timed_call_api(call_api: Callable[..., Any], emit: RequestHook) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(call_api):
+
+        @functools.wraps(call_api)
+        async def timed_async(*args: Any, **kwargs: Any) -> Any:
+            timing = _current.get()
+            if timing is None:
+                return await call_api(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                response = await call_api(*args, **kwargs)
+            except BaseException as e:
+                _failed(timing, e, emit)
+                raise
+            _sent(timing, start, response)
+            return response
+
+        return timed_async
+
+    @functools.wraps(call_api)
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        timing = _current.get()
+        if timing is None:
+            return call_api(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            response = call_api(*args, **kwargs)
+        except BaseException as e:
+            _failed(timing, e, emit)
+            raise
+        _sent(timing, start, response)
+        return response
+
+    return timed
+
+
+def _timed_response_deserialize(response_deserialize: Callable[..., Any], emit: RequestHook) -> Callable[..., Any]:
+    @functools.wraps(response_deserialize)
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        timing = _current.get()
+        if timing is None or timing.headers_received is None:
+            return response_deserialize(*args, **kwargs)
+        start = time.perf_counter()
+        # The generated operations read the body right before decoding it.
+        timing.body = start - timing.headers_received
+        data = getattr(args[0] if args else kwargs.get("response_data"), "data", None)
+        timing.response_bytes = None if data is None else len(data)
+        try:
+            return response_deserialize(*args, **kwargs)
+        except BaseException as e:
+            timing.error = e
+            raise
+        finally:
+            end = time.perf_counter()
+            timing.deserialize = end - start
+            timing.total = end - timing.started
+            emit(timing)
+
+    return timed
+
+
+def _install_transport(rest_client: Any) -> None:
+    pool_manager: Any = getattr(rest_client, "pool_manager", None)
+    if hasattr(pool_manager, "pool_classes_by_scheme"):
+        pool_manager.pool_classes_by_scheme = _urllib3_pool_classes()
+    elif hasattr(pool_manager, "_trace_configs"):
+        # aiohttp only accepts trace configs when the session is created, which the
+        # generated REST client does without any; a frozen config can be added afterwards.
+        pool_manager._trace_configs.append(_aiohttp_trace_config())
+
+
+@functools.lru_cache(maxsize=None)
+def _urllib3_pool_classes() -> dict:
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class TimedConnection:
+        def _new_conn(self) -> Any:
+            start = time.perf_counter()
+            try:
+                return super()._new_conn()  # type: ignore[misc]
+            finally:
+                _add("connect", time.perf_counter() - start)
+
+        def request(self, method: str, url: str, body: Any = None, *args: Any, **kwargs: Any) -> None:
+            # Called once per attempt, with the encoded body.
+            _add("attempts", 1)
+            if isinstance(body, (bytes, str)):
+                _add("request_bytes", len(body.encode() if isinstance(body, str) else body))
+            super().request(method, url, body, *args, **kwargs)  # type: ignore[misc]
+
+    class TimedHTTPConnection(TimedConnection, HTTPConnection):
+        pass
+
+    class TimedHTTPSConnection(TimedConnection, HTTPSConnection):
+        def connect(self) -> None:
+            timing = _current.get()
+            connected = (timing.connect or 0.0) if timing is not None else 0.0
+            start = time.perf_counter()
+            try:
+                super().connect()
+            finally:
+                if timing is not None:
+                    _add("tls", time.perf_counter() - start - ((timing.connect or 0.0) - connected))
+
+    def timed_get_conn(get_conn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(get_conn)
+        def _get_conn(self: Any, timeout: Optional[float] = None) -> Any:
+            start = time.perf_counter()
+            try:
+                return get_conn(self, timeout)
+            finally:
+                _add("queue", time.perf_counter() - start)
+
+        return _get_conn
+
+    class TimedHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = TimedHTTPConnection
+        _get_conn = timed_get_conn(HTTPConnectionPool._get_conn)
+
+    class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = TimedHTTPSConnection
+        _get_conn = timed_get_conn(HTTPSConnectionPool._get_conn)
+
+    return {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+
+
+def _aiohttp_trace_config() -> Any:
+    import aiohttp
+
+    config = aiohttp.TraceConfig()
+
+    def measure(phase: str, on_start: Any, on_end: Any) -> None:
+        async def start(session: Any, context: Any, params: Any) -> None:
+            setattr(context, phase, time.perf_counter())
+
+        async def end(session: Any, context: Any, params: Any) -> None:
+            _add(phase, time.perf_counter() - getattr(context, phase))
+
+        on_start.append(start)
+        on_end.append(end)
+
+    async def request_start(session: Any, context: Any, params: Any) -> None:
+        _add("attempts", 1)
+
+    async def chunk_sent(session: Any, context: Any, params: Any) -> None:
+        _add("request_bytes", len(params.chunk))
+
+    config.on_request_start.append(request_start)
+    config.on_request_chunk_sent.append(chunk_sent)
+    measure("queue", config.on_connection_queued_start, config.on_connection_queued_end)
+    measure("dns", config.on_dns_resolvehost_start, config.on_dns_resolvehost_end)
+    measure("connect", config.on_connection_create_start, config.on_connection_create_end)
+    config.freeze()
+    return config
@@ -0,0 +1,117 @@
+"""Upload repeated context documents once and reference them by file ID.
+
+RAG evaluations often pass the same retrieved documents with thousands of
+executions. :class:`DocumentInterner` takes a ``contexts`` list whose entries
+are either text or documents (a path, or the bytes of a PDF or image), uploads
+each distinct document once through :class:`scorable.files.Files` and replaces
+it with its file ID::
+
+  interner = DocumentInterner(client.files)
+  client.evaluators.run(evaluator_id, response=response, **interner.intern([question_notes, Path("manual.pdf")]))
+
+Only documents are interned: the files endpoint accepts PDF and image uploads
+only, so text contexts are passed on inline as they are. File IDs only help
+evaluators whose model supports file inputs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, TypedDict, Union
+
+from .upload_cache import content_digest
+
+if TYPE_CHECKING:
+    from .files import Files
+
+Context = Union[str, bytes, "os.PathLike[str]"]
+Document = Union[bytes, "os.PathLike[str]"]
+
+_SIGNATURES = (
+    (b"%PDF", ".pdf"),
+    (b"\x89PNG", ".png"),
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"<svg", ".svg"),
+    (b"<?xml", ".svg"),
+)
+
+
+def _suffix(data: bytes) -> str:
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    for signature, suffix in _SIGNATURES:
+        if data.startswith(signature):
+            return suffix
+    raise ValueError("Context documents must be PDF or image (png, jpg, webp, svg) files")
+
+
+class InternedContexts(TypedDict):
+    """Keyword arguments for an execution: the inline text contexts and the document file IDs."""
+
+    contexts: Optional[List[str]]
+    file_ids: Optional[List[uuid.UUID]]
+
+
+class DocumentInterner:
+    """Uploads each distinct context document once and remembers its file ID by content hash.
+
+    Args:
+      files: The Files API used for uploads, e.g. ``client.files``.
+    """
+
+    def __init__(self, files: Files):
+        self.files = files
+        self._file_ids: Dict[str, uuid.UUID] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _document(context: Document) -> Tuple[str, Union[str, bytes], str]:
+        # The content hash, the upload source and the file name of a document. Files are hashed
+        # without being read into memory.
+        digest = content_digest(context)
+        if isinstance(context, bytes):
+            return digest, context, f"{digest}{_suffix(context)}"
+        return digest, os.fspath(context), Path(context).name
+
+    def _split(self, contexts: Sequence[Context]) -> Tuple[List[str], List[Document]]:
+        texts = [context for context in contexts if isinstance(context, str)]
+        documents = [context for context in contexts if not isinstance(context, str)]
+        return texts, documents
+
+    def intern(self, contexts: Sequence[Context]) -> InternedContexts:
+        """Upload the documents among ``contexts`` that were not uploaded yet."""
+        texts, documents = self._split(contexts)
+        file_ids = []
+        for document in documents:
+            digest, source, filename = self._document(document)
+            with self._lock:
+                file_id = self._file_ids.get(digest)
+            if file_id is None:
+                file_id = self.files.upload(io.BytesIO(source) if isinstance(source, bytes) else source, filename)
+                with self._lock:
+                    self._file_ids[digest] = file_id
+            file_ids.append(file_id)
+        return InternedContexts(contexts=texts or None, file_ids=file_ids or None)
+
+    async def aintern(self, contexts: Sequence[Context]) -> InternedContexts:
+        """Asynchronously upload the documents among ``contexts`` that were not uploaded yet.
+
+        Concurrent calls with the same document share a single upload.
+        """
+        texts, documents = self._split(contexts)
+        file_ids = []
+        for document in documents:
+            # hashlib releases the GIL, so large files are hashed without blocking the loop.
+            digest, source, filename = await asyncio.to_thread(self._document, document)
+            file_id = self._file_ids.get(digest)
+            if file_id is None:
+                async with self.files._async_client() as api_client:
+                    file_id = await self.files._aupload(api_client, source, filename, None, None, digest=digest)
+                self._file_ids[digest] = file_id
+            file_ids.append(file_id)
+        return InternedContexts(contexts=texts or None, file_ids=file_ids or None)
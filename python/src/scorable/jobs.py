@@ -0,0 +1,222 @@
+"""Checkpointed, resumable bulk evaluation jobs.
+
+:meth:`Jobs.evaluate` runs a set of evaluators over a source and appends the
+outcome of every (input key, evaluator version) pair to a journal file. When
+the same job is started again with the same journal, pairs that already
+succeeded are skipped, so an interrupted run continues where it stopped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from .metrics import queued
+from .sources import aevaluate_record
+
+if TYPE_CHECKING:
+    from .client import Scorable
+    from .sources import DatasetSource, JsonlSource
+
+    Source = JsonlSource | DatasetSource
+
+_Pair = Tuple[str, str, str]
+
+
+def _pair(entry: Dict[str, Any]) -> _Pair:
+    return entry["key"], entry["evaluator_id"], entry["evaluator_version_id"]
+
+
+class Journal:
+    """Append-only log of finished evaluations, one JSON object per line.
+
+    Appends are written immediately but flushed to disk (``fsync``) in batches, every
+    ``sync_every`` entries or ``sync_interval`` seconds, whichever comes first. A crash
+    loses at most the unsynced tail, whose evaluations are then simply run again.
+
+    Args:
+      path: Journal file; created if it does not exist.
+      sync_every: Maximum number of entries between syncs.
+      sync_interval: Maximum number of seconds between syncs.
+    """
+
+    def __init__(self, path: str, *, sync_every: int = 100, sync_interval: float = 1.0):
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._entries: Dict[_Pair, Dict[str, Any]] = {}
+        torn = self._load()
+        self._file = open(path, "a", encoding="utf-8")
+        if torn:
+            # Terminate a line left half-written by a crash so that it stays unparseable on its own.
+            self._file.write("\n")
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, "rb") as f:
+            content = f.read()
+        for line in content.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            self._entries[_pair(entry)] = entry
+        return bool(content) and not content.endswith(b"\n")
+
+    def status(self, key: str, evaluator_id: str, evaluator_version_id: str) -> Optional[str]:
+        """``"ok"`` or ``"error"`` for a recorded pair, None if it was never evaluated."""
+        entry = self._entries.get((key, evaluator_id, evaluator_version_id))
+        return None if entry is None else entry["status"]
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """The latest entry of every recorded pair."""
+        return list(self._entries.values())
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(entry) + "\n")
+        self._entries[_pair(entry)] = entry
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __enter__(self) -> Journal:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+@dataclass
+class JobReport:
+    """Counts of (input, evaluator) pairs of one :meth:`Jobs.evaluate` call."""
+
+    evaluated: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+
+class Jobs:
+    """
+    Jobs (sub) API
+
+    Note:
+
+      The construction of the API instance should be handled by
+      accesing an attribute of a :class:`scorable.client.Scorable` instance.
+    """
+
+    def __init__(self, client: Scorable):
+        self._client = client
+
+    def evaluate(
+        self,
+        source: Source,
+        evaluator_ids: Sequence[str],
+        *,
+        journal: str,
+        concurrency: int = 16,
+        only_failed: bool = False,
+    ) -> JobReport:
+        """
+        Run evaluators over every input of a source, recording each outcome in a journal.
+
+        Evaluations that already succeeded according to the journal are skipped, so an
+        interrupted job can be resumed by calling this again with the same arguments.
+        Evaluators are pinned to their latest version when the job starts; inputs are
+        re-evaluated if an evaluator has changed since they were journaled.
+
+        Args:
+            source: A :class:`scorable.sources.JsonlSource` or :class:`scorable.sources.DatasetSource`.
+            evaluator_ids: Evaluators to run on every input.
+            journal: Path of the journal file.
+            concurrency: Maximum number of concurrent evaluations.
+            only_failed: Only re-run evaluations that failed in a previous run.
+        """
+        assert not self._client.run_async, "This method is not available in asynchronous mode"
+        return asyncio.run(
+            self.aevaluate(source, evaluator_ids, journal=journal, concurrency=concurrency, only_failed=only_failed)
+        )
+
+    async def aevaluate(
+        self,
+        source: Source,
+        evaluator_ids: Sequence[str],
+        *,
+        journal: str,
+        concurrency: int = 16,
+        only_failed: bool = False,
+    ) -> JobReport:
+        """
+        Asynchronously run evaluators over every input of a source, recording each outcome in a journal.
+
+        Evaluations that already succeeded according to the journal are skipped, so an
+        interrupted job can be resumed by calling this again with the same arguments.
+        Evaluators are pinned to their latest version when the job starts; inputs are
+        re-evaluated if an evaluator has changed since they were journaled.
+
+        Args:
+            source: A :class:`scorable.sources.JsonlSource` or :class:`scorable.sources.DatasetSource`.
+            evaluator_ids: Evaluators to run on every input.
+            journal: Path of the journal file.
+            concurrency: Maximum number of concurrent evaluations.
+            only_failed: Only re-run evaluations that failed in a previous run.
+        """
+        report = JobReport()
+        async with self._client._pooled_async_client() as client:
+            versions = {
+                evaluator_id: (await client.evaluators.aget(evaluator_id)).version_id for evaluator_id in evaluator_ids
+            }
+            with Journal(journal) as log:
+                semaphore = asyncio.Semaphore(concurrency)
+                running: Set[asyncio.Task] = set()
+
+                async def evaluate(key: str, arguments: Dict[str, Any], evaluator_id: str, version_id: str) -> None:
+                    try:
+                        record = await aevaluate_record(
+                            client, evaluator_id, key, arguments, evaluator_version_id=version_id
+                        )
+                    finally:
+                        semaphore.release()
+                    failed = record["error"] is not None
+                    log.append({**record, "evaluator_version_id": version_id, "status": "error" if failed else "ok"})
+                    report.evaluated += 1
+                    report.failed += failed
+
+                try:
+                    async for key, arguments in source.aread(client):
+                        for evaluator_id, version_id in versions.items():
+                            status = log.status(key, evaluator_id, version_id)
+                            if status == "ok" or (only_failed and status != "error"):
+                                report.skipped += 1
+                                continue
+                            # Bounds the number of inputs held in memory to the concurrency.
+                            await semaphore.acquire()
+                            task = queued(
+                                asyncio.create_task(evaluate(key, arguments, evaluator_id, version_id)), "jobs.evaluate"
+                            )
+                            running.add(task)
+                            task.add_done_callback(running.discard)
+                    await asyncio.gather(*running)
+                finally:
+                    for task in running:
+                        task.cancel()
+                    await asyncio.gather(*running, return_exceptions=True)
+        return report
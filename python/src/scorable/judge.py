@@ -0,0 +1,174 @@
+"""Wrappers of single judges, as returned by :class:`scorable.judges.Judges`.
+
+They subclass the generated judge model, so this module is imported on first use
+rather than with :mod:`scorable.judges`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
+
+from .generated.openapi_client import ApiClient
+from .generated.openapi_client.api.judges_api import JudgesApi
+from .generated.openapi_client.models.judge import Judge as OpenApiJudge
+from .generated.openapi_client.models.judge_execution_request import JudgeExecutionRequest
+from .generated.openapi_client.models.judge_execution_response import JudgeExecutionResponse
+from .generated.openapi_client.models.judge_list import JudgeList
+from .generated.openapi_client.models.message_turn_request import MessageTurnRequest
+from .utils import ClientContextCallable, LazyImport, with_async_client, with_sync_client
+
+if TYPE_CHECKING:
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.judges_api import JudgesApi as AJudgesApi
+else:
+    AJudgesApi = LazyImport("scorable.generated.openapi_aclient.api.judges_api", "JudgesApi")
+
+
+class Judge(OpenApiJudge):
+    """Wrapper for a single Judge.
+
+    For available attributes, please check the (automatically
+    generated) superclass documentation.
+    """
+
+    client_context: ClientContextCallable
+
+    @classmethod
+    def _wrap(cls, apiobj: Union[OpenApiJudge, JudgeList], client_context: ClientContextCallable) -> Judge:
+        """Wrap API object into a Judge instance."""
+        if not isinstance(apiobj, (OpenApiJudge, JudgeList)):
+            raise ValueError(f"Wrong instance in _wrap: {apiobj!r}")
+        obj = cast(Judge, apiobj)
+        obj.__class__ = cls
+        obj.client_context = client_context
+        return obj
+
+    @with_sync_client
+    def run(
+        self,
+        *,
+        response: Optional[str] = None,
+        request: Optional[str] = None,
+        turns: Optional[List[MessageTurnRequest]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        contexts: Optional[List[str]] = None,
+        expected_output: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        project_id: Optional[str] = None,
+        _request_timeout: Optional[int] = None,
+        _client: ApiClient,
+    ) -> JudgeExecutionResponse:
+        """
+        Run the judge.
+
+        Args:
+          response: LLM output to evaluate
+          request: The prompt sent to the LLM. Optional.
+          turns: Optional multi-turn conversation as a list of turns.
+          tools: Optional list of tool definitions available to the assistant in the conversation.
+          contexts: Optional documents passed to RAG evaluators
+          expected_output: Optional expected output
+          tags: Optional tags to add to the judge execution
+          user_id: Optional user identifier for tracking purposes.
+          session_id: Optional session identifier for tracking purposes.
+          system_prompt: Optional system prompt that was used for the LLM call.
+          project_id: Optional project to attribute the execution log to.
+          _request_timeout: Optional timeout for the request
+        """
+        api_instance = JudgesApi(_client)
+        execution_request = JudgeExecutionRequest(
+            request=request,
+            response=response,
+            turns=turns,
+            tools=tools,
+            contexts=contexts,
+            expected_output=expected_output,
+            tags=tags,
+            user_id=user_id,
+            session_id=session_id,
+            system_prompt=system_prompt,
+            project_id=project_id,
+        )
+        return api_instance.judges_execute_create(
+            judge_id=self.id,
+            judge_execution_request=execution_request,
+            _request_timeout=_request_timeout,
+        )
+
+
+class AJudge(OpenApiJudge):
+    """
+    Async wrapper for a single Judge.
+
+    For available attributes, please check the (automatically
+    generated) superclass documentation.
+    """
+
+    client_context: ClientContextCallable
+
+    @classmethod
+    async def _awrap(cls, apiobj: Union[OpenApiJudge, JudgeList], client_context: ClientContextCallable) -> AJudge:
+        if not isinstance(apiobj, (OpenApiJudge, JudgeList)):
+            raise ValueError(f"Wrong instance in _wrap: {apiobj!r}")
+        obj = cast(AJudge, apiobj)
+        obj.__class__ = cls
+        obj.client_context = client_context
+        return obj
+
+    @with_async_client
+    async def arun(
+        self,
+        *,
+        response: Optional[str] = None,
+        request: Optional[str] = None,
+        turns: Optional[List[MessageTurnRequest]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        contexts: Optional[List[str]] = None,
+        expected_output: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        project_id: Optional[str] = None,
+        _request_timeout: Optional[int] = None,
+        _client: AApiClient,
+    ) -> JudgeExecutionResponse:
+        """
+        Asynchronously run the judge.
+
+        Args:
+          response: LLM output to evaluate
+          request: The prompt sent to the LLM. Optional.
+          turns: Optional multi-turn conversation as a list of turns.
+          tools: Optional list of tool definitions available to the assistant in the conversation.
+          contexts: Optional documents passed to RAG evaluators
+          expected_output: Optional expected output
+          tags: Optional tags to add to the judge execution
+          user_id: Optional user identifier for tracking purposes.
+          session_id: Optional session identifier for tracking purposes.
+          system_prompt: Optional system prompt that was used for the LLM call.
+          project_id: Optional project to attribute the execution log to.
+          _request_timeout: Optional timeout for the request
+        """
+        api_instance = AJudgesApi(_client)
+        execution_request = JudgeExecutionRequest(
+            contexts=contexts,
+            expected_output=expected_output,
+            request=request,
+            response=response,
+            turns=turns,
+            tools=tools,
+            tags=tags,
+            user_id=user_id,
+            session_id=session_id,
+            system_prompt=system_prompt,
+            project_id=project_id,
+        )
+        return await api_instance.judges_execute_create(
+            judge_id=self.id,
+            judge_execution_request=execution_request,
+            _request_timeout=_request_timeout,
+        )
@@ -1,211 +1,86 @@
 from __future__ import annotations
 
-from contextlib import AbstractAsyncContextManager
-from functools import partial
-from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional, Union, cast
-
-from pydantic import StrictStr
-
-from scorable.generated.openapi_aclient.models.judge_generator_request import (
-    JudgeGeneratorRequest as AJudgeGeneratorRequest,
-)
-from scorable.generated.openapi_aclient.models.judge_generator_response import (
-    JudgeGeneratorResponse as AJudgeGeneratorResponse,
-)
-from scorable.generated.openapi_aclient.models.judge_request import (
-    JudgeRequest as AJudgeRequest,
-)
-from scorable.generated.openapi_aclient.models.visibility_enum import (
-    VisibilityEnum as AJudgeGeneratorVisibilityEnum,
-)
-from scorable.generated.openapi_client.models.judge_generator_request import JudgeGeneratorRequest
-from scorable.generated.openapi_client.models.judge_generator_response import JudgeGeneratorResponse
-from scorable.generated.openapi_client.models.judge_request import JudgeRequest
-from scorable.generated.openapi_client.models.visibility_enum import VisibilityEnum as JudgeGeneratorVisibilityEnum
-
-from .generated.openapi_aclient import ApiClient as AApiClient
-from .generated.openapi_aclient.api.judges_api import JudgesApi as AJudgesApi
-from .generated.openapi_aclient.models.evaluator_reference_request import (
-    EvaluatorReferenceRequest as AEvaluatorReferenceRequest,
-)
-from .generated.openapi_aclient.models.judge import Judge as AOpenApiJudge
-from .generated.openapi_aclient.models.judge_execution_request import (
-    JudgeExecutionRequest as AJudgeExecutionRequest,
-)
-from .generated.openapi_aclient.models.judge_execution_response import (
-    JudgeExecutionResponse as AJudgeExecutionResponse,
-)
-from .generated.openapi_aclient.models.judge_list import JudgeList as AJudgeList
-from .generated.openapi_aclient.models.message_turn_request import (
-    MessageTurnRequest as AMessageTurnRequest,
-)
-from .generated.openapi_aclient.models.paginated_judge_list_list import (
-    PaginatedJudgeListList as APaginatedJudgeListList,
-)
-from .generated.openapi_aclient.models.patched_judge_request import (
-    PatchedJudgeRequest as APatchedJudgeRequest,
+import uuid
+from contextlib import AbstractAsyncContextManager, contextmanager
+from functools import cached_property, partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
 )
-from .generated.openapi_client import ApiClient
-from .generated.openapi_client.api.judges_api import JudgesApi
-from .generated.openapi_client.models.evaluator_reference_request import EvaluatorReferenceRequest
-from .generated.openapi_client.models.judge import Judge as OpenApiJudge
-from .generated.openapi_client.models.judge_execution_request import JudgeExecutionRequest
-from .generated.openapi_client.models.judge_execution_response import JudgeExecutionResponse
-from .generated.openapi_client.models.judge_list import JudgeList
-from .generated.openapi_client.models.message_turn_request import MessageTurnRequest
-from .generated.openapi_client.models.paginated_judge_list_list import PaginatedJudgeListList
-from .generated.openapi_client.models.patched_judge_request import PatchedJudgeRequest
-from .utils import ClientContextCallable, with_async_client, with_sync_client
-
-
-class Judge(OpenApiJudge):
-    """Wrapper for a single Judge.
-
-    For available attributes, please check the (automatically
-    generated) superclass documentation.
-    """
-
-    client_context: ClientContextCallable
-
-    @classmethod
-    def _wrap(cls, apiobj: Union[OpenApiJudge, JudgeList], client_context: ClientContextCallable) -> Judge:
-        """Wrap API object into a Judge instance."""
-        if not isinstance(apiobj, (OpenApiJudge, JudgeList)):
-            raise ValueError(f"Wrong instance in _wrap: {apiobj!r}")
-        obj = cast(Judge, apiobj)
-        obj.__class__ = cls
-        obj.client_context = client_context
-        return obj
 
-    @with_sync_client
-    def run(
-        self,
-        *,
-        response: Optional[str] = None,
-        request: Optional[str] = None,
-        turns: Optional[List[MessageTurnRequest]] = None,
-        tools: Optional[List[Dict[str, Any]]] = None,
-        contexts: Optional[List[str]] = None,
-        expected_output: Optional[str] = None,
-        tags: Optional[List[str]] = None,
-        user_id: Optional[str] = None,
-        session_id: Optional[str] = None,
-        system_prompt: Optional[str] = None,
-        project_id: Optional[str] = None,
-        _request_timeout: Optional[int] = None,
-        _client: ApiClient,
-    ) -> JudgeExecutionResponse:
-        """
-        Run the judge.
-
-        Args:
-          response: LLM output to evaluate
-          request: The prompt sent to the LLM. Optional.
-          turns: Optional multi-turn conversation as a list of turns.
-          tools: Optional list of tool definitions available to the assistant in the conversation.
-          contexts: Optional documents passed to RAG evaluators
-          expected_output: Optional expected output
-          tags: Optional tags to add to the judge execution
-          user_id: Optional user identifier for tracking purposes.
-          session_id: Optional session identifier for tracking purposes.
-          system_prompt: Optional system prompt that was used for the LLM call.
-          project_id: Optional project to attribute the execution log to.
-          _request_timeout: Optional timeout for the request
-        """
-        api_instance = JudgesApi(_client)
-        execution_request = JudgeExecutionRequest(
-            request=request,
-            response=response,
-            turns=turns,
-            tools=tools,
-            contexts=contexts,
-            expected_output=expected_output,
-            tags=tags,
-            user_id=user_id,
-            session_id=session_id,
-            system_prompt=system_prompt,
-            project_id=project_id,
-        )
-        return api_instance.judges_execute_create(
-            judge_id=self.id,
-            judge_execution_request=execution_request,
-            _request_timeout=_request_timeout,
-        )
-
-
-class AJudge(AOpenApiJudge):
-    """
-    Async wrapper for a single Judge.
-
-    For available attributes, please check the (automatically
-    generated) superclass documentation.
-    """
+from pydantic import StrictStr
 
-    client_context: ClientContextCallable
-
-    @classmethod
-    async def _awrap(cls, apiobj: Union[AOpenApiJudge, AJudgeList], client_context: ClientContextCallable) -> AJudge:
-        if not isinstance(apiobj, (AOpenApiJudge, AJudgeList)):
-            raise ValueError(f"Wrong instance in _wrap: {apiobj!r}")
-        obj = cast(AJudge, apiobj)
-        obj.__class__ = cls
-        obj.client_context = client_context
-        return obj
-
-    @with_async_client
-    async def arun(
-        self,
-        *,
-        response: Optional[str] = None,
-        request: Optional[str] = None,
-        turns: Optional[List[AMessageTurnRequest]] = None,
-        tools: Optional[List[Dict[str, Any]]] = None,
-        contexts: Optional[List[str]] = None,
-        expected_output: Optional[str] = None,
-        tags: Optional[List[str]] = None,
-        user_id: Optional[str] = None,
-        session_id: Optional[str] = None,
-        system_prompt: Optional[str] = None,
-        project_id: Optional[str] = None,
-        _request_timeout: Optional[int] = None,
-        _client: AApiClient,
-    ) -> AJudgeExecutionResponse:
-        """
-        Asynchronously run the judge.
-
-        Args:
-          response: LLM output to evaluate
-          request: The prompt sent to the LLM. Optional.
-          turns: Optional multi-turn conversation as a list of turns.
-          tools: Optional list of tool definitions available to the assistant in the conversation.
-          contexts: Optional documents passed to RAG evaluators
-          expected_output: Optional expected output
-          tags: Optional tags to add to the judge execution
-          user_id: Optional user identifier for tracking purposes.
-          session_id: Optional session identifier for tracking purposes.
-          system_prompt: Optional system prompt that was used for the LLM call.
-          project_id: Optional project to attribute the execution log to.
-          _request_timeout: Optional timeout for the request
-        """
-        api_instance = AJudgesApi(_client)
-        execution_request = AJudgeExecutionRequest(
-            contexts=contexts,
-            expected_output=expected_output,
-            request=request,
-            response=response,
-            turns=turns,
-            tools=tools,
-            tags=tags,
-            user_id=user_id,
-            session_id=session_id,
-            system_prompt=system_prompt,
-            project_id=project_id,
-        )
-        return await api_instance.judges_execute_create(
-            judge_id=self.id,
-            judge_execution_request=execution_request,
-            _request_timeout=_request_timeout,
-        )
+from .dedup import DEFAULT_WINDOW, BatchResult, Deduplicator
+from .metrics import QUEUE_DEPTH
+from .polling import AsyncBatchHandle, BatchHandle, BatchPoller
+from .utils import ClientContextCallable, LazyImport, with_async_client, with_sync_client
+
+if TYPE_CHECKING:
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.judges_api import JudgesApi as AJudgesApi
+    from .generated.openapi_client import ApiClient
+    from .generated.openapi_client.api.judges_api import JudgesApi
+    from .generated.openapi_client.models.evaluator_reference_request import EvaluatorReferenceRequest
+    from .generated.openapi_client.models.judge_batch_execution_detail import JudgeBatchExecutionDetail
+    from .generated.openapi_client.models.judge_batch_execution_input_request import JudgeBatchExecutionInputRequest
+    from .generated.openapi_client.models.judge_batch_execution_item import JudgeBatchExecutionItem
+    from .generated.openapi_client.models.judge_batch_execution_request import JudgeBatchExecutionRequest
+    from .generated.openapi_client.models.judge_execution_request import JudgeExecutionRequest
+    from .generated.openapi_client.models.judge_execution_response import JudgeExecutionResponse
+    from .generated.openapi_client.models.judge_generator_request import JudgeGeneratorRequest
+    from .generated.openapi_client.models.judge_generator_response import JudgeGeneratorResponse
+    from .generated.openapi_client.models.judge_request import JudgeRequest
+    from .generated.openapi_client.models.message_turn_request import MessageTurnRequest
+    from .generated.openapi_client.models.paginated_judge_list_list import PaginatedJudgeListList
+    from .generated.openapi_client.models.patched_judge_request import PatchedJudgeRequest
+    from .generated.openapi_client.models.visibility_enum import VisibilityEnum as JudgeGeneratorVisibilityEnum
+    from .judge import AJudge, Judge
+else:
+    AJudgesApi = LazyImport("scorable.generated.openapi_aclient.api.judges_api", "JudgesApi")
+    JudgesApi = LazyImport("scorable.generated.openapi_client.api.judges_api", "JudgesApi")
+    JudgeBatchExecutionInputRequest = LazyImport(
+        "scorable.generated.openapi_client.models.judge_batch_execution_input_request",
+        "JudgeBatchExecutionInputRequest",
+    )
+    JudgeBatchExecutionRequest = LazyImport(
+        "scorable.generated.openapi_client.models.judge_batch_execution_request", "JudgeBatchExecutionRequest"
+    )
+    JudgeExecutionRequest = LazyImport(
+        "scorable.generated.openapi_client.models.judge_execution_request", "JudgeExecutionRequest"
+    )
+    JudgeGeneratorRequest = LazyImport(
+        "scorable.generated.openapi_client.models.judge_generator_request", "JudgeGeneratorRequest"
+    )
+    JudgeRequest = LazyImport("scorable.generated.openapi_client.models.judge_request", "JudgeRequest")
+    PatchedJudgeRequest = LazyImport(
+        "scorable.generated.openapi_client.models.patched_judge_request", "PatchedJudgeRequest"
+    )
+    JudgeGeneratorVisibilityEnum = LazyImport(
+        "scorable.generated.openapi_client.models.visibility_enum", "VisibilityEnum"
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # The judge wrappers subclass a generated model, so they are imported on first use.
+    if name in ("Judge", "AJudge"):
+        from . import judge
+
+        return getattr(judge, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+#: Maximum number of inputs of one batch execution.
+MAX_BATCH_INPUTS = 100
 
 
 class Judges:
@@ -220,6 +95,16 @@ class Judges:
     def __init__(self, client_context: ClientContextCallable):
         self.client_context = client_context
 
+    @cached_property
+    def batch_poller(self) -> BatchPoller:
+        """The poller of the batch executions of this client, shared by all its batch runs.
+
+        Track batches submitted with ``judges_batch_execute_create`` with
+        :meth:`~scorable.polling.BatchPoller.track` (or ``atrack``) to get a future for their
+        detail and their items as they complete.
+        """
+        return BatchPoller(self.client_context)
+
     @with_sync_client
     def generate(
         self,
@@ -298,7 +183,7 @@ class Judges:
         project_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AJudgeGeneratorResponse:
+    ) -> JudgeGeneratorResponse:
         """
         Asynchronously generate a judge.
 
@@ -324,11 +209,11 @@ class Judges:
           Wrapper for the judge id and optionally an error code if the generation failed.
         """
         _visibility_map = {
-            "public": AJudgeGeneratorVisibilityEnum.PUBLIC,
-            "private": AJudgeGeneratorVisibilityEnum.PRIVATE,
+            "public": JudgeGeneratorVisibilityEnum.PUBLIC,
+            "private": JudgeGeneratorVisibilityEnum.PRIVATE,
         }
         api_instance = AJudgesApi(_client)
-        judge_request = AJudgeGeneratorRequest(
+        judge_request = JudgeGeneratorRequest(
             intent=intent,
             stage=stage,
             extra_contexts=extra_contexts,
@@ -367,6 +252,8 @@ class Judges:
           project_id: Optional project to attribute the judge to.
           _request_timeout: Optional timeout for the request
         """
+        from .judge import Judge
+
         api_instance = JudgesApi(_client)
         request = JudgeRequest(
             name=name,
@@ -386,7 +273,7 @@ class Judges:
         *,
         name: str,
         intent: str,
-        evaluator_references: Optional[List[AEvaluatorReferenceRequest]] = None,
+        evaluator_references: Optional[List[EvaluatorReferenceRequest]] = None,
         stage: Optional[str] = None,
         project_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
@@ -403,8 +290,10 @@ class Judges:
           project_id: Optional project to attribute the judge to.
           _request_timeout: Optional timeout for the request
         """
+        from .judge import AJudge
+
         api_instance = AJudgesApi(_client)
-        request = AJudgeRequest(
+        request = JudgeRequest(
             name=name,
             intent=intent,
             evaluator_references=evaluator_references,
@@ -424,6 +313,8 @@ class Judges:
         Args:
           judge_id: The judge to be fetched.
         """
+        from .judge import Judge
+
         api_instance = JudgesApi(_client)
         return Judge._wrap(
             api_instance.judges_retrieve(id=judge_id, _request_timeout=_request_timeout),
@@ -438,6 +329,8 @@ class Judges:
         Args:
           judge_id: The judge to be fetched.
         """
+        from .judge import AJudge
+
         api_instance = AJudgesApi(_client)
         return await AJudge._awrap(
             await api_instance.judges_retrieve(id=judge_id, _request_timeout=_request_timeout),
@@ -481,6 +374,8 @@ class Judges:
           limit: Number of entries to iterate through at most.
           project_id: Optional project filter. Public judges are excluded when set.
         """
+        from .judge import Judge
+
         api_instance = JudgesApi(_client)
         cursor: Optional[StrictStr] = None
         while limit > 0:
@@ -506,6 +401,8 @@ class Judges:
           limit: Number of entries to iterate through at most.
           project_id: Optional project filter. Public judges are excluded when set.
         """
+        from .judge import AJudge
+
         context = self.client_context()
         assert isinstance(context, AbstractAsyncContextManager), "This method is not available in synchronous mode"
         async with context as client:
@@ -514,7 +411,7 @@ class Judges:
 
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedJudgeListList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedJudgeListList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
 
@@ -548,6 +445,8 @@ class Judges:
           evaluator_references: New list of evaluator references
           project_id: Optional new project for the judge (move semantics).
         """
+        from .judge import Judge
+
         api_instance = JudgesApi(_client)
         request = PatchedJudgeRequest(
             name=name,
@@ -569,7 +468,7 @@ class Judges:
         judge_id: str,
         *,
         name: Optional[str] = None,
-        evaluator_references: Optional[List[AEvaluatorReferenceRequest]] = None,
+        evaluator_references: Optional[List[EvaluatorReferenceRequest]] = None,
         project_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
@@ -585,8 +484,10 @@ class Judges:
           evaluator_references: New list of evaluator references
           project_id: Optional new project for the judge (move semantics).
         """
+        from .judge import AJudge
+
         api_instance = AJudgesApi(_client)
-        request = APatchedJudgeRequest(
+        request = PatchedJudgeRequest(
             name=name,
             evaluator_references=evaluator_references,
             project_id=project_id,
@@ -615,6 +516,7 @@ class Judges:
         user_id: Optional[str] = None,
         session_id: Optional[str] = None,
         system_prompt: Optional[str] = None,
+        file_ids: Optional[List[uuid.UUID]] = None,
         project_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
         _client: ApiClient,
@@ -634,6 +536,8 @@ class Judges:
           user_id: Optional user identifier for tracking purposes.
           session_id: Optional session identifier for tracking purposes.
           system_prompt: Optional system prompt that was used for the LLM call.
+          file_ids: Optional list of file UUIDs (from Files.upload). PDFs are extracted to text
+            context; images are passed directly to the model.
           project_id: Optional project to attribute the execution log to.
           _request_timeout: Optional timeout for the request
         """
@@ -649,6 +553,7 @@ class Judges:
             user_id=user_id,
             session_id=session_id,
             system_prompt=system_prompt,
+            file_ids=[str(f) for f in file_ids] if file_ids else None,
             project_id=project_id,
         )
         return api_instance.judges_execute_create(
@@ -664,7 +569,7 @@ class Judges:
         *,
         response: Optional[str] = None,
         request: Optional[str] = None,
-        turns: Optional[List[AMessageTurnRequest]] = None,
+        turns: Optional[List[MessageTurnRequest]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         contexts: Optional[List[str]] = None,
         expected_output: Optional[str] = None,
@@ -672,10 +577,11 @@ class Judges:
         user_id: Optional[str] = None,
         session_id: Optional[str] = None,
         system_prompt: Optional[str] = None,
+        file_ids: Optional[List[uuid.UUID]] = None,
         project_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AJudgeExecutionResponse:
+    ) -> JudgeExecutionResponse:
         """
         Asynchronously run a judge directly by ID.
 
@@ -691,11 +597,13 @@ class Judges:
           user_id: Optional user identifier for tracking purposes.
           session_id: Optional session identifier for tracking purposes.
           system_prompt: Optional system prompt that was used for the LLM call.
+          file_ids: Optional list of file UUIDs (from Files.upload). PDFs are extracted to text
+            context; images are passed directly to the model.
           project_id: Optional project to attribute the execution log to.
           _request_timeout: Optional timeout for the request
         """
         api_instance = AJudgesApi(_client)
-        execution_request = AJudgeExecutionRequest(
+        execution_request = JudgeExecutionRequest(
             contexts=contexts,
             expected_output=expected_output,
             request=request,
@@ -706,6 +614,7 @@ class Judges:
             user_id=user_id,
             session_id=session_id,
             system_prompt=system_prompt,
+            file_ids=[str(f) for f in file_ids] if file_ids else None,
             project_id=project_id,
         )
         return await api_instance.judges_execute_create(
@@ -778,7 +687,7 @@ class Judges:
         *,
         response: Optional[str] = None,
         request: Optional[str] = None,
-        turns: Optional[List[AMessageTurnRequest]] = None,
+        turns: Optional[List[MessageTurnRequest]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         contexts: Optional[List[str]] = None,
         expected_output: Optional[str] = None,
@@ -789,7 +698,7 @@ class Judges:
         project_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AJudgeExecutionResponse:
+    ) -> JudgeExecutionResponse:
         """
         Asynchronously run a judge by name.
 
@@ -809,7 +718,7 @@ class Judges:
           _request_timeout: Optional timeout for the request
         """
         api_instance = AJudgesApi(_client)
-        execution_request = AJudgeExecutionRequest(
+        execution_request = JudgeExecutionRequest(
             contexts=contexts,
             expected_output=expected_output,
             request=request,
@@ -827,3 +736,191 @@ class Judges:
             judge_execution_request=execution_request,
             _request_timeout=_request_timeout,
         )
+
+    @with_sync_client
+    def run_batch(
+        self,
+        judge_id: str,
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        judge_version_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        project_id: Optional[str] = None,
+        poll_interval: float = 2.0,
+        dedup_window: int = DEFAULT_WINDOW,
+        _request_timeout: Optional[int] = None,
+        _client: ApiClient,
+    ) -> BatchResult[JudgeBatchExecutionItem]:
+        """
+        Run a judge on many inputs as batch executions, sending each distinct input only once.
+
+        Identical inputs (after canonicalization) among the most recent ``dedup_window``
+        distinct ones are submitted once, and the resulting item is returned for each of them.
+        Distinct inputs are submitted in batches of up to 100 and polled until every batch
+        has finished. Inputs left without an item by a failed or partial batch have a
+        ``RuntimeError`` in place of their item.
+
+        Args:
+          judge_id: ID of the judge to run
+          inputs: Fields of each input, e.g. ``{"request": ..., "response": ..., "contexts": [...]}``
+          judge_version_id: Optional judge version to run. If omitted, the latest version is used.
+          tags: Optional tags to add to the executions
+          project_id: Optional project to attribute the execution logs to.
+          poll_interval: Shortest delay between polls of an unfinished batch, in seconds. Batches are
+            polled by the shared :attr:`batch_poller`, less often while they make slow progress.
+          dedup_window: Number of distinct inputs remembered for deduplication.
+          _request_timeout: Optional timeout for each request
+        """
+        api_instance = JudgesApi(_client)
+        dedup: Deduplicator[int] = Deduplicator(dedup_window)
+        positions: List[int] = []
+        handles: List[Tuple[BatchHandle, int]] = []
+        items: Dict[int, Union[JudgeBatchExecutionItem, BaseException]] = {}
+        with _queued_inputs() as pending:
+            try:
+                for chunk in _batch_chunks(inputs, dedup, positions):
+                    batch_id = api_instance.judges_batch_execute_create(
+                        judge_id=judge_id,
+                        judge_batch_execution_request=JudgeBatchExecutionRequest(
+                            inputs=chunk, tags=tags, judge_version_id=judge_version_id, project_id=project_id
+                        ),
+                        _request_timeout=_request_timeout,
+                    ).batch_execution_id
+                    handle = self.batch_poller.track(
+                        batch_id, min_interval=poll_interval, _request_timeout=_request_timeout
+                    )
+                    handles.append((handle, len(chunk)))
+                    pending(len(chunk))
+                offset = 0
+                for handle, size in handles:
+                    _collect_batch_items(handle.result(), offset, size, items)
+                    pending(-size)
+                    offset += size
+            finally:
+                for handle, _ in handles:
+                    handle.cancel()
+        return BatchResult([items[position] for position in positions], dedup.report)
+
+    @with_async_client
+    async def arun_batch(
+        self,
+        judge_id: str,
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        judge_version_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        project_id: Optional[str] = None,
+        poll_interval: float = 2.0,
+        dedup_window: int = DEFAULT_WINDOW,
+        _request_timeout: Optional[int] = None,
+        _client: AApiClient,
+    ) -> BatchResult[JudgeBatchExecutionItem]:
+        """
+        Asynchronously run a judge on many inputs as batch executions, sending each distinct input only once.
+
+        Identical inputs (after canonicalization) among the most recent ``dedup_window``
+        distinct ones are submitted once, and the resulting item is returned for each of them.
+        Distinct inputs are submitted in batches of up to 100 and polled until every batch
+        has finished. Inputs left without an item by a failed or partial batch have a
+        ``RuntimeError`` in place of their item.
+
+        Args:
+          judge_id: ID of the judge to run
+          inputs: Fields of each input, e.g. ``{"request": ..., "response": ..., "contexts": [...]}``
+          judge_version_id: Optional judge version to run. If omitted, the latest version is used.
+          tags: Optional tags to add to the executions
+          project_id: Optional project to attribute the execution logs to.
+          poll_interval: Shortest delay between polls of an unfinished batch, in seconds. Batches are
+            polled by the shared :attr:`batch_poller`, less often while they make slow progress.
+          dedup_window: Number of distinct inputs remembered for deduplication.
+          _request_timeout: Optional timeout for each request
+        """
+        api_instance = AJudgesApi(_client)
+        dedup: Deduplicator[int] = Deduplicator(dedup_window)
+        positions: List[int] = []
+        handles: List[Tuple[AsyncBatchHandle, int]] = []
+        items: Dict[int, Union[JudgeBatchExecutionItem, BaseException]] = {}
+        with _queued_inputs() as pending:
+            try:
+                for chunk in _batch_chunks(inputs, dedup, positions):
+                    response = await api_instance.judges_batch_execute_create(
+                        judge_id=judge_id,
+                        judge_batch_execution_request=JudgeBatchExecutionRequest(
+                            inputs=chunk, tags=tags, judge_version_id=judge_version_id, project_id=project_id
+                        ),
+                        _request_timeout=_request_timeout,
+                    )
+                    handle = await self.batch_poller.atrack(
+                        response.batch_execution_id, min_interval=poll_interval, _request_timeout=_request_timeout
+                    )
+                    handles.append((handle, len(chunk)))
+                    pending(len(chunk))
+                offset = 0
+                for handle, size in handles:
+                    _collect_batch_items(await handle, offset, size, items)
+                    pending(-size)
+                    offset += size
+            finally:
+                for handle, _ in handles:
+                    handle.cancel()
+        return BatchResult([items[position] for position in positions], dedup.report)
+
+
+def _collect_batch_items(
+    detail: JudgeBatchExecutionDetail,
+    offset: int,
+    size: int,
+    items: Dict[int, Union[JudgeBatchExecutionItem, BaseException]],
+) -> None:
+    # A failed or partial batch may finish without the items of some inputs, which get an error instead.
+    returned = {item.index: item for item in detail.items}
+    for index in range(size):
+        item = returned.get(index)
+        items[offset + index] = (
+            item
+            if item is not None
+            else RuntimeError(
+                f"Batch execution {detail.batch_execution_id} finished {detail.status.value} "
+                f"without a result for input {index}"
+            )
+        )
+
+
+@contextmanager
+def _queued_inputs() -> Iterator[Callable[[int], None]]:
+    # Counts the inputs of submitted batches in the queue depth until their batch has finished:
+    # pending(n) adds n inputs, pending(-n) takes them off.
+    remaining = 0
+
+    def pending(count: int) -> None:
+        nonlocal remaining
+        remaining += count
+        QUEUE_DEPTH.inc("judges.run_batch", amount=count)
+
+    try:
+        yield pending
+    finally:
+        QUEUE_DEPTH.dec("judges.run_batch", amount=remaining)
+
+
+def _batch_chunks(
+    inputs: Iterable[Dict[str, Any]], dedup: Deduplicator[int], positions: List[int]
+) -> Iterator[List[JudgeBatchExecutionInputRequest]]:
+    # Distinct inputs in batches of up to MAX_BATCH_INPUTS, read from the stream one batch at a
+    # time. The position of its distinct twin among all distinct inputs is appended to positions
+    # for every input.
+    sent = 0
+    chunk: List[JudgeBatchExecutionInputRequest] = []
+
+    def start(arguments: Dict[str, Any]) -> int:
+        chunk.append(JudgeBatchExecutionInputRequest(**arguments))
+        return sent + len(chunk) - 1
+
+    for arguments in inputs:
+        positions.append(dedup.submit(arguments, partial(start, arguments)))
+        if len(chunk) == MAX_BATCH_INPUTS:
+            yield chunk
+            sent += len(chunk)
+            chunk = []
+    if chunk:
+        yield chunk
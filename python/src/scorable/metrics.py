@@ -0,0 +1,377 @@
+"""Prometheus-style metrics of client health.
+
+The SDK records into :data:`REGISTRY`: lookups of the upload cache and of
+batch deduplication, and the depth of the queues of batch evaluations. With
+``Scorable(metrics=True)`` (or a :class:`MetricsHook` among the request hooks)
+every API call is also counted by operation and status, with latency buckets,
+retries, bytes sent and received, calls in flight and time spent waiting for a
+pooled connection.
+
+Metrics are exported with :func:`render_prometheus` (the Prometheus text
+format, e.g. for an HTTP endpoint or a node exporter text file) or pushed with
+a :class:`StatsdExporter`; any object with an ``export(registry)`` method can
+serve as exporter.
+
+Updates never take a lock: each thread increments its own shard of a metric,
+and the shards are only summed when the metrics are collected.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import concurrent.futures
+import math
+import socket
+import threading
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Protocol, Sequence, Tuple, TypeVar, Union
+
+from .instrumentation import RequestTiming
+
+Labels = Tuple[str, ...]
+F = TypeVar("F", bound=Union[concurrent.futures.Future, asyncio.Future])
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Sample(NamedTuple):
+    name: str
+    labels: Dict[str, str]
+    value: float
+
+
+class MetricFamily(NamedTuple):
+    name: str
+    type: str
+    help: str
+    samples: List[Sample]
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[Tuple[threading.Thread, Dict[Labels, Any]]] = []
+        # Shards of threads that have exited, folded together.
+        self._retired: Dict[Labels, Any] = {}
+
+    def _shard(self) -> Dict[Labels, Any]:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: Dict[Labels, Any] = {}
+            self._local.shard = shard
+            with self._lock:
+                self._shards.append((threading.current_thread(), shard))
+            return shard
+
+    def _check(self, labels: Labels) -> None:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} takes the labels {self.labelnames}, got {labels}")
+
+    def _merge(self, total: Dict[Labels, Any], shard: Dict[Labels, Any]) -> None:
+        for labels, value in shard.items():
+            total[labels] = total.get(labels, 0.0) + value
+
+    def _values(self) -> Dict[Labels, Any]:
+        total: Dict[Labels, Any] = {}
+        with self._lock:
+            alive = []
+            for thread, shard in self._shards:
+                # dict.copy() does not release the GIL, so it sees a consistent shard.
+                if thread.is_alive():
+                    alive.append((thread, shard))
+                    self._merge(total, shard.copy())
+                else:
+                    self._merge(self._retired, shard.copy())
+            self._shards = alive
+            self._merge(total, self._retired)
+        return total
+
+    def _labels(self, values: Labels) -> Dict[str, str]:
+        return dict(zip(self.labelnames, values, strict=True))
+
+    def collect(self) -> MetricFamily:
+        samples = [Sample(self.name, self._labels(labels), value) for labels, value in self._values().items()]
+        return MetricFamily(self.name, self.type, self.help, samples)
+
+
+class Counter(_Metric):
+    """A monotonically increasing count, per combination of label values."""
+
+    type = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        shard = self._shard()
+        try:
+            shard[labels] += amount
+        except KeyError:
+            self._check(labels)
+            shard[labels] = amount
+
+
+class Gauge(Counter):
+    """A value that goes up and down, such as the number of calls in flight."""
+
+    type = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """Observations counted in cumulative buckets, with their sum and count."""
+
+    type = "histogram"
+
+    def __init__(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        shard = self._shard()
+        counts = shard.get(labels)
+        if counts is None:
+            self._check(labels)
+            # One count per bucket and one for +Inf, then the sum.
+            counts = shard[labels] = [0.0] * (len(self.buckets) + 2)
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def _merge(self, total: Dict[Labels, Any], shard: Dict[Labels, Any]) -> None:
+        for labels, counts in shard.items():
+            merged = total.setdefault(labels, [0.0] * len(counts))
+            for i, count in enumerate(list(counts)):
+                merged[i] += count
+
+    def collect(self) -> MetricFamily:
+        samples = []
+        for labels, counts in self._values().items():
+            names = self._labels(labels)
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=False):
+                cumulative += count
+                samples.append(Sample(f"{self.name}_bucket", {**names, "le": _format(bound)}, cumulative))
+            samples.append(Sample(f"{self.name}_sum", names, counts[-1]))
+            samples.append(Sample(f"{self.name}_count", names, cumulative))
+        return MetricFamily(self.name, self.type, self.help, samples)
+
+
+class MetricsRegistry:
+    """A set of metrics collected and exported together.
+
+    The factory methods return the existing metric of a name, so independent
+    components can share one.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls: type, name: str, *args: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args)
+            elif type(metric) is not cls:
+                raise ValueError(f"{name} is already registered as a {metric.type}")
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get(Gauge, name, help, labelnames)
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._get(Histogram, name, help, labelnames, buckets)
+
+    def collect(self) -> List[MetricFamily]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return [metric.collect() for metric in metrics]
+
+
+#: The registry the SDK records into.
+REGISTRY = MetricsRegistry()
+
+CACHE_LOOKUPS = REGISTRY.counter(
+    "scorable_cache_lookups_total",
+    "Lookups of the upload cache, of batch deduplication and of compared scores",
+    ("cache", "result"),
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    "scorable_evaluation_queue_depth", "Inputs of batch evaluations submitted and not yet finished", ("entry_point",)
+)
+
+
+def queued(future: F, entry_point: str) -> F:
+    """Count a submitted future in :data:`QUEUE_DEPTH` until it is done."""
+    QUEUE_DEPTH.inc(entry_point)
+    future.add_done_callback(lambda _: QUEUE_DEPTH.dec(entry_point))
+    return future
+
+
+class MetricsHook:
+    """Request hook that records every API call in a registry.
+
+    Args:
+      registry: Where the metrics are kept.
+    """
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY):
+        self.registry = registry
+        self._requests = registry.counter(
+            "scorable_requests_total", "API calls by operation and HTTP status", ("operation", "status")
+        )
+        self._duration = registry.histogram(
+            "scorable_request_duration_seconds", "Duration of API calls", ("operation",)
+        )
+        self._retries = registry.counter("scorable_request_retries_total", "Retried API requests", ("operation",))
+        self._bytes = registry.counter(
+            "scorable_request_bytes_total", "Bytes of request and response bodies", ("operation", "direction")
+        )
+        self._in_flight = registry.gauge("scorable_requests_in_flight", "API calls in flight", ("operation",))
+        self._pool_wait = registry.histogram(
+            "scorable_pool_wait_seconds", "Time spent waiting for a pooled connection", ()
+        )
+
+    def __reduce__(self) -> Any:
+        if self.registry is not REGISTRY:
+            raise TypeError("A MetricsHook with a custom registry cannot be pickled")
+        return (MetricsHook, ())
+
+    def start(self, timing: RequestTiming, headers: Dict[str, Any]) -> None:
+        self._in_flight.inc(timing.operation_id or timing.resource_path)
+
+    def __call__(self, timing: RequestTiming) -> None:
+        operation = timing.operation_id or timing.resource_path
+        self._in_flight.dec(operation)
+        self._requests.inc(operation, "error" if timing.status is None else str(timing.status))
+        if timing.total is not None:
+            self._duration.observe(timing.total, operation)
+        if timing.retries:
+            self._retries.inc(operation, amount=timing.retries)
+        if timing.request_bytes:
+            self._bytes.inc(operation, "out", amount=timing.request_bytes)
+        if timing.response_bytes:
+            self._bytes.inc(operation, "in", amount=timing.response_bytes)
+        if timing.queue is not None:
+            self._pool_wait.observe(timing.queue)
+
+
+def _format(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_prometheus(registry: MetricsRegistry = REGISTRY) -> str:
+    """The metrics of a registry in the Prometheus text exposition format."""
+    lines = []
+    for family in registry.collect():
+        lines.append(f"# HELP {family.name} {_escape(family.help)}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        for sample in family.samples:
+            labels = ",".join(f'{name}="{_escape(value)}"' for name, value in sample.labels.items())
+            lines.append(
+                f"{sample.name}{{{labels}}} {_format(sample.value)}"
+                if labels
+                else f"{sample.name} {_format(sample.value)}"
+            )
+    return "\n".join(lines) + "\n"
+
+
+class Exporter(Protocol):
+    def export(self, registry: MetricsRegistry) -> None: ...
+
+
+class StatsdExporter:
+    """Pushes metrics to a statsd daemon over UDP.
+
+    Counters are sent as the increase since the previous export, gauges as their value and
+    histograms as the increase of their count and sum. Label values become dot-separated
+    name components, or DogStatsD tags with ``tags=True``.
+
+    Args:
+      host: Host of the statsd daemon.
+      port: Its UDP port.
+      prefix: Prefix of all metric names.
+      tags: Send labels as DogStatsD tags.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 8125, *, prefix: str = "", tags: bool = False):
+        self.address = (host, port)
+        self.prefix = prefix
+        self.tags = tags
+        self._previous: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        self._socket: Optional[socket.socket] = None
+
+    def _name(self, name: str, labels: Dict[str, str]) -> str:
+        parts = [self.prefix, name] if self.prefix else [name]
+        if not self.tags:
+            parts += [value.replace(".", "_").replace(":", "_") for value in labels.values()]
+        name = ".".join(parts)
+        if self.tags and labels:
+            name_tags = ",".join(f"{key}:{value}" for key, value in labels.items())
+            return f"{name}|#{name_tags}"
+        return name
+
+    def lines(self, registry: MetricsRegistry) -> List[str]:
+        """The statsd lines for the changes since the previous call."""
+        lines = []
+        for family in registry.collect():
+            for sample in family.samples:
+                if sample.name.endswith("_bucket"):
+                    continue
+                if family.type == "gauge":
+                    lines.append(self._line(sample.name, sample.labels, sample.value, "g"))
+                    continue
+                key = (sample.name, tuple(sample.labels.items()))
+                delta = sample.value - self._previous.get(key, 0.0)
+                self._previous[key] = sample.value
+                if delta:
+                    lines.append(self._line(sample.name, sample.labels, delta, "c"))
+        return lines
+
+    def _line(self, name: str, labels: Dict[str, str], value: float, kind: str) -> str:
+        metric = self._name(name, labels)
+        metric, _, tags = metric.partition("|")
+        return f"{metric}:{_format(value)}|{kind}" + (f"|{tags}" if tags else "")
+
+    def export(self, registry: MetricsRegistry = REGISTRY) -> None:
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        for packet in _packets(self.lines(registry)):
+            self._socket.sendto(packet, self.address)
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+def _packets(lines: Iterable[str], size: int = 1432) -> Iterable[bytes]:
+    # Lines joined into datagrams that fit a typical MTU.
+    packet = b""
+    for line in lines:
+        data = line.encode()
+        if packet and len(packet) + 1 + len(data) > size:
+            yield packet
+            packet = b""
+        packet = packet + b"\n" + data if packet else data
+    if packet:
+        yield packet
@@ -2,32 +2,25 @@ from __future__ import annotations
 
 from contextlib import AbstractAsyncContextManager
 from functools import partial
-from typing import AsyncIterator, Iterator, Optional, cast
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Optional, cast
 
 from pydantic import StrictStr
 
-from .generated.openapi_aclient import ApiClient as AApiClient
-from .generated.openapi_aclient.api.objectives_api import ObjectivesApi as AObjectivesApi
-from .generated.openapi_aclient.models.objective import Objective as AOpenApiObjective
-from .generated.openapi_aclient.models.objective_list import ObjectiveList as AObjectiveList
-from .generated.openapi_aclient.models.objective_request import ObjectiveRequest as AObjectiveRequest
-from .generated.openapi_aclient.models.paginated_objective_list import (
-    PaginatedObjectiveList as APaginatedObjectiveList,
-)
-from .generated.openapi_aclient.models.paginated_objective_list_list import (
-    PaginatedObjectiveListList as APaginatedObjectiveListList,
-)
-from .generated.openapi_aclient.models.patched_objective_request import (
-    PatchedObjectiveRequest as APatchedObjectiveRequest,
-)
 from .generated.openapi_client import ApiClient
 from .generated.openapi_client.api.objectives_api import ObjectivesApi as ObjectivesApi
 from .generated.openapi_client.models.objective import Objective as OpenApiObjective
 from .generated.openapi_client.models.objective_list import ObjectiveList
 from .generated.openapi_client.models.objective_request import ObjectiveRequest
 from .generated.openapi_client.models.paginated_objective_list import PaginatedObjectiveList
+from .generated.openapi_client.models.paginated_objective_list_list import PaginatedObjectiveListList
 from .generated.openapi_client.models.patched_objective_request import PatchedObjectiveRequest
-from .utils import ClientContextCallable, iterate_cursor_list, with_async_client, with_sync_client
+from .utils import ClientContextCallable, LazyImport, iterate_cursor_list, with_async_client, with_sync_client
+
+if TYPE_CHECKING:
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.objectives_api import ObjectivesApi as AObjectivesApi
+else:
+    AObjectivesApi = LazyImport("scorable.generated.openapi_aclient.api.objectives_api", "ObjectivesApi")
 
 
 class Versions:
@@ -50,7 +43,7 @@ class Versions:
         api_instance = ObjectivesApi(_client)
         return api_instance.objectives_versions_list(id=objective_id)
 
-    async def alist(self, objective_id: str) -> APaginatedObjectiveList:
+    async def alist(self, objective_id: str) -> PaginatedObjectiveList:
         """Asynchronously list all versions of an objective.
 
         Args:
@@ -83,7 +76,7 @@ class Objective(OpenApiObjective):
         return obj
 
 
-class AObjective(AOpenApiObjective):
+class AObjective(OpenApiObjective):
     """
     Wrapper for a single Objective.
 
@@ -94,8 +87,8 @@ class AObjective(AOpenApiObjective):
     client_context: ClientContextCallable
 
     @classmethod
-    async def _awrap(cls, apiobj: AOpenApiObjective, client_context: ClientContextCallable) -> "AObjective":
-        if not isinstance(apiobj, AOpenApiObjective):
+    async def _awrap(cls, apiobj: OpenApiObjective, client_context: ClientContextCallable) -> "AObjective":
+        if not isinstance(apiobj, OpenApiObjective):
             raise ValueError(f"Wrong instance in _wrap: {apiobj!r}")
         obj = cast(AObjective, apiobj)
         obj.__class__ = cls
@@ -164,7 +157,7 @@ class Objectives:
           project_id: Optional project to attribute the objective to.
         """
 
-        request = AObjectiveRequest(
+        request = ObjectiveRequest(
             intent=intent,
             test_dataset_id=test_dataset_id,
             project_id=project_id,
@@ -270,7 +263,7 @@ class Objectives:
         intent: Optional[str] = None,
         limit: int = 100,
         project_id: Optional[str] = None,
-    ) -> AsyncIterator[AObjectiveList]:
+    ) -> AsyncIterator[ObjectiveList]:
         """
         Asynchronously iterate through the objectives.
 
@@ -288,7 +281,7 @@ class Objectives:
 
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedObjectiveListList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedObjectiveListList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
 
@@ -357,7 +350,7 @@ class Objectives:
           intent: The intent of the objective.
         """
 
-        request = APatchedObjectiveRequest(
+        request = PatchedObjectiveRequest(
             intent=intent,
             test_dataset_id=test_dataset_id,
             project_id=project_id,
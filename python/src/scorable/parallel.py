@@ -0,0 +1,432 @@
+"""Evaluate large sources across worker processes.
+
+A single event loop spends most of its time (de)serializing pydantic models once
+requests are concurrent enough, so :class:`ParallelRunner` splits a source into
+shards of positions and evaluates each shard in a worker process, with its own
+asynchronous API client and concurrency limit. Results of every shard are
+written to a sink by the coordinating process.
+
+Several machines can work through the same source by sharing a lease table
+(:class:`SQLiteLeaseTable` or :class:`FileLeaseTable` on a shared filesystem):
+each runner claims pending shards and renews their leases while it works on
+them, and shards whose lease expires (e.g. because the machine died) are handed
+out again. A runner whose lease expired anyway drops the results of the shard,
+which the runner that took it over writes instead.
+
+Example::
+
+  from scorable import Scorable
+  from scorable.parallel import JsonlSink, ParallelRunner
+  from scorable.sources import JsonlSource
+
+  runner = ParallelRunner(Scorable(), evaluator_ids=[evaluator_id], workers=8, concurrency=32)
+  report = runner.run(JsonlSource("inputs.jsonl"), JsonlSink("results.jsonl"))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Protocol, Sequence
+
+from .client import Scorable
+from .sources import DatasetSource, JsonlSource, aevaluate_record
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+    Source = JsonlSource | DatasetSource
+
+__all__ = [
+    "FileLeaseTable",
+    "JsonlSink",
+    "ParallelReport",
+    "ParallelRunner",
+    "SQLiteLeaseTable",
+    "Shard",
+]
+
+
+@dataclass(frozen=True)
+class Shard:
+    """Positions ``[start, stop)`` of a source."""
+
+    index: int
+    start: int
+    stop: int
+
+
+@dataclass
+class ParallelReport:
+    """Summary of the shards processed by one :meth:`ParallelRunner.run` call."""
+
+    shards: int = 0
+    items: int = 0
+    results: int = 0
+    errors: int = 0
+    #: Shards taken over by another runner after their lease expired, whose results were dropped.
+    lost: int = 0
+
+
+def plan_shards(total: int, shard_size: int) -> List[Shard]:
+    return [
+        Shard(index, start, min(start + shard_size, total)) for index, start in enumerate(range(0, total, shard_size))
+    ]
+
+
+class Sink(Protocol):
+    def write(self, records: Sequence[Dict[str, Any]]) -> None: ...
+
+
+class JsonlSink:
+    """Append result records to a JSON Lines file.
+
+    Each shard is written with a single locked append, so several runners (on a shared
+    filesystem) can write to the same file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def write(self, records: Sequence[Dict[str, Any]]) -> None:
+        data = "".join(json.dumps(record) + "\n" for record in records)
+        with open(self.path, "a", encoding="utf-8") as f, _locked(f):
+            f.write(data)
+
+
+class LeaseTable(Protocol):
+    #: Seconds a lease lasts unless renewed; None if leases never expire.
+    lease_seconds: Optional[float]
+
+    def plan(self, shards: Sequence[Shard]) -> None: ...
+
+    def claim(self, owner: str) -> Optional[Shard]: ...
+
+    def renew(self, shard: Shard, owner: str) -> bool: ...
+
+    def complete(self, shard: Shard, owner: str) -> bool: ...
+
+    def release(self, shard: Shard, owner: str) -> None: ...
+
+
+class _LocalLeaseTable:
+    # Single-machine runs: every planned shard is handed out exactly once.
+
+    lease_seconds: Optional[float] = None
+
+    def __init__(self) -> None:
+        self._pending: List[Shard] = []
+
+    def plan(self, shards: Sequence[Shard]) -> None:
+        self._pending = list(reversed(shards))
+
+    def claim(self, owner: str) -> Optional[Shard]:
+        return self._pending.pop() if self._pending else None
+
+    def renew(self, shard: Shard, owner: str) -> bool:
+        return True
+
+    def complete(self, shard: Shard, owner: str) -> bool:
+        return True
+
+    def release(self, shard: Shard, owner: str) -> None:
+        pass
+
+
+class SQLiteLeaseTable:
+    """Shard leases in a SQLite database shared by all runners working on the same source.
+
+    Args:
+      path: Database file; created if it does not exist.
+      lease_seconds: How long a claimed shard stays reserved before another runner may take it over.
+    """
+
+    def __init__(self, path: str, *, lease_seconds: float = 3600.0):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        with self._transaction() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS shards ("
+                "idx INTEGER PRIMARY KEY, start INTEGER NOT NULL, stop INTEGER NOT NULL,"
+                "state TEXT NOT NULL DEFAULT 'pending', owner TEXT, expires_at REAL)"
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        db = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+        finally:
+            db.close()
+
+    def plan(self, shards: Sequence[Shard]) -> None:
+        with self._transaction() as db:
+            db.executemany(
+                "INSERT OR IGNORE INTO shards (idx, start, stop) VALUES (?, ?, ?)",
+                [(s.index, s.start, s.stop) for s in shards],
+            )
+
+    def claim(self, owner: str) -> Optional[Shard]:
+        now = time.time()
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT idx, start, stop FROM shards"
+                " WHERE state = 'pending' OR (state = 'leased' AND expires_at < ?) ORDER BY idx LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE shards SET state = 'leased', owner = ?, expires_at = ? WHERE idx = ?",
+                (owner, now + self.lease_seconds, row[0]),
+            )
+        return Shard(*row)
+
+    def renew(self, shard: Shard, owner: str) -> bool:
+        """Extend the lease of ``owner`` on a shard; False if it no longer holds it."""
+        with self._transaction() as db:
+            return (
+                db.execute(
+                    "UPDATE shards SET expires_at = ? WHERE idx = ? AND owner = ? AND state = 'leased'",
+                    (time.time() + self.lease_seconds, shard.index, owner),
+                ).rowcount
+                > 0
+            )
+
+    def complete(self, shard: Shard, owner: str) -> bool:
+        """Mark a shard of ``owner`` done; False if it no longer holds the lease."""
+        with self._transaction() as db:
+            return (
+                db.execute(
+                    "UPDATE shards SET state = 'done', expires_at = NULL"
+                    " WHERE idx = ? AND owner = ? AND state = 'leased'",
+                    (shard.index, owner),
+                ).rowcount
+                > 0
+            )
+
+    def release(self, shard: Shard, owner: str) -> None:
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE shards SET state = 'pending', owner = NULL, expires_at = NULL"
+                " WHERE idx = ? AND owner = ? AND state = 'leased'",
+                (shard.index, owner),
+            )
+
+
+class FileLeaseTable:
+    """Shard leases in a JSON file, for shared filesystems where SQLite locking is unreliable.
+
+    Every operation rewrites the file under an exclusive ``flock``; fine for the few
+    hundred shards a run typically has.
+
+    Args:
+      path: Lease file; created if it does not exist.
+      lease_seconds: How long a claimed shard stays reserved before another runner may take it over.
+    """
+
+    def __init__(self, path: str, *, lease_seconds: float = 3600.0):
+        self.path = path
+        self.lease_seconds = lease_seconds
+
+    @contextmanager
+    def _shards(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        with open(self.path, "a+", encoding="utf-8") as f, _locked(f):
+            f.seek(0)
+            content = f.read()
+            shards = json.loads(content) if content else {}
+            yield shards
+            f.seek(0)
+            f.truncate()
+            json.dump(shards, f)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def plan(self, shards: Sequence[Shard]) -> None:
+        with self._shards() as table:
+            for shard in shards:
+                table.setdefault(
+                    str(shard.index), {"start": shard.start, "stop": shard.stop, "state": "pending", "owner": None}
+                )
+
+    def claim(self, owner: str) -> Optional[Shard]:
+        now = time.time()
+        with self._shards() as table:
+            for index in sorted(table, key=int):
+                lease = table[index]
+                if lease["state"] == "pending" or (lease["state"] == "leased" and lease["expires_at"] < now):
+                    lease.update(state="leased", owner=owner, expires_at=now + self.lease_seconds)
+                    return Shard(int(index), lease["start"], lease["stop"])
+        return None
+
+    def renew(self, shard: Shard, owner: str) -> bool:
+        """Extend the lease of ``owner`` on a shard; False if it no longer holds it."""
+        with self._shards() as table:
+            lease = table[str(shard.index)]
+            if lease["owner"] != owner or lease["state"] != "leased":
+                return False
+            lease.update(expires_at=time.time() + self.lease_seconds)
+            return True
+
+    def complete(self, shard: Shard, owner: str) -> bool:
+        """Mark a shard of ``owner`` done; False if it no longer holds the lease."""
+        with self._shards() as table:
+            lease = table[str(shard.index)]
+            if lease["owner"] != owner or lease["state"] != "leased":
+                return False
+            lease.update(state="done", expires_at=None)
+            return True
+
+    def release(self, shard: Shard, owner: str) -> None:
+        with self._shards() as table:
+            lease = table[str(shard.index)]
+            if lease["owner"] == owner and lease["state"] == "leased":
+                lease.update(state="pending", owner=None, expires_at=None)
+
+
+@contextmanager
+def _locked(f: Any) -> Iterator[None]:
+    try:
+        import fcntl
+    except ImportError:  # Windows: no cross-process locking, single runner only.
+        yield
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+async def _aevaluate(
+    client: Scorable, evaluator_id: str, key: str, arguments: Dict[str, Any], semaphore: asyncio.Semaphore
+) -> Dict[str, Any]:
+    async with semaphore:
+        return await aevaluate_record(client, evaluator_id, key, arguments)
+
+
+async def _arun_shard(
+    client: Scorable, evaluator_ids: Sequence[str], source: Source, shard: Shard, concurrency: int
+) -> List[Dict[str, Any]]:
+    async with client._pooled_async_client() as aclient:
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = [
+            _aevaluate(aclient, evaluator_id, key, arguments, semaphore)
+            async for key, arguments in source.aread(aclient, shard.start, shard.stop)
+            for evaluator_id in evaluator_ids
+        ]
+        return list(await asyncio.gather(*tasks))
+
+
+def _run_shard(
+    client: Scorable, evaluator_ids: Sequence[str], source: Source, shard: Shard, concurrency: int
+) -> List[Dict[str, Any]]:
+    # Runs in a worker process.
+    return asyncio.run(_arun_shard(client, evaluator_ids, source, shard, concurrency))
+
+
+async def _acount(client: Scorable, source: Source, every: int) -> int:
+    # Records where every shard starts, so that the worker reading it resumes there.
+    async with client._pooled_async_client() as aclient:
+        return await source.acount(aclient, every)
+
+
+class ParallelRunner:
+    """Evaluate every input of a source with a set of evaluators, in worker processes.
+
+    Each result record has the input ``key``, the ``evaluator_id``, and either the ``score``,
+    ``justification`` and ``execution_log_id``, or the ``error`` of a failed evaluation.
+
+    Args:
+      client: Client whose configuration the workers use; it is pickled to each worker.
+      evaluator_ids: Evaluators to run on every input.
+      workers: Number of worker processes.
+      concurrency: Maximum number of concurrent requests in each worker.
+      shard_size: Number of inputs per shard.
+      mp_context: Optional multiprocessing context for the process pool.
+    """
+
+    def __init__(
+        self,
+        client: Scorable,
+        evaluator_ids: Sequence[str],
+        *,
+        workers: Optional[int] = None,
+        concurrency: int = 16,
+        shard_size: int = 1000,
+        mp_context: Optional[BaseContext] = None,
+    ):
+        if not evaluator_ids:
+            raise ValueError("At least one evaluator ID is required")
+        if shard_size < 1 or concurrency < 1:
+            raise ValueError("shard_size and concurrency must be positive")
+        self.client = client
+        self.evaluator_ids = list(evaluator_ids)
+        self.workers = workers or os.cpu_count() or 1
+        self.concurrency = concurrency
+        self.shard_size = shard_size
+        self.mp_context = mp_context
+
+    def run(self, source: Source, sink: Sink, *, leases: Optional[LeaseTable] = None) -> ParallelReport:
+        """Evaluate the source and write the result records of each shard to ``sink``.
+
+        Args:
+          source: A :class:`scorable.sources.JsonlSource` or :class:`scorable.sources.DatasetSource`.
+          sink: Receives the records of each finished shard, e.g. :class:`JsonlSink`.
+          leases: Shared lease table to coordinate several runners (possibly on different machines)
+            working on the same source; each shard is then processed by only one of them.
+        """
+        if leases is None:
+            leases = _LocalLeaseTable()
+        total = asyncio.run(_acount(self.client, source, self.shard_size))
+        leases.plan(plan_shards(total, self.shard_size))
+
+        owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        # Leases of running shards are renewed a few times per lease period.
+        heartbeat = None if leases.lease_seconds is None else leases.lease_seconds / 3
+        report = ParallelReport()
+        running: Dict[Future, Shard] = {}
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=self.mp_context) as pool:
+            try:
+                while True:
+                    while len(running) < self.workers and (shard := leases.claim(owner)) is not None:
+                        future = pool.submit(
+                            _run_shard, self.client, self.evaluator_ids, source, shard, self.concurrency
+                        )
+                        running[future] = shard
+                    if not running:
+                        return report
+                    done, _ = wait(running, timeout=heartbeat, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        shard = running.pop(future)
+                        records = future.result()
+                        # The renewed lease keeps the shard ours while its records are written.
+                        if not leases.renew(shard, owner):
+                            report.lost += 1
+                            continue
+                        sink.write(records)
+                        leases.complete(shard, owner)
+                        report.shards += 1
+                        report.items += len(records) // len(self.evaluator_ids)
+                        report.results += len(records)
+                        report.errors += sum(1 for record in records if record["error"] is not None)
+                    for shard in running.values():
+                        leases.renew(shard, owner)
+            finally:
+                for future, shard in running.items():
+                    future.cancel()
+                    leases.release(shard, owner)
@@ -0,0 +1,534 @@
+"""Shared polling of long-running server-side work.
+
+A batch submitted with ``judges_batch_execute_create`` runs on the server, and
+its :class:`JudgeBatchExecutionDetail` has to be polled until it finishes.
+:class:`BatchPoller` tracks any number of pending batches and polls each on its
+own schedule, from a single thread (or a single task per event loop for the
+asynchronous client), over one connection pool::
+
+  poller = client.judges.batch_poller
+  handles = [poller.track(batch_id) for batch_id in batch_ids]
+  for item in handles[0].items():  # as they complete
+      ...
+  details = [handle.result() for handle in handles]
+
+The delay before the next poll of a batch adapts to its progress: once items
+complete, the next poll is due at half the time the batch is estimated to still
+need, at its completion rate so far; while nothing completes, the delay doubles.
+Delays stay between ``min_interval`` and ``max_interval``, with ±10% jitter so
+that batches submitted together do not poll in lockstep. Finished batches are
+not polled again, and each item is delivered once, when it is first reported
+completed or failed.
+
+:func:`poll_until_done` and :func:`apoll_until_done` wait for other resources,
+such as calibration runs, on one schedule with exponential backoff and jitter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextlib
+import queue
+import random
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .utils import ClientContextCallable
+
+if TYPE_CHECKING:
+    from .generated.openapi_client.models.judge_batch_execution_detail import JudgeBatchExecutionDetail
+    from .generated.openapi_client.models.judge_batch_execution_item import JudgeBatchExecutionItem
+
+T = TypeVar("T")
+
+# Values of BatchExecutionStatus and JudgeBatchExecutionItemStatusEnum, which are str enums; kept
+# as strings so that importing the poller does not import the generated models.
+BATCH_DONE = frozenset({"completed", "failed", "partial"})
+_ITEM_DONE = frozenset({"completed", "failed"})
+
+
+class _Schedule:
+    # When to poll a batch next, from the progress it made.
+
+    def __init__(self, min_interval: float, max_interval: float):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.delay = min_interval
+        self.due = time.monotonic()
+        self.errors = 0
+        self._first_poll: Optional[float] = None
+        self._first_finished = 0
+        self._finished = 0
+
+    def progressed(self, now: float, finished: int, total: int, rng: random.Random) -> None:
+        if self._first_poll is None:
+            self._first_poll, self._first_finished = now, finished
+        if finished > self._finished and now > self._first_poll and finished > self._first_finished:
+            rate = (finished - self._first_finished) / (now - self._first_poll)
+            delay = (total - finished) / rate / 2
+        else:
+            delay = self.delay * 2
+        self._finished = finished
+        self._reschedule(now, delay, rng)
+
+    def backoff(self, now: float, rng: random.Random) -> None:
+        self._reschedule(now, self.delay * 2, rng)
+
+    def failed(self, now: float, rng: random.Random) -> None:
+        self.errors += 1
+        self.backoff(now, rng)
+
+    def _reschedule(self, now: float, delay: float, rng: random.Random) -> None:
+        self.delay = min(max(delay, self.min_interval), self.max_interval)
+        self.due = now + self.delay * rng.uniform(0.9, 1.1)
+
+
+class BatchHandle:
+    """A batch execution tracked by a :class:`BatchPoller` for synchronous code."""
+
+    def __init__(self, batch_id: str):
+        self.batch_id = batch_id
+        #: Resolves to the detail of the finished batch.
+        self.future: concurrent.futures.Future[JudgeBatchExecutionDetail] = concurrent.futures.Future()
+        self._items: queue.SimpleQueue[Optional[List[JudgeBatchExecutionItem]]] = queue.SimpleQueue()
+
+    def result(self, timeout: Optional[float] = None) -> JudgeBatchExecutionDetail:
+        """Wait for the batch to finish and return its detail."""
+        return self.future.result(timeout)
+
+    def items(self) -> Iterator[JudgeBatchExecutionItem]:
+        """Yield the items of the batch as they complete or fail, until it has finished.
+
+        Items are delivered once, to a single consumer.
+        """
+        while (items := self._items.get()) is not None:
+            yield from items
+        self.future.result()
+
+    def cancel(self) -> bool:
+        """Stop polling the batch; it keeps running on the server."""
+        if not self.future.cancel():
+            return False
+        self._items.put(None)
+        return True
+
+    def _deliver(self, items: List[JudgeBatchExecutionItem]) -> None:
+        self._items.put(items)
+
+    def _finish(self, detail: JudgeBatchExecutionDetail) -> None:
+        if self.future.set_running_or_notify_cancel():
+            self.future.set_result(detail)
+        self._items.put(None)
+
+    def _fail(self, error: BaseException) -> None:
+        if self.future.set_running_or_notify_cancel():
+            self.future.set_exception(error)
+        self._items.put(None)
+
+
+class AsyncBatchHandle:
+    """A batch execution tracked by a :class:`BatchPoller` for asynchronous code; awaiting it returns its detail."""
+
+    def __init__(self, batch_id: str):
+        self.batch_id = batch_id
+        self.future: asyncio.Future[JudgeBatchExecutionDetail] = asyncio.get_running_loop().create_future()
+        self._items: asyncio.Queue[Optional[List[JudgeBatchExecutionItem]]] = asyncio.Queue()
+
+    def __await__(self) -> Any:
+        return asyncio.shield(self.future).__await__()
+
+    async def items(self) -> AsyncIterator[JudgeBatchExecutionItem]:
+        """Yield the items of the batch as they complete or fail, until it has finished.
+
+        Items are delivered once, to a single consumer.
+        """
+        while (items := await self._items.get()) is not None:
+            for item in items:
+                yield item
+        await self
+
+    def cancel(self) -> bool:
+        """Stop polling the batch; it keeps running on the server."""
+        if not self.future.cancel():
+            return False
+        self._items.put_nowait(None)
+        return True
+
+    def _deliver(self, items: List[JudgeBatchExecutionItem]) -> None:
+        self._items.put_nowait(items)
+
+    def _finish(self, detail: JudgeBatchExecutionDetail) -> None:
+        if not self.future.done():
+            self.future.set_result(detail)
+        self._items.put_nowait(None)
+
+    def _fail(self, error: BaseException) -> None:
+        if not self.future.done():
+            self.future.set_exception(error)
+        self._items.put_nowait(None)
+
+
+_Handle = Union[BatchHandle, AsyncBatchHandle]
+
+
+class _Tracked:
+    def __init__(self, handle: _Handle, schedule: _Schedule, timeout: Optional[int]):
+        self.handle = handle
+        self.schedule = schedule
+        self.timeout = timeout
+        self.delivered: Set[int] = set()
+
+
+class _Loop:
+    # The tracked batches and polling task of one event loop.
+
+    def __init__(self) -> None:
+        self.batches: Dict[str, _Tracked] = {}
+        self.wake = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        #: Set once the task stopped taking new batches.
+        self.closing = False
+
+
+class BatchPoller:
+    """Polls the pending batch executions of a client.
+
+    Synchronous clients poll from one thread, which runs while batches are pending;
+    asynchronous clients from one task per event loop. A poll that fails is retried
+    with backoff; ``max_poll_errors`` consecutive failures fail the batch.
+
+    Note:
+        Accessed as ``client.judges.batch_poller`` rather than constructed directly.
+
+    Args:
+      client_context: Client context of the :class:`~scorable.judges.Judges` API.
+      max_concurrent_polls: Polls in flight at once.
+      max_poll_errors: Consecutive failed polls after which a batch fails.
+    """
+
+    def __init__(
+        self, client_context: ClientContextCallable, *, max_concurrent_polls: int = 8, max_poll_errors: int = 3
+    ):
+        self.client_context = client_context
+        self.max_concurrent_polls = max_concurrent_polls
+        self.max_poll_errors = max_poll_errors
+        self._rng = random.Random()  # noqa: S311 - jitter
+        self._condition = threading.Condition()
+        self._batches: Dict[str, _Tracked] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._loops: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Loop] = weakref.WeakKeyDictionary()
+
+    def track(
+        self,
+        batch_id: str,
+        *,
+        min_interval: float = 0.5,
+        max_interval: float = 30.0,
+        _request_timeout: Optional[int] = None,
+    ) -> BatchHandle:
+        """
+        Start polling a batch execution.
+
+        Args:
+          batch_id: ID of the batch execution
+          min_interval: Shortest delay between polls of the batch, in seconds.
+          max_interval: Longest delay between polls of the batch, in seconds.
+          _request_timeout: Optional timeout for each poll
+        """
+        handle = BatchHandle(batch_id)
+        with self._condition:
+            self._add(self._batches, _Tracked(handle, _Schedule(min_interval, max_interval), _request_timeout))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="scorable-batch-poller", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return handle
+
+    async def atrack(
+        self,
+        batch_id: str,
+        *,
+        min_interval: float = 0.5,
+        max_interval: float = 30.0,
+        _request_timeout: Optional[int] = None,
+    ) -> AsyncBatchHandle:
+        """
+        Start polling a batch execution.
+
+        Args:
+          batch_id: ID of the batch execution
+          min_interval: Shortest delay between polls of the batch, in seconds.
+          max_interval: Longest delay between polls of the batch, in seconds.
+          _request_timeout: Optional timeout for each poll
+        """
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None or state.closing:
+            state = self._loops[loop] = _Loop()
+            state.task = loop.create_task(self._arun(state))
+        handle = AsyncBatchHandle(batch_id)
+        self._add(state.batches, _Tracked(handle, _Schedule(min_interval, max_interval), _request_timeout))
+        state.wake.set()
+        return handle
+
+    @property
+    def pending(self) -> int:
+        """Number of batches being polled."""
+        with self._condition:
+            return len(self._batches) + sum(len(state.batches) for state in list(self._loops.values()))
+
+    def _add(self, batches: Dict[str, _Tracked], tracked: _Tracked) -> None:
+        batch_id = tracked.handle.batch_id
+        if batch_id in batches:
+            raise ValueError(f"Batch execution {batch_id} is already being polled")
+        batches[batch_id] = tracked
+
+    def _due(self, batches: Dict[str, _Tracked]) -> tuple:
+        # Batches due for a poll, and the seconds until the next one is otherwise.
+        for batch_id in [batch_id for batch_id, tracked in batches.items() if tracked.handle.future.cancelled()]:
+            del batches[batch_id]
+        now = time.monotonic()
+        due = [tracked for tracked in batches.values() if tracked.schedule.due <= now]
+        wait = min((tracked.schedule.due - now for tracked in batches.values()), default=None)
+        return due[: self.max_concurrent_polls], wait
+
+    def _settle(
+        self, batches: Dict[str, _Tracked], tracked: _Tracked, outcome: Union[JudgeBatchExecutionDetail, BaseException]
+    ) -> None:
+        now = time.monotonic()
+        handle, schedule = tracked.handle, tracked.schedule
+        if handle.future.cancelled():
+            batches.pop(handle.batch_id, None)
+            return
+        if isinstance(outcome, BaseException):
+            schedule.failed(now, self._rng)
+            if schedule.errors >= self.max_poll_errors:
+                batches.pop(handle.batch_id, None)
+                handle._fail(outcome)
+            return
+        schedule.errors = 0
+        new = [item for item in outcome.items if item.status in _ITEM_DONE and item.index not in tracked.delivered]
+        if new:
+            tracked.delivered.update(item.index for item in new)
+            handle._deliver(new)
+        if outcome.status in BATCH_DONE:
+            batches.pop(handle.batch_id, None)
+            handle._finish(outcome)
+        else:
+            finished = outcome.completed_count + outcome.failed_count
+            schedule.progressed(now, finished, outcome.total_count, self._rng)
+
+    @staticmethod
+    def _poll(api: Any, tracked: _Tracked) -> Union[JudgeBatchExecutionDetail, BaseException]:
+        try:
+            return api.judges_batch_executions_retrieve(id=tracked.handle.batch_id, _request_timeout=tracked.timeout)
+        except Exception as e:
+            return e
+
+    @staticmethod
+    async def _apoll(api: Any, tracked: _Tracked) -> Union[JudgeBatchExecutionDetail, BaseException]:
+        try:
+            return await api.judges_batch_executions_retrieve(
+                id=tracked.handle.batch_id, _request_timeout=tracked.timeout
+            )
+        except Exception as e:
+            return e
+
+    @staticmethod
+    def _fail_all(batches: Dict[str, _Tracked], error: BaseException) -> None:
+        # The client context could not be opened: fail what is pending, so that no caller waits forever.
+        for tracked in batches.values():
+            tracked.handle._fail(error)
+        batches.clear()
+
+    def _run(self) -> None:
+        from .generated.openapi_client.api.judges_api import JudgesApi
+
+        try:
+            with self.client_context() as client, ThreadPoolExecutor(self.max_concurrent_polls) as pool:  # type: ignore[union-attr]
+                api = JudgesApi(client)
+                while True:
+                    with self._condition:
+                        while not (due := self._due(self._batches))[0]:
+                            if due[1] is None:
+                                self._thread = None
+                                return
+                            self._condition.wait(due[1])
+                    outcomes = list(pool.map(partial(self._poll, api), due[0]))
+                    with self._condition:
+                        for tracked, outcome in zip(due[0], outcomes, strict=True):
+                            self._settle(self._batches, tracked, outcome)
+        except BaseException as e:
+            with self._condition:
+                self._thread = None
+                self._fail_all(self._batches, e)
+            if not isinstance(e, Exception):
+                raise
+
+    async def _arun(self, state: _Loop) -> None:
+        from .generated.openapi_aclient.api.judges_api import JudgesApi as AJudgesApi
+
+        try:
+            async with self.client_context() as client:  # type: ignore[union-attr]
+                api = AJudgesApi(client)
+                while (next_poll := self._due(state.batches))[1] is not None:
+                    due, wait = next_poll
+                    if due:
+                        outcomes = await asyncio.gather(*(self._apoll(api, tracked) for tracked in due))
+                        for tracked, outcome in zip(due, outcomes, strict=True):
+                            self._settle(state.batches, tracked, outcome)
+                        continue
+                    state.wake.clear()
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(state.wake.wait(), wait)
+                state.closing = True
+        except BaseException as e:
+            state.closing = True
+            self._fail_all(state.batches, e)
+            if not isinstance(e, Exception):
+                raise
+
+
+class _Waiting(Generic[T]):
+    # Schedules of the keys still pending, for poll_until_done and apoll_until_done.
+
+    def __init__(
+        self,
+        keys: Iterable[str],
+        done: Callable[[T], bool],
+        min_interval: float,
+        max_interval: float,
+        timeout: Optional[float],
+        max_concurrent_polls: int,
+        max_poll_errors: int,
+    ):
+        self.schedules = {key: _Schedule(min_interval, max_interval) for key in dict.fromkeys(keys)}
+        self.total = len(self.schedules)
+        self.done = done
+        self.timeout = timeout
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.max_concurrent_polls = max_concurrent_polls
+        self.max_poll_errors = max_poll_errors
+        self.rng = random.Random()  # noqa: S311 - jitter
+
+    def due(self) -> Tuple[List[str], float]:
+        # Keys to poll now, or else the seconds to sleep before polling again.
+        now = time.monotonic()
+        due = [key for key, schedule in self.schedules.items() if schedule.due <= now]
+        if due:
+            return due[: self.max_concurrent_polls], 0.0
+        self.check_deadline(now)
+        wake = min(schedule.due for schedule in self.schedules.values())
+        return [], min(wake, self.deadline if self.deadline is not None else wake) - now
+
+    def check_deadline(self, now: float) -> None:
+        if self.schedules and self.deadline is not None and now >= self.deadline:
+            keys = list(self.schedules)
+            pending = ", ".join(keys[:10]) + (", ..." if len(keys) > 10 else "")
+            raise TimeoutError(f"{len(keys)} of {self.total} still pending after {self.timeout} seconds: {pending}")
+
+    def settle(self, key: str, outcome: Union[T, Exception]) -> bool:
+        # Whether the outcome of a poll is final; raises once the polls of a key failed too often.
+        schedule = self.schedules[key]
+        if isinstance(outcome, Exception):
+            schedule.failed(time.monotonic(), self.rng)
+            if schedule.errors >= self.max_poll_errors:
+                raise outcome
+            return False
+        if self.done(outcome):
+            del self.schedules[key]
+            return True
+        schedule.errors = 0
+        schedule.backoff(time.monotonic(), self.rng)
+        return False
+
+
+def poll_until_done(
+    keys: Iterable[str],
+    fetch: Callable[[str], T],
+    done: Callable[[T], bool],
+    *,
+    min_interval: float = 0.5,
+    max_interval: float = 30.0,
+    timeout: Optional[float] = None,
+    max_concurrent_polls: int = 8,
+    max_poll_errors: int = 3,
+) -> Iterator[T]:
+    """Poll ``fetch(key)`` for all keys on one schedule and yield the results that are ``done``, as they are.
+
+    Each key is polled again after a delay that doubles from ``min_interval`` up to ``max_interval``,
+    with jitter. A key whose polls fail ``max_poll_errors`` times in a row raises the last error.
+
+    Raises:
+      TimeoutError: Keys are still pending ``timeout`` seconds after polling started.
+    """
+    waiting = _Waiting(keys, done, min_interval, max_interval, timeout, max_concurrent_polls, max_poll_errors)
+
+    def attempt(key: str) -> Union[T, Exception]:
+        try:
+            return fetch(key)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_concurrent_polls) as pool:
+        while waiting.schedules:
+            due, sleep = waiting.due()
+            if not due:
+                time.sleep(sleep)
+                continue
+            for key, outcome in zip(due, pool.map(attempt, due), strict=True):
+                if waiting.settle(key, outcome) and not isinstance(outcome, Exception):
+                    yield outcome
+            waiting.check_deadline(time.monotonic())
+
+
+async def apoll_until_done(
+    keys: Iterable[str],
+    fetch: Callable[[str], Awaitable[T]],
+    done: Callable[[T], bool],
+    *,
+    min_interval: float = 0.5,
+    max_interval: float = 30.0,
+    timeout: Optional[float] = None,
+    max_concurrent_polls: int = 8,
+    max_poll_errors: int = 3,
+) -> AsyncIterator[T]:
+    """Asynchronously poll ``fetch(key)`` for all keys on one schedule, like :func:`poll_until_done`."""
+    waiting = _Waiting(keys, done, min_interval, max_interval, timeout, max_concurrent_polls, max_poll_errors)
+
+    async def attempt(key: str) -> Union[T, Exception]:
+        try:
+            return await fetch(key)
+        except Exception as e:
+            return e
+
+    while waiting.schedules:
+        due, sleep = waiting.due()
+        if not due:
+            await asyncio.sleep(sleep)
+            continue
+        for key, outcome in zip(due, await asyncio.gather(*(attempt(key) for key in due)), strict=True):
+            if waiting.settle(key, outcome) and not isinstance(outcome, Exception):
+                yield outcome
+        waiting.check_deadline(time.monotonic())
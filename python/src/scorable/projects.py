@@ -2,28 +2,23 @@ from __future__ import annotations
 
 from contextlib import AbstractAsyncContextManager
 from functools import partial
-from typing import AsyncIterator, Iterator, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Optional
 
 from pydantic import StrictStr
 
-from .generated.openapi_aclient import ApiClient as AApiClient
-from .generated.openapi_aclient.api.projects_api import ProjectsApi as AProjectsApi
-from .generated.openapi_aclient.models.paginated_project_list import (
-    PaginatedProjectList as APaginatedProjectList,
-)
-from .generated.openapi_aclient.models.patched_project_request import (
-    PatchedProjectRequest as APatchedProjectRequest,
-)
-from .generated.openapi_aclient.models.project import Project as AProject
-from .generated.openapi_aclient.models.project_request import (
-    ProjectRequest as AProjectRequest,
-)
 from .generated.openapi_client import ApiClient
 from .generated.openapi_client.api.projects_api import ProjectsApi
+from .generated.openapi_client.models.paginated_project_list import PaginatedProjectList
 from .generated.openapi_client.models.patched_project_request import PatchedProjectRequest
 from .generated.openapi_client.models.project import Project
 from .generated.openapi_client.models.project_request import ProjectRequest
-from .utils import ClientContextCallable, with_async_client, with_sync_client
+from .utils import ClientContextCallable, LazyImport, with_async_client, with_sync_client
+
+if TYPE_CHECKING:
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.projects_api import ProjectsApi as AProjectsApi
+else:
+    AProjectsApi = LazyImport("scorable.generated.openapi_aclient.api.projects_api", "ProjectsApi")
 
 
 class Projects:
@@ -74,7 +69,7 @@ class Projects:
         *,
         limit: int = 100,
         _request_timeout: Optional[int] = None,
-    ) -> AsyncIterator[AProject]:
+    ) -> AsyncIterator[Project]:
         """
         Asynchronously iterate through all projects in your organization.
 
@@ -88,7 +83,7 @@ class Projects:
             partial_list = partial(api_instance.projects_list, _request_timeout=_request_timeout)
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedProjectList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedProjectList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
 
@@ -121,7 +116,7 @@ class Projects:
         *,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AProject:
+    ) -> Project:
         """
         Asynchronously retrieve a project by ID.
         """
@@ -160,12 +155,12 @@ class Projects:
         is_default: Optional[bool] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AProject:
+    ) -> Project:
         """
         Asynchronously create a new project.
         """
         api_instance = AProjectsApi(_client)
-        request = AProjectRequest(name=name, description=description, is_default=is_default)
+        request = ProjectRequest(name=name, description=description, is_default=is_default)
         return await api_instance.projects_create(project_request=request, _request_timeout=_request_timeout)
 
     @with_sync_client
@@ -204,12 +199,12 @@ class Projects:
         is_default: Optional[bool] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AProject:
+    ) -> Project:
         """
         Asynchronously update a project.
         """
         api_instance = AProjectsApi(_client)
-        request = APatchedProjectRequest(name=name, description=description, is_default=is_default)
+        request = PatchedProjectRequest(name=name, description=description, is_default=is_default)
         return await api_instance.projects_partial_update(
             id=project_id,
             patched_project_request=request,
@@ -2,28 +2,24 @@ from __future__ import annotations
 
 from contextlib import AbstractAsyncContextManager
 from functools import partial
-from typing import Any, AsyncIterator, Iterator, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, List, Optional
 
 from pydantic import StrictStr
 
-from .generated.openapi_aclient import ApiClient as AApiClient
-from .generated.openapi_aclient.api.score_configs_api import ScoreConfigsApi as AScoreConfigsApi
-from .generated.openapi_aclient.models.paginated_score_config_list import (
-    PaginatedScoreConfigList as APaginatedScoreConfigList,
-)
-from .generated.openapi_aclient.models.patched_score_config_request import (
-    PatchedScoreConfigRequest as APatchedScoreConfigRequest,
-)
-from .generated.openapi_aclient.models.score_config import ScoreConfig as AScoreConfig
-from .generated.openapi_aclient.models.score_config_request import ScoreConfigRequest as AScoreConfigRequest
-from .generated.openapi_aclient.models.score_config_type_enum import ScoreConfigTypeEnum as AScoreConfigTypeEnum
 from .generated.openapi_client import ApiClient
 from .generated.openapi_client.api.score_configs_api import ScoreConfigsApi
+from .generated.openapi_client.models.paginated_score_config_list import PaginatedScoreConfigList
 from .generated.openapi_client.models.patched_score_config_request import PatchedScoreConfigRequest
 from .generated.openapi_client.models.score_config import ScoreConfig
 from .generated.openapi_client.models.score_config_request import ScoreConfigRequest
 from .generated.openapi_client.models.score_config_type_enum import ScoreConfigTypeEnum
-from .utils import ClientContextCallable, iterate_cursor_list, with_async_client, with_sync_client
+from .utils import ClientContextCallable, LazyImport, iterate_cursor_list, with_async_client, with_sync_client
+
+if TYPE_CHECKING:
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.score_configs_api import ScoreConfigsApi as AScoreConfigsApi
+else:
+    AScoreConfigsApi = LazyImport("scorable.generated.openapi_aclient.api.score_configs_api", "ScoreConfigsApi")
 
 
 class ScoreConfigs:
@@ -85,12 +81,12 @@ class ScoreConfigs:
         max_value: Optional[float] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AScoreConfig:
+    ) -> ScoreConfig:
         """Asynchronously create a score config."""
 
-        request = AScoreConfigRequest(
+        request = ScoreConfigRequest(
             name=name,
-            type=AScoreConfigTypeEnum(type),
+            type=ScoreConfigTypeEnum(type),
             categories=categories or [],
             min_value=min_value,
             max_value=max_value,
@@ -108,7 +104,7 @@ class ScoreConfigs:
     @with_async_client
     async def aget(
         self, score_config_id: str, *, _request_timeout: Optional[int] = None, _client: AApiClient
-    ) -> AScoreConfig:
+    ) -> ScoreConfig:
         """Asynchronously get a score config by ID."""
 
         api_instance = AScoreConfigsApi(_client)
@@ -121,7 +117,7 @@ class ScoreConfigs:
         api_instance = ScoreConfigsApi(_client)
         yield from iterate_cursor_list(partial(api_instance.score_configs_list), limit=limit)
 
-    async def alist(self, *, limit: int = 100) -> AsyncIterator[AScoreConfig]:
+    async def alist(self, *, limit: int = 100) -> AsyncIterator[ScoreConfig]:
         """Asynchronously iterate through the score configs."""
 
         context = self.client_context()
@@ -131,7 +127,7 @@ class ScoreConfigs:
             partial_list = partial(api_instance.score_configs_list)
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedScoreConfigList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedScoreConfigList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
                 used_results = result.results[:limit]
@@ -180,12 +176,12 @@ class ScoreConfigs:
         max_value: Optional[float] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AScoreConfig:
+    ) -> ScoreConfig:
         """Asynchronously update a score config."""
 
-        request = APatchedScoreConfigRequest(
+        request = PatchedScoreConfigRequest(
             name=name,
-            type=AScoreConfigTypeEnum(type) if type is not None else None,
+            type=ScoreConfigTypeEnum(type) if type is not None else None,
             categories=categories,
             min_value=min_value,
             max_value=max_value,
@@ -0,0 +1,162 @@
+"""Calibration that stops as soon as the agreement estimate is precise enough.
+
+:meth:`~scorable.skills.Evaluators.calibrate_sequential` runs a calibration
+set slice by slice, in a random order of ``dataset_range`` slices, and keeps a
+running estimate of the agreement between the evaluator scores and the
+expected scores. It stops once the confidence interval of that estimate is
+narrower than a target width, so that the evaluators a comparison rules out
+early are not run on the whole dataset.
+
+Stopping when the interval first gets narrow enough makes its coverage
+slightly optimistic; ``min_rows`` keeps the smallest samples from stopping the
+run.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import TYPE_CHECKING, Iterator, List, Literal, Optional, Tuple
+
+from .utils import LazyImport
+
+if TYPE_CHECKING:
+    from .generated.openapi_client.models.evaluator_calibration_output import EvaluatorCalibrationOutput
+    from .generated.openapi_client.models.skill_test_data_request_dataset_range import SkillTestDataRequestDatasetRange
+else:
+    SkillTestDataRequestDatasetRange = LazyImport(
+        "scorable.generated.openapi_client.models.skill_test_data_request_dataset_range",
+        "SkillTestDataRequestDatasetRange",
+    )
+
+Metric = Literal["mae", "pearson"]
+
+
+@dataclass(frozen=True)
+class AgreementEstimate:
+    """An agreement metric over the first ``n`` rows and its confidence interval."""
+
+    metric: Metric
+    n: int
+    value: float
+    low: float
+    high: float
+
+    @property
+    def width(self) -> float:
+        return self.high - self.low
+
+
+class RunningAgreement:
+    """Streaming estimate of the agreement of scores with expected scores.
+
+    ``mae`` is the mean absolute error, with a normal interval; ``pearson`` the correlation, with a
+    Fisher z interval.
+    """
+
+    def __init__(self, metric: Metric = "mae", confidence: float = 0.95):
+        if metric not in ("mae", "pearson"):
+            raise ValueError(f"Unknown metric {metric!r}; choose from 'mae' and 'pearson'")
+        self.metric: Metric = metric
+        self.z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self.n = 0
+        # Running means and (co)moments, updated as in Welford's algorithm.
+        self._mean_error = self._m2_error = 0.0
+        self._mean_x = self._mean_y = self._m2_x = self._m2_y = self._co_xy = 0.0
+
+    def add(self, score: float, expected: float) -> None:
+        self.n += 1
+        error = abs(score - expected)
+        delta = error - self._mean_error
+        self._mean_error += delta / self.n
+        self._m2_error += delta * (error - self._mean_error)
+        dx = score - self._mean_x
+        self._mean_x += dx / self.n
+        dy = expected - self._mean_y
+        self._mean_y += dy / self.n
+        self._m2_x += dx * (score - self._mean_x)
+        self._m2_y += dy * (expected - self._mean_y)
+        self._co_xy += dx * (expected - self._mean_y)
+
+    def estimate(self) -> AgreementEstimate:
+        if self.metric == "mae":
+            value = self._mean_error
+            half = self.z * math.sqrt(self._m2_error / (self.n - 1) / self.n) if self.n > 1 else math.inf
+            return AgreementEstimate(self.metric, self.n, value, value - half, value + half)
+        spread = math.sqrt(self._m2_x * self._m2_y)
+        value = self._co_xy / spread if spread else math.nan
+        if self.n < 4 or math.isnan(value):
+            return AgreementEstimate(self.metric, self.n, value, -1.0, 1.0)
+        # Clamped so that a perfect correlation keeps a finite transform.
+        center = math.atanh(max(-1 + 1e-12, min(1 - 1e-12, value)))
+        half = self.z / math.sqrt(self.n - 3)
+        return AgreementEstimate(self.metric, self.n, value, math.tanh(center - half), math.tanh(center + half))
+
+
+@dataclass
+class SequentialCalibration:
+    """The rows evaluated by a sequential calibration and its final agreement estimate."""
+
+    outputs: List[EvaluatorCalibrationOutput]
+    estimate: AgreementEstimate
+    #: Rows of the calibration set; fewer were evaluated if ``stopped_early``.
+    dataset_size: int
+    stopped_early: bool
+    #: The estimate after each slice.
+    history: List[AgreementEstimate] = field(default_factory=list)
+
+
+class _Driver:
+    # Hands out the slices to evaluate and folds their outputs into the estimate until it is precise enough.
+
+    def __init__(
+        self,
+        dataset_size: int,
+        *,
+        metric: Metric,
+        confidence: float,
+        target_width: float,
+        slice_size: int,
+        min_rows: int,
+        seed: Optional[int],
+    ):
+        if slice_size < 1:
+            raise ValueError("slice_size must be at least 1")
+        self.dataset_size = dataset_size
+        self.target_width = target_width
+        self.min_rows = min_rows
+        self.running = RunningAgreement(metric, confidence)
+        self.outputs: List[EvaluatorCalibrationOutput] = []
+        self.history: List[AgreementEstimate] = []
+        starts = list(range(0, dataset_size, slice_size))
+        random.Random(seed).shuffle(starts)  # noqa: S311
+        self._slices: List[Tuple[int, int]] = [(start, min(start + slice_size, dataset_size)) for start in starts]
+        self.stopped_early = False
+
+    def ranges(self) -> Iterator[SkillTestDataRequestDatasetRange]:
+        for index, (start, end) in enumerate(self._slices):
+            yield SkillTestDataRequestDatasetRange(start=start, end=end)
+            if self._precise_enough():
+                self.stopped_early = index < len(self._slices) - 1
+                return
+
+    def record(self, outputs: List[EvaluatorCalibrationOutput]) -> None:
+        self.outputs.extend(outputs)
+        for output in outputs:
+            if output.result.score is not None:
+                self.running.add(output.result.score, output.result.expected_score)
+        self.history.append(self.running.estimate())
+
+    def _precise_enough(self) -> bool:
+        return self.running.n >= self.min_rows and self.running.estimate().width <= self.target_width
+
+    def result(self) -> SequentialCalibration:
+        return SequentialCalibration(
+            outputs=sorted(self.outputs, key=lambda output: output.row_number),
+            estimate=self.running.estimate(),
+            dataset_size=self.dataset_size,
+            stopped_early=self.stopped_early,
+            history=self.history,
+        )
@@ -1,83 +1,114 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from enum import Enum
 from functools import partial
-from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from pydantic import BaseModel, StrictStr
 
-from scorable.generated.openapi_aclient.models.evaluator_request import EvaluatorRequest as AEvaluatorRequest
-from scorable.generated.openapi_aclient.models.paginated_evaluator_list import (
-    PaginatedEvaluatorList as APaginatedEvaluatorList,
-)
-from scorable.generated.openapi_aclient.models.paginated_evaluator_list_output_list import (
-    PaginatedEvaluatorListOutputList as APaginatedEvaluatorListOutputList,
-)
-from scorable.generated.openapi_client.models.evaluator_request import EvaluatorRequest
-from scorable.generated.openapi_client.models.paginated_evaluator_list import PaginatedEvaluatorList
-
-from .generated.openapi_aclient import ApiClient as AApiClient
-from .generated.openapi_aclient.api.calibration_runs_api import CalibrationRunsApi as ACalibrationRunsApi
-from .generated.openapi_aclient.api.evaluators_api import EvaluatorsApi as AEvaluatorsApi
-from .generated.openapi_aclient.api.objectives_api import ObjectivesApi as AObjectivesApi
-from .generated.openapi_aclient.models import (
-    EvaluatorExecutionRequest as AEvaluatorExecutionRequest,
-)
-from .generated.openapi_aclient.models import (
-    EvaluatorExecutionResult as AEvaluatorExecutionResult,
-)
-from .generated.openapi_aclient.models.calibration_run import CalibrationRun as ACalibrationRun
-from .generated.openapi_aclient.models.calibration_run_create_request import (
-    CalibrationRunCreateRequest as ACalibrationRunCreateRequest,
-)
-from .generated.openapi_aclient.models.calibration_run_source_request import (
-    CalibrationRunSourceRequest as ACalibrationRunSourceRequest,
-)
-from .generated.openapi_aclient.models.calibration_source_type_enum import (
-    CalibrationSourceTypeEnum as ACalibrationSourceTypeEnum,
-)
-from .generated.openapi_aclient.models.evaluator import Evaluator as AOpenAPIEvaluator
-from .generated.openapi_aclient.models.evaluator import Evaluator as GeneratedEvaluator
-from .generated.openapi_aclient.models.evaluator_calibration_output import (
-    EvaluatorCalibrationOutput as AEvaluatorCalibrationOutput,
-)
-from .generated.openapi_aclient.models.evaluator_list_output import EvaluatorListOutput as AEvaluatorListOutput
-from .generated.openapi_aclient.models.input_variable_request import InputVariableRequest as AInputVariableRequest
-from .generated.openapi_aclient.models.message_turn_request import (
-    MessageTurnRequest as AMessageTurnRequest,
+from .budget import BudgetScheduler, LatencyProfiles
+from .cascade import Band, Cascade
+from .dedup import DEFAULT_WINDOW, BatchResult, Deduplicator, TaskWindow, ThreadWindow
+from .metrics import queued
+from .sequential import Metric, SequentialCalibration, _Driver
+from .suite import EvaluatorSuite
+from .utils import (
+    ClientContextCallable,
+    LazyImport,
+    aiterate_cursor_list,
+    iterate_cursor_list,
+    with_async_client,
+    with_sync_client,
 )
-from .generated.openapi_aclient.models.objective_request import ObjectiveRequest as AObjectiveRequest
-from .generated.openapi_aclient.models.patched_evaluator_request import (
-    PatchedEvaluatorRequest as APatchedEvaluatorRequest,
-)
-from .generated.openapi_aclient.models.reference_variable_request import (
-    ReferenceVariableRequest as AReferenceVariableRequest,
-)
-from .generated.openapi_aclient.models.skill_test_input_request import (
-    SkillTestInputRequest as ASkillTestInputRequest,
-)
-from .generated.openapi_client import ApiClient as ApiClient
-from .generated.openapi_client.api.calibration_runs_api import CalibrationRunsApi
-from .generated.openapi_client.api.evaluators_api import EvaluatorsApi as EvaluatorsApi
-from .generated.openapi_client.api.objectives_api import ObjectivesApi as ObjectivesApi
-from .generated.openapi_client.models.calibration_run import CalibrationRun
-from .generated.openapi_client.models.calibration_run_create_request import CalibrationRunCreateRequest
-from .generated.openapi_client.models.calibration_run_source_request import CalibrationRunSourceRequest
-from .generated.openapi_client.models.calibration_source_type_enum import CalibrationSourceTypeEnum
-from .generated.openapi_client.models.evaluator import Evaluator as SyncGeneratedEvaluator
-from .generated.openapi_client.models.evaluator_calibration_output import EvaluatorCalibrationOutput
-from .generated.openapi_client.models.evaluator_execution_request import EvaluatorExecutionRequest
-from .generated.openapi_client.models.evaluator_execution_result import EvaluatorExecutionResult
-from .generated.openapi_client.models.evaluator_list_output import EvaluatorListOutput
-from .generated.openapi_client.models.input_variable_request import InputVariableRequest
-from .generated.openapi_client.models.message_turn_request import MessageTurnRequest
-from .generated.openapi_client.models.objective_request import ObjectiveRequest
-from .generated.openapi_client.models.patched_evaluator_request import PatchedEvaluatorRequest
-from .generated.openapi_client.models.reference_variable_request import ReferenceVariableRequest
-from .generated.openapi_client.models.skill_test_input_request import SkillTestInputRequest
-from .utils import ClientContextCallable, aiterate_cursor_list, iterate_cursor_list, with_async_client, with_sync_client
+
+if TYPE_CHECKING:
+    from .evaluator import AEvaluator, Evaluator
+    from .generated.openapi_aclient import ApiClient as AApiClient
+    from .generated.openapi_aclient.api.calibration_runs_api import CalibrationRunsApi as ACalibrationRunsApi
+    from .generated.openapi_aclient.api.evaluators_api import EvaluatorsApi as AEvaluatorsApi
+    from .generated.openapi_aclient.api.objectives_api import ObjectivesApi as AObjectivesApi
+    from .generated.openapi_client import ApiClient as ApiClient
+    from .generated.openapi_client.api.calibration_runs_api import CalibrationRunsApi
+    from .generated.openapi_client.api.evaluators_api import EvaluatorsApi as EvaluatorsApi
+    from .generated.openapi_client.api.objectives_api import ObjectivesApi as ObjectivesApi
+    from .generated.openapi_client.models.calibration_run import CalibrationRun
+    from .generated.openapi_client.models.calibration_run_create_request import CalibrationRunCreateRequest
+    from .generated.openapi_client.models.calibration_run_source_request import CalibrationRunSourceRequest
+    from .generated.openapi_client.models.calibration_source_type_enum import CalibrationSourceTypeEnum
+    from .generated.openapi_client.models.evaluator_calibration_output import EvaluatorCalibrationOutput
+    from .generated.openapi_client.models.evaluator_execution_request import EvaluatorExecutionRequest
+    from .generated.openapi_client.models.evaluator_execution_result import EvaluatorExecutionResult
+    from .generated.openapi_client.models.evaluator_list_output import EvaluatorListOutput
+    from .generated.openapi_client.models.evaluator_request import EvaluatorRequest
+    from .generated.openapi_client.models.input_variable_request import InputVariableRequest
+    from .generated.openapi_client.models.message_turn_request import MessageTurnRequest
+    from .generated.openapi_client.models.objective_request import ObjectiveRequest
+    from .generated.openapi_client.models.paginated_evaluator_list import PaginatedEvaluatorList
+    from .generated.openapi_client.models.paginated_evaluator_list_output_list import PaginatedEvaluatorListOutputList
+    from .generated.openapi_client.models.patched_evaluator_request import PatchedEvaluatorRequest
+    from .generated.openapi_client.models.reference_variable_request import ReferenceVariableRequest
+    from .generated.openapi_client.models.skill_test_input_request import SkillTestInputRequest
+else:
+    ACalibrationRunsApi = LazyImport(
+        "scorable.generated.openapi_aclient.api.calibration_runs_api", "CalibrationRunsApi"
+    )
+    AEvaluatorsApi = LazyImport("scorable.generated.openapi_aclient.api.evaluators_api", "EvaluatorsApi")
+    AObjectivesApi = LazyImport("scorable.generated.openapi_aclient.api.objectives_api", "ObjectivesApi")
+    CalibrationRunsApi = LazyImport("scorable.generated.openapi_client.api.calibration_runs_api", "CalibrationRunsApi")
+    EvaluatorsApi = LazyImport("scorable.generated.openapi_client.api.evaluators_api", "EvaluatorsApi")
+    ObjectivesApi = LazyImport("scorable.generated.openapi_client.api.objectives_api", "ObjectivesApi")
+    CalibrationRunCreateRequest = LazyImport(
+        "scorable.generated.openapi_client.models.calibration_run_create_request", "CalibrationRunCreateRequest"
+    )
+    CalibrationRunSourceRequest = LazyImport(
+        "scorable.generated.openapi_client.models.calibration_run_source_request", "CalibrationRunSourceRequest"
+    )
+    CalibrationSourceTypeEnum = LazyImport(
+        "scorable.generated.openapi_client.models.calibration_source_type_enum", "CalibrationSourceTypeEnum"
+    )
+    EvaluatorExecutionRequest = LazyImport(
+        "scorable.generated.openapi_client.models.evaluator_execution_request", "EvaluatorExecutionRequest"
+    )
+    EvaluatorRequest = LazyImport("scorable.generated.openapi_client.models.evaluator_request", "EvaluatorRequest")
+    InputVariableRequest = LazyImport(
+        "scorable.generated.openapi_client.models.input_variable_request", "InputVariableRequest"
+    )
+    ObjectiveRequest = LazyImport("scorable.generated.openapi_client.models.objective_request", "ObjectiveRequest")
+    PatchedEvaluatorRequest = LazyImport(
+        "scorable.generated.openapi_client.models.patched_evaluator_request", "PatchedEvaluatorRequest"
+    )
+    ReferenceVariableRequest = LazyImport(
+        "scorable.generated.openapi_client.models.reference_variable_request", "ReferenceVariableRequest"
+    )
+    SkillTestInputRequest = LazyImport(
+        "scorable.generated.openapi_client.models.skill_test_input_request", "SkillTestInputRequest"
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # The evaluator wrappers subclass a generated model, so they are imported on first use.
+    if name in ("Evaluator", "AEvaluator"):
+        from . import evaluator
+
+        return getattr(evaluator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 ModelName = Union[
     str,
@@ -127,7 +158,7 @@ class Versions:
         api_instance = EvaluatorsApi(_client)
         return api_instance.evaluators_versions_list(id=evaluator_id)
 
-    async def alist(self, evaluator_id: str) -> APaginatedEvaluatorList:
+    async def alist(self, evaluator_id: str) -> PaginatedEvaluatorList:
         """
         Asynchronously list all versions of a evaluator.
         """
@@ -139,182 +170,6 @@ class Versions:
             return await api_instance.evaluators_versions_list(id=evaluator_id)
 
 
-class Evaluator(AOpenAPIEvaluator):
-    """
-    Wrapper for a single Evaluator.
-
-    For available attributes, please check the (automatically
-    generated) superclass documentation.
-    """
-
-    client_context: ClientContextCallable
-
-    @classmethod
-    def _wrap(
-        cls, apiobj: Union[AOpenAPIEvaluator, "SyncGeneratedEvaluator"], client_context: ClientContextCallable
-    ) -> "Evaluator":  # noqa: E501
-        obj = cast(Evaluator, apiobj)
-        obj.__class__ = cls
-        obj.client_context = client_context
-        return obj
-
-    @with_sync_client
-    def run(
-        self,
-        response: Optional[str] = None,
-        request: Optional[str] = None,
-        turns: Optional[List[MessageTurnRequest]] = None,
-        tools: Optional[List[Dict[str, Any]]] = None,
-        contexts: Optional[List[str]] = None,
-        expected_output: Optional[str] = None,
-        variables: Optional[dict[str, str]] = None,
-        tags: Optional[List[str]] = None,
-        user_id: Optional[str] = None,
-        session_id: Optional[str] = None,
-        system_prompt: Optional[str] = None,
-        file_ids: Optional[List[uuid.UUID]] = None,
-        project_id: Optional[str] = None,
-        *,
-        _client: ApiClient,
-        _request_timeout: Optional[int] = None,
-    ) -> EvaluatorExecutionResult:
-        """
-        Run the evaluator.
-
-        Args:
-          response: LLM output.
-          request: The prompt sent to the LLM.
-          turns: Optional multi-turn conversation as a list of turns.
-          tools: Optional OpenAI-style tool catalog available to the agent during the conversation.
-          contexts: Optional documents passed to RAG evaluators
-          expected_output: Optional expected output for the evaluator.
-          variables: Optional additional variable mappings for the evaluator. For example, if the evaluator
-            predicate is "evaluate the output based on {subject}: {output}", then variables={"subject": "clarity"}.
-          tags: Optional tags to add to the evaluator execution
-          user_id: Optional user identifier for tracking purposes.
-          session_id: Optional session identifier for tracking purposes.
-          system_prompt: Optional system prompt that was used for the LLM call.
-          file_ids: Optional list of file UUIDs (from Files.upload). PDFs are extracted to text
-            context; images are passed directly to the model.
-          project_id: Optional project to attribute the execution log to.
-        """
-
-        if not response and not request and not turns:
-            raise ValueError("Either response, request, or turns must be provided")
-
-        api_instance = EvaluatorsApi(_client)
-
-        evaluator_execution_request = EvaluatorExecutionRequest(
-            evaluator_version_id=self.version_id,
-            request=request,
-            response=response,
-            turns=turns,
-            tools=tools,
-            contexts=contexts,
-            expected_output=expected_output,
-            variables=variables,
-            tags=tags,
-            user_id=user_id,
-            session_id=session_id,
-            system_prompt=system_prompt,
-            file_ids=[str(f) for f in file_ids] if file_ids else None,
-            project_id=project_id,
-        )
-        return api_instance.evaluators_execute_create(
-            id=self.id,
-            evaluator_execution_request=evaluator_execution_request,
-            _request_timeout=_request_timeout,
-        )
-
-
-class AEvaluator(AOpenAPIEvaluator):
-    """
-    Wrapper for a single Evaluator.
-
-    For available attributes, please check the (automatically
-    generated) superclass documentation.
-    """
-
-    client_context: ClientContextCallable
-
-    @classmethod
-    async def _awrap(
-        cls, apiobj: Union[AOpenAPIEvaluator, "GeneratedEvaluator"], client_context: ClientContextCallable
-    ) -> "AEvaluator":  # noqa: E501
-        obj = cast(AEvaluator, apiobj)
-        obj.__class__ = cls
-        obj.client_context = client_context
-        return obj
-
-    @with_async_client
-    async def arun(
-        self,
-        response: Optional[str] = None,
-        request: Optional[str] = None,
-        turns: Optional[List[AMessageTurnRequest]] = None,
-        tools: Optional[List[Dict[str, Any]]] = None,
-        contexts: Optional[List[str]] = None,
-        expected_output: Optional[str] = None,
-        variables: Optional[dict[str, str]] = None,
-        tags: Optional[List[str]] = None,
-        user_id: Optional[str] = None,
-        session_id: Optional[str] = None,
-        system_prompt: Optional[str] = None,
-        file_ids: Optional[List[uuid.UUID]] = None,
-        project_id: Optional[str] = None,
-        *,
-        _client: AApiClient,
-        _request_timeout: Optional[int] = None,
-    ) -> AEvaluatorExecutionResult:
-        """
-        Asynchronously run the evaluator.
-
-        Args:
-          response: LLM output.
-          request: The prompt sent to the LLM.
-          turns: Optional multi-turn conversation as a list of turns.
-          tools: Optional OpenAI-style tool catalog available to the agent during the conversation.
-          contexts: Optional documents passed to RAG evaluators
-          expected_output: Optional expected output for the evaluator.
-          variables: Optional additional variable mappings for the evaluator. For example, if the evaluator
-            predicate is "evaluate the output based on {subject}: {output}", then variables={"subject": "clarity"}.
-          tags: Optional tags to add to the evaluator execution
-          user_id: Optional user identifier for tracking purposes.
-          session_id: Optional session identifier for tracking purposes.
-          system_prompt: Optional system prompt that was used for the LLM call.
-          file_ids: Optional list of file UUIDs (from Files.upload). PDFs are extracted to text
-            context; images are passed directly to the model.
-          project_id: Optional project to attribute the execution log to.
-        """
-
-        if not response and not request and not turns:
-            raise ValueError("Either response, request, or turns must be provided")
-
-        api_instance = AEvaluatorsApi(_client)
-
-        evaluator_execution_request = AEvaluatorExecutionRequest(
-            evaluator_version_id=self.version_id,
-            request=request,
-            response=response,
-            turns=turns,
-            tools=tools,
-            contexts=contexts,
-            expected_output=expected_output,
-            variables=variables,
-            tags=tags,
-            user_id=user_id,
-            session_id=session_id,
-            system_prompt=system_prompt,
-            file_ids=[str(f) for f in file_ids] if file_ids else None,
-            project_id=project_id,
-        )
-        return await api_instance.evaluators_execute_create(
-            id=self.id,
-            evaluator_execution_request=evaluator_execution_request,
-            _request_timeout=_request_timeout,
-        )
-
-
 def _to_input_variables(
     input_variables: Optional[Union[List[InputVariable], List[InputVariableRequest]]],
 ) -> List[InputVariableRequest]:
@@ -339,28 +194,44 @@ def _to_reference_variables(
     return [_convert_to_generated_model(entry) for entry in reference_variables or {}]
 
 
-def _ato_input_variables(
-    input_variables: Optional[Union[List[InputVariable], List[AInputVariableRequest]]],
-) -> List[AInputVariableRequest]:
-    def _convert_to_generated_model(entry: Union[InputVariable, AInputVariableRequest]) -> AInputVariableRequest:
-        if not isinstance(entry, AInputVariableRequest):
-            return AInputVariableRequest(name=entry.name)
-        return entry
-
-    return [_convert_to_generated_model(entry) for entry in input_variables or {}]
-
-
-def _ato_reference_variables(
-    reference_variables: Optional[Union[List[ReferenceVariable], List[AReferenceVariableRequest]]],
-) -> List[AReferenceVariableRequest]:
-    def _convert_to_generated_model(
-        entry: Union[ReferenceVariable, AReferenceVariableRequest],
-    ) -> AReferenceVariableRequest:
-        if not isinstance(entry, AReferenceVariableRequest):
-            return AReferenceVariableRequest(name=entry.name, dataset=entry.dataset_id)
-        return entry
-
-    return [_convert_to_generated_model(entry) for entry in reference_variables or {}]
+def _calibration_request(
+    name: str,
+    test_dataset_id: Optional[str],
+    test_data: Optional[List[List[str]]],
+    prompt: str,
+    model: ModelName,
+    reference_variables: Optional[Union[List[ReferenceVariable], List[ReferenceVariableRequest]]],
+    input_variables: Optional[Union[List[InputVariable], List[InputVariableRequest]]],
+) -> SkillTestInputRequest:
+    if not test_dataset_id and not test_data:
+        raise ValueError("Either test_dataset_id or test_data must be provided")
+    if test_dataset_id and test_data:
+        raise ValueError("Only one of test_dataset_id or test_data must be provided")
+    return SkillTestInputRequest(
+        name=name,
+        test_dataset_id=test_dataset_id,
+        test_data=test_data,
+        prompt=prompt,
+        models=[model],
+        is_evaluator=True,
+        objective=ObjectiveRequest(intent="Calibration"),
+        reference_variables=_to_reference_variables(reference_variables),
+        input_variables=_to_input_variables(input_variables),
+    )
+
+
+def _calibration_size(test_data: Optional[List[List[str]]], dataset_size: Optional[int]) -> int:
+    if test_data:
+        return len(test_data)
+    if dataset_size is None:
+        raise ValueError("dataset_size must be provided with test_dataset_id")
+    return dataset_size
+
+
+def _evaluator_id(name_or_id: str) -> str:
+    # Preset names (e.g. "Faithfulness_Swift") stand for the ID of the preset evaluator.
+    preset = Evaluators.Eval.__members__.get(name_or_id)
+    return name_or_id if preset is None else preset.value
 
 
 class PresetEvaluatorRunner:
@@ -462,7 +333,7 @@ class APresetEvaluatorRunner:
         self,
         response: Optional[str] = None,
         request: Optional[str] = None,
-        turns: Optional[List[AMessageTurnRequest]] = None,
+        turns: Optional[List[MessageTurnRequest]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         contexts: Optional[List[str]] = None,
         expected_output: Optional[str] = None,
@@ -475,7 +346,7 @@ class APresetEvaluatorRunner:
         *,
         _client: AApiClient,
         _request_timeout: Optional[int] = None,
-    ) -> AEvaluatorExecutionResult:
+    ) -> EvaluatorExecutionResult:
         """
         Asynchronously run the evaluator.
 
@@ -499,7 +370,7 @@ class APresetEvaluatorRunner:
 
         api_instance = AEvaluatorsApi(_client)
 
-        evaluator_execution_request = AEvaluatorExecutionRequest(
+        evaluator_execution_request = EvaluatorExecutionRequest(
             evaluator_version_id=self.evaluator_version_id,
             request=request,
             response=response,
@@ -549,11 +420,6 @@ class Evaluators:
             intent=intent,
         )
 
-    async def _ato_objective_request(self, *, intent: Optional[str] = None) -> AObjectiveRequest:
-        return AObjectiveRequest(
-            intent=intent,
-        )
-
     @with_sync_client
     def run(
         self,
@@ -571,6 +437,7 @@ class Evaluators:
         user_id: Optional[str] = None,
         session_id: Optional[str] = None,
         system_prompt: Optional[str] = None,
+        file_ids: Optional[List[uuid.UUID]] = None,
         project_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
         _client: ApiClient,
@@ -593,6 +460,8 @@ class Evaluators:
             user_id: Optional user identifier for tracking purposes.
             session_id: Optional session identifier for tracking purposes.
             system_prompt: Optional system prompt that was used for the LLM call.
+            file_ids: Optional list of file UUIDs (from Files.upload). PDFs are extracted to text
+              context; images are passed directly to the model.
             project_id: Optional project to attribute the execution log to.
             _request_timeout: Optional timeout for the request.
         """
@@ -615,6 +484,7 @@ class Evaluators:
             user_id=user_id,
             session_id=session_id,
             system_prompt=system_prompt,
+            file_ids=[str(f) for f in file_ids] if file_ids else None,
             project_id=project_id,
         )
         return api_instance.evaluators_execute_create(
@@ -630,7 +500,7 @@ class Evaluators:
         *,
         request: Optional[str] = None,
         response: Optional[str] = None,
-        turns: Optional[List[AMessageTurnRequest]] = None,
+        turns: Optional[List[MessageTurnRequest]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         contexts: Optional[List[str]] = None,
         expected_output: Optional[str] = None,
@@ -640,10 +510,11 @@ class Evaluators:
         user_id: Optional[str] = None,
         session_id: Optional[str] = None,
         system_prompt: Optional[str] = None,
+        file_ids: Optional[List[uuid.UUID]] = None,
         project_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AEvaluatorExecutionResult:
+    ) -> EvaluatorExecutionResult:
         """
         Asynchronously run the evaluator.
 
@@ -662,6 +533,8 @@ class Evaluators:
             user_id: Optional user identifier for tracking purposes.
             session_id: Optional session identifier for tracking purposes.
             system_prompt: Optional system prompt that was used for the LLM call.
+            file_ids: Optional list of file UUIDs (from Files.upload). PDFs are extracted to text
+              context; images are passed directly to the model.
             project_id: Optional project to attribute the execution log to.
             _request_timeout: Optional timeout for the request.
         """
@@ -670,7 +543,7 @@ class Evaluators:
             raise ValueError("Either response, request, or turns must be provided")
 
         api_instance = AEvaluatorsApi(_client)
-        evaluator_execution_request = AEvaluatorExecutionRequest(
+        evaluator_execution_request = EvaluatorExecutionRequest(
             evaluator_version_id=evaluator_version_id,
             request=request,
             response=response,
@@ -683,6 +556,7 @@ class Evaluators:
             user_id=user_id,
             session_id=session_id,
             system_prompt=system_prompt,
+            file_ids=[str(f) for f in file_ids] if file_ids else None,
             project_id=project_id,
         )
         return await api_instance.evaluators_execute_create(
@@ -691,6 +565,127 @@ class Evaluators:
             _request_timeout=_request_timeout,
         )
 
+    def run_many(
+        self,
+        evaluator_id: str,
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        evaluator_version_id: Optional[str] = None,
+        concurrency: int = 8,
+        dedup_window: int = DEFAULT_WINDOW,
+        _request_timeout: Optional[int] = None,
+    ) -> BatchResult[EvaluatorExecutionResult]:
+        """
+        Run the evaluator on many inputs, sending each distinct input only once.
+
+        Identical inputs (after canonicalization) among the most recent ``dedup_window``
+        distinct ones share a single execution, whose result is returned for each of them.
+
+        Args:
+            evaluator_id: The ID of the evaluator to run.
+            inputs: Keyword arguments of :meth:`run` for each input, e.g. ``{"request": ..., "response": ...}``.
+            evaluator_version_id: Version ID of the evaluator to run. If omitted, the latest version is used.
+            concurrency: Maximum number of concurrent executions.
+            dedup_window: Number of distinct inputs remembered for deduplication.
+            _request_timeout: Optional timeout for each request.
+        """
+        context = self.client_context()
+        assert isinstance(context, AbstractContextManager), "This method is not available in asynchronous mode"
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            window: ThreadWindow[EvaluatorExecutionResult] = ThreadWindow(pool, concurrency)
+
+            def start(arguments: Dict[str, Any]) -> Future[EvaluatorExecutionResult]:
+                future = window.start(
+                    self.run,
+                    evaluator_id,
+                    evaluator_version_id=evaluator_version_id,
+                    _request_timeout=_request_timeout,
+                    **arguments,
+                )
+                return queued(future, "evaluators.run_many")
+
+            # Inputs are read as workers free up, so that long input streams are never all queued.
+            dedup: Deduplicator[Future[EvaluatorExecutionResult]] = Deduplicator(dedup_window)
+            for arguments in inputs:
+                window.reserve()
+                window.collect(dedup.submit(arguments, partial(start, arguments)))
+            results = window.drain()
+        return BatchResult(results, dedup.report)
+
+    async def arun_many(
+        self,
+        evaluator_id: str,
+        inputs: Iterable[Dict[str, Any]],
+        *,
+        evaluator_version_id: Optional[str] = None,
+        concurrency: int = 8,
+        dedup_window: int = DEFAULT_WINDOW,
+        _request_timeout: Optional[int] = None,
+    ) -> BatchResult[EvaluatorExecutionResult]:
+        """
+        Asynchronously run the evaluator on many inputs, sending each distinct input only once.
+
+        Identical inputs (after canonicalization) among the most recent ``dedup_window``
+        distinct ones share a single execution, whose result is returned for each of them.
+
+        Args:
+            evaluator_id: The ID of the evaluator to run.
+            inputs: Keyword arguments of :meth:`run` for each input, e.g. ``{"request": ..., "response": ...}``.
+            evaluator_version_id: Version ID of the evaluator to run. If omitted, the latest version is used.
+            concurrency: Maximum number of concurrent executions.
+            dedup_window: Number of distinct inputs remembered for deduplication.
+            _request_timeout: Optional timeout for each request.
+        """
+        context = self.client_context()
+        assert isinstance(context, AbstractAsyncContextManager), "This method is not available in synchronous mode"
+        window: TaskWindow[EvaluatorExecutionResult] = TaskWindow(concurrency)
+
+        def start(arguments: Dict[str, Any]) -> asyncio.Future[EvaluatorExecutionResult]:
+            run = self.arun(
+                evaluator_id,
+                evaluator_version_id=evaluator_version_id,
+                _request_timeout=_request_timeout,
+                **arguments,
+            )
+            return queued(window.start(run), "evaluators.run_many")
+
+        # Inputs are read as slots free up, so that long input streams are never all in flight.
+        dedup: Deduplicator[asyncio.Future[EvaluatorExecutionResult]] = Deduplicator(dedup_window)
+        for arguments in inputs:
+            await window.reserve()
+            window.collect(dedup.submit(arguments, partial(start, arguments)))
+        return BatchResult(await window.drain(), dedup.report)
+
+    def cascade(self, *evaluators: str, bands: Optional[Sequence[Band]] = None) -> Cascade:
+        """
+        Chain evaluators from the fastest to the most thorough, escalating only uncertain results.
+
+        Args:
+          evaluators: Evaluator IDs or preset names, e.g. ``"Faithfulness_Swift", "Faithfulness"``.
+          bands: The uncertain band of each evaluator but the last; :class:`scorable.cascade.Band`
+            defaults (scores from 0.3 to 0.7) if omitted.
+        """
+        return Cascade(self, evaluators, [Band()] * (len(evaluators) - 1) if bands is None else bands)
+
+    def budget_scheduler(self, profiles: Optional[LatencyProfiles] = None) -> BudgetScheduler:
+        """
+        Create a scheduler that runs evaluators concurrently within a latency budget.
+
+        Args:
+          profiles: Latency profiles to choose variants by, e.g. shared between schedulers or seeded from
+            execution logs; the scheduler starts with empty profiles if omitted.
+        """
+        return BudgetScheduler(self, profiles)
+
+    def suite(self, *evaluators: str) -> EvaluatorSuite:
+        """
+        Group evaluators to run side by side on each input, sending the input to all of them at once.
+
+        Args:
+          evaluators: Evaluator IDs or preset names, e.g. ``"Politeness", "Clarity"``.
+        """
+        return EvaluatorSuite(self, evaluators)
+
     @with_sync_client
     def calibrate_run(
         self,
@@ -731,7 +726,7 @@ class Evaluators:
         score_config_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> ACalibrationRun:
+    ) -> CalibrationRun:
         """Asynchronously start a calibration run for a saved evaluator against a labelled dataset.
 
         Returns the run with ``status="pending"``; poll the calibration run until it completes to
@@ -743,9 +738,9 @@ class Evaluators:
           score_config_id: Optional score config; omitting it uses the dataset's continuous scores.
         """
 
-        request = ACalibrationRunCreateRequest(
+        request = CalibrationRunCreateRequest(
             evaluator_external_id=evaluator_id,
-            source=ACalibrationRunSourceRequest(type=ACalibrationSourceTypeEnum("dataset"), dataset_id=dataset_id),
+            source=CalibrationRunSourceRequest(type=CalibrationSourceTypeEnum("dataset"), dataset_id=dataset_id),
             score_config_id=score_config_id,
         )
         api_instance = ACalibrationRunsApi(_client)
@@ -772,21 +767,9 @@ class Evaluators:
         See the create evaluator method for more details on the parameters.
         """
 
-        if not test_dataset_id and not test_data:
-            raise ValueError("Either test_dataset_id or test_data must be provided")
-        if test_dataset_id and test_data:
-            raise ValueError("Only one of test_dataset_id or test_data must be provided")
         api_instance = EvaluatorsApi(_client)
-        evaluator_test_request = SkillTestInputRequest(
-            name=name,
-            test_dataset_id=test_dataset_id,
-            test_data=test_data,
-            prompt=prompt,
-            models=[model],
-            is_evaluator=True,
-            objective=ObjectiveRequest(intent="Calibration"),
-            reference_variables=_to_reference_variables(reference_variables),
-            input_variables=_to_input_variables(input_variables),
+        evaluator_test_request = _calibration_request(
+            name, test_dataset_id, test_data, prompt, model, reference_variables, input_variables
         )
         return api_instance.evaluators_calibrate_create(evaluator_test_request, _request_timeout=_request_timeout)
 
@@ -799,34 +782,134 @@ class Evaluators:
         test_data: Optional[List[List[str]]] = None,
         prompt: str,
         model: ModelName,
-        reference_variables: Optional[Union[List[ReferenceVariable], List[AReferenceVariableRequest]]] = None,
-        input_variables: Optional[Union[List[InputVariable], List[AInputVariableRequest]]] = None,
+        reference_variables: Optional[Union[List[ReferenceVariable], List[ReferenceVariableRequest]]] = None,
+        input_variables: Optional[Union[List[InputVariable], List[InputVariableRequest]]] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> List[AEvaluatorCalibrationOutput]:
+    ) -> List[EvaluatorCalibrationOutput]:
         """
         Asynchronously run calibration set for an evaluator definition.
         See the create evaluator method for more details on the parameters.
         """
 
-        if not test_dataset_id and not test_data:
-            raise ValueError("Either test_dataset_id or test_data must be provided")
-        if test_dataset_id and test_data:
-            raise ValueError("Only one of test_dataset_id or test_data must be provided")
         api_instance = AEvaluatorsApi(_client)
-        evaluator_test_request = ASkillTestInputRequest(
-            name=name,
-            test_dataset_id=test_dataset_id,
-            test_data=test_data,
-            prompt=prompt,
-            models=[model],
-            is_evaluator=True,
-            objective=AObjectiveRequest(intent="Calibration"),
-            reference_variables=_ato_reference_variables(reference_variables),
-            input_variables=_ato_input_variables(input_variables),
+        evaluator_test_request = _calibration_request(
+            name, test_dataset_id, test_data, prompt, model, reference_variables, input_variables
         )
         return await api_instance.evaluators_calibrate_create(evaluator_test_request, _request_timeout=_request_timeout)
 
+    @with_sync_client
+    def calibrate_sequential(
+        self,
+        *,
+        name: str,
+        test_dataset_id: Optional[str] = None,
+        test_data: Optional[List[List[str]]] = None,
+        dataset_size: Optional[int] = None,
+        prompt: str,
+        model: ModelName,
+        reference_variables: Optional[Union[List[ReferenceVariable], List[ReferenceVariableRequest]]] = None,
+        input_variables: Optional[Union[List[InputVariable], List[InputVariableRequest]]] = None,
+        metric: Metric = "mae",
+        target_width: float = 0.1,
+        confidence: float = 0.95,
+        slice_size: int = 20,
+        min_rows: int = 30,
+        seed: Optional[int] = None,
+        _request_timeout: Optional[int] = None,
+        _client: ApiClient,
+    ) -> SequentialCalibration:
+        """
+        Run calibration set for an evaluator definition until the agreement estimate is precise enough.
+
+        The rows are evaluated in slices of ``slice_size``, in a random order, and the run stops once
+        the confidence interval of ``metric`` is at most ``target_width`` wide. See :meth:`calibrate`
+        for the evaluator parameters.
+
+        Args:
+          dataset_size: Rows of ``test_dataset_id``; the length of ``test_data`` otherwise.
+          metric: ``mae`` (mean absolute error) or ``pearson`` between the scores and the expected scores.
+          target_width: Width of the confidence interval at which to stop.
+          confidence: Coverage of the confidence interval.
+          slice_size: Rows evaluated per request.
+          min_rows: Rows scored at least before stopping.
+          seed: Seed of the slice order.
+        """
+
+        request = _calibration_request(
+            name, test_dataset_id, test_data, prompt, model, reference_variables, input_variables
+        )
+        driver = _Driver(
+            _calibration_size(test_data, dataset_size),
+            metric=metric,
+            confidence=confidence,
+            target_width=target_width,
+            slice_size=slice_size,
+            min_rows=min_rows,
+            seed=seed,
+        )
+        api_instance = EvaluatorsApi(_client)
+        for dataset_range in driver.ranges():
+            request.dataset_range = dataset_range
+            driver.record(api_instance.evaluators_calibrate_create(request, _request_timeout=_request_timeout))
+        return driver.result()
+
+    @with_async_client
+    async def acalibrate_sequential(
+        self,
+        *,
+        name: str,
+        test_dataset_id: Optional[str] = None,
+        test_data: Optional[List[List[str]]] = None,
+        dataset_size: Optional[int] = None,
+        prompt: str,
+        model: ModelName,
+        reference_variables: Optional[Union[List[ReferenceVariable], List[ReferenceVariableRequest]]] = None,
+        input_variables: Optional[Union[List[InputVariable], List[InputVariableRequest]]] = None,
+        metric: Metric = "mae",
+        target_width: float = 0.1,
+        confidence: float = 0.95,
+        slice_size: int = 20,
+        min_rows: int = 30,
+        seed: Optional[int] = None,
+        _request_timeout: Optional[int] = None,
+        _client: AApiClient,
+    ) -> SequentialCalibration:
+        """
+        Asynchronously run calibration set for an evaluator definition until the agreement estimate is precise enough.
+
+        The rows are evaluated in slices of ``slice_size``, in a random order, and the run stops once
+        the confidence interval of ``metric`` is at most ``target_width`` wide. See :meth:`calibrate`
+        for the evaluator parameters.
+
+        Args:
+          dataset_size: Rows of ``test_dataset_id``; the length of ``test_data`` otherwise.
+          metric: ``mae`` (mean absolute error) or ``pearson`` between the scores and the expected scores.
+          target_width: Width of the confidence interval at which to stop.
+          confidence: Coverage of the confidence interval.
+          slice_size: Rows evaluated per request.
+          min_rows: Rows scored at least before stopping.
+          seed: Seed of the slice order.
+        """
+
+        request = _calibration_request(
+            name, test_dataset_id, test_data, prompt, model, reference_variables, input_variables
+        )
+        driver = _Driver(
+            _calibration_size(test_data, dataset_size),
+            metric=metric,
+            confidence=confidence,
+            target_width=target_width,
+            slice_size=slice_size,
+            min_rows=min_rows,
+            seed=seed,
+        )
+        api_instance = AEvaluatorsApi(_client)
+        for dataset_range in driver.ranges():
+            request.dataset_range = dataset_range
+            driver.record(await api_instance.evaluators_calibrate_create(request, _request_timeout=_request_timeout))
+        return driver.result()
+
     @with_sync_client
     def get_by_name(
         self,
@@ -840,6 +923,8 @@ class Evaluators:
         name: The evaluator to be fetched. Note this only works for uniquely named evaluators.
         """
 
+        from .evaluator import Evaluator
+
         api_instance = EvaluatorsApi(_client)
 
         evaluator_list: List[EvaluatorListOutput] = list(
@@ -870,6 +955,8 @@ class Evaluators:
         name: The evaluator to be fetched. Note this only works for uniquely named evaluators.
         """
 
+        from .evaluator import AEvaluator
+
         context = self.client_context()
 
         assert isinstance(context, AbstractAsyncContextManager), "This method is not available in synchronous mode"
@@ -877,7 +964,7 @@ class Evaluators:
         async with context as client:
             api_instance = AEvaluatorsApi(client)
 
-            evaluator_list: List[AEvaluatorListOutput] = []
+            evaluator_list: List[EvaluatorListOutput] = []
             async for evaluator in aiterate_cursor_list(  # type: ignore[var-annotated]
                 partial(api_instance.evaluators_list, name=name),
                 limit=1,
@@ -934,6 +1021,8 @@ class Evaluators:
           overwrite: Whether to overwrite an evaluator with the same name if it exists.
         """
 
+        from .evaluator import Evaluator
+
         name = self._validate_create_params_sanitize_name(name, intent, objective_id)
         api_instance = EvaluatorsApi(_client)
         objective: Optional[ObjectiveRequest] = None
@@ -972,7 +1061,7 @@ class Evaluators:
         intent: Optional[str] = None,
         model: Optional[ModelName] = None,
         fallback_models: Optional[List[ModelName]] = None,
-        input_variables: Optional[Union[List[InputVariable], List[AInputVariableRequest]]] = None,
+        input_variables: Optional[Union[List[InputVariable], List[InputVariableRequest]]] = None,
         demonstration_dataset_id: Optional[str] = None,
         objective_id: Optional[str] = None,
         overwrite: bool = False,
@@ -1006,23 +1095,25 @@ class Evaluators:
           overwrite: Whether to overwrite an evaluator with the same name if it exists.
         """
 
+        from .evaluator import AEvaluator
+
         name = self._validate_create_params_sanitize_name(name, intent, objective_id)
         api_instance = AEvaluatorsApi(_client)
-        objective: Optional[AObjectiveRequest] = None
+        objective: Optional[ObjectiveRequest] = None
         if objective_id is None:
             if intent is None:
                 intent = name
-            objective = await self._ato_objective_request(intent=intent)
+            objective = self._to_objective_request(intent=intent)
             objectives_api_instance = AObjectivesApi(_client)
             new_objective = await objectives_api_instance.objectives_create(objective_request=objective)
             objective_id = new_objective.id
 
-        evaluator_request = AEvaluatorRequest(
+        evaluator_request = EvaluatorRequest(
             name=name,
             objective_id=objective_id,
             scoring_criteria=scoring_criteria,
             models=[model for model in [model] + (fallback_models or []) if model is not None],
-            input_variables=_ato_input_variables(input_variables),
+            input_variables=_to_input_variables(input_variables),
             demonstration_dataset_id=demonstration_dataset_id,
             overwrite=overwrite,
             project_id=project_id,
@@ -1059,6 +1150,8 @@ class Evaluators:
         See the create method for more information on the arguments.
         """
 
+        from .evaluator import Evaluator
+
         api_instance = EvaluatorsApi(_client)
         request = PatchedEvaluatorRequest(
             change_note=change_note or "",
@@ -1087,7 +1180,7 @@ class Evaluators:
         *,
         change_note: Optional[str] = None,
         fallback_models: Optional[List[ModelName]] = None,
-        input_variables: Optional[Union[List[InputVariable], List[AInputVariableRequest]]] = None,
+        input_variables: Optional[Union[List[InputVariable], List[InputVariableRequest]]] = None,
         model: Optional[ModelName] = None,
         name: Optional[str] = None,
         scoring_criteria: Optional[str] = None,
@@ -1104,11 +1197,13 @@ class Evaluators:
 
         See the create method for more information on the arguments.
         """
+        from .evaluator import AEvaluator
+
         api_instance = AEvaluatorsApi(_client)
 
-        request = APatchedEvaluatorRequest(
+        request = PatchedEvaluatorRequest(
             change_note=change_note or "",
-            input_variables=_ato_input_variables(input_variables) if input_variables else None,
+            input_variables=_to_input_variables(input_variables) if input_variables else None,
             models=[model for model in [model] + (fallback_models or []) if model is not None]
             if model or fallback_models
             else None,
@@ -1137,6 +1232,8 @@ class Evaluators:
         Get a Evaluator instance by ID.
         """
 
+        from .evaluator import Evaluator
+
         api_instance = EvaluatorsApi(_client)
         api_response = api_instance.evaluators_retrieve(id=evaluator_id, _request_timeout=_request_timeout)
         return Evaluator._wrap(api_response, self.client_context)
@@ -1153,6 +1250,8 @@ class Evaluators:
         Asynchronously get a Evaluator instance by ID.
         """
 
+        from .evaluator import AEvaluator
+
         api_instance = AEvaluatorsApi(_client)
         api_response = await api_instance.evaluators_retrieve(id=evaluator_id, _request_timeout=_request_timeout)
         return await AEvaluator._awrap(api_response, self.client_context)
@@ -1199,7 +1298,7 @@ class Evaluators:
         name: Optional[str] = None,
         only_root_evaluators: bool = False,
         project_id: Optional[str] = None,
-    ) -> AsyncIterator[AEvaluatorListOutput]:
+    ) -> AsyncIterator[EvaluatorListOutput]:
         """
         Asynchronously iterate through the evaluators.
 
@@ -1225,7 +1324,7 @@ class Evaluators:
 
             cursor: Optional[StrictStr] = None
             while limit > 0:
-                result: APaginatedEvaluatorListOutputList = await partial_list(page_size=limit, cursor=cursor)
+                result: PaginatedEvaluatorListOutputList = await partial_list(page_size=limit, cursor=cursor)
                 if not result.results:
                     return
 
@@ -1331,7 +1430,7 @@ class Evaluators:
         *,
         request: Optional[str] = None,
         response: Optional[str] = None,
-        turns: Optional[List[AMessageTurnRequest]] = None,
+        turns: Optional[List[MessageTurnRequest]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         contexts: Optional[List[str]] = None,
         expected_output: Optional[str] = None,
@@ -1344,7 +1443,7 @@ class Evaluators:
         project_id: Optional[str] = None,
         _request_timeout: Optional[int] = None,
         _client: AApiClient,
-    ) -> AEvaluatorExecutionResult:
+    ) -> EvaluatorExecutionResult:
         """
         Asynchronously run an evaluator by name.
 
@@ -1371,7 +1470,7 @@ class Evaluators:
             raise ValueError("Either response, request, or turns must be provided")
 
         api_instance = AEvaluatorsApi(_client)
-        evaluator_execution_request = AEvaluatorExecutionRequest(
+        evaluator_execution_request = EvaluatorExecutionRequest(
             evaluator_version_id=evaluator_version_id,
             request=request,
             response=response,
@@ -0,0 +1,130 @@
+"""Input sources and result records for bulk evaluation.
+
+A source produces ``(key, arguments)`` pairs, where ``arguments`` are keyword
+arguments of :meth:`scorable.skills.Evaluators.arun` and ``key`` identifies the
+input in results. Sources are addressed by position so that a range of them can
+be read independently, e.g. by a worker process. Counting a source with
+``every`` set records where the positions that are multiples of it start (a
+byte offset, a page cursor), and reads of a range from such a position resume
+there instead of reading the source from its beginning.
+"""
+
+from __future__ import annotations
+
+import json
+from itertools import islice
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .client import Scorable
+
+#: Fields of an input record that are passed on to the evaluator.
+INPUT_FIELDS = ("request", "response", "contexts", "expected_output", "variables")
+
+SourceItem = Tuple[str, Dict[str, Any]]
+
+
+def evaluator_arguments(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the evaluator arguments out of an input record, skipping empty ones."""
+    return {name: record[name] for name in INPUT_FIELDS if record.get(name) is not None}
+
+
+async def aevaluate_record(
+    client: Scorable,
+    evaluator_id: str,
+    key: str,
+    arguments: Dict[str, Any],
+    *,
+    evaluator_version_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run one evaluation and describe its outcome as a JSON-serializable result record.
+
+    The record has the input ``key``, the ``evaluator_id``, and either the ``score``,
+    ``justification`` and ``execution_log_id``, or the ``error`` of a failed evaluation.
+    """
+    record: Dict[str, Any] = {"key": key, "evaluator_id": evaluator_id}
+    try:
+        result = await client.evaluators.arun(evaluator_id, evaluator_version_id=evaluator_version_id, **arguments)
+    except Exception as e:
+        return {**record, "error": f"{type(e).__name__}: {e}"}
+    return {
+        **record,
+        "score": result.score,
+        "justification": result.justification,
+        "execution_log_id": result.execution_log_id,
+        "error": None,
+    }
+
+
+class JsonlSource:
+    """Inputs from a JSON Lines file.
+
+    Each non-empty line is an object with any of the fields in :data:`INPUT_FIELDS`.
+    The key of an input is its ``key_field`` value, or its line number if it has none.
+    """
+
+    def __init__(self, path: str, *, key_field: str = "id"):
+        self.path = path
+        self.key_field = key_field
+        # Byte offset of the lines recorded by ``acount``, by line number.
+        self._offsets: Dict[int, int] = {}
+
+    async def acount(self, client: Scorable, every: Optional[int] = None) -> int:
+        count = offset = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if every and count % every == 0:
+                    self._offsets[count] = offset
+                offset += len(line)
+                count += 1
+        return count
+
+    async def aread(self, client: Scorable, start: int = 0, stop: Optional[int] = None) -> AsyncIterator[SourceItem]:
+        with open(self.path, "rb") as f:
+            skip = start
+            if start in self._offsets:
+                f.seek(self._offsets[start])
+                skip = 0
+            lines = islice(f, skip, None if stop is None else skip + stop - start)
+            for position, line in enumerate(lines, start):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                yield str(record.get(self.key_field, position)), evaluator_arguments(record)
+
+
+class DatasetSource:
+    """Inputs from the items of a Scorable dataset, keyed by item ID.
+
+    The items endpoint is cursor paginated: reading a range starts from the page of
+    ``start`` if :meth:`acount` recorded its cursor, and from the first item otherwise.
+    """
+
+    def __init__(self, dataset_id: str, *, include_archived: bool = False):
+        self.dataset_id = dataset_id
+        self.include_archived = include_archived
+        # Cursor of the page of the positions recorded by ``acount``, and their index in that page.
+        self._checkpoints: Dict[int, Tuple[Optional[str], int]] = {}
+
+    async def acount(self, client: Scorable, every: Optional[int] = None) -> int:
+        count = 0
+        async for cursor, page in client.datasets._aitem_pages(self.dataset_id, include_archived=self.include_archived):
+            if every:
+                first = -(-count // every) * every
+                for position in range(first, count + len(page.results), every):
+                    self._checkpoints[position] = (cursor, position - count)
+            count += len(page.results)
+        return count
+
+    async def aread(self, client: Scorable, start: int = 0, stop: Optional[int] = None) -> AsyncIterator[SourceItem]:
+        cursor, index = self._checkpoints.get(start, (None, start))
+        position = start - index
+        async for _, page in client.datasets._aitem_pages(
+            self.dataset_id, include_archived=self.include_archived, cursor=cursor
+        ):
+            for item in page.results:
+                if stop is not None and position >= stop:
+                    return
+                if position >= start:
+                    yield item.id, evaluator_arguments(item.to_dict())
+                position += 1
@@ -0,0 +1,180 @@
+"""Run several evaluators on the same input.
+
+An :class:`EvaluatorSuite` sends one input to all its evaluators at once. The
+request is built and validated once, and every evaluator receives it over the
+connection pool of a single API client, where separate
+:meth:`~scorable.skills.Evaluators.run` calls would each build the request and
+open a client of their own::
+
+  suite = client.evaluators.suite("Politeness", "Clarity")
+  result = suite.run(response="This is polite and clear.")
+  print(result.scores, result.errors)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
+
+from .metrics import queued
+from .utils import LazyImport
+
+if TYPE_CHECKING:
+    from .generated.openapi_aclient.api.evaluators_api import EvaluatorsApi as AEvaluatorsApi
+    from .generated.openapi_client.api.evaluators_api import EvaluatorsApi
+    from .generated.openapi_client.models.evaluator_execution_request import EvaluatorExecutionRequest
+    from .generated.openapi_client.models.evaluator_execution_result import EvaluatorExecutionResult
+    from .skills import Evaluators
+else:
+    AEvaluatorsApi = LazyImport("scorable.generated.openapi_aclient.api.evaluators_api", "EvaluatorsApi")
+    EvaluatorsApi = LazyImport("scorable.generated.openapi_client.api.evaluators_api", "EvaluatorsApi")
+    EvaluatorExecutionRequest = LazyImport(
+        "scorable.generated.openapi_client.models.evaluator_execution_request", "EvaluatorExecutionRequest"
+    )
+
+
+@dataclass
+class SuiteResult:
+    """Results of the evaluators of a suite on one input, by evaluator name.
+
+    A failed evaluator has its exception in :attr:`errors` instead of a result.
+    """
+
+    results: Dict[str, EvaluatorExecutionResult] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+    #: Seconds from building the request until the last evaluator answered.
+    latency: float = 0.0
+
+    @property
+    def scores(self) -> Dict[str, Optional[float]]:
+        """Score of every evaluator, None for the failed ones."""
+        return {name: result.score for name, result in self.results.items()} | dict.fromkeys(self.errors)
+
+    def __getitem__(self, name: str) -> EvaluatorExecutionResult:
+        """The result of an evaluator, or its error raised."""
+        if name in self.errors:
+            raise self.errors[name]
+        return self.results[name]
+
+
+def _execution_request(arguments: Dict[str, Any]) -> EvaluatorExecutionRequest:
+    # Built once per input and sent to every evaluator of the suite.
+    # Versions belong to one evaluator, so the suite runs the latest version of each.
+    unknown = set(arguments) - (set(EvaluatorExecutionRequest.model_fields) - {"evaluator_version_id"})
+    if unknown:
+        raise TypeError(f"Unexpected arguments: {', '.join(sorted(unknown))}")
+    if not arguments.get("response") and not arguments.get("request") and not arguments.get("turns"):
+        raise ValueError("Either response, request, or turns must be provided")
+    file_ids = arguments.get("file_ids")
+    return EvaluatorExecutionRequest(**{**arguments, "file_ids": [str(f) for f in file_ids] if file_ids else None})
+
+
+class EvaluatorSuite:
+    """Evaluators run side by side on each input.
+
+    Create it with :meth:`scorable.skills.Evaluators.suite`.
+
+    Args:
+      evaluators: The evaluators API of the client to send requests with.
+      names: Evaluator IDs or preset names, which also name the results.
+      max_workers: Threads of the synchronous suite; one per evaluator by default.
+    """
+
+    def __init__(self, evaluators: Evaluators, names: Sequence[str], max_workers: Optional[int] = None):
+        from .skills import _evaluator_id
+
+        if not names:
+            raise ValueError("A suite needs at least one evaluator")
+        if len(set(names)) != len(names):
+            raise ValueError(f"Evaluators are in the suite more than once: {list(names)}")
+        self._evaluators = evaluators
+        self.names = list(names)
+        self.evaluator_ids = [_evaluator_id(name) for name in names]
+        self.max_workers = max_workers or len(names)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _send(
+        self, api_client: Any, evaluator_id: str, request: EvaluatorExecutionRequest, timeout: Optional[int]
+    ) -> EvaluatorExecutionResult:
+        return EvaluatorsApi(api_client).evaluators_execute_create(
+            id=evaluator_id, evaluator_execution_request=request, _request_timeout=timeout
+        )
+
+    async def _asend(
+        self, api_client: Any, evaluator_id: str, request: EvaluatorExecutionRequest, timeout: Optional[int]
+    ) -> EvaluatorExecutionResult:
+        return await AEvaluatorsApi(api_client).evaluators_execute_create(
+            id=evaluator_id, evaluator_execution_request=request, _request_timeout=timeout
+        )
+
+    def _result(self, outcomes: List[Union[EvaluatorExecutionResult, BaseException]], start: float) -> SuiteResult:
+        result = SuiteResult()
+        for name, outcome in zip(self.names, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                result.errors[name] = outcome
+            else:
+                result.results[name] = outcome
+        result.latency = time.perf_counter() - start
+        return result
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="scorable-suite")
+            return self._pool
+
+    def run(self, *, _request_timeout: Optional[int] = None, **arguments: Any) -> SuiteResult:
+        """
+        Run every evaluator of the suite on an input.
+
+        Args:
+          arguments: Keyword arguments of :meth:`scorable.skills.Evaluators.run` but ``evaluator_version_id``,
+            e.g. ``request``, ``response`` and ``contexts``.
+          _request_timeout: Optional timeout for each request.
+        """
+        context = self._evaluators.client_context()
+        assert isinstance(context, AbstractContextManager), "This method is not available in asynchronous mode"
+        start = time.perf_counter()
+        request = _execution_request(arguments)
+        with context as api_client:
+            pool = self._executor()
+            futures = [
+                queued(pool.submit(self._send, api_client, evaluator_id, request, _request_timeout), "evaluators.suite")
+                for evaluator_id in self.evaluator_ids
+            ]
+            outcomes = [future.exception() or future.result() for future in futures]
+        return self._result(outcomes, start)
+
+    async def arun(self, *, _request_timeout: Optional[int] = None, **arguments: Any) -> SuiteResult:
+        """
+        Asynchronously run every evaluator of the suite on an input.
+
+        See :meth:`run` for the parameters.
+        """
+        context = self._evaluators.client_context()
+        assert isinstance(context, AbstractAsyncContextManager), "This method is not available in synchronous mode"
+        start = time.perf_counter()
+        request = _execution_request(arguments)
+        async with context as api_client:
+            tasks = [
+                queued(
+                    asyncio.ensure_future(self._asend(api_client, evaluator_id, request, _request_timeout)),
+                    "evaluators.suite",
+                )
+                for evaluator_id in self.evaluator_ids
+            ]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        return self._result(list(outcomes), start)
+
+    def close(self) -> None:
+        """Shut down the threads of the synchronous suite."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
@@ -0,0 +1,90 @@
+"""OpenTelemetry spans and metrics for the SDK's own API calls.
+
+Install the OpenTelemetry API (``pip install scorable[otel]``) and pass the hook
+to the client; spans and metrics go to the globally configured providers unless
+others are given::
+
+  from scorable.telemetry import OpenTelemetryHook
+
+  client = Scorable(request_hooks=[OpenTelemetryHook()])
+
+Every call becomes a client span named after its operation id, with the HTTP
+method, URL, status, retries and request and response sizes, and the trace
+context is propagated in the request headers so that the server side of the
+call joins the caller's trace. The hook records the
+``http.client.request.duration`` histogram and the
+``http.client.active_requests`` counter of in-flight calls.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from .__about__ import __version__
+from .instrumentation import RequestTiming
+
+try:
+    from opentelemetry import metrics, propagate, trace
+except ImportError as e:  # pragma: no cover - exercised without the optional dependency
+    raise ImportError("scorable.telemetry requires the OpenTelemetry API: pip install scorable[otel]") from e
+
+
+class OpenTelemetryHook:
+    """Request hook that traces and measures API calls with OpenTelemetry.
+
+    Args:
+      tracer_provider: Provider of the tracer; the global one by default.
+      meter_provider: Provider of the meter; the global one by default.
+    """
+
+    def __init__(self, tracer_provider: Optional[Any] = None, meter_provider: Optional[Any] = None):
+        self._tracer = trace.get_tracer("scorable", __version__, tracer_provider)
+        meter = metrics.get_meter("scorable", __version__, meter_provider)
+        self._duration = meter.create_histogram(
+            "http.client.request.duration", unit="s", description="Duration of Scorable API calls"
+        )
+        self._active = meter.create_up_down_counter(
+            "http.client.active_requests", unit="{request}", description="Scorable API calls in flight"
+        )
+
+    @staticmethod
+    def _attributes(timing: RequestTiming) -> Dict[str, Any]:
+        return {
+            "scorable.operation_id": timing.operation_id or timing.resource_path,
+            "http.request.method": timing.method,
+        }
+
+    def start(self, timing: RequestTiming, headers: Dict[str, Any]) -> None:
+        attributes = self._attributes(timing)
+        span = self._tracer.start_span(
+            timing.operation_id or f"{timing.method} {timing.resource_path}",
+            kind=trace.SpanKind.CLIENT,
+            attributes={**attributes, "url.full": timing.url, "url.template": timing.resource_path},
+        )
+        propagate.inject(headers, context=trace.set_span_in_context(span))
+        self._active.add(1, attributes)
+        timing.context[self] = span
+
+    def __call__(self, timing: RequestTiming) -> None:
+        attributes = self._attributes(timing)
+        self._active.add(-1, attributes)
+        if timing.status is not None:
+            attributes["http.response.status_code"] = timing.status
+        if timing.error is not None:
+            attributes["error.type"] = type(timing.error).__name__
+        if timing.total is not None:
+            self._duration.record(timing.total, attributes)
+
+        span = timing.context.pop(self, None)
+        if span is None:
+            return
+        span.set_attributes(attributes)
+        span.set_attribute("http.request.resend_count", timing.retries)
+        if timing.request_bytes is not None:
+            span.set_attribute("http.request.body.size", timing.request_bytes)
+        if timing.response_bytes is not None:
+            span.set_attribute("http.response.body.size", timing.response_bytes)
+        if timing.error is not None:
+            span.record_exception(timing.error)
+            span.set_status(trace.Status(trace.StatusCode.ERROR, str(timing.error)))
+        span.end()
@@ -0,0 +1,275 @@
+"""Wrappers around the HTTP transport of the generated API clients.
+
+A :class:`TransportWrapper` sees every request a client sends before it reaches
+the connection pool. It may pass the request on, answer it itself, or change
+the response::
+
+  client = Scorable(transport_wrappers=[Cassette("tests/cassettes/evaluations.json")])
+
+Wrappers apply alike to the synchronous (urllib3), asynchronous (aiohttp) and
+background-loop transports. The first wrapper of the list is the outermost.
+Responses pass through the wrappers fully read, so with a wrapper the body is
+read before the call returns to the generated client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Sequence, Tuple, Type
+
+
+@dataclass
+class Request:
+    """An HTTP request, as the generated API client hands it to its REST client."""
+
+    method: str
+    url: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    #: JSON-serializable body, serialized by the REST client.
+    body: Any = None
+    #: Form fields; files are ``(name, (filename, content, content_type))``.
+    post_params: Any = None
+    timeout: Any = None
+
+
+class Headers(Dict[str, str]):
+    """Response headers, looked up regardless of case."""
+
+    def __init__(self, headers: Any = ()):
+        super().__init__((name.lower(), value) for name, value in dict(headers).items())
+
+    def __getitem__(self, name: str) -> str:
+        return super().__getitem__(name.lower())
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and super().__contains__(name.lower())
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return super().get(name.lower(), default)
+
+
+@dataclass
+class Response:
+    """A fully read HTTP response."""
+
+    status: int
+    reason: Optional[str]
+    data: bytes
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+    async def read(self) -> bytes:
+        # Read by the asynchronous RESTResponse; the synchronous one reads ``data``.
+        return self.data
+
+
+class TransportWrapper:
+    """Base class of transport wrappers; by default, requests are passed on unchanged.
+
+    Subclasses override :meth:`handle` for the synchronous transport and :meth:`ahandle`
+    for the asynchronous ones. A wrapper may be shared by several clients and threads.
+    """
+
+    def handle(self, request: Request, send: Callable[[Request], Response]) -> Response:
+        return send(request)
+
+    async def ahandle(self, request: Request, send: Callable[[Request], Awaitable[Response]]) -> Response:
+        return await send(request)
+
+
+class Retry(TransportWrapper):
+    """Retries requests rejected with a retryable status or failed by a connection error.
+
+    Waits grow exponentially with full jitter, or follow the ``Retry-After`` of the
+    response, at most ``max_backoff`` either way.
+
+    Args:
+      attempts: Requests sent at most, the first included.
+      statuses: Response statuses retried.
+      methods: HTTP methods retried, all by default. A request whose connection failed
+        after it was sent may have been executed, and is executed again.
+      backoff: Longest wait before the first retry, in seconds; doubled at every retry.
+      max_backoff: Longest wait, in seconds.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        statuses: Sequence[int] = (429, 502, 503, 504),
+        methods: Optional[Sequence[str]] = None,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self.attempts = attempts
+        self.statuses = frozenset(statuses)
+        self.methods = None if methods is None else frozenset(method.upper() for method in methods)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        #: Requests retried, and requests that failed on their last attempt.
+        self.retries = 0
+        self.exhausted = 0
+        self._lock = threading.Lock()
+
+    def __reduce__(self) -> Any:
+        return (Retry, (self.attempts, tuple(self.statuses), self.methods, self.backoff, self.max_backoff))
+
+    def _wait(self, request: Request, attempt: int, response: Optional[Response]) -> Optional[float]:
+        # Seconds to wait before retrying, None to return the outcome of this attempt.
+        retryable = response is None or response.status in self.statuses
+        if not retryable or (self.methods is not None and request.method.upper() not in self.methods):
+            return None
+        with self._lock:
+            if attempt == self.attempts:
+                self.exhausted += 1
+                return None
+            self.retries += 1
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after is not None and retry_after.replace(".", "", 1).isdigit():
+            return min(float(retry_after), self.max_backoff)
+        return random.uniform(0, min(self.backoff * 2 ** (attempt - 1), self.max_backoff))  # noqa: S311
+
+    def handle(self, request: Request, send: Callable[[Request], Response]) -> Response:
+        errors = _connection_errors()
+        for attempt in range(1, self.attempts + 1):
+            try:
+                response = send(request)
+            except errors:
+                wait = self._wait(request, attempt, None)
+                if wait is None:
+                    raise
+            else:
+                wait = self._wait(request, attempt, response)
+                if wait is None:
+                    return response
+            time.sleep(wait)
+        raise AssertionError("unreachable")
+
+    async def ahandle(self, request: Request, send: Callable[[Request], Awaitable[Response]]) -> Response:
+        errors = _async_connection_errors()
+        for attempt in range(1, self.attempts + 1):
+            try:
+                response = await send(request)
+            except errors:
+                wait = self._wait(request, attempt, None)
+                if wait is None:
+                    raise
+            else:
+                wait = self._wait(request, attempt, response)
+                if wait is None:
+                    return response
+            await asyncio.sleep(wait)
+        raise AssertionError("unreachable")
+
+
+@functools.lru_cache(maxsize=None)
+def _connection_errors() -> Tuple[Type[BaseException], ...]:
+    from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+    return (ProtocolError, NewConnectionError, MaxRetryError)
+
+
+@functools.lru_cache(maxsize=None)
+def _async_connection_errors() -> Tuple[Type[BaseException], ...]:
+    import aiohttp
+
+    return (aiohttp.ClientConnectionError,)
+
+
+def install(api_client: Any, wrappers: Sequence[TransportWrapper]) -> None:
+    """Route the requests of a generated ``ApiClient`` through ``wrappers``; does nothing without any."""
+    from .background import LoopRESTClient
+
+    if not wrappers or getattr(api_client, "_scorable_wrapped", False):
+        return
+    api_client._scorable_wrapped = True
+    rest_client = api_client.rest_client
+    if isinstance(rest_client, LoopRESTClient):
+        # Its requests run through the wrapped asynchronous client on the loop.
+        return
+    if inspect.iscoroutinefunction(rest_client.request):
+        api_client.rest_client = _AsyncWrappedRESTClient(rest_client, wrappers)
+    else:
+        api_client.rest_client = _WrappedRESTClient(rest_client, wrappers)
+
+
+class _WrappedRESTClient:
+    def __init__(self, rest_client: Any, wrappers: Sequence[TransportWrapper]):
+        self._rest_client = rest_client
+        send: Callable[[Request], Response] = self._send
+        for wrapper in reversed(wrappers):
+            send = functools.partial(wrapper.handle, send=send)
+        self._chain = send
+
+    def __getattr__(self, name: str) -> Any:
+        # pool_manager, close(), ... of the wrapped client.
+        return getattr(self._rest_client, name)
+
+    def _send(self, request: Request) -> Response:
+        response = self._rest_client.request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            body=request.body,
+            post_params=request.post_params,
+            _request_timeout=request.timeout,
+        )
+        return Response(response.status, response.reason, response.read(), response.getheaders())
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        body: Any = None,
+        post_params: Any = None,
+        _request_timeout: Any = None,
+    ) -> Any:
+        from .generated.openapi_client import rest
+
+        return rest.RESTResponse(
+            self._chain(Request(method, url, dict(headers or {}), body, post_params, _request_timeout))
+        )
+
+
+class _AsyncWrappedRESTClient:
+    def __init__(self, rest_client: Any, wrappers: Sequence[TransportWrapper]):
+        self._rest_client = rest_client
+        send: Callable[[Request], Awaitable[Response]] = self._send
+        for wrapper in reversed(wrappers):
+            send = functools.partial(wrapper.ahandle, send=send)
+        self._chain = send
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._rest_client, name)
+
+    async def _send(self, request: Request) -> Response:
+        response = await self._rest_client.request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            body=request.body,
+            post_params=request.post_params,
+            _request_timeout=request.timeout,
+        )
+        return Response(response.status, response.reason, await response.read(), response.getheaders())
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        body: Any = None,
+        post_params: Any = None,
+        _request_timeout: Any = None,
+    ) -> Any:
+        from .generated.openapi_aclient import rest
+
+        request = Request(method, url, dict(headers or {}), body, post_params, _request_timeout)
+        return rest.RESTResponse(await self._chain(request))
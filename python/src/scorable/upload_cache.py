@@ -0,0 +1,121 @@
+"""Content-addressed cache of uploaded files.
+
+:class:`UploadCache` maps the SHA-256 of a file's content to the ID the files
+endpoint returned for it, so :meth:`scorable.files.Files.upload` can skip the
+upload of content it has sent before::
+
+  client = Scorable(upload_cache=UploadCache("~/.cache/scorable/uploads.sqlite", ttl=30 * 24 * 3600))
+
+The cache is a SQLite database and can be shared by threads, processes and
+machines with a common file system. Set ``ttl`` to the server's file retention
+so that IDs of files the server may have deleted are not reused.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import mmap
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from typing import IO, Iterator, Optional, Union
+
+_CHUNK_SIZE = 1 << 20
+
+
+def content_digest(file: Union[str, os.PathLike, IO[bytes], bytes, bytearray, memoryview]) -> str:
+    """SHA-256 of a file's content, given its path, a binary file object or the content itself.
+
+    Files on disk are memory-mapped and hashed without being read into memory. A file
+    object is hashed from its current position, to which it is restored afterwards.
+    """
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(file).hexdigest()
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as f:
+            return _mapped_digest(f)
+    position = file.tell()
+    try:
+        if position == 0:
+            try:
+                return _mapped_digest(file)
+            except (OSError, ValueError, io.UnsupportedOperation):
+                # Not backed by a regular file (BytesIO, sockets, ...), hash it in chunks instead.
+                file.seek(position)
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: file.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+    finally:
+        file.seek(position)
+
+
+def _mapped_digest(file: IO[bytes]) -> str:
+    fileno = file.fileno()
+    if os.fstat(fileno).st_size == 0:
+        # Empty files cannot be mapped.
+        return hashlib.sha256().hexdigest()
+    with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+        return hashlib.sha256(mapped).hexdigest()
+
+
+class UploadCache:
+    """Persistent map from content digests to uploaded file IDs.
+
+    Args:
+      path: Database file; created if it does not exist.
+      ttl: Seconds after which a cached file ID is no longer used and the content is
+        uploaded again. None keeps entries forever.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], *, ttl: Optional[float] = None):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        with self._transaction() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS uploads ("
+                "digest TEXT PRIMARY KEY, file_id TEXT NOT NULL, uploaded_at REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _transaction(self, mode: str = "IMMEDIATE") -> Iterator[sqlite3.Connection]:
+        # Writers take the write lock up front; readers use a deferred transaction, which only
+        # waits for a writer that is committing.
+        db = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        try:
+            db.execute(f"BEGIN {mode}")
+            try:
+                yield db
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+        finally:
+            db.close()
+
+    def get(self, digest: str) -> Optional[uuid.UUID]:
+        """The file ID uploaded for ``digest``, or None if there is none or it has expired."""
+        with self._transaction("DEFERRED") as db:
+            row = db.execute("SELECT file_id, uploaded_at FROM uploads WHERE digest = ?", (digest,)).fetchone()
+        if row is None or (self.ttl is not None and row[1] + self.ttl < time.time()):
+            return None
+        return uuid.UUID(row[0])
+
+    def put(self, digest: str, file_id: uuid.UUID) -> None:
+        with self._transaction() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO uploads (digest, file_id, uploaded_at) VALUES (?, ?, ?)",
+                (digest, str(file_id), time.time()),
+            )
+
+    def discard(self, digest: str) -> None:
+        """Forget the upload of ``digest``, e.g. after the server reported its file as missing."""
+        with self._transaction() as db:
+            db.execute("DELETE FROM uploads WHERE digest = ?", (digest,))
+
+    def clear(self) -> None:
+        with self._transaction() as db:
+            db.execute("DELETE FROM uploads")
@@ -0,0 +1,112 @@
+"""Request bodies for file uploads on the asynchronous transport.
+
+Files on disk are memory-mapped and bytes-like sources are sent from a
+``memoryview``, so an upload is written to the socket chunk by chunk without
+copying the file into memory. Asynchronous byte iterators are sent as they are
+produced, with chunked transfer encoding. This module imports aiohttp and is
+only loaded by the asynchronous upload methods of :class:`scorable.files.Files`.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import IO, Any, AsyncIterable, AsyncIterator, Callable, Iterator, Optional, Union
+
+import aiohttp
+from aiohttp.abc import AbstractStreamWriter
+
+UploadSource = Union[str, "os.PathLike[str]", IO[bytes], bytes, bytearray, memoryview, AsyncIterable[bytes]]
+
+#: Called with the number of bytes sent so far and the total size, which is None for iterators.
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+_CHUNK_SIZE = 256 * 1024
+
+
+class _ViewPayload(aiohttp.BytesPayload):
+    # Writes a memoryview in chunks, reporting progress after each one.
+
+    def __init__(self, value: memoryview, progress: Optional[ProgressCallback], **kwargs: Any):
+        super().__init__(value, **kwargs)
+        self._view = value
+        self._progress = progress
+
+    async def write(self, writer: AbstractStreamWriter) -> None:
+        await self.write_with_length(writer, None)
+
+    async def write_with_length(self, writer: AbstractStreamWriter, content_length: Optional[int]) -> None:
+        view = self._view if content_length is None else self._view[:content_length]
+        for offset in range(0, len(view), _CHUNK_SIZE):
+            chunk = view[offset : offset + _CHUNK_SIZE]
+            await writer.write(chunk)
+            if self._progress is not None:
+                self._progress(offset + len(chunk), len(self._view))
+
+
+async def _iterate(
+    chunks: AsyncIterable[bytes], progress: Optional[ProgressCallback]
+) -> AsyncIterator[Union[bytes, bytearray, memoryview]]:
+    sent = 0
+    async for chunk in chunks:
+        yield chunk
+        sent += len(chunk)
+        if progress is not None:
+            progress(sent, None)
+
+
+def source_filename(source: UploadSource, filename: Optional[str]) -> str:
+    """The file name sent for ``source``: ``filename``, else the name of its path or file object."""
+    if filename:
+        return filename
+    if isinstance(source, (str, os.PathLike)):
+        return Path(source).name
+    return Path(str(getattr(source, "name", None) or "upload")).name
+
+
+def _file_view(file: IO[bytes], stack: ExitStack) -> Optional[memoryview]:
+    # A view of the rest of a file object: its buffer for BytesIO, a memory map for
+    # regular files read from the start, None for anything else.
+    if isinstance(file, io.BytesIO):
+        buffer = stack.enter_context(file.getbuffer())
+        return stack.enter_context(buffer[file.tell() :])
+    try:
+        if file.tell() != 0 or os.fstat(file.fileno()).st_size == 0:
+            return None
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, io.UnsupportedOperation):
+        return None
+    stack.callback(_close_map, mapped)
+    return stack.enter_context(memoryview(mapped))
+
+
+def _close_map(mapped: mmap.mmap) -> None:
+    try:
+        mapped.close()
+    except BufferError:
+        # A chunk is still referenced by the transport; the map is closed when it is collected.
+        pass
+
+
+@contextmanager
+def upload_body(
+    source: UploadSource, filename: str, content_type: str, progress: Optional[ProgressCallback] = None
+) -> Iterator[Any]:
+    """The value of the multipart ``file`` field for ``source``, valid until the context exits."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        yield _ViewPayload(memoryview(source).cast("B"), progress, filename=filename, content_type=content_type)
+        return
+    if hasattr(source, "__aiter__"):
+        yield _iterate(source, progress)  # type: ignore[arg-type]
+        return
+    with ExitStack() as stack:
+        if isinstance(source, (str, os.PathLike)):
+            file: IO[bytes] = stack.enter_context(open(source, "rb"))
+        else:
+            file = source
+        view = _file_view(file, stack)
+        # Empty files and unmappable streams are read by aiohttp itself.
+        yield file if view is None else _ViewPayload(view, progress, filename=filename, content_type=content_type)
@@ -1,5 +1,7 @@
+import importlib
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncContextManager,
     AsyncIterator,
@@ -16,14 +18,52 @@ from typing import (
 from pydantic import StrictStr
 from typing_extensions import TypeAlias
 
-from .generated import openapi_aclient, openapi_client
+if TYPE_CHECKING:
+    from .generated import openapi_aclient, openapi_client
 
 T = TypeVar("T")
 
 
-ClientContextCallable: TypeAlias = Union[
-    Callable[[], ContextManager[openapi_client.ApiClient]], Callable[[], AsyncContextManager[openapi_aclient.ApiClient]]
-]
+if TYPE_CHECKING:
+    ClientContextCallable: TypeAlias = Union[
+        Callable[[], ContextManager[openapi_client.ApiClient]],
+        Callable[[], AsyncContextManager[openapi_aclient.ApiClient]],
+    ]
+else:
+    # The precise alias would import both generated clients (and aiohttp) at runtime.
+    ClientContextCallable: TypeAlias = Callable[[], Any]
+
+
+class LazyImport:
+    """Stand-in for a class that is imported on first use.
+
+    The asynchronous API classes pull in aiohttp and the async client tree, and
+    the generated models take long to build, so sub-API modules bind them
+    through this instead of importing them up front; a process only pays for
+    the API classes and models it calls.
+    """
+
+    def __init__(self, module: str, name: str):
+        self._module = module
+        self._name = name
+        self._target: Any = None
+
+    def _resolve(self) -> Any:
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module), self._name)
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __instancecheck__(self, instance: Any) -> bool:
+        return isinstance(instance, self._resolve())
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._module}.{self._name}>"
 
 
 # This is internal generic class only to handle duck typing of the
@@ -0,0 +1,321 @@
+import json
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+
+class FakeScorableAPI(ThreadingHTTPServer):
+    """A small in-process stand-in for the parts of the Scorable API used by transport-level tests.
+
+    * ``GET /v1/projects/<id>/`` returns a project (404 for ``missing``).
+    * ``GET /v1/evaluators/<id>/`` returns an evaluator at version ``evaluator_versions[id]`` (default ``v1``).
+    * ``POST /v1/evaluators/execute/<id>/`` scores the response by its length, plus ``evaluator_offsets[id]``, at a
+      cost of ``evaluator_costs[id]``, after ``evaluator_delays[id]`` seconds (500 for ``failing``).
+    * ``GET /v1/datasets/<id>/items/`` pages through ``dataset_size`` synthetic items.
+    * ``POST /v1/files/`` stores the raw multipart upload (which may be chunked) and returns a new file ID after
+      ``upload_delay`` seconds.
+    * ``GET /v1/calibration-runs/<id>/`` reports a run as running until poll ``calibration_polls[id]`` (default 2),
+      then completed (failed for IDs starting with ``failing``); ``GET /v1/calibration-runs/<id>/items/`` pages
+      through ``calibration_size`` items.
+    * ``POST /v1/evaluators/calibrate/`` scores the ``dataset_range`` rows (``[start, end)``) of the test data, or of
+      ``calibration_size`` rows of a test dataset, like the items of calibration runs.
+    * ``POST /v1/judges/<id>/batch-execute/`` accepts a batch, which ``GET /v1/judges/batch-executions/<id>/``
+      reports as processing on the first poll; its items complete evenly over the following polls, and the batch
+      is completed at poll ``batch_polls`` (failed, with only the first half of its items, for judge IDs starting
+      with ``failing``).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, dataset_size: int = 25):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.dataset_size = dataset_size
+        self.evaluator_versions: dict = {}
+        self.evaluator_offsets: dict = {}
+        self.evaluator_costs: dict = {}
+        self.evaluator_delays: dict = {}
+        self.batches: dict = {}
+        self.batch_polls = 2
+        self.calibration_polls: dict = {}
+        self.calibration_size = 30
+        self.calibration_run_polls: Counter = Counter()
+        self.uploads: list = []
+        self.upload_delay = 0.0
+        self.calls: Counter = Counter()
+        self.bodies: list = []
+        self.request_headers: list = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def record(self, key: str, body: object = None) -> None:
+        with self.lock:
+            self.calls[key] += 1
+            if body is not None:
+                self.bodies.append(body)
+
+
+def _item(position: int) -> dict:
+    return {
+        "id": f"item-{position}",
+        "external_id": f"ext-{position}",
+        "version_id": f"version-{position}",
+        "is_latest_version": True,
+        "request": f"question {position}",
+        "response": "x" * (position % 10),
+        "is_archived": False,
+        "annotations": [],
+        "created_at": None,
+    }
+
+
+def _calibration_item(run_id: str, position: int) -> dict:
+    # Scores agree with the human values except on every fourth item.
+    score = (position % 10) / 10
+    return {
+        "id": f"{run_id}-item-{position}",
+        "annotation": None,
+        "dataset_item": f"item-{position}",
+        "execution_log": None,
+        "evaluator_score": score,
+        "human_value": round((score + 0.3) % 1, 1) if position % 4 == 0 else score,
+        "disagreement": None,
+        "status": "completed",
+        "justification": "",
+        "request": f"question {position}",
+        "response": "x" * (position % 10),
+        "created_at": None,
+    }
+
+
+def _calibration_output(row: int, model: str) -> dict:
+    item = _calibration_item("calibrate", row)
+    return {
+        "variables": {"response": item["response"]},
+        "row_number": row,
+        "result": {
+            "llm_output": "",
+            "model": model,
+            "execution_log_id": f"log-{row}",
+            "rendered_prompt": "",
+            "cost": None,
+            "expected_score": item["human_value"],
+            "score": item["evaluator_score"],
+        },
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: FakeScorableAPI
+
+    def _send(self, status: int, payload: object) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_upload(self) -> bytes:
+        if self.headers.get("Transfer-Encoding") != "chunked":
+            return self.rfile.read(int(self.headers["Content-Length"]))
+        upload = b""
+        while size := int(self.rfile.readline().split(b";")[0], 16):
+            upload += self.rfile.read(size)
+            self.rfile.readline()
+        self.rfile.readline()
+        return upload
+
+    def do_GET(self):  # noqa: N802
+        self.server.request_headers.append(dict(self.headers))
+        url = urlparse(self.path)
+        if match := re.fullmatch(r"/v1/projects/([^/]+)/", url.path):
+            self.server.record("projects_retrieve")
+            project_id = match.group(1)
+            if project_id == "missing":
+                return self._send(404, {"detail": "Not found."})
+            return self._send(
+                200,
+                {
+                    "id": project_id,
+                    "name": f"Project {project_id}",
+                    "created_at": None,
+                    "owner": self.headers["Authorization"],
+                },
+            )
+        if match := re.fullmatch(r"/v1/evaluators/([^/]+)/", url.path):
+            self.server.record("evaluators_retrieve")
+            evaluator_id = match.group(1)
+            return self._send(
+                200,
+                {
+                    "id": evaluator_id,
+                    "name": evaluator_id,
+                    "version_id": self.server.evaluator_versions.get(evaluator_id, "v1"),
+                    "created_at": "2025-01-01T00:00:00Z",
+                    "objective": None,
+                    "owner": {"email": "owner@example.com", "full_name": "Owner"},
+                    "visibility": "private",
+                    "updated_at": None,
+                    "updated_by": None,
+                    "_meta": None,
+                    "inputs": {},
+                    "scoring_criteria": "Is the response long?",
+                    "is_root_evaluator": False,
+                },
+            )
+        if match := re.fullmatch(r"/v1/judges/batch-executions/([^/]+)/", url.path):
+            self.server.record("judges_batch_executions_retrieve")
+            batch = self.server.batches.get(match.group(1))
+            if batch is None:
+                return self._send(404, {"detail": "Not found."})
+            batch["polls"] += 1
+            # Items finish evenly from the second poll on, the last ones at poll ``batch_polls``.
+            finished = len(batch["inputs"]) * (batch["polls"] - 1) // (self.server.batch_polls - 1)
+            items = [
+                {
+                    "index": index,
+                    "status": "completed" if (done := index < finished) else "pending",
+                    "input": {"request": i.get("request"), "response": i.get("response")},
+                    "evaluator_results": [{"score": len(i.get("response") or "") / 10}] if done else None,
+                    "error_message": "",
+                    "execution_log_id": f"log-{match.group(1)}-{index}" if done else None,
+                    "started_at": None,
+                    "completed_at": None,
+                }
+                for index, i in enumerate(batch["inputs"])
+            ]
+            status = "completed" if finished >= len(items) else "processing"
+            failed = 0
+            if status == "completed" and batch["judge_id"].startswith("failing"):
+                status, failed, items = "failed", len(items) - len(items) // 2, items[: len(items) // 2]
+            return self._send(
+                200,
+                {
+                    "batch_execution_id": match.group(1),
+                    "status": status,
+                    "total_count": len(batch["inputs"]),
+                    "completed_count": len(items) if failed else min(finished, len(items)),
+                    "failed_count": failed,
+                    "created_at": None,
+                    "started_at": None,
+                    "completed_at": None,
+                    "judge": {"id": batch["judge_id"], "name": "Judge", "version_id": "v1"},
+                    "project_id": None,
+                    "items": items,
+                },
+            )
+        if match := re.fullmatch(r"/v1/calibration-runs/([^/]+)/items/", url.path):
+            self.server.record("calibration_runs_items_list")
+            query = parse_qs(url.query)
+            start = int(query.get("cursor", ["0"])[0])
+            stop = min(start + int(query.get("page_size", ["100"])[0]), self.server.calibration_size)
+            return self._send(
+                200,
+                {
+                    "next": str(stop) if stop < self.server.calibration_size else None,
+                    "results": [_calibration_item(match.group(1), position) for position in range(start, stop)],
+                },
+            )
+        if match := re.fullmatch(r"/v1/calibration-runs/([^/]+)/", url.path):
+            run_id = match.group(1)
+            self.server.record("calibration_runs_retrieve")
+            with self.server.lock:
+                self.server.calibration_run_polls[run_id] += 1
+                done = self.server.calibration_run_polls[run_id] >= self.server.calibration_polls.get(run_id, 2)
+            status = ("failed" if run_id.startswith("failing") else "completed") if done else "running"
+            return self._send(
+                200,
+                {
+                    "id": run_id,
+                    "evaluator_external_id": "evaluator",
+                    "evaluator_version_id": "v1",
+                    "score_config": None,
+                    "source_type": "dataset",
+                    "dataset": "dataset",
+                    "status": status,
+                    "metrics": {"mae": 0.1} if status == "completed" else None,
+                    "n_examples": self.server.calibration_size if status == "completed" else 0,
+                    "n_skipped": 0,
+                    "error": "Evaluator failed" if status == "failed" else "",
+                    "created_at": None,
+                },
+            )
+        if re.fullmatch(r"/v1/datasets/([^/]+)/items/", url.path):
+            self.server.record("datasets_items_list")
+            query = parse_qs(url.query)
+            start = int(query.get("cursor", ["0"])[0])
+            stop = min(start + int(query.get("page_size", ["100"])[0]), self.server.dataset_size)
+            return self._send(
+                200,
+                {
+                    "next": str(stop) if stop < self.server.dataset_size else None,
+                    "results": [_item(position) for position in range(start, stop)],
+                },
+            )
+        return self._send(404, {"detail": "Not found."})
+
+    def do_POST(self):  # noqa: N802
+        self.server.request_headers.append(dict(self.headers))
+        url = urlparse(self.path)
+        if url.path == "/v1/files/":
+            upload = self._read_upload()
+            self.server.record("files_create")
+            with self.server.lock:
+                self.server.uploads.append(upload)
+            time.sleep(self.server.upload_delay)
+            return self._send(201, {"id": str(uuid.uuid4())})
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"null")
+        if match := re.fullmatch(r"/v1/evaluators/execute/([^/]+)/", url.path):
+            evaluator_id = match.group(1)
+            self.server.record("evaluators_execute_create", body)
+            time.sleep(self.server.evaluator_delays.get(evaluator_id, 0))
+            if evaluator_id == "failing":
+                return self._send(500, {"detail": "Evaluator failed."})
+            response = body.get("response") or ""
+            return self._send(
+                200,
+                {
+                    "evaluator_name": evaluator_id,
+                    "score": len(response) / 10 + self.server.evaluator_offsets.get(evaluator_id, 0),
+                    "cost": self.server.evaluator_costs.get(evaluator_id),
+                    "execution_log_id": f"log-{evaluator_id}-{len(response)}",
+                    "justification": f"{len(response)} characters",
+                    "confidence": None,
+                },
+            )
+        if url.path == "/v1/evaluators/calibrate/":
+            self.server.record("evaluators_calibrate_create", body)
+            size = len(body["test_data"]) if body.get("test_data") else self.server.calibration_size
+            dataset_range = body.get("dataset_range") or {}
+            start, end = dataset_range.get("start") or 0, min(dataset_range.get("end") or size, size)
+            return self._send(200, [_calibration_output(row, body["models"][0]) for row in range(start, end)])
+        if match := re.fullmatch(r"/v1/judges/([^/]+)/batch-execute/", url.path):
+            self.server.record("judges_batch_execute_create", body)
+            batch_id = f"batch-{len(self.server.batches)}"
+            self.server.batches[batch_id] = {"judge_id": match.group(1), "inputs": body["inputs"], "polls": 0}
+            return self._send(
+                202, {"batch_execution_id": batch_id, "status_url": f"/v1/judges/batch-executions/{batch_id}/"}
+            )
+        return self._send(404, {"detail": "Not found."})
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fake_api():
+    server = FakeScorableAPI()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from scorable.analysis import (
+    CalibrationArrays,
+    agreement,
+    confusion_matrix,
+    kappa,
+    pearson,
+    rank,
+    recommend_thresholds,
+    spearman,
+    threshold_curve,
+)
+from scorable.client import Scorable
+
+CATEGORIES = [i / 10 for i in range(10)]
+
+
+def _reference_kappa(x, y, categories, weights=None):
+    # The textbook formula, over a confusion matrix counted pair by pair.
+    k = len(categories)
+    observed = np.zeros((k, k))
+    for a, b in zip(x, y, strict=True):
+        observed[categories.index(a), categories.index(b)] += 1
+    expected = np.outer(observed.sum(axis=1), observed.sum(axis=0)) / observed.sum()
+    i, j = np.indices((k, k))
+    cost = {None: (i != j) * 1.0, "linear": abs(i - j) / (k - 1), "quadratic": ((i - j) / (k - 1)) ** 2}[weights]
+    return 1 - (cost * observed).sum() / (cost * expected).sum()
+
+
+def test_calibration_arrays__loads_the_items_of_a_run(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    arrays = CalibrationArrays.from_items(client.calibration_runs.list_items("run", limit=1000))
+
+    assert len(arrays) == fake_api.calibration_size
+    assert arrays.evaluator_scores.dtype == np.float64 and arrays.evaluator_scores.flags.c_contiguous
+    assert arrays.dataset_items[3] == "item-3"
+    assert np.isnan(arrays.disagreements).all() and arrays.scored.all()
+    assert list(arrays[arrays.evaluator_scores > 0.7].ids) == [f"run-item-{i}" for i in (8, 9, 18, 19, 28, 29)]
+
+
+@pytest.mark.asyncio
+async def test_calibration_arrays__loads_items_asynchronously(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+
+    arrays = await CalibrationArrays.afrom_items(client.calibration_runs.alist_items("run", limit=1000))
+
+    assert list(arrays.ids) == [f"run-item-{i}" for i in range(fake_api.calibration_size)]
+
+
+def test_metrics__match_reference_implementations():
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 10, 500) / 10
+    y = np.clip(x + rng.integers(-2, 3, 500) / 10, 0, 0.9).round(1)
+
+    assert pearson(x, y) == pytest.approx(np.corrcoef(x, y)[0, 1])
+    # Ties get the average of their ranks.
+    assert list(rank(np.array([0.5, 0.1, 0.5, 0.3]))[0]) == [3.5, 1.0, 3.5, 2.0]
+    stacked = np.stack([x, y])
+    assert spearman(stacked, stacked[::-1]) == pytest.approx([spearman(x, y)] * 2)
+    for weights in (None, "linear", "quadratic"):
+        assert kappa(x, y, CATEGORIES, weights) == pytest.approx(
+            _reference_kappa(list(x), list(y), CATEGORIES, weights)
+        )
+    matrix = confusion_matrix(x, y, CATEGORIES)
+    assert matrix.sum() == 500 and np.trace(matrix) == (x == y).sum()
+    with pytest.raises(ValueError, match="Unknown kappa weights"):
+        kappa(x, y, CATEGORIES, "cubic")  # type: ignore[arg-type]
+
+
+def test_agreement__reports_metrics_with_bootstrap_intervals(fake_api):
+    fake_api.calibration_size = 400
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    arrays = CalibrationArrays.from_items(client.calibration_runs.list_items("run", limit=1000))
+
+    report = agreement(arrays, categories=CATEGORIES, n_resamples=200, seed=1)
+
+    assert report.n == 400
+    # Every fourth item is off by 0.3 (or 0.7 when wrapping around).
+    assert report.mae.value == pytest.approx(np.abs(arrays.evaluator_scores - arrays.human_values).mean())
+    assert report.kappa is not None and report.kappa.value == pytest.approx(0.75 - 0.25 / 9, abs=0.01)
+    for estimate in (report.pearson, report.spearman, report.mae, report.kappa, report.weighted_kappa):
+        assert estimate is not None and estimate.low <= estimate.value <= estimate.high
+    assert report == agreement(arrays, categories=CATEGORIES, n_resamples=200, seed=1)
+    assert report.confusion is not None and np.trace(report.confusion) == 300
+
+    groups = arrays.group_by(["agree" if i % 4 else "disagree" for i in range(len(arrays))])
+    assert {label: len(group) for label, group in groups.items()} == {"agree": 300, "disagree": 100}
+    assert agreement(groups["agree"], n_resamples=0).mae.value == 0
+
+
+def test_threshold_curve__matches_a_sweep_of_every_threshold():
+    rng = np.random.default_rng(2)
+    scores = rng.integers(0, 50, 1000) / 50
+    labels = rng.random(1000) < scores
+
+    curve = threshold_curve(scores, labels)
+
+    assert curve.thresholds[0] == np.inf and curve.precision[0] == 1
+    for index in (1, 10, len(curve.thresholds) - 1):
+        passed = scores >= curve.thresholds[index]
+        assert curve.true_positives[index] == (passed & labels).sum()
+        assert curve.false_positives[index] == (passed & ~labels).sum()
+    f1 = [2 * (p & labels).sum() / (p.sum() + labels.sum()) for p in (scores[:, None] >= curve.thresholds).T]
+    assert curve.f1 == pytest.approx(f1)
+    best = curve.best()
+    assert best.f1 == max(f1) and best.threshold == curve.thresholds[int(np.argmax(f1))]
+    # The ROC AUC is the probability that a positive outscores a negative, ties counting half.
+    diff = scores[labels][:, None] - scores[~labels]
+    assert curve.roc_auc() == pytest.approx(((diff > 0) + (diff == 0) / 2).mean())
+    assert curve.best("cost", false_negative_cost=10).threshold < curve.best("cost", false_positive_cost=10).threshold
+    assert curve.best(min_precision=0.9).precision >= 0.9
+    with pytest.raises(ValueError, match="Unknown objective"):
+        curve.best("accuracy")  # type: ignore[arg-type]
+
+
+def test_recommend_thresholds__per_score_config(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    arrays = CalibrationArrays.from_items(client.calibration_runs.list_items("run", limit=1000))
+
+    recommended = recommend_thresholds({"binary": arrays, "strict": arrays}, passing=0.5, min_precision=1.0)
+
+    assert set(recommended) == {"binary", "strict"}
+    assert recommended["strict"].precision == 1.0
+    assert recommended["strict"].false_positives == 0
@@ -0,0 +1,96 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from scorable.client import Scorable
+from scorable.generated.openapi_aclient.exceptions import NotFoundException as ANotFoundException
+from scorable.generated.openapi_client.exceptions import NotFoundException
+
+
+@pytest.fixture
+def base_url(fake_api):
+    return fake_api.url
+
+
+@pytest.fixture
+def client(base_url):
+    client = Scorable(api_key="fake", base_url=base_url, background_loop=True)
+    yield client
+    client.close()
+
+
+def test_background_loop__sync_methods_share_one_async_client(client):
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        projects = list(pool.map(client.projects.retrieve, [str(i) for i in range(32)]))
+
+    assert [p.id for p in projects] == [str(i) for i in range(32)]
+    assert projects[0].owner == "Api-Key fake"
+    background = client._background
+    assert background is not None
+    assert background._sync_client is client.get_client_context().__enter__()
+
+
+def test_background_loop__submit_returns_futures(client):
+    futures = [client.submit(client.projects.aretrieve, str(i)) for i in range(16)]
+
+    assert all(isinstance(f, Future) for f in futures)
+    assert [f.result(timeout=10).name for f in futures] == [f"Project {i}" for i in range(16)]
+
+
+def test_background_loop__errors_are_raised_in_the_caller(client):
+    with pytest.raises(NotFoundException):
+        client.projects.retrieve("missing")
+    with pytest.raises(ANotFoundException):
+        client.submit(client.projects.aretrieve, "missing").result(timeout=10)
+
+
+def test_background_loop__async_methods_must_be_submitted(client):
+    with pytest.raises(RuntimeError, match="Scorable.submit"):
+        asyncio.run(client.projects.aretrieve("1"))
+
+
+def test_background_loop__submit_rejects_sync_methods(client):
+    with pytest.raises(TypeError):
+        client.submit(client.projects.retrieve, "1")
+
+
+def test_background_loop__argument_validation():
+    with pytest.raises(ValueError):
+        Scorable(api_key="fake", run_async=True, background_loop=True)
+    with pytest.raises(ValueError):
+        Scorable(api_key="fake").submit(lambda: None)
+
+
+def test_background_loop__close_stops_the_loop(base_url):
+    client = Scorable(api_key="fake", base_url=base_url, background_loop=True)
+    client.projects.retrieve("1")
+    loop = client._background._loop
+    client.close()
+
+    assert loop is not None and loop.loop.is_closed()
+    # The transport is rebuilt lazily if the client is used again.
+    assert client.projects.retrieve("2").id == "2"
+    client.close()
+
+
+def _retrieve_in_child(client, queue):
+    queue.put(client.projects.retrieve("child").id)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_background_loop__is_rebuilt_in_forked_child(client):
+    assert client.projects.retrieve("parent").id == "parent"
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+
+    process = context.Process(target=_retrieve_in_child, args=(client, queue))
+    process.start()
+    process.join(timeout=30)
+
+    assert process.exitcode == 0
+    assert queue.get(timeout=1) == "child"
+    # The parent's loop and pool are unaffected.
+    assert client.projects.retrieve("parent").id == "parent"
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+import requests
+
+from benchmarks.server import FakeServerConfig, Latency, run_in_thread
+from benchmarks.stress import StressConfig, run_stress
+from benchmarks.suite import SCENARIOS, SuiteConfig, compare, run_suite
+from scorable.client import Scorable
+from scorable.generated.openapi_client.exceptions import ServiceException
+
+ID = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+
+
+def _stats(url):
+    return requests.get(f"{url}/_fake/stats", timeout=10).json()
+
+
+def test_spec_server__responses_deserialize_into_sdk_models():
+    with run_in_thread(FakeServerConfig(collection_size=250)) as url:
+        client = Scorable(api_key="fake", base_url=url)
+
+        assert client.evaluators.run(ID, response="abc").score == 0.5
+        assert client.judges.run(ID, response="abc").evaluator_results
+        assert client.evaluators.get(ID).id == ID
+        assert len(list(client.datasets.list_items(ID, limit=1000))) == 250
+        assert len(client.datasets.add_items(ID, [{"request": "q", "response": "a"}] * 7)) == 7
+        assert client.files.upload(b"%PDF-1.4", "doc.pdf")
+
+        assert _stats(url)["calls"]["datasets_items_list"] == 3
+
+
+def test_spec_server__injects_errors_and_latency():
+    config = FakeServerConfig(
+        operation_error_rate={"evaluators_execute_create": 1.0},
+        operation_latency={"projects_retrieve": Latency.parse("uniform:0.05,0.06")},
+    )
+    with run_in_thread(config) as url:
+        timings = []
+        client = Scorable(api_key="fake", base_url=url, request_hooks=[timings.append])
+
+        with pytest.raises(ServiceException):
+            client.evaluators.run(ID, response="abc")
+        client.projects.retrieve(ID)
+
+        assert _stats(url)["errors"] == {"evaluators_execute_create": 1}
+        assert timings[-1].ttfb >= 0.05
+
+
+def test_latency__parses_distributions():
+    assert Latency.parse("0.01") == Latency("constant", (0.01,))
+    assert str(Latency.parse("lognormal:0.05,0.5")) == "lognormal:0.05,0.5"
+    with pytest.raises(ValueError):
+        Latency.parse("gamma:1")
+
+
+def test_run_suite__writes_comparable_results():
+    config = SuiteConfig.quick(
+        requests=10, collection_size=120, ingest_items=1500, uploads=3, upload_size=1024, in_process=True
+    )
+    scenarios = [name for name in SCENARIOS if name != "import_time"]
+
+    results = json.loads(json.dumps(run_suite(config, scenarios)))
+
+    assert list(results["results"]) == scenarios
+    assert results["config"]["server"]["latency"] == "constant:0.0"
+    assert results["results"]["paginate_sync"]["details"]["count"] == 120
+    assert results["results"]["ingest_async"]["details"]["errors"] == 0
+    assert all(result["value"] > 0 for result in results["results"].values())
+
+    slower = json.loads(json.dumps(results))
+    slower["results"]["run_sync"]["value"] /= 2
+    [regression] = [change for change in compare(results, slower) if change["regression"]]
+    assert regression["scenario"] == "run_sync"
+
+
+def test_run_stress__reports_retries_and_injected_faults():
+    profile = {"endpoints": {"POST /v1/evaluators/*": {"error_rate": 0.3, "statuses": [503]}}, "seed": 1}
+    config = StressConfig(requests=40, concurrency=4, profile=profile, attempts=1, in_process=True)
+
+    report = json.loads(json.dumps(run_stress(config)))
+
+    assert report["failed"] == {"ServiceException": report["injected"]["error"]}
+    assert report["succeeded"] == 40 - report["injected"]["error"]
+    assert report["retries"] == 0
+
+    report = run_stress(
+        StressConfig(requests=40, concurrency=4, profile=profile, attempts=10, backoff=0, in_process=True)
+    )
+    assert (report["succeeded"], report["retries"]) == (40, report["injected"]["error"])
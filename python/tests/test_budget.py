@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from scorable.budget import Budgeted, LatencyProfiles
+from scorable.client import Scorable
+from scorable.generated.openapi_client.models.execution_log_details_evaluator_latencies_inner import (
+    ExecutionLogDetailsEvaluatorLatenciesInner as EvaluatorLatency,
+)
+from scorable.skills import Evaluators
+
+
+def test_budget_scheduler__returns_what_finished_in_time(fake_api):
+    fake_api.evaluator_delays = {"slow": 1.0, "medium": 0.3}
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    scheduler = client.evaluators.budget_scheduler()
+
+    outcome = scheduler.run(
+        ["fast", Budgeted("slow", default=1.0), Budgeted("medium", timeout=0.1)], budget=0.5, response="xx"
+    )
+
+    assert outcome.scores == {"fast": 0.2, "slow": 1.0, "medium": None}
+    assert set(outcome.results) == {"fast"}
+    assert sorted(outcome.timed_out) == ["medium", "slow"]
+    assert 0.5 <= outcome.elapsed < 0.9
+    # The stragglers of the last run hold threads of their own.
+    assert set(scheduler.run(["fast"], budget=0.3, response="x").results) == {"fast"}
+
+
+def test_budget_scheduler__launches_the_variants_that_fit(fake_api):
+    profiles = LatencyProfiles(quantile=0.9)
+    for seconds in (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0):
+        profiles.record("Faithfulness", seconds)
+    profiles.learn_from_log(MagicMock(evaluator_latencies=[EvaluatorLatency(evaluator_name="Toxicity", duration=2.0)]))
+    assert profiles.estimate("Faithfulness") == 0.9 and profiles.estimate("unknown") is None
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    scheduler = client.evaluators.budget_scheduler(profiles)
+
+    outcome = scheduler.run(
+        [Budgeted("Faithfulness", variants=["Faithfulness_Swift"]), Budgeted("Toxicity", default=0.0)],
+        budget=0.5,
+        response="x",
+    )
+
+    assert outcome.launched == {"Faithfulness": "Faithfulness_Swift"}
+    assert outcome.skipped == ["Toxicity"] and outcome.scores == {"Faithfulness": 0.1, "Toxicity": 0.0}
+    assert fake_api.calls["evaluators_execute_create"] == 1
+    assert profiles.estimate("Faithfulness_Swift") is not None
+    with pytest.raises(ValueError, match="more than once"):
+        scheduler.run(["a", "a"], budget=1.0, response="x")
+
+
+def test_latency_profiles__key_evaluators_by_id():
+    profiles = LatencyProfiles()
+    profiles.learn_from_log(
+        MagicMock(
+            evaluator_latencies=[
+                EvaluatorLatency(evaluator_name="Faithfulness", duration=2.0),
+                EvaluatorLatency(evaluator_name="My judge", duration=3.0),
+            ]
+        ),
+        ids={"My judge": "custom-id"},
+    )
+    profiles.record(Evaluators.Eval.Politeness.value, 1.0)
+
+    assert profiles.estimate(Evaluators.Eval.Faithfulness.value) == 2.0
+    assert profiles.estimate("custom-id") == 3.0 and profiles.estimate("My judge") is None
+    assert profiles.estimate("Politeness") == 1.0
+
+
+@pytest.mark.asyncio
+async def test_budget_scheduler__cancels_stragglers(fake_api):
+    fake_api.evaluator_delays = {"slow": 2.0}
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+    scheduler = client.evaluators.budget_scheduler()
+
+    outcome = await scheduler.arun(["fast", "slow", "failing"], budget=0.3, response="x")
+
+    assert set(outcome.results) == {"fast"} and outcome.timed_out == ["slow"]
+    assert set(outcome.failed) == {"failing"}
+    assert outcome.elapsed < 1.0
+    # The cancelled call taught the profile that "slow" takes at least the budget.
+    assert scheduler.profiles.estimate("slow") >= 0.3
+    outcome = await scheduler.arun([Budgeted("slow", variants=["fast"])], budget=0.3, response="x")
+    assert outcome.launched == {"slow": "fast"}
@@ -69,3 +69,46 @@ async def test_acreate_calibration_run__builds_dataset_source(mock_api):
     assert result.id == "run-async"
     request = instance.calibration_runs_create.call_args.kwargs["calibration_run_create_request"]
     assert request.source.dataset_id == "ds1"
+
+
+def test_wait_runs__yields_runs_as_they_finish(fake_api):
+    fake_api.calibration_polls.update({"slow": 4, "fast": 2, "failing-run": 3})
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    finished = list(
+        client.calibration_runs.wait_runs(["slow", "fast", "failing-run"], poll_interval=0, with_items=True)
+    )
+
+    assert [(f.run.id, f.run.status) for f in finished] == [
+        ("fast", "completed"),
+        ("failing-run", "failed"),
+        ("slow", "completed"),
+    ]
+    assert [len(f.items) if f.items is not None else None for f in finished] == [30, None, 30]
+    # Items are fetched only for completed runs, and each run is polled until it finishes.
+    assert fake_api.calls["calibration_runs_items_list"] == 2
+    assert fake_api.calls["calibration_runs_retrieve"] == 4 + 2 + 3
+
+
+def test_wait_runs__raises_at_the_deadline(fake_api):
+    fake_api.calibration_polls.update({"stuck": 10_000})
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    waiting = client.calibration_runs.wait_runs(["done", "stuck"], timeout=0.3, poll_interval=0.01)
+
+    assert next(waiting).run.id == "done"
+    with pytest.raises(TimeoutError, match="1 of 2 still pending after 0.3 seconds: stuck"):
+        next(waiting)
+    # Backoff keeps the number of polls of the stuck run logarithmic in the wait.
+    assert fake_api.calibration_run_polls["stuck"] < 10
+
+
+@pytest.mark.asyncio
+async def test_await_runs__yields_runs_as_they_finish(fake_api):
+    fake_api.calibration_polls.update({"slow": 3})
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+
+    finished = [f async for f in client.calibration_runs.await_runs(["slow", "fast"], poll_interval=0, with_items=True)]
+
+    assert [f.run.id for f in finished] == ["fast", "slow"]
+    assert [len(f.items) for f in finished] == [30, 30]
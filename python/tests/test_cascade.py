@@ -0,0 +1,55 @@
+import pytest
+
+from scorable.cascade import Band
+from scorable.client import Scorable
+from scorable.generated.openapi_client.exceptions import ServiceException
+from scorable.skills import Evaluators
+
+
+def test_cascade__escalates_only_uncertain_scores(fake_api):
+    fake_api.evaluator_costs = {"fast": 1.0, "slow": 10.0}
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    cascade = client.evaluators.cascade("fast", "slow", bands=[Band(0.3, 0.7)])
+
+    results = [cascade.run(response="x" * n) for n in range(1, 10)]
+
+    assert [result.escalated for result in results] == [False, False, True, True, True, True, True, False, False]
+    assert [result.evaluator_id for result in results[1:3]] == ["fast", "slow"]
+    assert [len(result.results) for result in results[1:3]] == [1, 2]
+    report = cascade.report
+    assert (report.runs, report.reached) == (9, [9, 5])
+    assert report.escalation_rate == pytest.approx(5 / 9)
+    # Always running "slow" would have cost 9 * 10; the cascade cost 9 * 1 + 5 * 10.
+    assert report.cost_saved == pytest.approx(31.0)
+    assert fake_api.calls["evaluators_execute_create"] == 14
+
+
+def test_cascade__escalates_failures_and_low_confidence(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    cascade = client.evaluators.cascade("failing", "slow")
+    assert cascade.run(response="x").stage == 1
+    assert cascade.report.errors == 1
+    with pytest.raises(ServiceException):
+        client.evaluators.cascade("fast", "failing").run(response="xxxxx")
+
+    # The fake API reports no confidence, which a confidence threshold does not trust.
+    cascade = client.evaluators.cascade("fast", "slow", bands=[Band(0.4, 0.6, min_confidence=0.9)])
+    assert cascade.run(response="x").escalated
+    assert client.evaluators.cascade("Faithfulness_Swift", "Faithfulness").stages == [
+        Evaluators.Eval.Faithfulness_Swift.value,
+        Evaluators.Eval.Faithfulness.value,
+    ]
+    with pytest.raises(ValueError, match="a band for each"):
+        client.evaluators.cascade("fast", "medium", "slow", bands=[Band()])
+
+
+@pytest.mark.asyncio
+async def test_cascade__runs_asynchronously(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+    cascade = client.evaluators.cascade("fast", "medium", "slow", bands=[Band(0.0, 0.5), Band(0.0, 0.3)])
+
+    results = [await cascade.arun(response="x" * n) for n in (1, 4, 8)]
+
+    assert [result.stage for result in results] == [2, 1, 0]
+    assert cascade.report.reached == [3, 2, 1]
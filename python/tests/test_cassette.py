@@ -0,0 +1,104 @@
+import pickle
+
+import pytest
+
+from scorable.cassette import Cassette
+from scorable.client import Scorable
+from scorable.generated.openapi_client.exceptions import ServiceException
+
+#: Nothing listens here, so replayed clients fail if they reach the network.
+OFFLINE = "http://127.0.0.1:9"
+
+
+def test_cassette__replays_recorded_calls_offline(fake_api, tmp_path):
+    path = tmp_path / "cassette.json"
+    with Cassette(path) as cassette:
+        client = Scorable(api_key="fake", base_url=fake_api.url, transport_wrappers=[cassette])
+        recorded = [client.evaluators.run("relevance", response=text) for text in ("a", "abc")]
+        with pytest.raises(ServiceException):
+            client.evaluators.run("failing", response="abc")
+    assert cassette.recording and path.exists()
+
+    replay = Cassette(path)
+    client = Scorable(api_key="fake", base_url=OFFLINE, transport_wrappers=[replay])
+
+    assert [client.evaluators.run("relevance", response=text) for text in ("a", "abc")] == recorded
+    with pytest.raises(ServiceException):
+        client.evaluators.run("failing", response="abc")
+    assert (replay.hits, replay.misses) == (3, 0)
+    assert fake_api.calls["evaluators_execute_create"] == 3
+
+
+def test_cassette__strict_mode_fails_on_misses(fake_api, tmp_path):
+    path = tmp_path / "cassette.json"
+    with Cassette(path) as cassette:
+        Scorable(api_key="fake", base_url=fake_api.url, transport_wrappers=[cassette]).evaluators.run(
+            "relevance", response="a"
+        )
+
+    client = Scorable(api_key="fake", base_url=OFFLINE, transport_wrappers=[Cassette(path)])
+    with pytest.raises(LookupError, match="No recorded response for POST"):
+        client.evaluators.run("relevance", response="not recorded")
+
+    # Without strict mode, misses are sent and added to the cassette.
+    with Cassette(path, strict=False) as cassette:
+        client = Scorable(api_key="fake", base_url=fake_api.url, transport_wrappers=[cassette])
+        assert client.evaluators.run("relevance", response="new").score == 0.3
+    client = Scorable(api_key="fake", base_url=OFFLINE, transport_wrappers=[Cassette(path)])
+    assert client.evaluators.run("relevance", response="new").score == 0.3
+    assert client.evaluators.run("relevance", response="a").score == 0.1
+
+
+def test_cassette__ignored_fields_do_not_affect_matching(fake_api, tmp_path):
+    path = tmp_path / "cassette.json"
+    with Cassette(path, ignore=["tags"]) as cassette:
+        client = Scorable(api_key="fake", base_url=fake_api.url, transport_wrappers=[cassette])
+        client.evaluators.run("relevance", response="abc", tags=["run-1"])
+
+    client = Scorable(api_key="fake", base_url=OFFLINE, transport_wrappers=[Cassette(path, ignore=["tags"])])
+    assert client.evaluators.run("relevance", response="abc", tags=["run-2"]).score == 0.3
+
+
+def test_cassette__replays_repeated_requests_in_order(fake_api, tmp_path):
+    path = tmp_path / "cassette.json.gz"
+    inputs = [{"response": "a"}, {"response": "bb"}]
+    with Cassette(path) as cassette:
+        client = Scorable(api_key="fake", base_url=fake_api.url, transport_wrappers=[cassette])
+        recorded = client.judges.run_batch("judge", inputs, poll_interval=0)
+    assert fake_api.calls["judges_batch_executions_retrieve"] == 2
+
+    replay = Cassette(path)
+    client = Scorable(api_key="fake", base_url=OFFLINE, transport_wrappers=[replay])
+    assert client.judges.run_batch("judge", inputs, poll_interval=0).results == recorded.results
+    assert replay.hits == 3
+
+
+@pytest.mark.asyncio
+async def test_cassette__records_and_replays_async_calls(fake_api, tmp_path):
+    path = tmp_path / "cassette.json"
+    with Cassette(path) as cassette:
+        client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True, transport_wrappers=[cassette])
+        recorded = await client.evaluators.arun("relevance", response="abcd")
+        items = [item async for item in client.datasets.alist_items("dataset", limit=30)]
+
+    client = Scorable(api_key="fake", base_url=OFFLINE, run_async=True, transport_wrappers=[Cassette(path)])
+    assert await client.evaluators.arun("relevance", response="abcd") == recorded
+    assert [item async for item in client.datasets.alist_items("dataset", limit=30)] == items
+
+
+def test_cassette__replays_on_background_loop_and_after_pickling(fake_api, tmp_path):
+    path = tmp_path / "cassette.json"
+    with Cassette(path) as cassette:
+        Scorable(api_key="fake", base_url=fake_api.url, transport_wrappers=[cassette]).evaluators.run(
+            "relevance", response="abc"
+        )
+        with pytest.raises(TypeError, match="recording"):
+            pickle.dumps(cassette)
+
+    client = Scorable(api_key="fake", base_url=OFFLINE, background_loop=True, transport_wrappers=[Cassette(path)])
+    try:
+        assert client.evaluators.run("relevance", response="abc").score == 0.3
+    finally:
+        client.close()
+    clone = pickle.loads(pickle.dumps(Scorable(api_key="fake", base_url=OFFLINE, transport_wrappers=[Cassette(path)])))  # noqa: S301
+    assert clone.evaluators.run("relevance", response="abc").score == 0.3
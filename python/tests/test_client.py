@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from scorable.client import Scorable
@@ -10,3 +12,31 @@ async def test_throws_exception_when_sync_methods_used_with_async_client__fails(
 
         aclient.evaluators.get_by_name("Whoops, this is a sync method")
     assert str(e.value) == "This method is not available in asynchronous mode"
+
+
+def test_client_pickles_to_its_configuration():
+    client = Scorable(api_key="fake", base_url="https://example.invalid", background_loop=True)
+    assert client.evaluators is not None
+
+    clone = pickle.loads(pickle.dumps(client))  # noqa: S301
+
+    assert (clone.api_key, clone.base_url, clone.run_async, clone.background_loop) == (
+        "fake",
+        "https://example.invalid",
+        False,
+        True,
+    )
+    assert "evaluators" not in vars(clone)
+    assert clone._background is not client._background
+    assert clone.projects.client_context is not None
+    client.close()
+    clone.close()
+
+
+def test_client_with_explicit_api_client_does_not_pickle():
+    from scorable.generated import openapi_client
+
+    client = Scorable(api_key="fake", _api_client=openapi_client.ApiClient())
+
+    with pytest.raises(TypeError):
+        pickle.dumps(client)
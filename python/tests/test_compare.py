@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from scorable.client import Scorable
+from scorable.compare import Variant
+from scorable.skills import Evaluators
+
+
+def test_compare__pairs_the_scores_of_every_variant(fake_api):
+    fake_api.evaluator_offsets = {"shifted": 0.1}
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    inputs = [{"response": "x" * n} for n in (1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 2, 3)]
+    cache: dict = {}
+
+    comparison = client.compare(["base", "shifted", "failing"], inputs, cache=cache, seed=0)
+
+    assert comparison.keys == [str(i) for i in range(12)]
+    assert comparison.scores["base"][:3] == pytest.approx([0.1, 0.2, 0.3])
+    assert np.isnan(comparison.scores["failing"]).all()
+    assert comparison.errors["failing"][0].startswith("ServiceException")
+    assert (comparison.latencies["base"] > 0).all() and np.isnan(comparison.costs["base"]).all()
+    # Each distinct input is run once per variant.
+    assert fake_api.calls["evaluators_execute_create"] == 3 * 9
+    assert comparison.reports["base"].duplicates == 3
+
+    [base_vs_shifted, base_vs_failing, _] = comparison.tests
+    assert (base_vs_shifted.a, base_vs_shifted.b, base_vs_shifted.n) == ("base", "shifted", 12)
+    assert base_vs_shifted.mean_difference.value == pytest.approx(-0.1)
+    assert (base_vs_shifted.wins, base_vs_shifted.losses, base_vs_shifted.ties) == (0, 12, 0)
+    assert base_vs_shifted.p_value < 0.01 and base_vs_shifted.wilcoxon_p_value < 0.01
+    assert base_vs_shifted.pearson == pytest.approx(1.0)
+    assert base_vs_failing.n == 0
+    assert comparison.summary()["shifted"]["mean_score"] == pytest.approx(np.mean(comparison.scores["base"]) + 0.1)
+
+    # Known pairs come from the cache: only the new variant runs.
+    again = client.compare(["base", "other"], inputs, cache=cache, seed=0)
+    assert again.cached == 9
+    assert fake_api.calls["evaluators_execute_create"] == 3 * 9 + 9
+    assert again.tests[0].p_value == 1.0 and again.tests[0].ties == 12
+
+
+@pytest.mark.asyncio
+async def test_acompare__reads_a_dataset(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+
+    comparison = await client.acompare(["base", ("base", "v2")], "dataset", n_resamples=100)
+
+    assert comparison.variants == ["base", "base@v2"]
+    assert comparison.keys[:2] == ["item-0", "item-1"] and len(comparison.keys) == fake_api.dataset_size
+    versions = {body.get("evaluator_version_id") for body in fake_api.bodies if "response" in body}
+    assert versions == {None, "v2"}
+
+
+def test_compare__resolves_presets_and_rejects_single_variants():
+    assert Variant.parse("Faithfulness").evaluator_id == Evaluators.Eval.Faithfulness.value
+    assert Variant.parse(("ev1", "v3")) == Variant("ev1", "v3", "ev1@v3")
+    client = Scorable(api_key="fake")
+    with pytest.raises(ValueError, match="At least two"):
+        client.compare(["base"], [{"response": "x"}])
+    with pytest.raises(ValueError, match="more than once"):
+        client.compare(["base", "base"], [{"response": "x"}])
+
+
+def test_compare__dispatches_by_the_mode_of_the_client(fake_api):
+    inputs = [{"response": "x" * (i + 1)} for i in range(12)]
+    client = Scorable(api_key="fake", base_url=fake_api.url, background_loop=True)
+    try:
+        comparison = client.compare(["base", "other"], inputs, n_resamples=10)
+    finally:
+        client.close()
+    assert len(comparison.keys) == 12
+
+    def bounded():
+        for i, arguments in enumerate(inputs):
+            # Two variants per input, at most four evaluations in flight.
+            assert fake_api.calls["evaluators_execute_create"] >= 24 + 2 * i - 4
+            yield arguments
+
+    comparison = Scorable(api_key="fake", base_url=fake_api.url).compare(
+        ["base", "other"], bounded(), concurrency=4, n_resamples=10
+    )
+    assert comparison.scores["base"].tolist() == [(i + 1) / 10 for i in range(12)]
+    with pytest.raises(AssertionError, match="asynchronous mode"):
+        Scorable(api_key="fake", base_url=fake_api.url, run_async=True).compare(["base", "other"], inputs)
+
+
+@pytest.mark.asyncio
+async def test_compare__explains_running_inside_an_event_loop(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    with pytest.raises(RuntimeError, match="use acompare"):
+        client.compare(["base", "other"], [{"response": "x"}])
@@ -0,0 +1,139 @@
+import pytest
+
+from scorable.client import Scorable
+from scorable.dedup import Deduplicator, input_key
+from scorable.generated.openapi_client.exceptions import ServiceException
+from scorable.generated.openapi_client.models.message_turn_request import MessageTurnRequest
+
+
+def _inputs():
+    # 12 inputs, 4 of them distinct.
+    return [{"request": "q", "response": "x" * (i % 4 + 1), "contexts": ["a", "b"]} for i in range(12)]
+
+
+def test_input_key__is_canonical():
+    assert input_key({"request": "q", "response": "r"}) == input_key({"response": "r", "request": "q", "tags": None})
+    assert input_key({"contexts": ["a", "b"]}) != input_key({"contexts": ["b", "a"]})
+    turns = [MessageTurnRequest(role="user", content="hi")]
+    assert input_key({"turns": turns}) == input_key({"turns": [MessageTurnRequest(role="user", content="hi")]})
+
+
+def test_deduplicator__forgets_inputs_outside_the_window():
+    dedup = Deduplicator(window=2)
+    started = []
+
+    for response in ["a", "b", "a", "c", "b", "a"]:
+        dedup.submit({"response": response}, lambda response=response: started.append(response) or response)
+
+    # "b" was evicted by "c" before it came back; "a" was refreshed and stayed.
+    assert started == ["a", "b", "c", "b", "a"]
+    assert (dedup.report.total, dedup.report.unique, dedup.report.duplicates) == (6, 5, 1)
+
+
+def test_run_many__sends_each_distinct_input_once(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    batch = client.evaluators.run_many("relevance", _inputs(), concurrency=4)
+
+    assert fake_api.calls["evaluators_execute_create"] == 4
+    assert [r.score for r in batch.results] == [(i % 4 + 1) / 10 for i in range(12)]
+    assert (batch.report.total, batch.report.unique, batch.report.ratio) == (12, 4, 8 / 12)
+
+
+def test_run_many__returns_failures_in_place(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    batch = client.evaluators.run_many("failing", _inputs())
+
+    assert all(isinstance(r, ServiceException) for r in batch.results)
+    assert fake_api.calls["evaluators_execute_create"] == 4
+
+
+@pytest.mark.asyncio
+async def test_arun_many__sends_each_distinct_input_once(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+
+    batch = await client.evaluators.arun_many("relevance", _inputs(), concurrency=2)
+
+    assert fake_api.calls["evaluators_execute_create"] == 4
+    assert [r.score for r in batch.results] == [(i % 4 + 1) / 10 for i in range(12)]
+
+
+@pytest.mark.asyncio
+async def test_arun_many__reads_inputs_as_requests_finish(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+
+    def inputs():
+        for i in range(20):
+            # At most two requests are in flight when the next input is read.
+            assert fake_api.calls["evaluators_execute_create"] >= i - 2
+            yield {"response": "x" * (i % 10 + 1), "request": str(i)}
+
+    batch = await client.evaluators.arun_many("relevance", inputs(), concurrency=2)
+
+    assert fake_api.calls["evaluators_execute_create"] == 20
+    assert [r.score for r in batch.results] == [(i % 10 + 1) / 10 for i in range(20)]
+
+
+def test_run_many__reads_inputs_as_requests_finish(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    def inputs():
+        for i in range(20):
+            # At most two requests are running or queued when the next input is read.
+            assert fake_api.calls["evaluators_execute_create"] >= i - 2
+            yield {"response": "x" * (i % 10 + 1), "request": str(i)}
+
+    batch = client.evaluators.run_many("relevance", inputs(), concurrency=2)
+
+    assert fake_api.calls["evaluators_execute_create"] == 20
+    assert [r.score for r in batch.results] == [(i % 10 + 1) / 10 for i in range(20)]
+
+
+def test_run_batch__sends_each_batch_as_its_inputs_are_read(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    def inputs():
+        for i in range(250):
+            # A batch is sent as soon as it has 100 distinct inputs.
+            assert fake_api.calls["judges_batch_execute_create"] == i // 100
+            yield {"response": str(i)}
+
+    batch = client.judges.run_batch("judge-1", inputs(), poll_interval=0)
+
+    assert [len(body["inputs"]) for body in fake_api.bodies] == [100, 100, 50]
+    assert [r.input.response for r in batch.results] == [str(i) for i in range(250)]
+
+
+def test_run_batch__submits_distinct_inputs_in_batches(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    inputs = [{"response": str(i % 150)} for i in range(400)]
+
+    batch = client.judges.run_batch("judge-1", inputs, poll_interval=0)
+
+    assert [len(body["inputs"]) for body in fake_api.bodies] == [100, 50]
+    assert batch.report.unique == 150
+    assert [r.input.response for r in batch.results] == [str(i % 150) for i in range(400)]
+    assert batch.results[0] is batch.results[150]
+
+
+@pytest.mark.asyncio
+async def test_arun_batch__submits_distinct_inputs_in_batches(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+
+    batch = await client.judges.arun_batch("judge-1", _inputs(), poll_interval=0)
+
+    assert fake_api.calls["judges_batch_execute_create"] == 1
+    assert fake_api.calls["judges_batch_executions_retrieve"] == 2
+    assert [r.execution_log_id for r in batch.results[:5]] == [f"log-batch-0-{i % 4}" for i in range(5)]
+
+
+def test_run_batch__reports_inputs_missing_from_a_failed_batch(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    inputs = [{"response": str(i)} for i in range(4)] * 2
+
+    batch = client.judges.run_batch("failing-judge", inputs, poll_interval=0)
+
+    assert [r.input.response for r in batch.results[:2]] == ["0", "1"]
+    assert all(isinstance(r, RuntimeError) for r in batch.results[2:4] + batch.results[6:])
+    assert "batch-0 finished failed without a result for input 2" in str(batch.results[2])
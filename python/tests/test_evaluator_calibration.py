@@ -65,3 +65,51 @@ def test_evaluators__legacy_calibrate_methods_removed():
     client = Scorable(api_key="fake")
     for gone in ("calibrate_existing", "acalibrate_existing", "calibrate_batch", "acalibrate_batch"):
         assert not hasattr(client.evaluators, gone)
+
+
+def _calibrate(client, **kwargs):
+    return client.evaluators.calibrate_sequential(name="variant", prompt="Score {{response}}", model="gpt", **kwargs)
+
+
+def test_calibrate_sequential__stops_once_the_interval_is_narrow_enough(fake_api):
+    fake_api.calibration_size = 2000
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    result = _calibrate(client, test_dataset_id="ds1", dataset_size=2000, target_width=0.08, seed=0)
+
+    assert result.stopped_early and result.estimate.width <= 0.08
+    assert result.estimate.n == len(result.outputs) < 2000
+    assert result.estimate.low <= 0.125 <= result.estimate.high  # A quarter of the rows are off by 0.3 or 0.7.
+    assert fake_api.calls["evaluators_calibrate_create"] == len(result.history) == len(result.outputs) // 20
+    ranges = [(body["dataset_range"]["start"], body["dataset_range"]["end"]) for body in fake_api.bodies]
+    assert len(set(ranges)) == len(ranges) and ranges != sorted(ranges)
+    assert [output.row_number for output in result.outputs] == sorted(
+        start + i for start, _ in ranges for i in range(20)
+    )
+
+
+def test_calibrate_sequential__runs_every_row_when_the_target_is_not_reached(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    test_data = [["x" * (row % 10 + 1), str(row % 10 / 10)] for row in range(50)]
+
+    result = _calibrate(client, test_data=test_data, metric="pearson", target_width=0.01, slice_size=15)
+
+    assert not result.stopped_early
+    assert [output.row_number for output in result.outputs] == list(range(50))
+    assert fake_api.calls["evaluators_calibrate_create"] == 4
+    assert -1 < result.estimate.low < result.estimate.value < result.estimate.high < 1
+    with pytest.raises(ValueError, match="dataset_size must be provided"):
+        _calibrate(client, test_dataset_id="ds1")
+
+
+@pytest.mark.asyncio
+async def test_acalibrate_sequential__stops_early(fake_api):
+    fake_api.calibration_size = 1000
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+
+    result = await client.evaluators.acalibrate_sequential(
+        name="variant", prompt="p", model="gpt", test_dataset_id="ds1", dataset_size=1000, target_width=0.1, seed=1
+    )
+
+    assert result.stopped_early and result.estimate.width <= 0.1
+    assert fake_api.calls["evaluators_calibrate_create"] == len(result.outputs) // 20
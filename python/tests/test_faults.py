@@ -0,0 +1,111 @@
+import pickle
+
+import aiohttp
+import pytest
+from urllib3.exceptions import ProtocolError
+
+from scorable.client import Scorable
+from scorable.faults import FaultInjector, FaultProfile, Faults, Latency
+from scorable.generated.openapi_client.exceptions import ApiException, ServiceException
+from scorable.transport import Retry
+
+EXECUTE = "POST /v1/evaluators/execute/*"
+
+
+def test_fault_profile__endpoints_override_the_defaults():
+    profile = FaultProfile.from_dict(
+        {
+            "latency": "0.01",
+            "statuses": [500],
+            "endpoints": {EXECUTE: {"error_rate": 0.5}, "/v1/datasets/*": {"latency": "uniform:0,0.1"}},
+        }
+    )
+
+    assert profile.faults_for("POST", "/v1/evaluators/execute/abc/") == Faults(
+        latency=Latency("constant", (0.01,)), error_rate=0.5, statuses=(500,)
+    )
+    assert profile.faults_for("GET", "/v1/evaluators/execute/abc/") == profile.default
+    assert profile.faults_for("GET", "/v1/datasets/abc/").latency == Latency("uniform", (0.0, 0.1))
+    with pytest.raises(ValueError, match="Unknown fault options"):
+        FaultProfile.from_dict({"error_rates": 0.1})
+
+
+def test_fault_injector__fails_matching_endpoints(fake_api):
+    injector = FaultInjector({"endpoints": {EXECUTE: {"error_rate": 1.0, "statuses": [500]}}})
+    client = Scorable(api_key="fake", base_url=fake_api.url, transport_wrappers=[injector])
+
+    with pytest.raises(ServiceException):
+        client.evaluators.run("relevance", response="abc")
+    assert len(list(client.datasets.list_items("dataset", limit=3))) == 3
+    assert injector.injected == {"error": 1}
+    assert fake_api.calls["evaluators_execute_create"] == 0
+
+
+def test_retry__rides_out_a_429_storm(fake_api):
+    injector = FaultInjector({"storms": [{"every": 3600, "duration": 0.2, "status": 429, "retry_after": 0.15}]})
+    client = Scorable(api_key="fake", base_url=fake_api.url, transport_wrappers=[injector])
+    with pytest.raises(ApiException) as e:
+        client.evaluators.run("relevance", response="abc")
+    assert e.value.status == 429
+
+    retry = Retry(attempts=3)
+    client = Scorable(api_key="fake", base_url=fake_api.url, transport_wrappers=[retry, injector])
+    assert client.evaluators.run("relevance", response="abc").score == 0.3
+    assert retry.retries >= 1 and retry.exhausted == 0
+    assert fake_api.calls["evaluators_execute_create"] == 1
+
+
+def test_fault_injector__resets_connections_after_sending(fake_api):
+    injector = FaultInjector({"reset_rate": 1.0})
+    client = Scorable(api_key="fake", base_url=fake_api.url, transport_wrappers=[injector])
+    with pytest.raises(ProtocolError):
+        client.evaluators.run("relevance", response="abc")
+    # The API executed the request whose response was lost.
+    assert fake_api.calls["evaluators_execute_create"] == 1
+
+    retry = Retry(attempts=2, backoff=0)
+    client = Scorable(api_key="fake", base_url=fake_api.url, transport_wrappers=[retry, injector])
+    with pytest.raises(ProtocolError):
+        client.evaluators.run("relevance", response="abc")
+    assert (retry.retries, retry.exhausted) == (1, 1)
+    assert fake_api.calls["evaluators_execute_create"] == 3
+
+
+def test_fault_injector__truncates_and_slows_bodies(fake_api):
+    injector = FaultInjector({"endpoints": {EXECUTE: {"truncate_rate": 1.0}}, "body_rate": 10_000})
+    client = Scorable(api_key="fake", base_url=fake_api.url, transport_wrappers=[injector])
+
+    with pytest.raises(ValueError):  # The half body does not validate.
+        client.evaluators.run("relevance", response="abc")
+    assert len(list(client.datasets.list_items("dataset", limit=3))) == 3
+    assert injector.injected["truncate"] == 1 and injector.injected["slow_body"] == 2
+
+
+@pytest.mark.asyncio
+async def test_fault_injector__drops_async_requests(fake_api):
+    injector = FaultInjector({"drop_rate": 1.0, "latency": "0.01"})
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True, transport_wrappers=[injector])
+    with pytest.raises(aiohttp.ClientOSError):
+        await client.evaluators.arun("relevance", response="abc")
+    assert fake_api.calls["evaluators_execute_create"] == 0
+
+    profile = {"endpoints": {EXECUTE: {"error_rate": 0.5, "statuses": [503]}}, "seed": 3}
+    retry = Retry(attempts=10, backoff=0)
+    client = Scorable(
+        api_key="fake", base_url=fake_api.url, run_async=True, transport_wrappers=[retry, FaultInjector(profile)]
+    )
+    results = [await client.evaluators.arun("relevance", response="a" * n) for n in range(1, 6)]
+    assert [result.score for result in results] == [0.1, 0.2, 0.3, 0.4, 0.5]
+    assert retry.retries > 0
+
+
+def test_fault_injector__pickles_with_the_client(fake_api):
+    client = Scorable(
+        api_key="fake",
+        base_url=fake_api.url,
+        transport_wrappers=[Retry(attempts=2), FaultInjector({"endpoints": {EXECUTE: {"error_rate": 1.0}}})],
+    )
+    clone = pickle.loads(pickle.dumps(client))  # noqa: S301
+    with pytest.raises(ServiceException):
+        clone.evaluators.run("relevance", response="abc")
+    assert fake_api.calls["evaluators_execute_create"] == 0
@@ -0,0 +1,88 @@
+import io
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from scorable.client import Scorable
+
+PDF = b"%PDF-1.4\n" + bytes(range(256)) * 2048
+
+
+async def _chunks():
+    for offset in range(0, len(PDF), 100_000):
+        yield PDF[offset : offset + 100_000]
+
+
+def test_upload_many__streams_every_kind_of_source(fake_api, tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(PDF)
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    progress: dict = {}
+
+    file_ids = client.files.upload_many(
+        [str(path), ("bytes.pdf", memoryview(PDF)), ("buffer.pdf", io.BytesIO(PDF)), ("generated.pdf", _chunks())],
+        concurrency=2,
+        progress=lambda index, sent, total: progress.__setitem__(index, (sent, total)),
+    )
+
+    assert all(isinstance(file_id, uuid.UUID) for file_id in file_ids)
+    assert fake_api.calls["files_create"] == 4
+    assert all(PDF in upload for upload in fake_api.uploads)
+    for filename in (b"doc.pdf", b"bytes.pdf", b"buffer.pdf", b"generated.pdf"):
+        assert any(b'filename="%s"' % filename in upload for upload in fake_api.uploads)
+    assert all(b"Content-Type: application/pdf" in upload for upload in fake_api.uploads)
+    assert progress == {0: (len(PDF), len(PDF)), 1: (len(PDF), len(PDF)), 2: (len(PDF), len(PDF)), 3: (len(PDF), None)}
+
+
+def test_upload_many__returns_errors_in_place(fake_api, tmp_path):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    file_ids = client.files.upload_many([("a.pdf", PDF), str(tmp_path / "missing.pdf")])
+
+    assert isinstance(file_ids[0], uuid.UUID)
+    assert isinstance(file_ids[1], FileNotFoundError)
+
+
+def test_upload_many__uses_the_background_loop(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url, background_loop=True)
+    try:
+        file_ids = client.files.upload_many([("a.pdf", PDF), ("b.pdf", PDF[:-1])])
+    finally:
+        client.close()
+
+    assert len(set(file_ids)) == 2
+    assert fake_api.calls["files_create"] == 2
+
+
+@pytest.mark.asyncio
+async def test_aupload_many__shares_the_upload_cache(fake_api, tmp_path):
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True, upload_cache=tmp_path / "cache.sqlite")
+
+    file_ids = await client.files.aupload_many([("a.pdf", PDF)] * 5 + [("b.pdf", io.BytesIO(PDF))], concurrency=3)
+
+    assert len(set(file_ids)) == 1
+    assert fake_api.calls["files_create"] == 1
+    with pytest.raises(AssertionError, match="not available in asynchronous mode"):
+        client.files.upload_many([("a.pdf", PDF)])
+
+
+@pytest.mark.asyncio
+async def test_aupload__works_with_a_synchronous_client(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    file_id = await client.files.aupload(_chunks(), "generated.pdf")
+
+    assert isinstance(file_id, uuid.UUID)
+    assert PDF in fake_api.uploads[0]
+
+
+def test_upload_many__threads_share_uploads_of_the_same_content(fake_api, tmp_path):
+    fake_api.upload_delay = 0.3
+    client = Scorable(api_key="fake", base_url=fake_api.url, upload_cache=tmp_path / "uploads.sqlite")
+
+    with ThreadPoolExecutor(4) as pool:
+        file_ids = list(pool.map(lambda _: client.files.upload_many([io.BytesIO(PDF)])[0], range(4)))
+
+    assert len(set(file_ids)) == 1 and isinstance(file_ids[0], uuid.UUID)
+    assert fake_api.calls["files_create"] == 1
@@ -0,0 +1,82 @@
+"""Import-time regression checks.
+
+These run in a fresh interpreter, as anything already imported by the test
+session would otherwise hide regressions.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_after(code: str) -> dict:
+    script = f"""
+import json, sys
+{code}
+print(json.dumps({{"modules": sorted(sys.modules)}}))
+"""
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def _generated_models(modules: list) -> list:
+    return [m for m in modules if ".models." in m and m.startswith("scorable.generated.")]
+
+
+def test_import_scorable__does_not_import_generated_clients():
+    result = _loaded_after("import scorable; scorable.Scorable(api_key='fake')")
+
+    assert not [m for m in result["modules"] if m.startswith("scorable.generated")]
+    assert "aiohttp" not in result["modules"]
+
+
+def test_sync_client__does_not_import_async_transport():
+    result = _loaded_after(
+        "from scorable import Scorable\n"
+        "client = Scorable(api_key='fake')\n"
+        "client.evaluators; client.judges; client.datasets; client.files; client.calibration_runs\n"
+        "client.get_client_context"
+    )
+
+    assert "aiohttp" not in result["modules"]
+    assert not [m for m in result["modules"] if m.startswith("scorable.generated.openapi_aclient")]
+    # Models are imported by the calls that use them, not by the sub-APIs.
+    assert not _generated_models(result["modules"])
+
+
+def test_async_client__imports_async_transport_on_use():
+    result = _loaded_after(
+        "from scorable import Scorable\nclient = Scorable(api_key='fake', run_async=True)\nclient.get_client_context"
+    )
+
+    assert "aiohttp" in result["modules"]
+    assert "scorable.generated.openapi_client.api_client" not in result["modules"]
+
+
+@pytest.mark.parametrize("package", ["openapi_client", "openapi_aclient"])
+def test_lazy_models_package__resolves_every_model(package):
+    result = _loaded_after(
+        f"from scorable.generated.{package} import models\n"
+        "assert models.CalibrationRun.__name__ == 'CalibrationRun'\n"
+        "assert all(getattr(models, name) for name in models.__all__)\n"
+        "assert 'JudgeBatchExecutionDetail' in dir(models)"
+    )
+
+    assert len(_generated_models(result["modules"])) == 133
+
+
+def test_sync_and_async_clients__share_one_model_hierarchy():
+    result = _loaded_after(
+        "from scorable.generated.openapi_aclient import models as amodels\n"
+        "from scorable.generated.openapi_aclient.api.judges_api import JudgesApi\n"
+        "from scorable.generated.openapi_client import models\n"
+        "from scorable.generated.openapi_client.api.judges_api import JudgesApi as SyncJudgesApi\n"
+        "assert amodels.Judge is models.Judge\n"
+        "assert amodels.__all__ == models.__all__"
+    )
+
+    assert not _generated_models([m for m in result["modules"] if "openapi_aclient" in m])
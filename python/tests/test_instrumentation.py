@@ -0,0 +1,80 @@
+import pytest
+
+from scorable.client import Scorable
+from scorable.generated.openapi_client.exceptions import ServiceException
+
+
+def test_sync_client__reports_timing_breakdown(fake_api):
+    timings = []
+    client = Scorable(api_key="fake", base_url=fake_api.url, request_hooks=[timings.append])
+
+    client.evaluators.run("relevance", response="abc")
+
+    [timing] = timings
+    assert timing.operation_id == "evaluators_execute_create"
+    assert timing.method == "POST"
+    assert timing.resource_path == "/v1/evaluators/execute/{id}/"
+    assert timing.url == f"{fake_api.url}/v1/evaluators/execute/relevance/"
+    assert timing.status == 200
+    assert timing.error is None
+    assert timing.connect is not None and timing.queue is not None
+    assert timing.tls is None
+    for phase in (timing.serialize, timing.ttfb, timing.body, timing.deserialize):
+        assert 0 <= phase <= timing.total
+
+
+def test_sync_client__reports_failed_calls(fake_api):
+    timings = []
+    client = Scorable(api_key="fake", base_url=fake_api.url, request_hooks=[timings.append])
+
+    with pytest.raises(ServiceException):
+        client.evaluators.run("failing", response="abc")
+
+    assert timings[0].status == 500
+    assert isinstance(timings[0].error, ServiceException)
+
+
+def test_client_without_hooks__is_not_instrumented(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    with client.get_client_context() as api_client:
+        assert not getattr(api_client, "_scorable_instrumented", False)
+        assert "param_serialize" not in vars(api_client)
+
+
+def test_failing_hook__warns_without_failing_the_call(fake_api):
+    def broken(timing):
+        raise ValueError("broken hook")
+
+    client = Scorable(api_key="fake", base_url=fake_api.url, request_hooks=[broken])
+
+    with pytest.warns(RuntimeWarning, match="broken hook"):
+        assert client.evaluators.run("relevance", response="abc").score == 0.3
+
+
+@pytest.mark.asyncio
+async def test_async_client__reports_aiohttp_trace_timings(fake_api):
+    timings = []
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+    client.instrumentation.add_hook(timings.append)
+
+    await client.evaluators.arun("relevance", response="abc")
+    await client.projects.aretrieve("project")
+
+    assert [t.operation_id for t in timings] == ["evaluators_execute_create", "projects_retrieve"]
+    assert all(t.connect is not None for t in timings)
+    assert timings[1].resource_path == "/v1/projects/{id}/"
+
+
+def test_background_loop__carries_timings_to_the_loop_thread(fake_api):
+    timings = []
+    client = Scorable(api_key="fake", base_url=fake_api.url, background_loop=True, request_hooks=[timings.append])
+    try:
+        client.evaluators.run("relevance", response="abc")
+        client.evaluators.run("relevance", response="abcd")
+    finally:
+        client.close()
+
+    assert [t.status for t in timings] == [200, 200]
+    # Measured by the trace config of the shared aiohttp session, on the loop thread.
+    assert all(t.connect is not None for t in timings)
@@ -0,0 +1,69 @@
+import asyncio
+import uuid
+
+import pytest
+
+from scorable.client import Scorable
+from scorable.interning import DocumentInterner
+
+PDF = b"%PDF-1.4\n" + b"0" * 1024
+
+
+def test_intern__uploads_each_document_once(fake_api, tmp_path):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    path = tmp_path / "manual.pdf"
+    path.write_bytes(PDF)
+    interner = DocumentInterner(client.files)
+
+    first = interner.intern(["inline note", PDF, path])
+    second = interner.intern([path, "another note"])
+
+    assert fake_api.calls["files_create"] == 1
+    assert first["contexts"] == ["inline note"]
+    assert first["file_ids"][0] == first["file_ids"][1] == second["file_ids"][0]
+    assert isinstance(second["file_ids"][0], uuid.UUID)
+
+    client.evaluators.run("relevance", response="answer", **second)
+    body = fake_api.bodies[-1]
+    assert body["contexts"] == ["another note"]
+    assert body["file_ids"] == [str(second["file_ids"][0])]
+
+
+def test_intern__text_only_contexts_are_left_inline(fake_api):
+    interner = DocumentInterner(Scorable(api_key="fake", base_url=fake_api.url).files)
+
+    assert interner.intern(["a", "b"]) == {"contexts": ["a", "b"], "file_ids": None}
+    assert fake_api.calls["files_create"] == 0
+
+
+def test_intern__rejects_unsupported_documents(fake_api):
+    interner = DocumentInterner(Scorable(api_key="fake", base_url=fake_api.url).files)
+
+    with pytest.raises(ValueError):
+        interner.intern([b"plain bytes"])
+
+
+@pytest.mark.asyncio
+async def test_aintern__uploads_each_document_once(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+    interner = DocumentInterner(client.files)
+
+    first = await interner.aintern([PDF])
+    second = await interner.aintern([PDF, "note"])
+
+    assert fake_api.calls["files_create"] == 1
+    assert first["file_ids"] == second["file_ids"]
+    assert (await client.evaluators.arun("relevance", response="answer", **second)).score == 0.6
+
+
+@pytest.mark.asyncio
+async def test_aintern__concurrent_calls_share_an_upload(fake_api, tmp_path):
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+    path = tmp_path / "manual.pdf"
+    path.write_bytes(PDF)
+    interner = DocumentInterner(client.files)
+
+    results = await asyncio.gather(*(interner.aintern([path, PDF]) for _ in range(4)))
+
+    assert fake_api.calls["files_create"] == 1
+    assert len({file_id for result in results for file_id in result["file_ids"]}) == 1
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from scorable.client import Scorable
+from scorable.jobs import Journal
+from scorable.sources import JsonlSource
+
+
+@pytest.fixture
+def client(fake_api):
+    return Scorable(api_key="fake", base_url=fake_api.url)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "inputs.jsonl"
+    path.write_text("".join(json.dumps({"id": f"row-{i}", "response": "x" * (i + 1)}) + "\n" for i in range(10)))
+    return JsonlSource(str(path))
+
+
+def test_evaluate__journals_every_pair(client, source, tmp_path, fake_api):
+    journal = str(tmp_path / "run.journal")
+
+    report = client.jobs.evaluate(source, ["relevance", "clarity"], journal=journal, concurrency=3)
+
+    assert (report.evaluated, report.failed, report.skipped) == (20, 0, 0)
+    with Journal(journal) as opened:
+        entries = opened.entries()
+    assert len(entries) == 20
+    assert {e["evaluator_version_id"] for e in entries} == {"v1"}
+    assert {e["execution_log_id"] for e in entries if e["key"] == "row-3"} == {"log-relevance-4", "log-clarity-4"}
+    assert all(body["evaluator_version_id"] == "v1" for body in fake_api.bodies)
+
+
+def test_evaluate__resumes_and_reruns_new_evaluator_versions(client, source, tmp_path, fake_api):
+    journal = str(tmp_path / "run.journal")
+    client.jobs.evaluate(source, ["relevance", "clarity"], journal=journal)
+
+    resumed = client.jobs.evaluate(source, ["relevance", "clarity"], journal=journal)
+    assert (resumed.evaluated, resumed.skipped) == (0, 20)
+
+    fake_api.evaluator_versions["clarity"] = "v2"
+    updated = client.jobs.evaluate(source, ["relevance", "clarity"], journal=journal)
+    assert (updated.evaluated, updated.skipped) == (10, 10)
+    assert fake_api.calls["evaluators_execute_create"] == 30
+
+
+def test_evaluate__only_failed_reruns_failures(client, source, tmp_path, fake_api):
+    journal = str(tmp_path / "run.journal")
+    first = client.jobs.evaluate(source, ["failing", "relevance"], journal=journal)
+    assert (first.evaluated, first.failed) == (20, 10)
+
+    rerun = client.jobs.evaluate(source, ["failing", "relevance"], journal=journal, only_failed=True)
+
+    assert (rerun.evaluated, rerun.failed, rerun.skipped) == (10, 10, 10)
+    with Journal(journal) as opened:
+        assert {e["status"] for e in opened.entries() if e["evaluator_id"] == "failing"} == {"error"}
+
+
+def test_journal__ignores_torn_last_line(tmp_path):
+    path = tmp_path / "run.journal"
+    entry = {"key": "a", "evaluator_id": "e", "evaluator_version_id": "v1", "status": "ok"}
+    path.write_text(json.dumps(entry) + "\n" + '{"key": "b", "evalu')
+
+    with Journal(str(path), sync_every=1) as journal:
+        assert journal.status("a", "e", "v1") == "ok"
+        assert journal.status("b", "e", "v1") is None
+        journal.append({**entry, "key": "b"})
+
+    with Journal(str(path)) as journal:
+        assert journal.status("b", "e", "v1") == "ok"
+
+
+@pytest.mark.asyncio
+async def test_aevaluate__in_async_mode(fake_api, source, tmp_path):
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+
+    report = await client.jobs.aevaluate(source, ["relevance"], journal=str(tmp_path / "run.journal"))
+
+    assert report.evaluated == 10
@@ -0,0 +1,99 @@
+import pickle
+import threading
+
+from scorable.client import Scorable
+from scorable.metrics import REGISTRY, MetricsHook, MetricsRegistry, StatsdExporter, render_prometheus
+
+
+def _value(name, registry=REGISTRY, **labels):
+    for family in registry.collect():
+        for sample in family.samples:
+            if sample.name == name and sample.labels == labels:
+                return sample.value
+    return 0.0
+
+
+def test_counter__sums_the_shards_of_all_threads():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs", ("kind",))
+
+    def work():
+        for _ in range(1000):
+            counter.inc("a")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc("b", amount=2)
+
+    assert _value("jobs_total", registry, kind="a") == 8000
+    assert _value("jobs_total", registry, kind="b") == 2
+    # Shards of exited threads stay counted once they are folded together.
+    assert _value("jobs_total", registry, kind="a") == 8000
+
+
+def test_render_prometheus__text_format():
+    registry = MetricsRegistry()
+    registry.gauge("depth", "Queue depth").inc(amount=3)
+    histogram = registry.histogram("latency_seconds", 'Latency "of calls"', ("op",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, "run")
+
+    assert render_prometheus(registry) == (
+        "# HELP depth Queue depth\n"
+        "# TYPE depth gauge\n"
+        "depth 3\n"
+        '# HELP latency_seconds Latency \\"of calls\\"\n'
+        "# TYPE latency_seconds histogram\n"
+        'latency_seconds_bucket{op="run",le="0.1"} 1\n'
+        'latency_seconds_bucket{op="run",le="1"} 2\n'
+        'latency_seconds_bucket{op="run",le="+Inf"} 3\n'
+        'latency_seconds_sum{op="run"} 5.55\n'
+        'latency_seconds_count{op="run"} 3\n'
+    )
+
+
+def test_statsd_exporter__sends_counter_deltas():
+    registry = MetricsRegistry()
+    counter = registry.counter("calls_total", "Calls", ("operation",))
+    registry.gauge("in_flight", "In flight").inc()
+    exporter = StatsdExporter(prefix="app")
+
+    counter.inc("run", amount=2)
+    assert exporter.lines(registry) == ["app.calls_total.run:2|c", "app.in_flight:1|g"]
+    counter.inc("run")
+    assert exporter.lines(registry) == ["app.calls_total.run:1|c", "app.in_flight:1|g"]
+
+    tagged = StatsdExporter(tags=True)
+    assert tagged.lines(registry)[0] == "calls_total:3|c|#operation:run"
+
+
+def test_metrics_hook__counts_calls_by_operation_and_status(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url, metrics=True)
+    labels = {"operation": "evaluators_execute_create", "status": "200"}
+    before = _value("scorable_requests_total", **labels)
+
+    client.evaluators.run("relevance", response="abc")
+    client.evaluators.run("relevance", response="def")
+
+    assert _value("scorable_requests_total", **labels) == before + 2
+    assert _value("scorable_request_duration_seconds_count", operation="evaluators_execute_create") >= 2
+    assert _value("scorable_requests_in_flight", operation="evaluators_execute_create") == 0
+    # The hook is re-created from the flag rather than pickled with the other hooks.
+    state = pickle.loads(pickle.dumps(client)).__getstate__()  # noqa: S301
+    assert state["metrics"] and state["request_hooks"] == []
+    assert isinstance(pickle.loads(pickle.dumps(MetricsHook())), MetricsHook)  # noqa: S301
+
+
+def test_sdk__counts_cache_lookups_and_queue_depth(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    hits = _value("scorable_cache_lookups_total", cache="dedup", result="hit")
+    misses = _value("scorable_cache_lookups_total", cache="dedup", result="miss")
+
+    client.evaluators.run_many("relevance", [{"response": "a"}, {"response": "b"}, {"response": "a"}])
+
+    assert _value("scorable_cache_lookups_total", cache="dedup", result="hit") == hits + 1
+    assert _value("scorable_cache_lookups_total", cache="dedup", result="miss") == misses + 2
+    assert _value("scorable_evaluation_queue_depth", entry_point="evaluators.run_many") == 0
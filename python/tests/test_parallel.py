@@ -0,0 +1,162 @@
+import json
+import multiprocessing
+import time
+
+import pytest
+
+from scorable.client import Scorable
+from scorable.parallel import FileLeaseTable, JsonlSink, ParallelRunner, SQLiteLeaseTable, plan_shards
+from scorable.sources import DatasetSource, JsonlSource
+
+
+@pytest.fixture
+def runner(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    return ParallelRunner(
+        client,
+        ["relevance", "clarity"],
+        workers=2,
+        concurrency=4,
+        shard_size=7,
+        mp_context=multiprocessing.get_context("fork"),
+    )
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    path = tmp_path / "inputs.jsonl"
+    path.write_text(
+        "".join(json.dumps({"id": f"row-{i}", "request": "q", "response": "x" * i}) + "\n" for i in range(20))
+    )
+    return str(path)
+
+
+def _read(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_plan_shards__covers_every_position():
+    shards = plan_shards(20, 7)
+
+    assert [(s.start, s.stop) for s in shards] == [(0, 7), (7, 14), (14, 20)]
+    assert plan_shards(0, 7) == []
+
+
+def test_runner__evaluates_jsonl_source(runner, inputs, tmp_path, fake_api):
+    sink = JsonlSink(str(tmp_path / "results.jsonl"))
+
+    report = runner.run(JsonlSource(inputs), sink)
+
+    records = _read(sink.path)
+    assert (report.shards, report.items, report.results, report.errors) == (3, 20, 40, 0)
+    assert sorted((r["key"], r["evaluator_id"]) for r in records) == sorted(
+        (f"row-{i}", e) for i in range(20) for e in ["relevance", "clarity"]
+    )
+    assert {r["score"] for r in records if r["key"] == "row-5"} == {0.5}
+    assert fake_api.calls["evaluators_execute_create"] == 40
+
+
+def test_runner__evaluates_dataset_source(runner, tmp_path):
+    sink = JsonlSink(str(tmp_path / "results.jsonl"))
+
+    report = runner.run(DatasetSource("dataset-1"), sink)
+
+    assert (report.shards, report.items) == (4, 25)
+    assert {r["key"] for r in _read(sink.path)} == {f"item-{i}" for i in range(25)}
+
+
+@pytest.mark.asyncio
+async def test_sources__resume_shards_where_counting_left_them(fake_api, inputs):
+    fake_api.dataset_size = 250
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+    source = DatasetSource("dataset-1")
+
+    assert await source.acount(client, every=60) == 250
+    assert fake_api.calls["datasets_items_list"] == 3
+    keys = [key async for key, _ in source.aread(client, 180, 240)]
+    assert keys == [f"item-{i}" for i in range(180, 240)]
+    # Read from the page of item 180 on, rather than from the first page.
+    assert fake_api.calls["datasets_items_list"] == 5
+
+    jsonl = JsonlSource(inputs)
+    assert await jsonl.acount(client, every=7) == 20
+    assert [key async for key, _ in jsonl.aread(client, 14, 20)] == [f"row-{i}" for i in range(14, 20)]
+    assert [key async for key, _ in jsonl.aread(client, 3, 5)] == ["row-3", "row-4"]
+
+
+def test_runner__records_failed_evaluations(fake_api, inputs, tmp_path):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    runner = ParallelRunner(client, ["failing"], workers=1, mp_context=multiprocessing.get_context("fork"))
+    sink = JsonlSink(str(tmp_path / "results.jsonl"))
+
+    report = runner.run(JsonlSource(inputs), sink)
+
+    assert report.errors == 20
+    assert all(r["error"].startswith("ServiceException") for r in _read(sink.path))
+
+
+@pytest.mark.parametrize("table", [SQLiteLeaseTable, FileLeaseTable])
+def test_runner__shared_lease_table_hands_out_each_shard_once(runner, inputs, tmp_path, table):
+    leases = table(str(tmp_path / "leases"))
+    sink = JsonlSink(str(tmp_path / "results.jsonl"))
+
+    first = runner.run(JsonlSource(inputs), sink, leases=leases)
+    second = runner.run(JsonlSource(inputs), sink, leases=leases)
+
+    assert (first.shards, second.shards) == (3, 0)
+    assert len(_read(sink.path)) == 40
+
+
+@pytest.mark.parametrize("table", [SQLiteLeaseTable, FileLeaseTable])
+def test_lease_table__expired_and_released_leases_are_claimed_again(tmp_path, table):
+    leases = table(str(tmp_path / "leases"), lease_seconds=-1)
+    leases.plan(plan_shards(10, 5))
+
+    first = leases.claim("a")
+    assert leases.claim("b") == first  # a's lease has already expired
+    leases.release(first, "a")  # no longer a's shard
+    assert leases.claim("c") == first
+
+    leases.complete(first, "c")
+    leases.release(first, "c")
+    assert [leases.claim("d").start, leases.claim("d").start] == [5, 5]
+
+
+@pytest.mark.parametrize("table", [SQLiteLeaseTable, FileLeaseTable])
+def test_lease_table__only_the_current_owner_renews_and_completes(tmp_path, table):
+    leases = table(str(tmp_path / "leases"), lease_seconds=-1)
+    leases.plan(plan_shards(5, 5))
+    shard = leases.claim("a")
+    assert leases.claim("b") == shard  # a's lease expired and b took the shard over
+
+    assert not leases.renew(shard, "a") and not leases.complete(shard, "a")
+    assert leases.renew(shard, "b") and leases.complete(shard, "b")
+    assert leases.claim("c") is None and not leases.renew(shard, "b")
+
+
+class _TakenOverLeases(SQLiteLeaseTable):
+    # The lease of the first shard expires while it runs, and another runner takes it over.
+    taken_over = False
+
+    def renew(self, shard, owner):
+        if shard.index == 0 and not self.taken_over:
+            self.taken_over = True
+            with self._transaction() as db:
+                db.execute("UPDATE shards SET expires_at = 0 WHERE idx = 0")
+            assert self.claim("other") == shard
+            with self._transaction() as db:
+                db.execute("UPDATE shards SET expires_at = ? WHERE idx = 0", (time.time() + 3600,))
+        return super().renew(shard, owner)
+
+
+def test_runner__drops_shards_taken_over_by_another_runner(runner, inputs, tmp_path, fake_api):
+    fake_api.evaluator_delays = {"relevance": 0.2}
+    leases = _TakenOverLeases(str(tmp_path / "leases"), lease_seconds=0.3)
+    sink = JsonlSink(str(tmp_path / "results.jsonl"))
+
+    report = runner.run(JsonlSource(inputs), sink, leases=leases)
+
+    assert (report.shards, report.lost) == (2, 1)
+    assert {r["key"] for r in _read(sink.path)} == {f"row-{i}" for i in range(7, 20)}
+    assert leases.complete(plan_shards(20, 7)[0], "other")
@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from scorable.client import Scorable
+from scorable.generated.openapi_client.api.judges_api import JudgesApi
+from scorable.generated.openapi_client.exceptions import NotFoundException
+from scorable.generated.openapi_client.models.judge_batch_execution_input_request import (
+    JudgeBatchExecutionInputRequest,
+)
+from scorable.generated.openapi_client.models.judge_batch_execution_request import JudgeBatchExecutionRequest
+from scorable.polling import _Schedule
+
+
+def _submit(client, count):
+    # Batches of 4, 8, ... inputs, submitted without waiting for them.
+    with client.judges.client_context() as api_client:
+        api = JudgesApi(api_client)
+        return [
+            api.judges_batch_execute_create(
+                judge_id="judge",
+                judge_batch_execution_request=JudgeBatchExecutionRequest(
+                    inputs=[JudgeBatchExecutionInputRequest(response="x" * i) for i in range(size * 4)]
+                ),
+            ).batch_execution_id
+            for size in range(1, count + 1)
+        ]
+
+
+def test_batch_poller__streams_items_and_resolves_futures(fake_api):
+    fake_api.batch_polls = 5
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    batch_ids = _submit(client, 3)
+    poller = client.judges.batch_poller
+
+    handles = [poller.track(batch_id, min_interval=0) for batch_id in batch_ids]
+    streamed = list(handles[2].items())
+
+    assert sorted(item.index for item in streamed) == list(range(12))
+    assert [len(handle.result(timeout=10).items) for handle in handles] == [4, 8, 12]
+    # Every batch is polled until it has finished, and not after.
+    assert fake_api.calls["judges_batch_executions_retrieve"] == 3 * 5
+    assert poller.pending == 0
+
+
+def test_batch_poller__fails_a_batch_after_repeated_poll_errors(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    poller = client.judges.batch_poller
+
+    handle = poller.track("missing", min_interval=0)
+    with pytest.raises(NotFoundException):
+        handle.result(timeout=10)
+    with pytest.raises(NotFoundException):
+        list(handle.items())
+    assert fake_api.calls["judges_batch_executions_retrieve"] == poller.max_poll_errors
+
+    [batch_id] = _submit(client, 1)
+    poller.track(batch_id)
+    with pytest.raises(ValueError, match="already being polled"):
+        poller.track(batch_id)
+
+
+@pytest.mark.asyncio
+async def test_batch_poller__tracks_batches_on_the_event_loop(fake_api):
+    fake_api.batch_polls = 3
+    batch_ids = _submit(Scorable(api_key="fake", base_url=fake_api.url), 2)
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+    poller = client.judges.batch_poller
+
+    handles = [await poller.atrack(batch_id, min_interval=0) for batch_id in batch_ids]
+    streamed = [item.index async for item in handles[0].items()]
+    details = [await handle for handle in handles]
+
+    assert sorted(streamed) == [0, 1, 2, 3]
+    assert [detail.status for detail in details] == ["completed", "completed"]
+    assert fake_api.calls["judges_batch_executions_retrieve"] == 2 * 3
+
+
+def test_schedule__backs_off_without_progress_and_follows_the_eta():
+    rng = random.Random(0)  # noqa: S311
+    schedule = _Schedule(min_interval=1.0, max_interval=60.0)
+
+    schedule.progressed(0.0, 0, 100, rng)
+    schedule.progressed(2.0, 0, 100, rng)
+    assert schedule.delay == 4.0
+
+    # 20 items in 10 seconds: 80 left take 40 seconds, polled again in 20.
+    schedule.progressed(10.0, 20, 100, rng)
+    assert schedule.delay == 20.0
+    assert 10.0 + 18.0 <= schedule.due <= 10.0 + 22.0
+
+    schedule.progressed(1000.0, 21, 100, rng)
+    assert schedule.delay == 60.0
@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+import pytest
+
+from scorable.client import Scorable
+from scorable.generated.openapi_client import ApiClient
+from scorable.generated.openapi_client.exceptions import ServiceException
+from scorable.skills import Evaluators
+
+
+def test_suite__runs_every_evaluator_over_one_client(fake_api):
+    fake_api.evaluator_offsets = {"slow": 0.5}
+    timings = []
+    client = Scorable(api_key="fake", base_url=fake_api.url, request_hooks=[timings.append])
+    suite = client.evaluators.suite("Politeness", "slow", "failing")
+
+    with patch.object(ApiClient, "__init__", autospec=True, side_effect=ApiClient.__init__) as constructed:
+        result = suite.run(response="xx", contexts=["c"])
+
+    assert constructed.call_count == 1
+    assert result.scores == {"Politeness": 0.2, "slow": 0.7, "failing": None}
+    assert result["slow"].score == 0.7
+    assert isinstance(result.errors["failing"], ServiceException)
+    with pytest.raises(ServiceException):
+        result["failing"]
+    assert fake_api.calls["evaluators_execute_create"] == 3
+    assert all(body == {"response": "xx", "contexts": ["c"]} for body in fake_api.bodies)
+    assert {timing.operation_id for timing in timings} == {"evaluators_execute_create"}
+    assert suite.evaluator_ids[0] == Evaluators.Eval.Politeness.value
+    suite.close()
+
+
+def test_suite__validates_the_input_once(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+    suite = client.evaluators.suite("fast", "slow")
+
+    with pytest.raises(ValueError, match="must be provided"):
+        suite.run(contexts=["c"])
+    with pytest.raises(TypeError, match="evaluator_version_id"):
+        suite.run(response="x", evaluator_version_id="v1")
+    with pytest.raises(TypeError, match="reponse"):
+        suite.run(reponse="x")
+    with pytest.raises(ValueError, match="more than once"):
+        client.evaluators.suite("fast", "fast")
+    assert fake_api.calls["evaluators_execute_create"] == 0
+
+
+@pytest.mark.asyncio
+async def test_suite__async(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True)
+    suite = client.evaluators.suite("fast", "failing")
+
+    result = await suite.arun(response="xxx")
+
+    assert result.scores == {"fast": 0.3, "failing": None}
+    assert list(result.errors) == ["failing"]
+    assert fake_api.calls["evaluators_execute_create"] == 2
@@ -0,0 +1,70 @@
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.metrics import MeterProvider  # noqa: E402
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+from opentelemetry.trace import SpanKind, StatusCode  # noqa: E402
+
+from scorable.client import Scorable  # noqa: E402
+from scorable.generated.openapi_aclient.exceptions import ServiceException  # noqa: E402
+from scorable.telemetry import OpenTelemetryHook  # noqa: E402
+
+
+@pytest.fixture
+def otel():
+    spans = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(spans))
+    metrics = InMemoryMetricReader()
+    hook = OpenTelemetryHook(tracer_provider, MeterProvider(metric_readers=[metrics]))
+    return hook, spans, metrics
+
+
+def _metrics(reader) -> dict:
+    data = reader.get_metrics_data()
+    return {
+        metric.name: metric.data.data_points
+        for resource in data.resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+    }
+
+
+def test_hook__traces_calls_and_propagates_context(fake_api, otel):
+    hook, spans, metrics = otel
+    client = Scorable(api_key="fake", base_url=fake_api.url, request_hooks=[hook])
+
+    client.evaluators.run("relevance", response="abc")
+
+    [span] = spans.get_finished_spans()
+    assert span.name == "evaluators_execute_create"
+    assert span.kind == SpanKind.CLIENT
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.attributes["http.request.resend_count"] == 0
+    assert span.attributes["http.request.body.size"] > 0
+    assert span.attributes["http.response.body.size"] > 0
+    traceparent = fake_api.request_headers[-1]["traceparent"]
+    assert traceparent.split("-")[1:3] == [f"{span.context.trace_id:032x}", f"{span.context.span_id:016x}"]
+
+    points = _metrics(metrics)
+    assert points["http.client.request.duration"][0].count == 1
+    assert points["http.client.active_requests"][0].value == 0
+
+
+@pytest.mark.asyncio
+async def test_hook__marks_failed_async_calls(fake_api, otel):
+    hook, spans, _ = otel
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True, request_hooks=[hook])
+
+    with pytest.raises(ServiceException):
+        await client.evaluators.arun("failing", response="abc")
+
+    [span] = spans.get_finished_spans()
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.attributes["http.response.status_code"] == 500
+    assert span.attributes["error.type"] == "ServiceException"
+    assert "traceparent" in fake_api.request_headers[-1]
@@ -0,0 +1,77 @@
+import asyncio
+import io
+import pickle
+import sqlite3
+
+import pytest
+
+from scorable.client import Scorable
+from scorable.upload_cache import UploadCache, content_digest
+
+PDF = b"%PDF-1.4\n" + b"0" * 4096
+
+
+def test_content_digest__same_for_paths_and_file_objects(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(PDF)
+    (tmp_path / "empty.pdf").write_bytes(b"")
+
+    with open(path, "rb") as f:
+        assert content_digest(f) == content_digest(path) == content_digest(io.BytesIO(PDF))
+        assert f.tell() == 0
+        f.seek(9)
+        assert content_digest(f) == content_digest(io.BytesIO(PDF[9:]))
+        assert f.tell() == 9
+    assert content_digest(str(tmp_path / "empty.pdf")) == content_digest(io.BytesIO(b""))
+
+
+def test_upload__reuses_persisted_file_ids(fake_api, tmp_path):
+    cache_path = str(tmp_path / "uploads.sqlite")
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(PDF)
+    client = Scorable(api_key="fake", base_url=fake_api.url, upload_cache=cache_path)
+
+    first = client.files.upload(str(path))
+    assert client.files.upload(io.BytesIO(PDF), "copy.pdf") == first
+    # A new client (or process) with the same cache does not upload it again either.
+    other = pickle.loads(pickle.dumps(Scorable(api_key="fake", base_url=fake_api.url, upload_cache=cache_path)))  # noqa: S301
+    assert other.files.upload(str(path)) == first
+    assert fake_api.calls["files_create"] == 1
+
+    assert client.files.upload(io.BytesIO(PDF + b"\n"), "other.pdf") != first
+    assert fake_api.calls["files_create"] == 2
+
+
+def test_upload__expired_entries_are_uploaded_again(fake_api, tmp_path):
+    cache = UploadCache(tmp_path / "uploads.sqlite", ttl=3600)
+    client = Scorable(api_key="fake", base_url=fake_api.url, upload_cache=cache)
+
+    first = client.files.upload(io.BytesIO(PDF), "doc.pdf")
+    with sqlite3.connect(cache.path) as db:
+        db.execute("UPDATE uploads SET uploaded_at = uploaded_at - 7200")
+
+    assert client.files.upload(io.BytesIO(PDF), "doc.pdf") != first
+    assert fake_api.calls["files_create"] == 2
+    assert cache.get(content_digest(io.BytesIO(PDF))) is not None
+
+
+def test_upload__without_cache_always_uploads(fake_api):
+    client = Scorable(api_key="fake", base_url=fake_api.url)
+
+    client.files.upload(io.BytesIO(PDF), "doc.pdf")
+    client.files.upload(io.BytesIO(PDF), "doc.pdf")
+
+    assert fake_api.calls["files_create"] == 2
+
+
+@pytest.mark.asyncio
+async def test_aupload__coalesces_concurrent_uploads_of_the_same_content(fake_api, tmp_path):
+    client = Scorable(api_key="fake", base_url=fake_api.url, run_async=True, upload_cache=tmp_path / "uploads.sqlite")
+
+    file_ids = await asyncio.gather(*(client.files.aupload(io.BytesIO(PDF), f"doc-{i}.pdf") for i in range(8)))
+
+    assert len(set(file_ids)) == 1
+    assert fake_api.calls["files_create"] == 1
+    assert await client.files.aupload(io.BytesIO(PDF), "doc.pdf") == file_ids[0]
+    assert fake_api.calls["files_create"] == 1
+    assert not client.files._inflight
@@ -0,0 +1,91 @@
+"""Rewrite the generated client package ``__init__`` files to import lazily.
+
+openapi-generator emits ``__init__.py`` files that eagerly import every model
+(and the whole transport), which makes ``import scorable`` pay for ~130 pydantic
+model builds and aiohttp even when only a handful are ever used. This script
+replaces them with PEP 562 module ``__getattr__`` shims that import on first
+attribute access, while keeping the eager imports visible to type checkers.
+
+Usage::
+
+  python tools/lazy_generated_init.py src/scorable/generated/openapi_client [...]
+"""
+
+import ast
+import sys
+from pathlib import Path
+
+HEADER = '''# coding: utf-8
+
+# flake8: noqa
+"""
+Scorable API
+
+Scorable JSON API provides a way to access Scorable using provisioned API token
+
+The version of the OpenAPI document: 1.0.0 (latest)
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+# This file is rewritten by tools/lazy_generated_init.py (make fix-openapi-client)
+# so that models are imported on first access instead of all at once.
+'''
+
+GETATTR = """
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+"""
+
+
+def _model_classes(models_dir: Path) -> dict[str, str]:
+    classes: dict[str, str] = {}
+    for path in sorted(models_dir.glob("*.py")):
+        if path.name == "__init__.py":
+            continue
+        tree = ast.parse(path.read_text())
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                classes[node.name] = path.stem
+    return classes
+
+
+def _render(package: str, lazy: dict[str, str]) -> str:
+    lines = [HEADER, "import importlib", "from typing import TYPE_CHECKING", "", "if TYPE_CHECKING:"]
+    for name, module in lazy.items():
+        lines.append(f"    from {package}{module} import {name}")
+    lines += ["", "_LAZY = {"]
+    for name, module in lazy.items():
+        lines.append(f'    "{name}": "{module}",')
+    lines.append("}")
+    return "\n".join(lines) + GETATTR
+
+
+def rewrite(package_dir: Path) -> None:
+    package = ".".join(package_dir.resolve().parts[package_dir.resolve().parts.index("scorable") :])
+    models = _model_classes(package_dir / "models")
+    (package_dir / "models" / "__init__.py").write_text(
+        _render(f"{package}.models", {name: f".{module}" for name, module in models.items()})
+    )
+    (package_dir / "__init__.py").write_text(_render(package, {"ApiClient": ".api_client"}))
+    (package_dir / "api" / "__init__.py").write_text("\n")
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:]:
+        rewrite(Path(arg))
@@ -0,0 +1,69 @@
+"""Make the async generated client use the synchronous client's models.
+
+openapi-generator emits an identical copy of every model for each client
+package. Importing both means building every pydantic schema twice, and the
+SDK wrappers have to convert between two sets of otherwise equal classes.
+This script points the async transport at ``openapi_client.models`` and
+replaces the duplicate ``openapi_aclient/models`` package with a shim, so
+there is a single model hierarchy shared by both transports.
+
+Usage::
+
+  python tools/share_generated_models.py src/scorable/generated
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+SYNC_MODELS = "scorable.generated.openapi_client.models"
+ASYNC_MODELS = "scorable.generated.openapi_aclient.models"
+
+SHIM = f'''# coding: utf-8
+
+# flake8: noqa
+"""
+Scorable API
+
+Scorable JSON API provides a way to access Scorable using provisioned API token
+
+The version of the OpenAPI document: 1.0.0 (latest)
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+# This file is rewritten by tools/share_generated_models.py (make fix-openapi-client).
+# The async client shares its models with the synchronous one; this module only
+# keeps ``{ASYNC_MODELS}.<Model>`` lookups working.
+
+from {SYNC_MODELS.rsplit(".", 1)[0]} import models as _models
+
+__all__ = _models.__all__
+
+
+def __getattr__(name: str):
+    return getattr(_models, name)
+
+
+def __dir__():
+    return dir(_models)
+'''
+
+
+def share(generated_dir: Path) -> None:
+    aclient = generated_dir / "openapi_aclient"
+    for path in aclient.rglob("*.py"):
+        if path.parent.name == "models" and path.parent.parent == aclient:
+            continue
+        source = path.read_text()
+        if ASYNC_MODELS in source:
+            path.write_text(source.replace(ASYNC_MODELS, SYNC_MODELS))
+    shutil.rmtree(aclient / "models")
+    (aclient / "models").mkdir()
+    (aclient / "models" / "__init__.py").write_text(SHIM)
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:]:
+        share(Path(arg))